@@ -24,6 +24,16 @@ DEFAULT_STATES = "AZ,CA,CO,FL,GA,ID,LA,MD,MN,VA"
 DEFAULT_GENDERS = "M,F"
 DEFAULT_AGES = "U10"
 
+# Seconds between refreshes while a background job is running
+JOB_REFRESH_SECONDS = 2
+# Rows shown in file previews
+PREVIEW_ROWS = 50
+
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from src.utils import dashboard_data as data
+
 st.set_page_config(
     page_title="⚽ Youth Soccer Master Index — Mission Control",
     page_icon="⚙️",
@@ -38,61 +48,85 @@ def run_cmd(cmd: list[str], timeout: int = 7200):
     except Exception as e:
         return 1, "", f"[ERROR] {e}"
 
+@st.cache_resource
+def get_registry():
+    from src.registry.registry import get_registry as _get_registry
+    return _get_registry()
+
+# Cached reads are keyed by file signatures (path, mtime_ns, size): reruns reuse
+# them until the underlying files change.
+@st.cache_data(show_spinner=False, ttl=300)
+def _registry_stats(signature) -> dict:
+    stats = data.registry_stats(get_registry())
+    # Computed once per registry change (or TTL), so each one is a distinct health check
+    data.append_registry_history(stats, REGISTRY_LOG)
+    return stats
+
 def get_registry_stats() -> dict:
-    rc, out, err = run_cmd([PYTHON, "-m", "src.registry.registry", "--stats"])
-    if rc != 0:
-        return {"_error": err or out}
     try:
-        # Use JSONDecoder to find and parse the first valid JSON object
-        decoder = json.JSONDecoder()
-        # Find the first '{' character
-        start_idx = out.find('{')
-        if start_idx == -1:
-            raise ValueError("No JSON object found in output")
-        
-        # Parse from the first '{' to the end, handling nested braces
-        stats, end_idx = decoder.raw_decode(out[start_idx:])
-        stats["timestamp"] = datetime.datetime.now().isoformat()
-        save_registry_history(stats)
-        return stats
-    except json.JSONDecodeError as e:
-        return {"_error": f"JSON parse failed: {e}\nOutput: {out[:200]}"}
+        return _registry_stats(data.registry_signature(get_registry()))
     except Exception as e:
-        return {"_error": f"Failed to extract JSON: {e}\nOutput: {out[:200]}"}
+        return {"_error": f"Failed to read registry: {e}"}
 
-def save_registry_history(entry: dict):
-    LOG_DIR.mkdir(parents=True, exist_ok=True)
-    try:
-        if REGISTRY_LOG.exists():
-            data = json.loads(REGISTRY_LOG.read_text())
-        else:
-            data = []
-        data.append(entry)
-        # Keep last 100 records
-        data = data[-100:]
-        REGISTRY_LOG.write_text(json.dumps(data, indent=2))
-    except Exception as e:
-        logging.exception("Failed to save registry history: %s", e)
+@st.cache_data(show_spinner=False, ttl=300)
+def get_slice_builds(signature) -> pd.DataFrame:
+    return data.slice_build_rows(get_registry())
+
+@st.cache_data(show_spinner=False)
+def _registry_history(signature) -> pd.DataFrame:
+    return data.load_registry_history(signature)
 
 def load_registry_history():
-    if REGISTRY_LOG.exists():
-        try:
-            return pd.DataFrame(json.loads(REGISTRY_LOG.read_text()))
-        except Exception:
-            return pd.DataFrame()
-    return pd.DataFrame()
+    return _registry_history(data.file_signature(REGISTRY_LOG))
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def read_table(signature, columns=None, nrows=None) -> pd.DataFrame:
+    return data.read_table(signature, columns, nrows)
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def read_bytes(signature) -> bytes:
+    return data.read_bytes(signature)
 
 def latest_audit_csv():
-    if not AUDITS_DIR.exists():
-        return None
-    files = sorted(AUDITS_DIR.glob("identity_audit_*.csv"), key=lambda p: p.stat().st_mtime, reverse=True)
-    return files[0] if files else None
+    return data.latest_file(AUDITS_DIR, "identity_audit_*.csv")
 
 def latest_rank_audit():
-    if not RANKINGS_DIR.exists():
-        return None
-    files = sorted(RANKINGS_DIR.glob("audit_*.parquet"), key=lambda p: p.stat().st_mtime, reverse=True)
-    return files[0] if files else None
+    return data.latest_file(RANKINGS_DIR, "audit_*.parquet")
+
+def show_file_preview(path: Path, label: str = "Download"):
+    signature = data.file_signature(path)
+    if signature is None:
+        return
+    st.dataframe(read_table(signature, nrows=PREVIEW_ROWS))
+    st.download_button(label, read_bytes(signature), file_name=path.name, key=f"download_{path.name}")
+
+# Long commands run in a background PipelineJob kept in session state; the page
+# re-renders every few seconds with the latest output until the job finishes.
+def start_job(key: str, cmd: list[str]):
+    st.session_state[key] = data.PipelineJob(cmd, cwd=REPO_ROOT).start()
+
+def job_running(key: str) -> bool:
+    job = st.session_state.get(key)
+    return bool(job and job.running)
+
+def show_job(key: str, success_msg: str, failure_msg: str, tail: int = 200):
+    job = st.session_state.get(key)
+    if job is None:
+        return
+    if job.running:
+        st.info(f"⏳ Running for {job.elapsed:.0f}s: `{' '.join(job.cmd[1:])}`")
+        if st.button("Cancel", key=f"{key}_cancel"):
+            job.cancel()
+        st.code(job.output(tail) or "[waiting for output]")
+        time.sleep(JOB_REFRESH_SECONDS)
+        st.rerun()
+    else:
+        if job.returncode == 0:
+            st.success(success_msg)
+        else:
+            st.error(f"{failure_msg} (exit {job.returncode})")
+        with st.expander("Show Logs", expanded=job.returncode != 0):
+            st.code(job.output() or "[no output]")
 
 def tail_log(logfile: Path, lines: int = 200):
     if not logfile.exists():
@@ -169,64 +203,11 @@ elif menu == "🗂️ Slice Builds":
     st.header("🗂️ Slice Build Registry")
     st.markdown("Real-time view of which build each slice is tracked in.")
     
-    from src.registry.registry import get_registry
-    registry = get_registry()
-    
-    # Get all build entries
-    builds = registry.list_all_builds()
+    df = get_slice_builds(data.registry_signature(get_registry()))
     
-    if not builds:
+    if df.empty:
         st.warning("No slice builds found in registry")
     else:
-        # Convert to DataFrame for display
-        rows = []
-        for slice_key, info in builds.items():
-            build_name = info.get('latest_build', 'N/A')
-            last_updated = info.get('last_updated', 'N/A')
-            
-            # Parse timestamp for age calculation
-            try:
-                from datetime import datetime, timezone
-                updated_dt = datetime.fromisoformat(last_updated.replace('Z', '+00:00'))
-                now = datetime.now(timezone.utc)
-                age_days = (now - updated_dt).days
-                
-                if age_days == 0:
-                    age_str = "Today"
-                    status = "✅ Fresh"
-                elif age_days <= 7:
-                    age_str = f"{age_days} days ago"
-                    status = "✅ Recent"
-                elif age_days <= 30:
-                    age_str = f"{age_days} days ago"
-                    status = "⚠️ Aging"
-                else:
-                    age_str = f"{age_days} days ago"
-                    status = "🔴 Stale"
-            except:
-                age_str = "Unknown"
-                status = "❓"
-            
-            # Parse slice key
-            parts = slice_key.split('_')
-            if len(parts) >= 3:
-                state, gender, age = parts[0], parts[1], parts[2]
-            else:
-                state, gender, age = slice_key, "", ""
-            
-            rows.append({
-                'Slice': slice_key,
-                'State': state,
-                'Gender': gender,
-                'Age Group': age,
-                'Build': build_name,
-                'Last Updated': last_updated[:10] if len(last_updated) > 10 else last_updated,
-                'Age': age_str,
-                'Status': status
-            })
-        
-        df = pd.DataFrame(rows)
-        
         # Add filters
         col1, col2, col3 = st.columns(3)
         with col1:
@@ -267,7 +248,7 @@ elif menu == "🗂️ Slice Builds":
         )
         
         # Show registry version
-        version = registry.get_registry_version()
+        version = get_registry_stats().get("registry_version", "n/a")
         st.caption(f"Registry Version: {version}")
 
 # 🚀 Run Pipeline
@@ -279,22 +260,16 @@ elif menu == "🚀 Run Pipeline":
     dry_run = st.checkbox("Dry run only", False)
     refresh = st.checkbox("Refresh normalized data", False)
     tuner = st.checkbox("Run tuner after ranking", False)
-    if st.button("Run Pipeline"):
-        with st.spinner("Running pipeline... check Slack for notifications"):
-            cmd = [PYTHON, "scripts/pipeline_runner.py", "--states", states, "--genders", genders, "--ages", ages]
-            if dry_run:
-                cmd.append("--dry-run")
-            if refresh:
-                cmd.append("--refresh-normalized")
-            if tuner:
-                cmd.append("--with-tuner")
-            rc, out, err = run_cmd(cmd, timeout=8*3600)
-            if rc == 0:
-                st.success("✅ Pipeline completed successfully.")
-            else:
-                st.error(f"❌ Pipeline failed (exit {rc})")
-            with st.expander("Show Logs"):
-                st.code(out or err)
+    if st.button("Run Pipeline", disabled=job_running("pipeline_job")):
+        cmd = [PYTHON, "scripts/pipeline_runner.py", "--states", states, "--genders", genders, "--ages", ages]
+        if dry_run:
+            cmd.append("--dry-run")
+        if refresh:
+            cmd.append("--refresh-normalized")
+        if tuner:
+            cmd.append("--with-tuner")
+        start_job("pipeline_job", cmd)
+    show_job("pipeline_job", "✅ Pipeline completed successfully.", "❌ Pipeline failed")
 
 # 🧩 Identity Audit
 elif menu == "🧩 Identity Audit":
@@ -302,44 +277,33 @@ elif menu == "🧩 Identity Audit":
     threshold = st.slider("Similarity Threshold", 60, 95, 85)
     export = st.checkbox("Export CSV Report")
     weekly = st.checkbox("Send Weekly Summary to Slack")
-    if st.button("Run Identity Audit"):
-        with st.spinner("Running identity audit..."):
-            cmd = [PYTHON, "-m", "src.identity.identity_audit", "--threshold", str(threshold)]
-            if export:
-                AUDITS_DIR.mkdir(parents=True, exist_ok=True)
-                path = AUDITS_DIR / f"identity_audit_{datetime.datetime.now().strftime('%Y%m%d_%H%M')}.csv"
-                cmd += ["--export", str(path)]
-            if weekly:
-                cmd.append("--weekly-summary")
-            rc, out, err = run_cmd(cmd)
-            if rc == 0:
-                st.success("✅ Audit completed.")
-            else:
-                st.error(f"❌ Audit failed (exit {rc})")
-            st.code(out or err)
+    if st.button("Run Identity Audit", disabled=job_running("audit_job")):
+        cmd = [PYTHON, "-m", "src.identity.identity_audit", "--threshold", str(threshold)]
+        if export:
+            AUDITS_DIR.mkdir(parents=True, exist_ok=True)
+            path = AUDITS_DIR / f"identity_audit_{datetime.datetime.now().strftime('%Y%m%d_%H%M')}.csv"
+            cmd += ["--export", str(path)]
+        if weekly:
+            cmd.append("--weekly-summary")
+        start_job("audit_job", cmd)
+    show_job("audit_job", "✅ Audit completed.", "❌ Audit failed")
 
     latest = latest_audit_csv()
     if latest:
         st.markdown(f"### 📄 Latest Audit: `{latest.name}`")
-        df = pd.read_csv(latest)
-        st.dataframe(df.head(50))
-        st.download_button("Download Full Audit CSV", latest.read_bytes(), file_name=latest.name)
+        show_file_preview(latest, "Download Full Audit CSV")
 
 # 🕵️ Game Integrity
 elif menu == "🕵️ Game Integrity":
     st.header("🕵️ Game Integrity Checker (Hash Verification)")
-    check_all = st.button("🔍 Check All Hashes")
-    refresh = st.button("♻️ Rebuild All Hashes")
+    busy = job_running("integrity_job")
+    check_all = st.button("🔍 Check All Hashes", disabled=busy)
+    refresh = st.button("♻️ Rebuild All Hashes", disabled=busy)
     if check_all:
-        rc, out, err = run_cmd([PYTHON, "-m", "src.scraper.utils.game_hash_checker", "--check-all"])
-        st.code(out or err)
-        if rc == 0:
-            st.success("✅ Integrity check completed.")
-        else:
-            st.error("❌ Integrity check failed.")
+        start_job("integrity_job", [PYTHON, "-m", "src.scraper.utils.game_hash_checker", "--check-all"])
     if refresh:
-        rc, out, err = run_cmd([PYTHON, "-m", "src.scraper.utils.game_hash_checker", "--refresh"])
-        st.code(out or err)
+        start_job("integrity_job", [PYTHON, "-m", "src.scraper.utils.game_hash_checker", "--refresh"])
+    show_job("integrity_job", "✅ Integrity job completed.", "❌ Integrity job failed.")
 
 # 📈 Charts & Trends
 elif menu == "📈 Charts & Trends":
@@ -367,13 +331,10 @@ elif menu == "📂 View Audit Files":
     identity_audit = latest_audit_csv()
     if identity_audit:
         st.subheader(f"🧩 Identity Audit: {identity_audit.name}")
-        st.dataframe(pd.read_csv(identity_audit).head(50))
-        st.download_button("Download", identity_audit.read_bytes(), file_name=identity_audit.name)
+        show_file_preview(identity_audit)
     if rank_audit:
         st.subheader(f"📊 Ranking Audit: {rank_audit.name}")
-        df = pd.read_parquet(rank_audit)
-        st.dataframe(df.head(50))
-        st.download_button("Download", rank_audit.read_bytes(), file_name=rank_audit.name)
+        show_file_preview(rank_audit)
 
 # 📢 Slack Controls
 elif menu == "📢 Slack Controls":
@@ -16,6 +16,7 @@ import os
 
 # Add src to path for imports
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
 # from schema.master_team_schema import validate_dataframe
 from schema.master_team_schema import validate_dataframe
@@ -6,18 +6,40 @@ Automates the complete pipeline:
 1. Scraper (--incremental --auto)
 2. Linker (--relink-latest)
 3. Normalizer (optional --refresh)
-4. Ranking Engine (default config)
+4. Ranking Engine (default config, one process per state)
 5. Tuner (optional)
+
+Stages run in-process as a DAG (src/utils/pipeline_dag.py): normalized games
+are handed to ranking in memory, states are ranked in parallel, the pipeline
+stops at the first failure and a per-stage timing report is written to
+data/logs/pipeline_timing_<timestamp>.json.
+
+Linker, normalizer and per-state ranking are memoized: their input checksums,
+config and code are fingerprinted in the unified registry, and a step whose
+fingerprint is unchanged since its last successful run is skipped and its
+previous outputs reused. Use --force to run everything.
 """
 
-import subprocess
 import logging
 import sys
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 import argparse
 
+import pandas as pd
+import yaml
+
+# Add project root to path for imports
+project_root = Path(__file__).resolve().parents[1]
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from src.utils.pipeline_dag import PipelineDAG, Stage, StageFailure, file_digests, frame_digest
+
+RANKING_CONFIG = 'src/analytics/ranking_config.yaml'
+TUNING_SCENARIOS = 'src/analytics/tuning_scenarios.yaml'
+
 # Global logger instances
 logger = logging.getLogger(__name__)
 error_logger = logging.getLogger('pipeline_errors')
@@ -44,81 +66,76 @@ def setup_logging():
     error_logger.addHandler(error_handler)
 
 
-def execute_step(step_name: str, cmd: List[str], dry_run: bool = False) -> bool:
-    """
-    Execute a pipeline step with fail-fast error handling.
-    
-    Args:
-        step_name: Name of the pipeline step for logging
-        cmd: Command to execute as list of strings
-        dry_run: If True, only print command without executing
-        
-    Returns:
-        True if successful, False on error (stops pipeline)
-    """
-    logger.info(f"[START] {step_name}")
-    logger.info(f"Command: {' '.join(cmd)}")
-    
-    if dry_run:
-        logger.info(f"[DRY RUN] Would execute: {' '.join(cmd)}")
-        return True
+def log_stage_failure(failure: StageFailure) -> None:
+    """Write a failed stage to the main log and the detailed error log."""
+    step = failure.stage if failure.shard is None else f"{failure.stage} ({failure.shard})"
+    logger.error(f"[FAILED] {step}")
+    logger.error(f"Error: {failure.error}")
     
-    try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            check=True
-        )
-        logger.info(f"[SUCCESS] {step_name}")
-        logger.debug(f"Output: {result.stdout}")
-        return True
-        
-    except subprocess.CalledProcessError as e:
-        logger.error(f"[FAILED] {step_name}")
-        logger.error(f"Exit code: {e.returncode}")
-        logger.error(f"Error output: {e.stderr}")
-        
-        # Write detailed error to error log
-        error_logger.error(f"""
+    # Write detailed error to error log
+    error_logger.error(f"""
 === Pipeline Failure ===
 Timestamp: {datetime.now().isoformat()}
-Step: {step_name}
-Command: {' '.join(cmd)}
-Exit Code: {e.returncode}
-Error Output:
-{e.stderr}
+Step: {step}
+Error: {failure.error!r}
+Traceback:
+{failure.details}
 ========================
 """)
-        return False
 
 
-def run_scraper(states: List[str], genders: List[str], ages: List[str], dry_run: bool = False) -> bool:
-    """Run game history scraper with --incremental --auto flags"""
-    cmd = [
-        'python', '-m', 'src.scraper.build_game_history',
-        '--providers', 'gotsport',
-        '--states', ','.join(states),
-        '--genders', ','.join(genders),
-        '--ages', ','.join(ages),
-        '--incremental',
-        '--auto'
-    ]
-    return execute_step('Scraper', cmd, dry_run)
+def scrape_games(states: List[str], genders: List[str], ages: List[str]) -> Dict[str, Any]:
+    """Run game history scraper in incremental auto-discovery mode"""
+    from src.scraper.build_game_history import run_game_history_build
+    
+    return run_game_history_build(['gotsport'], states, genders, ages, incremental=True, auto=True)
+
+
+def latest_games_builds(refresh: bool = False) -> List[Path]:
+    """Build directories the linker/normalizer read (latest only unless refreshing)"""
+    build_dirs = sorted(Path("data/games").glob("build_*"))
+    return build_dirs if refresh else build_dirs[-1:]
+
+
+def relink_games() -> int:
+    """Link games to master index (latest build)"""
+    from src.linkers.game_master_linker import relink_latest_build
+    
+    return relink_latest_build()
+
+
+def linker_fingerprint(shard: Optional[str], inputs: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Fingerprint the linker by its raw games files, master index and identity map"""
+    from src.linkers.game_master_linker import IDENTITY_MAP_PATH, latest_master_index
+    
+    builds = latest_games_builds()
+    if not builds:
+        return None
+    try:
+        master_path = latest_master_index()
+    except FileNotFoundError:
+        return None
+    return {'inputs': file_digests(list(builds[0].glob("games_gotsport_*.csv")) + [master_path, IDENTITY_MAP_PATH])}
+
+
+def linked_files(linked: int) -> Dict[str, Any]:
+    """Record the linked games files of the latest build"""
+    files = sorted(str(path) for build in latest_games_builds() for path in build.glob("games_linked_*.csv"))
+    return {'linked': linked, 'files': files}
 
 
-def run_linker(dry_run: bool = False) -> bool:
-    """Link games to master index with --relink-latest"""
-    cmd = [
-        'python', '-m', 'src.linkers.game_master_linker',
-        '--relink-latest'
-    ]
-    return execute_step('Linker', cmd, dry_run)
+def reuse_linked(outputs: Dict[str, Any]) -> int:
+    """Reuse a previous link run if its linked files are still on disk"""
+    missing = [path for path in outputs['files'] if not Path(path).exists()]
+    if missing:
+        raise FileNotFoundError(f"missing {missing[0]}")
+    return outputs['linked']
 
 
-def run_normalizer(states: List[str], genders: List[str], ages: List[str], refresh: bool, dry_run: bool = False) -> bool:
+def normalize_games(states: List[str], genders: List[str], ages: List[str], refresh: bool) -> Dict[str, Any]:
     """Run normalizer with per-slice build awareness"""
     from src.registry.registry import get_registry
+    from src.analytics.normalizer import run_normalizer
     
     # Show build status before normalizing
     registry = get_registry()
@@ -130,44 +147,118 @@ def run_normalizer(states: List[str], genders: List[str], ages: List[str], refre
                 build = registry.get_latest_build(slice_key)
                 logger.info(f"  {slice_key}: {build or 'NOT FOUND'}")
     
-    cmd = [
-        'python', '-m', 'src.analytics.normalizer',
-        '--states', ','.join(states),
-        '--genders', ','.join(genders),
-        '--ages', ','.join(ages)
-    ]
-    if refresh:
-        cmd.append('--refresh')
-    return execute_step('Normalizer', cmd, dry_run)
-
-
-def run_ranking_engine(states: List[str], genders: List[str], ages: List[str], dry_run: bool = False) -> bool:
-    """Run ranking engine for each state"""
-    for state in states:
-        cmd = [
-            'python', '-m', 'src.analytics.ranking_engine',
-            '--state', state,
-            '--genders', ','.join(genders),
-            '--ages', ','.join(ages),
-            '--config', 'src/analytics/ranking_config.yaml'
-        ]
-        if not execute_step(f'Ranking Engine ({state})', cmd, dry_run):
-            return False
-    return True
+    games, parquet_file = run_normalizer(states, genders, ages, refresh)
+    return {'normalized_games': games, 'normalized_path': str(parquet_file)}
 
 
-def run_tuner(states: List[str], genders: List[str], ages: List[str], dry_run: bool = False) -> bool:
-    """Run parameter tuner (optional)"""
-    for state in states:
-        cmd = [
-            'python', '-m', 'src.analytics.ranking_tuner',
-            '--state', state,
-            '--genders', ','.join(genders),
-            '--ages', ','.join(ages)
-        ]
-        if not execute_step(f'Tuner ({state})', cmd, dry_run):
-            return False
-    return True
+def normalizer_fingerprint(states: List[str], genders: List[str], ages: List[str],
+                           refresh: bool) -> Dict[str, Any]:
+    """Fingerprint the normalizer by the slice games files it consolidates"""
+    files = [path
+             for build in latest_games_builds(refresh)
+             for state in states for gender in genders for age in ages
+             for path in build.glob(f"games_*_{state}_{gender}_{age}.csv")]
+    return {
+        'inputs': file_digests(files),
+        'config': {'states': states, 'genders': genders, 'ages': ages, 'refresh': refresh}
+    }
+
+
+def reuse_normalized(parquet_file: str) -> Dict[str, Any]:
+    """Reload the normalized games saved by a previous run"""
+    return {'normalized_games': pd.read_parquet(parquet_file), 'normalized_path': parquet_file}
+
+
+def state_games(state: str, inputs: Dict[str, Any]) -> Dict[str, Any]:
+    """Hand one state's normalized games to a ranking/tuning shard"""
+    games = inputs['normalized_games']
+    return {'games': games[games['state'] == state]}
+
+
+def save_rankings(state: str, result_df: pd.DataFrame, genders: List[str], ages: List[str],
+                  config: Dict[str, Any]) -> Optional[str]:
+    """Write one state's ranking outputs (in the parent process: states share the ranking stores)"""
+    from src.analytics.ranking_engine import save_ranking_outputs
+    
+    if result_df.empty:
+        logger.warning(f"No rankings generated for {state}")
+        return None
+    rankings_file = save_ranking_outputs(result_df, state, genders, ages, config, 'data/rankings', 'gotsport')
+    logger.info(f"Ranking complete for {state}: {len(result_df)} teams ranked")
+    return str(rankings_file)
+
+
+def reuse_rankings(rankings_file: Optional[str]) -> Optional[str]:
+    """Reuse a previous state ranking if its rankings file is still on disk"""
+    if rankings_file is None or not Path(rankings_file).exists():
+        raise FileNotFoundError(f"missing {rankings_file or 'rankings file'}")
+    return rankings_file
+
+
+def tune_state(state: str, genders: List[str], ages: List[str], games: pd.DataFrame) -> Any:
+    """Run parameter tuner for one state"""
+    from src.analytics.ranking_tuner import load_yaml, run_tuning
+    
+    base_config = load_yaml(Path(RANKING_CONFIG))
+    scenarios = load_yaml(Path(TUNING_SCENARIOS))
+    return run_tuning(state, genders, ages, base_config, scenarios,
+                      'data', 'data/rankings/tuning', 'gotsport', games=games)
+
+
+def build_pipeline(states: List[str], genders: List[str], ages: List[str], refresh: bool,
+                   with_tuner: bool, max_workers: Optional[int] = None, force: bool = False) -> PipelineDAG:
+    """
+    Declare the weekly pipeline as a DAG of in-process stages.
+    
+    Scraper and linker communicate through files on disk (explicit ordering);
+    normalized games are handed to ranking and tuning in memory. Ranking runs
+    one shard per state on a process pool; its outputs are written serially.
+    Scraper (remote inputs) and tuner (shared report files) always run.
+    """
+    from src.analytics import normalizer, sos_iterative, utils_stats
+    from src.analytics.ranking_engine import run_ranking
+    from src.linkers import game_master_linker
+    from src.registry.registry import get_registry
+    
+    with open(RANKING_CONFIG, 'r') as f:
+        config = yaml.safe_load(f)
+    # Only hand games over in memory when ranking would have read per-state normalized data;
+    # national mode loads every state's games itself
+    handoff = config.get('PRIMARY_INPUT', 'normalized') != 'raw' and not config.get('NATIONAL_MODE', False)
+    split = state_games if handoff else None
+    ranking_inputs = ['normalized_games'] if split else []
+    
+    # Rankings are only fingerprinted when their games come from the in-memory hand-off
+    ranking_fingerprint = (
+        (lambda state, inputs: {'games': frame_digest(inputs['games']),
+                                'config': {'config': config, 'genders': genders, 'ages': ages}})
+        if split else None
+    )
+    
+    dag = PipelineDAG(max_workers=max_workers, logger=logger, registry=get_registry(), force=force)
+    dag.add(Stage('Scraper', scrape_games, outputs=['game_build'],
+                  params={'states': states, 'genders': genders, 'ages': ages}))
+    dag.add(Stage('Linker', relink_games, after=['Scraper'],
+                  fingerprint=linker_fingerprint, code=[game_master_linker],
+                  record=linked_files, reuse=reuse_linked))
+    dag.add(Stage('Normalizer', normalize_games, outputs=['normalized_games', 'normalized_path'],
+                  after=['Linker'],
+                  params={'states': states, 'genders': genders, 'ages': ages, 'refresh': refresh},
+                  fingerprint=lambda shard, inputs: normalizer_fingerprint(states, genders, ages, refresh),
+                  code=[normalizer], record=lambda result: result['normalized_path'], reuse=reuse_normalized))
+    dag.add(Stage('Ranking Engine', run_ranking, inputs=ranking_inputs, outputs=['ranking_files'],
+                  after=['Normalizer'], shards=states, split=split,
+                  params={'genders': genders, 'ages': ages, 'config': config,
+                          'input_root': 'data', 'output_root': 'data/rankings', 'provider': 'gotsport'},
+                  finalize=lambda state, result_df: save_rankings(state, result_df, genders, ages, config),
+                  fingerprint=ranking_fingerprint, code=[utils_stats, sos_iterative, sys.modules[__name__]],
+                  reuse=reuse_rankings))
+    if with_tuner:
+        # Tuner states share report files under data/rankings/tuning, so they run serially
+        dag.add(Stage('Tuner', tune_state, inputs=['normalized_games'], after=['Ranking Engine'],
+                      shards=states, parallel=False, split=state_games,
+                      params={'genders': genders, 'ages': ages}))
+    return dag
 
 
 def check_registry_health() -> bool:
@@ -217,7 +308,11 @@ def main():
     parser.add_argument('--ages', default='U10', help='Comma-separated age groups (default: U10)')
     parser.add_argument('--refresh-normalized', action='store_true', help='Rebuild normalized data from all builds')
     parser.add_argument('--with-tuner', action='store_true', help='Run parameter tuner after ranking')
-    parser.add_argument('--dry-run', action='store_true', help='Print commands without executing')
+    parser.add_argument('--dry-run', action='store_true', help='Print the stage plan without executing')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='Processes for per-state ranking (default: CPU count)')
+    parser.add_argument('--force', action='store_true',
+                        help='Run every stage even if its inputs, config and code are unchanged')
     
     args = parser.parse_args()
     
@@ -237,6 +332,7 @@ def main():
     logger.info(f"Refresh Normalized: {args.refresh_normalized}")
     logger.info(f"With Tuner: {args.with_tuner}")
     logger.info(f"Dry Run: {args.dry_run}")
+    logger.info(f"Force: {args.force}")
     logger.info("=" * 60)
     
     start_time = datetime.now()
@@ -263,27 +359,18 @@ def main():
         logger.error("Registry health check failed")
         sys.exit(1)
     
-    # Run pipeline steps (fail-fast)
-    if not run_scraper(states, genders, ages, args.dry_run):
-        logger.error("Pipeline failed at Scraper step")
-        sys.exit(1)
-    
-    if not run_linker(args.dry_run):
-        logger.error("Pipeline failed at Linker step")
-        sys.exit(1)
-    
-    if not run_normalizer(states, genders, ages, args.refresh_normalized, args.dry_run):
-        logger.error("Pipeline failed at Normalizer step")
-        sys.exit(1)
-    
-    if not run_ranking_engine(states, genders, ages, args.dry_run):
-        logger.error("Pipeline failed at Ranking Engine step")
+    # Run pipeline stages (fail-fast)
+    dag = build_pipeline(states, genders, ages, args.refresh_normalized, args.with_tuner, args.workers,
+                         args.force)
+    try:
+        dag.run(dry_run=args.dry_run)
+    except StageFailure as failure:
+        log_stage_failure(failure)
+        logger.error(f"Pipeline failed at {failure.stage} step")
+        dag.write_timing_report()
         sys.exit(1)
     
-    if args.with_tuner:
-        if not run_tuner(states, genders, ages, args.dry_run):
-            logger.error("Pipeline failed at Tuner step")
-            sys.exit(1)
+    dag.write_timing_report()
     
     # Success
     duration = datetime.now() - start_time
@@ -8,7 +8,7 @@ Consolidates games from build directories and normalizes schema for ranking anal
 import pandas as pd
 import numpy as np
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 import logging
 from datetime import datetime
 import argparse
@@ -191,7 +191,7 @@ def consolidate_builds(input_root: Path, states: List[str], genders: List[str],
     return consolidated
 
 
-def save_normalized(df: pd.DataFrame, output_dir: Path, timestamp: str) -> None:
+def save_normalized(df: pd.DataFrame, output_dir: Path, timestamp: str) -> Path:
     """
     Save normalized games data to parquet and CSV formats.
     
@@ -199,6 +199,9 @@ def save_normalized(df: pd.DataFrame, output_dir: Path, timestamp: str) -> None:
         df: Normalized DataFrame
         output_dir: Output directory
         timestamp: Timestamp string for filename
+        
+    Returns:
+        Path of the saved parquet file
     """
     output_dir.mkdir(parents=True, exist_ok=True)
     
@@ -220,6 +223,37 @@ def save_normalized(df: pd.DataFrame, output_dir: Path, timestamp: str) -> None:
     logger.info(f"  States: {sorted(df['state'].unique())}")
     logger.info(f"  Genders: {sorted(df['gender'].unique())}")
     logger.info(f"  Age groups: {sorted(df['age_group'].unique())}")
+    
+    return parquet_file
+
+
+def run_normalizer(states: List[str], genders: List[str], ages: List[str], refresh: bool = False,
+                   input_root: Path = Path("data/games"),
+                   output_dir: Path = Path("data/games/normalized")) -> Tuple[pd.DataFrame, Path]:
+    """
+    Consolidate games from builds and save the normalized dataset.
+    
+    Args:
+        states: List of states to include
+        genders: List of genders to include
+        ages: List of age groups to include
+        refresh: Refresh normalized data from latest builds
+        input_root: Root directory containing build subdirectories
+        output_dir: Output directory for normalized data
+        
+    Returns:
+        Tuple of (normalized games DataFrame as saved, parquet file path)
+    """
+    # Consolidate games from builds
+    consolidated = consolidate_builds(input_root, states, genders, ages, refresh)
+    
+    # Generate timestamp
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M")
+    
+    # Save normalized data
+    parquet_file = save_normalized(consolidated, output_dir, timestamp)
+    
+    return consolidated, parquet_file
 
 
 def main():
@@ -249,15 +283,7 @@ def main():
     logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
     
     try:
-        # Consolidate games from builds
-        consolidated = consolidate_builds(args.input_root, states, genders, ages, args.refresh)
-        
-        # Generate timestamp
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M")
-        
-        # Save normalized data
-        save_normalized(consolidated, args.output_dir, timestamp)
-        
+        consolidated, _ = run_normalizer(states, genders, ages, args.refresh, args.input_root, args.output_dir)
         print(f"Normalization complete! Saved {len(consolidated)} games")
         
     except Exception as e:
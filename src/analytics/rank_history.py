@@ -0,0 +1,348 @@
+#!/usr/bin/env python3
+"""
+Rank History Store - columnar time series of ranking builds.
+
+Each ranking run appends to a Parquet store partitioned by division and build
+timestamp (history/division={key}/build={ts}.parquet). Only rows that changed
+since the previous build of the division are stored, plus tombstones for teams
+that dropped out, so a weekly build adds kilobytes rather than a full CSV.
+
+Cross-build questions ("biggest movers this week", "rank trajectory for team X",
+"teams whose PowerScore moved more than N sigma") are answered with vectorized
+merges over reconstructed snapshots instead of loops over ranking CSVs.
+
+Usage:
+    python -m src.analytics.rank_history --division ALL_M_U11 --movers 20
+    python -m src.analytics.rank_history --team ab0fdba0732c
+    python -m src.analytics.rank_history --division ALL_M_U11 --shifts 2.5
+"""
+
+import argparse
+import logging
+from pathlib import Path
+from typing import List, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from src.io.safe_write import safe_write_parquet
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HISTORY_ROOT = Path("data/rankings/history")
+
+# Values whose change triggers a new history row for a team
+TRACKED_COLUMNS = [
+    'team', 'club', 'state', 'rank_national', 'powerscore_adj',
+    'sao_norm', 'sad_norm', 'sos_norm', 'gp_used', 'status'
+]
+FLOAT_TOLERANCE = 1e-9
+
+
+def division_key(scope: str, gender: str, age_group: str) -> str:
+    """Build the history partition key, e.g. ALL_M_U11 or AZ_M_U10."""
+    return f"{scope}_{gender}_{age_group}"
+
+
+def _changed_mask(new: pd.DataFrame, old: pd.DataFrame) -> pd.Series:
+    """
+    Flag rows of ``new`` whose tracked values differ from ``old``.
+
+    Both frames must be aligned on the same index. Numeric columns are
+    compared with a small tolerance; missing values compare equal.
+    """
+    changed = pd.Series(False, index=new.index)
+    for col in TRACKED_COLUMNS:
+        if col not in new.columns:
+            continue
+        a, b = new[col], old[col]
+        both_na = a.isna() & b.isna()
+        if pd.api.types.is_numeric_dtype(a) and pd.api.types.is_numeric_dtype(b):
+            diff = ~np.isclose(a.astype(float), b.astype(float), atol=FLOAT_TOLERANCE, equal_nan=True)
+            changed |= pd.Series(diff, index=new.index)
+        else:
+            changed |= (a.astype(str) != b.astype(str)) & ~both_na
+    return changed
+
+
+def _empty_snapshot() -> pd.DataFrame:
+    return pd.DataFrame(columns=TRACKED_COLUMNS).rename_axis('team_id_master')
+
+
+class RankHistoryStore:
+    """
+    Partitioned Parquet store of per-build ranking changes.
+    """
+
+    def __init__(self, root: Union[str, Path] = DEFAULT_HISTORY_ROOT):
+        """
+        Initialize the history store.
+
+        Args:
+            root: Root directory of the partitioned store
+        """
+        self.root = Path(root)
+
+    def _division_dir(self, division: str) -> Path:
+        return self.root / f"division={division}"
+
+    def list_divisions(self) -> List[str]:
+        """Return all divisions present in the store."""
+        if not self.root.exists():
+            return []
+        return sorted(p.name.split('=', 1)[1] for p in self.root.glob("division=*") if p.is_dir())
+
+    def list_builds(self, division: str) -> List[str]:
+        """Return the build timestamps stored for a division, oldest first."""
+        return sorted(p.stem.split('=', 1)[1] for p in self._division_dir(division).glob("build=*.parquet"))
+
+    def _read_changes(self, division: str, upto: Optional[str] = None,
+                      columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """Read the change rows of a division up to (and including) a build."""
+        builds = [b for b in self.list_builds(division) if upto is None or b <= upto]
+        if not builds:
+            return pd.DataFrame()
+
+        frames = [
+            pd.read_parquet(self._division_dir(division) / f"build={b}.parquet", columns=columns)
+            for b in builds
+        ]
+        return pd.concat(frames, ignore_index=True)
+
+    def snapshot(self, division: str, build_ts: Optional[str] = None) -> pd.DataFrame:
+        """
+        Reconstruct the full ranking of a division as of a build.
+
+        Args:
+            division: Division key, e.g. ALL_M_U11
+            build_ts: Build timestamp (defaults to the latest build)
+
+        Returns:
+            DataFrame indexed by team_id_master with the tracked columns
+        """
+        changes = self._read_changes(division, upto=build_ts)
+        if changes.empty:
+            return _empty_snapshot()
+
+        latest = changes.sort_values('build_ts', kind='mergesort').drop_duplicates('team_id_master', keep='last')
+        latest = latest[~latest['removed']]
+        return latest.set_index('team_id_master')[TRACKED_COLUMNS]
+
+    # ============================================================================
+    # APPEND
+    # ============================================================================
+
+    def append_division(self, df: pd.DataFrame, division: str, build_ts: str) -> int:
+        """
+        Append one division of a ranking build, storing only changed rows.
+
+        Args:
+            df: Ranking rows of the division (ranking_engine output)
+            division: Division key
+            build_ts: Build timestamp (YYYYMMDD_HHMM)
+
+        Returns:
+            Number of rows written (changed, new and removed teams)
+        """
+        current = df.drop_duplicates('team_id_master').set_index('team_id_master')
+        for col in TRACKED_COLUMNS:
+            if col not in current.columns:
+                current[col] = np.nan
+        current = current[TRACKED_COLUMNS]
+
+        previous_ts = self._previous_build(division, build_ts)
+        previous = self.snapshot(division, previous_ts) if previous_ts else _empty_snapshot()
+
+        common = current.index.intersection(previous.index)
+        changed = _changed_mask(current.loc[common], previous.loc[common])
+        added = current.index.difference(previous.index)
+        removed = previous.index.difference(current.index)
+
+        parts = [
+            current.loc[common[changed.to_numpy()]].assign(removed=False),
+            current.loc[added].assign(removed=False),
+            previous.loc[removed].assign(removed=True),
+        ]
+        rows = pd.concat([p for p in parts if not p.empty] or [current.iloc[:0].assign(removed=False)])
+        rows = rows.rename_axis('team_id_master').reset_index()
+        rows['build_ts'] = build_ts
+
+        safe_write_parquet(rows, self._division_dir(division) / f"build={build_ts}.parquet")
+        logger.info(f"Rank history {division} @ {build_ts}: {int(changed.sum())} changed, "
+                    f"{len(added)} new, {len(removed)} removed ({len(current)} teams)")
+        return len(rows)
+
+    def append_build(self, df: pd.DataFrame, scope: str, build_ts: str) -> int:
+        """
+        Append a ranking build, splitting it into one partition per division.
+
+        Args:
+            df: Full ranking result (may span several genders/age groups)
+            scope: Run scope, i.e. the --state argument (ALL in national mode)
+            build_ts: Build timestamp (YYYYMMDD_HHMM)
+
+        Returns:
+            Total number of rows written
+        """
+        written = 0
+        for (gender, age_group), division_df in df.groupby(['gender', 'age_group'], sort=True):
+            written += self.append_division(division_df, division_key(scope, gender, age_group), build_ts)
+        return written
+
+    def _previous_build(self, division: str, build_ts: str) -> Optional[str]:
+        earlier = [b for b in self.list_builds(division) if b < build_ts]
+        return earlier[-1] if earlier else None
+
+    # ============================================================================
+    # QUERIES
+    # ============================================================================
+
+    def compare_builds(self, division: str, build_ts: Optional[str] = None,
+                       previous_ts: Optional[str] = None) -> pd.DataFrame:
+        """
+        Compare a build with the one before it.
+
+        Args:
+            division: Division key
+            build_ts: Build to inspect (defaults to the latest)
+            previous_ts: Build to compare against (defaults to the one before)
+
+        Returns:
+            DataFrame indexed by team_id_master with rank_prev/rank_curr,
+            powerscore_prev/powerscore_curr, rank_delta (positive = moved up)
+            and powerscore_delta for teams present in both builds
+        """
+        builds = self.list_builds(division)
+        if build_ts is None:
+            build_ts = builds[-1] if builds else None
+        if previous_ts is None:
+            previous_ts = self._previous_build(division, build_ts) if build_ts else None
+        if not build_ts or not previous_ts:
+            return pd.DataFrame()
+
+        curr = self.snapshot(division, build_ts)
+        prev = self.snapshot(division, previous_ts)
+
+        merged = curr[['team', 'state', 'rank_national', 'powerscore_adj']].join(
+            prev[['rank_national', 'powerscore_adj']], how='inner', lsuffix='_curr', rsuffix='_prev'
+        )
+        merged = merged.rename(columns={
+            'rank_national_curr': 'rank_curr', 'rank_national_prev': 'rank_prev',
+            'powerscore_adj_curr': 'powerscore_curr', 'powerscore_adj_prev': 'powerscore_prev',
+        })
+        merged['rank_delta'] = merged['rank_prev'] - merged['rank_curr']
+        merged['powerscore_delta'] = merged['powerscore_curr'] - merged['powerscore_prev']
+        return merged
+
+    def biggest_movers(self, division: str, n: int = 20, build_ts: Optional[str] = None) -> pd.DataFrame:
+        """
+        Return the teams with the largest rank change versus the previous build.
+
+        Args:
+            division: Division key
+            n: Number of teams
+            build_ts: Build to inspect (defaults to the latest)
+        """
+        diff = self.compare_builds(division, build_ts)
+        if diff.empty:
+            return diff
+        order = diff['rank_delta'].abs().sort_values(ascending=False, kind='mergesort').index
+        return diff.loc[order].head(n)
+
+    def powerscore_shifts(self, division: str, sigma: float = 2.0,
+                          build_ts: Optional[str] = None) -> pd.DataFrame:
+        """
+        Return teams whose PowerScore change exceeds ``sigma`` standard deviations.
+
+        Args:
+            division: Division key
+            sigma: Z-score threshold on the build-over-build PowerScore delta
+            build_ts: Build to inspect (defaults to the latest)
+        """
+        diff = self.compare_builds(division, build_ts)
+        if diff.empty:
+            return diff
+
+        delta = diff['powerscore_delta']
+        std = delta.std()
+        diff['powerscore_z'] = (delta - delta.mean()) / (std if std and std > 0 else 1.0)
+        shifted = diff[diff['powerscore_z'].abs() > sigma]
+        return shifted.sort_values('powerscore_z', key=np.abs, ascending=False)
+
+    def team_trajectory(self, team_id_master: str, division: Optional[str] = None) -> pd.DataFrame:
+        """
+        Return a team's rank and PowerScore at every build of its division(s).
+
+        Builds where the team did not change are filled forward from the last
+        stored row; builds after the team dropped out are omitted.
+
+        Args:
+            team_id_master: Team identifier
+            division: Optional division key (defaults to all divisions)
+        """
+        divisions = [division] if division else self.list_divisions()
+        frames = []
+
+        for div in divisions:
+            builds = self.list_builds(div)
+            rows = pd.concat([
+                pd.read_parquet(self._division_dir(div) / f"build={b}.parquet",
+                                filters=[('team_id_master', '==', team_id_master)])
+                for b in builds
+            ], ignore_index=True) if builds else pd.DataFrame()
+            if rows.empty:
+                continue
+
+            # Carry each stored row forward to every later build of the division
+            rows = rows.sort_values('build_ts', kind='mergesort').reset_index(drop=True)
+            build_index = pd.Index(builds)
+            covered = build_index[build_index >= rows['build_ts'].iloc[0]]
+            pos = np.searchsorted(rows['build_ts'].to_numpy(), covered.to_numpy(), side='right') - 1
+            rows = rows.iloc[pos].assign(build_ts=covered.to_numpy())
+            rows = rows[~rows['removed'].astype(bool)]
+            rows['division'] = div
+            frames.append(rows)
+
+        if not frames:
+            return pd.DataFrame()
+        return pd.concat(frames, ignore_index=True)[
+            ['division', 'build_ts', 'team', 'state', 'rank_national', 'powerscore_adj',
+             'sao_norm', 'sad_norm', 'sos_norm', 'gp_used', 'status']
+        ]
+
+
+def main():
+    """CLI entry point for rank history queries."""
+    parser = argparse.ArgumentParser(description="Rank History Store - cross-build queries")
+    parser.add_argument("--root", type=str, default=str(DEFAULT_HISTORY_ROOT), help="History store root")
+    parser.add_argument("--division", type=str, help="Division key, e.g. ALL_M_U11")
+    parser.add_argument("--movers", type=int, metavar="N", help="Biggest rank movers in the latest build")
+    parser.add_argument("--shifts", type=float, metavar="SIGMA", help="PowerScore shifts beyond SIGMA")
+    parser.add_argument("--team", type=str, help="Rank trajectory for a team_id_master")
+    parser.add_argument("--list", action="store_true", help="List divisions and builds")
+
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    store = RankHistoryStore(args.root)
+
+    with pd.option_context('display.width', 200, 'display.max_columns', 20):
+        if args.team:
+            print(store.team_trajectory(args.team, args.division))
+        elif args.movers is not None or args.shifts is not None:
+            if not args.division:
+                parser.error("--movers/--shifts require --division")
+            if args.movers is not None:
+                print(store.biggest_movers(args.division, args.movers))
+            else:
+                print(store.powerscore_shifts(args.division, args.shifts))
+        elif args.list:
+            for div in store.list_divisions():
+                print(f"{div}: {', '.join(store.list_builds(div))}")
+        else:
+            print("Use --help for available options")
+
+
+if __name__ == "__main__":
+    main()
@@ -19,9 +19,13 @@ import networkx as nx
 from src.analytics.utils_stats import (
     robust_minmax, exp_decay, tapered_weights, clip_zscore_per_team,
     cap_goal_diff, safe_merge, compute_adaptive_k, apply_performance_multiplier,
-    compute_bayesian_shrinkage, performance_adj_factor, robust_scale_logistic
+    compute_bayesian_shrinkage, performance_adj_factor, robust_scale, robust_scale_logistic,
+    get_weight_tables
+)
+from src.analytics.sos_iterative import (
+    refine_iterative_sos, compute_baseline_sos, build_opponent_edges,
+    canonize_ids, compute_opponent_sos
 )
-from src.analytics.sos_iterative import refine_iterative_sos, compute_baseline_sos, build_opponent_edges
 
 logger = logging.getLogger(__name__)
 
@@ -68,7 +72,8 @@ def _load_latest_normalized(input_root: Path, state: str = None, genders: List[s
 
 
 def load_games(input_root: Path, normalized: str, state: str, genders: List[str], 
-               ages: List[str], national_mode: bool = False) -> pd.DataFrame:
+               ages: List[str], national_mode: bool = False,
+               games: Optional[pd.DataFrame] = None) -> pd.DataFrame:
     """
     Load games data with auto-detection of schema and format.
     
@@ -79,11 +84,16 @@ def load_games(input_root: Path, normalized: str, state: str, genders: List[str]
         genders: List of genders to include
         ages: List of age groups to include
         national_mode: If True, load all states for same age/gender
+        games: Already-loaded games (e.g. handed over in memory by the pipeline);
+            skips reading from disk but is filtered the same way
         
     Returns:
         Loaded and filtered DataFrame
     """
-    if national_mode:
+    if games is not None:
+        logger.info(f"Using {len(games)} in-memory games")
+        df = games
+    elif national_mode:
         # Load all states for this age/gender combination
         logger.info(f"Loading NATIONAL dataset for {genders} {ages}")
         
@@ -173,7 +183,8 @@ def load_games(input_root: Path, normalized: str, state: str, genders: List[str]
 
 def run_ranking(state: str, genders: List[str], ages: List[str], config: Dict[str, Any],
                 input_root: str, output_root: str, provider: str, 
-                emit_connectivity: bool = False, national_mode: bool = False) -> pd.DataFrame:
+                emit_connectivity: bool = False, national_mode: bool = False,
+                games: Optional[pd.DataFrame] = None) -> pd.DataFrame:
     """
     Run the complete v53E ranking pipeline.
     
@@ -188,6 +199,7 @@ def run_ranking(state: str, genders: List[str], ages: List[str], config: Dict[st
         output_root: Output directory (not used in pure function)
         provider: Data provider name
         emit_connectivity: Whether to compute connectivity metrics
+        games: Optional already-loaded games instead of reading input_root
         
     Returns:
         DataFrame with rankings and all metrics
@@ -198,7 +210,7 @@ def run_ranking(state: str, genders: List[str], ages: List[str], config: Dict[st
     logger.info("Layer 1: Loading and filtering games data")
     national_mode = config.get('NATIONAL_MODE', False)
     df = load_games(input_path, config.get('PRIMARY_INPUT', 'normalized'), 
-                   state, genders, ages, national_mode=national_mode)
+                   state, genders, ages, national_mode=national_mode, games=games)
     
     if df.empty:
         logger.warning(f"No games found for {state} {genders} {ages}")
@@ -307,24 +319,16 @@ def run_ranking(state: str, genders: List[str], ages: List[str], config: Dict[st
     # Layer 3: Recency weights
     logger.info("Layer 3: Computing recency weights")
     
+    # Config-derived lookup tables (tapered weights, decay, gp multipliers), cached by config hash
+    weight_tables = get_weight_tables(config)
+    tapered = weight_tables['tapered']
+    
     for team_info in team_data:
         games_df = team_info['games_df']
         n_games = len(games_df)
         
         if n_games > 0:
-            # Generate tapered weights
-            tail_cfg = {
-                'tail_start': config['DAMPEN_TAIL_START'],
-                'tail_end': config['DAMPEN_TAIL_END'],
-                'tail_start_weight': config['DAMPEN_TAIL_START_WEIGHT'],
-                'tail_end_weight': config['DAMPEN_TAIL_END_WEIGHT']
-            }
-            
-            weights = tapered_weights(
-                n_games, config['RECENT_K'], config['RECENT_SHARE'], tail_cfg
-            )
-            
-            games_df['weight'] = weights
+            games_df['weight'] = tapered[n_games, :n_games]
         else:
             games_df['weight'] = 0.0
     
@@ -516,7 +520,8 @@ def run_ranking(state: str, genders: List[str], ages: List[str], config: Dict[st
                         config['PERFORMANCE_K'], 
                         config['PERFORMANCE_DECAY_RATE'], 
                         idx,
-                        threshold=config.get('PERFORMANCE_THRESHOLD', 1.0)
+                        threshold=config.get('PERFORMANCE_THRESHOLD', 1.0),
+                        decay_table=weight_tables['decay']
                     )
                     
                     # Legacy v5.3E performance gate (simplified, linear)
@@ -566,17 +571,9 @@ def run_ranking(state: str, genders: List[str], ages: List[str], config: Dict[st
     # Layer 9: SOS (Strength of Schedule) - Fixed Implementation
     logger.info("Layer 9: Strength of Schedule calculation")
     
-    # 1) Load alias map + canonicalize helper
+    # 1) Load alias map
     import os, json
     
-    def _canonize_id(x):
-        if x is None:
-            return None
-        s = str(x).strip()
-        if s.endswith(".0"):
-            s = s[:-2]
-        return s
-    
     alias_map = {}
     slice_key = f"{state}_{genders[0]}_{ages[0]}" if not national_mode else f"ALL_{genders[0]}_{ages[0]}"
     alias_path = os.path.join("data", "derived", f"id_alias_map_{slice_key}.json")
@@ -585,85 +582,40 @@ def run_ranking(state: str, genders: List[str], ages: List[str], config: Dict[st
             alias_map = json.load(f)
         logger.info(f"Loaded alias map with {len(alias_map)} mappings from {alias_path}")
     
-    def _resolve_opp_id(opp_id):
-        cid = _canonize_id(opp_id)
-        if cid in alias_map:
-            return alias_map[cid]
-        return cid
-    
     # 2) Build a strength map keyed by canonical team ids
-    def _baseline_strength(ti):
-        # Use post-shrink offensive/defensive blend (no SOS circularity on first pass)
-        return 0.5 * ti["sao_shrunk"] + 0.5 * ti["sad_shrunk"]
-    
-    team_strength_map = {}
-    for ti in team_data:
-        tid = _canonize_id(ti["team_id_master"])
-        strength = _baseline_strength(ti)
-        team_strength_map[tid] = strength
-        
-        # Also add any aliases for this team ID to the map
-        for alias_id, canonical_id in alias_map.items():
-            if canonical_id == tid:
-                team_strength_map[alias_id] = strength
+    # Use post-shrink offensive/defensive blend (no SOS circularity on first pass)
+    team_ids = canonize_ids(pd.Series([ti["team_id_master"] for ti in team_data], dtype=object))
+    baseline_strength = pd.Series(
+        [0.5 * ti["sao_shrunk"] + 0.5 * ti["sad_shrunk"] for ti in team_data],
+        index=team_ids.to_numpy(), dtype=float
+    )
+    baseline_strength = baseline_strength[~baseline_strength.index.duplicated(keep='last')]
     
     # 3) Compute SOS from unique, resolved opponents, no self-loops, capped repeat weight
+    #    (exploded opponent table: alias map + cumcount cap + groupby mean)
     BASELINE = float(config.get("UNRANKED_SOS_BASE", 0.35))
     MAX_REPEAT_WEIGHT = int(config.get("SOS_REPEAT_CAP", 2))  # cap repeat games per opponent
     
-    for ti in team_data:
-        tid = _canonize_id(ti["team_id_master"])
-        
-        # Resolve and sanitize the opponent id list
-        raw_opps = ti.get("opponents", []) or []
-        resolved = []
-        for oid in raw_opps:
-            rid = _resolve_opp_id(oid)
-            if not rid:
-                continue
-            if rid == tid:
-                continue  # remove self-loop after aliasing
-            resolved.append(rid)
-        
-        # Limit repeat weight per opponent (prevents over-crediting the same strong opponent 5+ times)
-        counts = {}
-        capped = []
-        for rid in resolved:
-            c = counts.get(rid, 0)
-            if c < MAX_REPEAT_WEIGHT:
-                capped.append(rid)
-                counts[rid] = c + 1
-        
-        # Use unique opponents for the baseline mean (legacy-style fairness)
-        opp_ids = sorted(set(capped))
-        
-        strengths = []
-        for rid in opp_ids:
-            s = team_strength_map.get(rid)
-            if s is None:
-                s = BASELINE  # never zero-credit an unranked/unknown opponent
-            strengths.append(float(s))
-        
-        ti["sos_component"] = float(np.mean(strengths)) if strengths else BASELINE
+    sos_df = compute_opponent_sos(
+        team_ids,
+        pd.Series([ti.get("opponents", []) or [] for ti in team_data], dtype=object),
+        baseline_strength,
+        alias_map=alias_map,
+        baseline=BASELINE,
+        repeat_cap=MAX_REPEAT_WEIGHT
+    )
+    
+    for ti, sos_row in zip(team_data, sos_df.itertuples(index=False)):
+        ti["sos_component"] = float(sos_row.sos_component)
         
         # Quick diagnostics for Copper
         if "State 48 FC Avondale 16 Copper" in ti["team"]:
             logger.info(f"[COPPER SOS] raw={ti['sos_component']:.3f} "
-                       f"opp_count={len(raw_opps)} unique_opps={len(opp_ids)} "
-                       f"missing={sum(1 for o in raw_opps if team_strength_map.get(_resolve_opp_id(o)) is None)}")
-            logger.info(f"[COPPER DEBUG] raw_opps={raw_opps[:5]}...")  # Show first 5 opponents
-            logger.info(f"[COPPER DEBUG] resolved_opps={resolved[:5]}...")  # Show first 5 resolved
-            logger.info(f"[COPPER DEBUG] opp_ids={opp_ids[:5]}...")  # Show first 5 final opponent IDs
+                       f"opp_count={sos_row.opp_count} unique_opps={sos_row.unique_opps} "
+                       f"missing={sos_row.missing_opps}")
+            logger.info(f"[COPPER DEBUG] raw_opps={ti['opponents'][:5]}...")  # Show first 5 opponents
     
     # 4) Normalize SOS with logistic (no floor), then optional stretch
-    def robust_scale(series: pd.Series) -> pd.Series:
-        if series.empty:
-            return series
-        p1, p99 = np.nanpercentile(series, [1, 99])
-        s = series.clip(lower=p1, upper=p99)
-        z = (s - s.mean()) / (s.std() or 1.0)
-        return 1.0 / (1.0 + np.exp(-z))
-    
     sos_raw_series = pd.Series([t["sos_component"] for t in team_data])
     sos_norm_series = robust_scale(sos_raw_series)
     stretch = float(config.get("SOS_STRETCH_EXPONENT", 1.5))
@@ -683,8 +635,6 @@ def run_ranking(state: str, genders: List[str], ages: List[str], config: Dict[st
     # Layer 10: Data normalization (v5.3E style)
     logger.info("Layer 10: Data normalization (v5.3E style)")
     
-    from src.analytics.utils_stats import robust_scale
-
     # Extract raw values from team_data
     sao_raw = pd.Series([t['sao_shrunk'] for t in team_data], dtype=float)
     sad_raw = pd.Series([t['sad_shrunk'] for t in team_data], dtype=float)
@@ -724,13 +674,9 @@ def run_ranking(state: str, genders: List[str], ages: List[str], config: Dict[st
 
         # --- v53E realism controls ---
         gp = team_info["gp_used"]
-        adj = 1.0
 
         # 1. Stepwise provisional floor (softened for better differentiation)
-        if gp < 8:
-            adj *= 0.85
-        elif gp < 15:
-            adj *= 0.95
+        adj = float(weight_tables['gp_adj'][gp])
 
         # 2. Connectivity dampener disabled - national mode provides full connectivity
         # if emit_connectivity and team_info.get("component_size", 50) < 25:
@@ -743,7 +689,7 @@ def run_ranking(state: str, genders: List[str], ages: List[str], config: Dict[st
         #     adj *= 1.01
 
         # 4. Apply game-count multiplier (soft shrink)
-        gp_mult = (min(gp, 20) / 20.0) ** config["PROVISIONAL_ALPHA"]
+        gp_mult = float(weight_tables['gp_mult'][gp])
 
         powerscore_adj = powerscore * gp_mult * adj
 
@@ -931,6 +877,189 @@ def run_ranking(state: str, genders: List[str], ages: List[str], config: Dict[st
     return result_df
 
 
+STATE_RANK_SORT = ['powerscore_adj', 'sao_norm', 'sad_norm', 'sos_norm']
+
+
+def assign_state_ranks(result_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Assign per-state ranks for all states in a single groupby pass.
+    
+    Args:
+        result_df: National ranking result
+        
+    Returns:
+        DataFrame sorted by (state, rank_state) with rank_state and rank set
+        to the state rank
+    """
+    ranked = result_df[result_df['state'].notna()].sort_values(
+        STATE_RANK_SORT, ascending=[False] * len(STATE_RANK_SORT), kind='mergesort'
+    )
+    ranked = ranked.assign(rank_state=ranked.groupby('state', sort=False).cumcount() + 1)
+    ranked['rank'] = ranked['rank_state']
+    return ranked.sort_values(['state', 'rank_state'], kind='mergesort')
+
+
+def export_state_views(state_views: pd.DataFrame, state_views_dir: Path, suffix: str,
+                       write_parquet: bool = True, max_workers: int = 8) -> List[Path]:
+    """
+    Write one rankings file per state on a thread pool.
+    
+    Args:
+        state_views: Output of assign_state_ranks
+        state_views_dir: Destination directory
+        suffix: Filename suffix ({genders}_{ages}_{timestamp})
+        write_parquet: Also write a Parquet copy of each view
+        max_workers: Thread pool size
+        
+    Returns:
+        List of CSV paths written
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    
+    def _write(item):
+        st, state_df = item
+        state_path = state_views_dir / f"rankings_{st}_{suffix}.csv"
+        state_df.to_csv(state_path, index=False)
+        if write_parquet:
+            state_df.to_parquet(state_path.with_suffix('.parquet'), index=False)
+        return state_path
+    
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(_write, state_views.groupby('state', sort=True)))
+
+
+def build_state_summary(state_views: pd.DataFrame) -> pd.DataFrame:
+    """
+    Summarize state views into one row per state.
+    
+    Args:
+        state_views: Output of assign_state_ranks
+        
+    Returns:
+        DataFrame with team counts, PowerScore distribution and top team per state
+    """
+    grouped = state_views.groupby('state', sort=True)
+    top = state_views[state_views['rank_state'] == 1].set_index('state')
+    
+    summary = pd.DataFrame({
+        'total_teams': grouped.size(),
+        'active_teams': (state_views['status'] == 'Active').groupby(state_views['state']).sum(),
+        'mean_powerscore': grouped['powerscore_adj'].mean(),
+        'median_powerscore': grouped['powerscore_adj'].median(),
+        'max_powerscore': grouped['powerscore_adj'].max(),
+        'best_rank_national': grouped['rank_national'].min(),
+        'top_team': top['team'],
+        'top_team_id': top['team_id_master'],
+    })
+    summary['provisional_teams'] = summary['total_teams'] - summary['active_teams']
+    return summary.reset_index()
+
+
+def save_ranking_outputs(result_df: pd.DataFrame, state: str, genders: List[str], ages: List[str],
+                         config: Dict[str, Any], output_root: str, provider: str,
+                         emit_connectivity: bool = False) -> Path:
+    """
+    Write the rankings CSV, stores, state views, connectivity and summary for one run.
+    
+    Args:
+        result_df: Rankings from run_ranking
+        state: State that was ranked ("ALL" in national mode)
+        genders: Genders that were ranked
+        ages: Age groups that were ranked
+        config: Configuration dictionary used for the run
+        output_root: Output directory
+        provider: Data provider name
+        emit_connectivity: Whether to write the connectivity CSV
+        
+    Returns:
+        Path of the rankings CSV
+    """
+    genders_label = ','.join(genders)
+    ages_label = ','.join(ages)
+    
+    # Generate output files
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M")
+    output_dir = Path(output_root)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    
+    # Write rankings CSV
+    rankings_file = output_dir / f"rankings_{state}_{genders_label}_{ages_label}_{timestamp}.csv"
+    result_df.to_csv(rankings_file, index=False)
+    logger.info(f"Rankings saved to {rankings_file}")
+    
+    # Compile the build into the indexed ranking store for fast lookups
+    if config.get('RANKING_STORE', True):
+        try:
+            from src.analytics.ranking_store import RankingStore
+            store = RankingStore(output_dir / "ranking_store.sqlite")
+            store.ingest_csv(rankings_file)
+        except Exception as e:
+            logger.warning(f"Failed to update ranking store: {e}")
+    
+    # Append changed rows to the per-division rank history
+    if config.get('RANK_HISTORY', True):
+        try:
+            from src.analytics.rank_history import RankHistoryStore
+            history = RankHistoryStore(output_dir / "history")
+            history.append_build(result_df, state, timestamp)
+        except Exception as e:
+            logger.warning(f"Failed to update rank history: {e}")
+    
+    # Export per-state views if in national mode
+    if config.get('NATIONAL_MODE', False) and state == "ALL":
+        state_views_dir = output_dir / "state_views"
+        state_views_dir.mkdir(parents=True, exist_ok=True)
+    
+        # Assign state ranks for every state in one pass, then write views in parallel
+        state_views = assign_state_ranks(result_df)
+        written = export_state_views(
+            state_views, state_views_dir, f"{genders_label}_{ages_label}_{timestamp}",
+            write_parquet=config.get('STATE_VIEWS_PARQUET', True),
+            max_workers=config.get('EXPORT_WORKERS', 8)
+        )
+        logger.info(f"Exported {len(written)} state views to {state_views_dir}")
+    
+        # Optionally generate summary aggregation (from the in-memory frame)
+        if config.get('AUTO_SUMMARIZE', True):
+            try:
+                summary_output = output_dir / "summary_state_rankings.csv"
+                summary_df = build_state_summary(state_views)
+                summary_df.to_csv(summary_output, index=False)
+                logger.info(f"Generated master summary with {len(summary_df)} state records")
+            except Exception as e:
+                logger.warning(f"Failed to generate summary aggregation: {e}")
+    
+    # Write connectivity CSV if requested
+    if emit_connectivity:
+        connectivity_file = output_dir / f"connectivity_{state}_{genders_label}_{ages_label}_{timestamp}.csv"
+        connectivity_df = result_df[['team_id_master', 'team', 'state', 'gender', 'age_group',
+                                   'component_id', 'component_size', 'degree']].copy()
+        connectivity_df.to_csv(connectivity_file, index=False)
+        logger.info(f"Connectivity data saved to {connectivity_file}")
+    
+    # Write summary JSON
+    summary = {
+        'timestamp': timestamp,
+        'state': state,
+        'genders': genders,
+        'ages': ages,
+        'provider': provider,
+        'total_teams': len(result_df),
+        'active_teams': len(result_df[result_df['status'] == 'Active']),
+        'provisional_teams': len(result_df[result_df['status'] == 'Provisional']),
+        'config': config
+    }
+    
+    # Keyed like the rankings file so back-to-back per-state saves don't overwrite each other
+    summary_file = output_dir / f"summary_{state}_{genders_label}_{ages_label}_{timestamp}.json"
+    import json
+    with open(summary_file, 'w') as f:
+        json.dump(summary, f, indent=2, default=str)
+    logger.info(f"Summary saved to {summary_file}")
+    
+    return rankings_file
+
+
 def main():
     """CLI entry point for the ranking engine."""
     parser = argparse.ArgumentParser(description="v53E Ranking Engine")
@@ -988,75 +1117,8 @@ def main():
             logger.warning("No rankings generated")
             return
         
-        # Generate output files
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M")
-        output_dir = Path(args.output_root)
-        output_dir.mkdir(parents=True, exist_ok=True)
-        
-        # Write rankings CSV
-        rankings_file = output_dir / f"rankings_{args.state}_{args.genders}_{args.ages}_{timestamp}.csv"
-        result_df.to_csv(rankings_file, index=False)
-        logger.info(f"Rankings saved to {rankings_file}")
-        
-        # Export per-state views if in national mode
-        if config.get('NATIONAL_MODE', False) and args.state == "ALL":
-            state_views_dir = output_dir / "state_views"
-            state_views_dir.mkdir(parents=True, exist_ok=True)
-            
-            # Get full national result (before any filtering)
-            full_result = result_df.copy()
-            
-            for st in sorted(full_result['state'].dropna().unique()):
-                state_df = full_result[full_result['state'] == st].copy()
-                # Recalculate state rank
-                state_df = state_df.sort_values(
-                    ['powerscore_adj', 'sao_norm', 'sad_norm', 'sos_norm'],
-                    ascending=[False, False, False, False]
-                )
-                state_df['rank_state'] = range(1, len(state_df) + 1)
-                state_df['rank'] = state_df['rank_state']
-                
-                state_path = state_views_dir / f"rankings_{st}_{args.genders}_{args.ages}_{timestamp}.csv"
-                state_df.to_csv(state_path, index=False)
-            
-            logger.info(f"Exported {len(full_result['state'].unique())} state views to {state_views_dir}")
-            
-            # Optionally generate summary aggregation
-            if config.get('AUTO_SUMMARIZE', True):
-                try:
-                    from scripts.summary_state_rankings import build_master_summary
-                    summary_output = output_dir / "summary_state_rankings.csv"
-                    summary_df = build_master_summary(state_views_dir, summary_output)
-                    logger.info(f"Generated master summary with {len(summary_df)} state records")
-                except Exception as e:
-                    logger.warning(f"Failed to generate summary aggregation: {e}")
-        
-        # Write connectivity CSV if requested
-        if args.emit_connectivity:
-            connectivity_file = output_dir / f"connectivity_{args.state}_{args.genders}_{args.ages}_{timestamp}.csv"
-            connectivity_df = result_df[['team_id_master', 'team', 'state', 'gender', 'age_group',
-                                       'component_id', 'component_size', 'degree']].copy()
-            connectivity_df.to_csv(connectivity_file, index=False)
-            logger.info(f"Connectivity data saved to {connectivity_file}")
-        
-        # Write summary JSON
-        summary = {
-            'timestamp': timestamp,
-            'state': args.state,
-            'genders': genders,
-            'ages': ages,
-            'provider': args.provider,
-            'total_teams': len(result_df),
-            'active_teams': len(result_df[result_df['status'] == 'Active']),
-            'provisional_teams': len(result_df[result_df['status'] == 'Provisional']),
-            'config': config
-        }
-        
-        summary_file = output_dir / f"summary_{timestamp}.json"
-        import json
-        with open(summary_file, 'w') as f:
-            json.dump(summary, f, indent=2, default=str)
-        logger.info(f"Summary saved to {summary_file}")
+        save_ranking_outputs(result_df, args.state, genders, ages, config, args.output_root,
+                             args.provider, args.emit_connectivity)
         
         try:
             print(f"✅ Ranking complete! {len(result_df)} teams ranked")
@@ -0,0 +1,436 @@
+#!/usr/bin/env python3
+"""
+Ranking Store - compiled, indexed read model for ranking builds.
+
+Ranking runs land as timestamped CSVs (rankings_{state}_{genders}_{ages}_{ts}.csv).
+Looking up one team used to mean globbing and re-reading entire CSVs. This module
+compiles each build into a single SQLite file with indexes on team_id_master,
+state, division and club name so that team lookups, top-N per state and rank
+history across builds are answered with indexed queries.
+
+Usage:
+    python -m src.analytics.ranking_store --ingest data/rankings
+    python -m src.analytics.ranking_store --team ab0fdba0732c
+    python -m src.analytics.ranking_store --club "State 48"
+    python -m src.analytics.ranking_store --top AZ --division M_U11 -n 25
+    python -m src.analytics.ranking_store --history ab0fdba0732c
+"""
+
+import argparse
+import logging
+import re
+import sqlite3
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Union
+
+import pandas as pd
+
+from src.analytics.ranking_engine import STATE_RANK_SORT, assign_state_ranks
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_STORE_PATH = Path("data/rankings/ranking_store.sqlite")
+
+RANKINGS_FILE_PATTERN = re.compile(
+    r"^rankings_(?P<state>[^_]+)_(?P<genders>[^_]+)_(?P<ages>[^_]+)_(?P<ts>\d{8}_\d{4})\.csv$"
+)
+
+# Columns persisted per team (component scores + ranks)
+STORE_COLUMNS = [
+    'build_id', 'built_at', 'division', 'team_id_master', 'team', 'club', 'state',
+    'gender', 'age_group', 'rank_national', 'rank_state', 'powerscore', 'powerscore_adj',
+    'sao_norm', 'sad_norm', 'sos_norm', 'sos_component', 'gp_used', 'gp_mult',
+    'status', 'is_active', 'last_game_date'
+]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS builds (
+    build_id TEXT PRIMARY KEY,
+    built_at TEXT NOT NULL,
+    scope_state TEXT,
+    genders TEXT,
+    ages TEXT,
+    source_file TEXT,
+    row_count INTEGER,
+    ingested_at TEXT
+);
+CREATE TABLE IF NOT EXISTS rankings (
+    build_id TEXT NOT NULL,
+    built_at TEXT NOT NULL,
+    division TEXT NOT NULL,
+    team_id_master TEXT NOT NULL,
+    team TEXT,
+    club TEXT,
+    state TEXT,
+    gender TEXT,
+    age_group TEXT,
+    rank_national INTEGER,
+    rank_state INTEGER,
+    powerscore REAL,
+    powerscore_adj REAL,
+    sao_norm REAL,
+    sad_norm REAL,
+    sos_norm REAL,
+    sos_component REAL,
+    gp_used INTEGER,
+    gp_mult REAL,
+    status TEXT,
+    is_active INTEGER,
+    last_game_date TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_rankings_team ON rankings (team_id_master, built_at);
+CREATE INDEX IF NOT EXISTS idx_rankings_division_state ON rankings (division, state, built_at, rank_state);
+CREATE INDEX IF NOT EXISTS idx_rankings_division_built ON rankings (division, built_at);
+CREATE INDEX IF NOT EXISTS idx_rankings_club ON rankings (club COLLATE NOCASE);
+CREATE INDEX IF NOT EXISTS idx_rankings_build ON rankings (build_id);
+"""
+
+
+def parse_rankings_filename(path: Union[str, Path]) -> Optional[Dict[str, str]]:
+    """
+    Parse a rankings CSV filename into its scope and build timestamp.
+
+    Args:
+        path: Path to a rankings_{state}_{genders}_{ages}_{ts}.csv file
+
+    Returns:
+        Dictionary with state, genders, ages, ts and build_id keys, or None
+        if the filename does not follow the rankings naming convention
+    """
+    match = RANKINGS_FILE_PATTERN.match(Path(path).name)
+    if not match:
+        return None
+
+    info = match.groupdict()
+    info['build_id'] = f"{info['state']}_{info['genders']}_{info['ages']}_{info['ts']}"
+    return info
+
+
+def prepare_rankings_frame(df: pd.DataFrame, build_id: str, built_at: str) -> pd.DataFrame:
+    """
+    Project a ranking result onto the store columns.
+
+    State ranks come from assign_state_ranks so they match the per-state
+    views written by the ranking engine; older builds without the component
+    columns fall back to national rank order.
+
+    Args:
+        df: Ranking result DataFrame (ranking_engine.run_ranking output)
+        build_id: Identifier of the build the rows belong to
+        built_at: ISO timestamp of the build
+
+    Returns:
+        DataFrame with STORE_COLUMNS
+    """
+    # Older per-state builds only carry a single 'rank' column
+    if 'rank_national' not in df.columns:
+        df = df.assign(rank_national=df['rank'] if 'rank' in df.columns else range(1, len(df) + 1))
+
+    out = df.sort_values('rank_national', kind='mergesort').reset_index(drop=True)
+    if set(STATE_RANK_SORT).issubset(out.columns):
+        rank_state = assign_state_ranks(out)['rank_state']
+    else:
+        rank_state = out.groupby('state', sort=False).cumcount() + 1
+    out = out.assign(
+        build_id=build_id,
+        built_at=built_at,
+        division=out['gender'].astype(str) + '_' + out['age_group'].astype(str),
+        team_id_master=out['team_id_master'].astype(str),
+        rank_state=rank_state,
+    )
+
+    for col in STORE_COLUMNS:
+        if col not in out.columns:
+            out[col] = None
+
+    out = out[STORE_COLUMNS].copy()
+    active = out['is_active'].astype(str).str.lower().isin(['true', '1']).astype(int)
+    out['is_active'] = active.where(out['is_active'].notna(), None)
+    # Missing dates are stored as NULL, not the string 'nan'
+    out['last_game_date'] = out['last_game_date'].astype(str).where(out['last_game_date'].notna(), None)
+    return out
+
+
+class RankingStore:
+    """
+    SQLite-backed ranking index with fast lookups across builds.
+    """
+
+    def __init__(self, db_path: Union[str, Path] = DEFAULT_STORE_PATH):
+        """
+        Initialize the ranking store, creating the schema if needed.
+
+        Args:
+            db_path: Path to the SQLite store file
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        with self._connect() as conn:
+            conn.executescript(_SCHEMA)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open a connection, committing on success and rolling back on error."""
+        conn = sqlite3.connect(self.db_path)
+        conn.row_factory = sqlite3.Row
+        try:
+            yield conn
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            conn.close()
+
+    # ============================================================================
+    # INGESTION
+    # ============================================================================
+
+    def ingest_dataframe(self, df: pd.DataFrame, build_id: str, built_at: Optional[str] = None,
+                         scope: Optional[Dict[str, str]] = None,
+                         source_file: Optional[str] = None) -> int:
+        """
+        Insert (or replace) one ranking build in the store.
+
+        Args:
+            df: Ranking result DataFrame
+            build_id: Identifier of the build
+            built_at: ISO timestamp of the build (defaults to now)
+            scope: Optional dict with state/genders/ages of the run
+            source_file: Optional path of the CSV the rows came from
+
+        Returns:
+            Number of team rows stored
+        """
+        if df.empty:
+            logger.warning(f"Skipping empty ranking build {build_id}")
+            return 0
+
+        built_at = built_at or datetime.now().isoformat(timespec='minutes')
+        scope = scope or {}
+        rows = prepare_rankings_frame(df, build_id, built_at)
+        placeholders = ', '.join('?' for _ in STORE_COLUMNS)
+
+        with self._connect() as conn:
+            conn.execute("DELETE FROM rankings WHERE build_id = ?", (build_id,))
+            conn.execute("DELETE FROM builds WHERE build_id = ?", (build_id,))
+            conn.executemany(
+                f"INSERT INTO rankings ({', '.join(STORE_COLUMNS)}) VALUES ({placeholders})",
+                rows.astype(object).where(rows.notna(), None).itertuples(index=False, name=None)
+            )
+            conn.execute(
+                "INSERT INTO builds VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (build_id, built_at, scope.get('state'), scope.get('genders'), scope.get('ages'),
+                 source_file, len(rows), datetime.now().isoformat(timespec='seconds'))
+            )
+
+        logger.info(f"Stored {len(rows)} teams for build {build_id} in {self.db_path}")
+        return len(rows)
+
+    def ingest_csv(self, csv_path: Union[str, Path]) -> int:
+        """
+        Ingest a rankings CSV, deriving the build identity from its filename.
+
+        Args:
+            csv_path: Path to a rankings_{state}_{genders}_{ages}_{ts}.csv file
+
+        Returns:
+            Number of team rows stored (0 if the filename is not a rankings file)
+        """
+        csv_path = Path(csv_path)
+        info = parse_rankings_filename(csv_path)
+        if info is None:
+            logger.warning(f"Not a rankings file, skipping: {csv_path}")
+            return 0
+
+        built_at = datetime.strptime(info['ts'], "%Y%m%d_%H%M").isoformat(timespec='minutes')
+        df = pd.read_csv(csv_path)
+        return self.ingest_dataframe(df, info['build_id'], built_at, scope=info,
+                                     source_file=str(csv_path))
+
+    def ingest_directory(self, rankings_dir: Union[str, Path], force: bool = False) -> int:
+        """
+        Ingest every rankings CSV in a directory that is not already stored.
+
+        Args:
+            rankings_dir: Directory containing rankings CSVs
+            force: Re-ingest builds that are already in the store
+
+        Returns:
+            Number of builds ingested
+        """
+        known = set() if force else set(self.list_builds()['build_id'])
+        ingested = 0
+
+        for csv_path in sorted(Path(rankings_dir).glob("rankings_*.csv")):
+            info = parse_rankings_filename(csv_path)
+            if info is None or info['build_id'] in known:
+                continue
+            if self.ingest_csv(csv_path):
+                ingested += 1
+
+        logger.info(f"Ingested {ingested} ranking builds from {rankings_dir}")
+        return ingested
+
+    # ============================================================================
+    # QUERIES
+    # ============================================================================
+
+    def _query(self, sql: str, params: tuple = ()) -> pd.DataFrame:
+        """Run a read query and return the rows as a DataFrame."""
+        with self._connect() as conn:
+            return pd.read_sql_query(sql, conn, params=params)
+
+    def list_builds(self) -> pd.DataFrame:
+        """Return all stored builds, newest first."""
+        return self._query("SELECT * FROM builds ORDER BY built_at DESC")
+
+    def latest_build_id(self, division: str, state: Optional[str] = None) -> Optional[str]:
+        """
+        Return the most recent build that contains a division (and state).
+
+        Args:
+            division: Division key, e.g. "M_U11"
+            state: Optional state the build must contain
+        """
+        sql = "SELECT build_id FROM rankings WHERE division = ?"
+        params: List[Any] = [division]
+        if state:
+            sql += " AND state = ?"
+            params.append(state)
+        sql += " ORDER BY built_at DESC, build_id DESC LIMIT 1"
+
+        with self._connect() as conn:
+            row = conn.execute(sql, tuple(params)).fetchone()
+        return row['build_id'] if row else None
+
+    def lookup_team(self, team_id_master: str, build_id: Optional[str] = None) -> pd.DataFrame:
+        """
+        Look up a team's ranking row(s).
+
+        Args:
+            team_id_master: Team identifier
+            build_id: Specific build (defaults to the team's latest build)
+
+        Returns:
+            DataFrame with the matching ranking rows
+        """
+        if build_id:
+            return self._query(
+                "SELECT * FROM rankings WHERE team_id_master = ? AND build_id = ?",
+                (team_id_master, build_id)
+            )
+        return self._query(
+            "SELECT * FROM rankings WHERE team_id_master = ? ORDER BY built_at DESC LIMIT 1",
+            (team_id_master,)
+        )
+
+    def search_club(self, club: str, division: Optional[str] = None, limit: int = 50) -> pd.DataFrame:
+        """
+        Find teams whose club name starts with a prefix (case-insensitive).
+
+        Only rows from the latest build of each division are returned.
+
+        Args:
+            club: Club name prefix
+            division: Optional division filter
+            limit: Maximum rows returned
+        """
+        sql = (
+            "SELECT r.* FROM rankings r "
+            "JOIN (SELECT division, MAX(built_at) AS built_at FROM rankings GROUP BY division) l "
+            "ON r.division = l.division AND r.built_at = l.built_at "
+            "WHERE r.club LIKE ? COLLATE NOCASE"
+        )
+        params: List[Any] = [f"{club}%"]
+        if division:
+            sql += " AND r.division = ?"
+            params.append(division)
+        sql += " ORDER BY r.division, r.rank_national LIMIT ?"
+        params.append(limit)
+        return self._query(sql, tuple(params))
+
+    def top_n(self, state: str, division: str, n: int = 25,
+              build_id: Optional[str] = None) -> pd.DataFrame:
+        """
+        Return the top-N teams of a state within a division.
+
+        Args:
+            state: Two-letter state code
+            division: Division key, e.g. "M_U11"
+            n: Number of teams
+            build_id: Specific build (defaults to the latest build covering the state)
+        """
+        build_id = build_id or self.latest_build_id(division, state)
+        if build_id is None:
+            return pd.DataFrame(columns=STORE_COLUMNS)
+
+        return self._query(
+            "SELECT * FROM rankings WHERE build_id = ? AND division = ? AND state = ? "
+            "ORDER BY rank_state LIMIT ?",
+            (build_id, division, state, n)
+        )
+
+    def rank_history(self, team_id_master: str) -> pd.DataFrame:
+        """
+        Return a team's rank across all stored builds, oldest first.
+
+        Args:
+            team_id_master: Team identifier
+        """
+        return self._query(
+            "SELECT build_id, built_at, division, state, rank_national, rank_state, "
+            "powerscore_adj, sao_norm, sad_norm, sos_norm, gp_used, status "
+            "FROM rankings WHERE team_id_master = ? ORDER BY built_at",
+            (team_id_master,)
+        )
+
+
+def main():
+    """CLI entry point for the ranking store."""
+    parser = argparse.ArgumentParser(description="Ranking Store - indexed ranking lookups")
+    parser.add_argument("--db", type=str, default=str(DEFAULT_STORE_PATH), help="Store file path")
+    parser.add_argument("--ingest", type=str, help="Ingest a rankings CSV or a directory of them")
+    parser.add_argument("--force", action="store_true", help="Re-ingest builds already stored")
+    parser.add_argument("--team", type=str, help="Look up a team by team_id_master")
+    parser.add_argument("--club", type=str, help="Search teams by club name prefix")
+    parser.add_argument("--top", type=str, metavar="STATE", help="Top-N teams for a state")
+    parser.add_argument("--division", type=str, help="Division key, e.g. M_U11")
+    parser.add_argument("-n", type=int, default=25, help="Number of rows for --top")
+    parser.add_argument("--history", type=str, metavar="TEAM_ID", help="Rank history for a team")
+    parser.add_argument("--builds", action="store_true", help="List stored builds")
+
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    store = RankingStore(args.db)
+
+    with pd.option_context('display.width', 200, 'display.max_columns', 20):
+        if args.ingest:
+            target = Path(args.ingest)
+            if target.is_dir():
+                store.ingest_directory(target, force=args.force)
+            else:
+                store.ingest_csv(target)
+        elif args.team:
+            print(store.lookup_team(args.team).T)
+        elif args.club:
+            print(store.search_club(args.club, args.division))
+        elif args.top:
+            if not args.division:
+                parser.error("--top requires --division")
+            print(store.top_n(args.top, args.division, args.n))
+        elif args.history:
+            print(store.rank_history(args.history))
+        elif args.builds:
+            print(store.list_builds())
+        else:
+            print("Use --help for available options")
+
+
+if __name__ == "__main__":
+    main()
@@ -9,7 +9,7 @@ ranking stability and parameter sensitivity.
 import pandas as pd
 import numpy as np
 from pathlib import Path
-from typing import List, Dict, Any, Tuple
+from typing import List, Dict, Any, Optional, Tuple
 import logging
 import argparse
 import yaml
@@ -174,6 +174,109 @@ def save_report(name: str, base_name: str, metrics: Dict[str, float],
     logger.info(f"Saved tuning report for {name} to {scenario_dir}")
 
 
+def run_tuning(state: str, genders: List[str], ages: List[str], base_config: Dict[str, Any],
+               scenarios: Dict[str, Any], input_root: str, output_root: str,
+               provider: str, games: Optional[pd.DataFrame] = None) -> Optional[Dict[str, Any]]:
+    """
+    Rank the baseline and every scenario for a state and save comparison reports.
+    
+    Args:
+        state: State to rank
+        genders: Genders to include
+        ages: Age groups to include
+        base_config: Base ranking configuration
+        scenarios: Scenario overrides keyed by name (must include 'baseline')
+        input_root: Root directory for input data
+        output_root: Output directory for tuning results
+        provider: Data provider name
+        games: Optional already-loaded games instead of reading input_root
+        
+    Returns:
+        Tuning summary dictionary, or None if the baseline produced no rankings
+    """
+    # Create output directory
+    output_dir = Path(output_root)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    
+    # Run baseline ranking
+    logger.info("Running baseline ranking...")
+    baseline_config = apply_overrides(base_config, scenarios['baseline'])
+    df_baseline = run_ranking(
+        state, genders, ages, baseline_config,
+        input_root, output_root, provider,
+        emit_connectivity=False, games=games
+    )
+    
+    if df_baseline.empty:
+        logger.error("Baseline ranking produced no results")
+        return None
+    
+    logger.info(f"Baseline ranking complete: {len(df_baseline)} teams")
+    
+    # Run each scenario
+    scenario_results = {}
+    
+    for scenario_name, scenario_overrides in scenarios.items():
+        if scenario_name == 'baseline':
+            continue
+        
+        logger.info(f"Running scenario: {scenario_name}")
+        
+        try:
+            # Apply scenario overrides
+            scenario_config = apply_overrides(base_config, scenario_overrides)
+            
+            # Run ranking
+            df_scenario = run_ranking(
+                state, genders, ages, scenario_config,
+                input_root, output_root, provider,
+                emit_connectivity=False, games=games
+            )
+            
+            if df_scenario.empty:
+                logger.warning(f"Scenario {scenario_name} produced no results")
+                continue
+            
+            # Compare to baseline
+            metrics = compare_rankings(df_baseline, df_scenario)
+            
+            # Save report
+            save_report(scenario_name, 'baseline', metrics, 
+                       df_baseline, df_scenario, output_dir)
+            
+            scenario_results[scenario_name] = metrics
+            
+            logger.info(f"Scenario {scenario_name} complete:")
+            logger.info(f"  Spearman correlation: {metrics['spearman_correlation']:.3f}")
+            logger.info(f"  Top-10 overlap: {metrics['top10_overlap']:.3f}")
+            logger.info(f"  Median rank delta: {metrics['median_rank_delta']:.1f}")
+        
+        except Exception as e:
+            logger.error(f"Scenario {scenario_name} failed: {e}")
+            continue
+    
+    # Save overall summary
+    summary = {
+        'timestamp': pd.Timestamp.now().isoformat(),
+        'state': state,
+        'genders': genders,
+        'ages': ages,
+        'provider': provider,
+        'baseline_teams': len(df_baseline),
+        'scenarios_run': len(scenario_results),
+        'scenario_results': scenario_results
+    }
+    
+    summary_file = output_dir / "tuning_summary.json"
+    with open(summary_file, 'w') as f:
+        json.dump(summary, f, indent=2, default=str)
+    
+    logger.info(f"Tuning complete! Results saved to {output_dir}")
+    logger.info(f"Summary saved to {summary_file}")
+    
+    return summary
+
+
 def main():
     """CLI entry point for the ranking tuner."""
     parser = argparse.ArgumentParser(description="v53E Ranking Engine Parameter Tuner")
@@ -207,86 +310,12 @@ def main():
     # Set up logging
     logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
     
-    # Create output directory
-    output_dir = Path(args.output_root)
-    output_dir.mkdir(parents=True, exist_ok=True)
-    
     try:
-        # Run baseline ranking
-        logger.info("Running baseline ranking...")
-        baseline_config = apply_overrides(base_config, scenarios['baseline'])
-        df_baseline = run_ranking(
-            args.state, genders, ages, baseline_config,
-            args.input_root, args.output_root, args.provider,
-            emit_connectivity=False
-        )
-        
-        if df_baseline.empty:
-            logger.error("Baseline ranking produced no results")
+        summary = run_tuning(args.state, genders, ages, base_config, scenarios,
+                             args.input_root, args.output_root, args.provider)
+        if summary is None:
             return
-        
-        logger.info(f"Baseline ranking complete: {len(df_baseline)} teams")
-        
-        # Run each scenario
-        scenario_results = {}
-        
-        for scenario_name, scenario_overrides in scenarios.items():
-            if scenario_name == 'baseline':
-                continue
-                
-            logger.info(f"Running scenario: {scenario_name}")
-            
-            try:
-                # Apply scenario overrides
-                scenario_config = apply_overrides(base_config, scenario_overrides)
-                
-                # Run ranking
-                df_scenario = run_ranking(
-                    args.state, genders, ages, scenario_config,
-                    args.input_root, args.output_root, args.provider,
-                    emit_connectivity=False
-                )
-                
-                if df_scenario.empty:
-                    logger.warning(f"Scenario {scenario_name} produced no results")
-                    continue
-                
-                # Compare to baseline
-                metrics = compare_rankings(df_baseline, df_scenario)
-                
-                # Save report
-                save_report(scenario_name, 'baseline', metrics, 
-                           df_baseline, df_scenario, output_dir)
-                
-                scenario_results[scenario_name] = metrics
-                
-                logger.info(f"Scenario {scenario_name} complete:")
-                logger.info(f"  Spearman correlation: {metrics['spearman_correlation']:.3f}")
-                logger.info(f"  Top-10 overlap: {metrics['top10_overlap']:.3f}")
-                logger.info(f"  Median rank delta: {metrics['median_rank_delta']:.1f}")
-                
-            except Exception as e:
-                logger.error(f"Scenario {scenario_name} failed: {e}")
-                continue
-        
-        # Save overall summary
-        summary = {
-            'timestamp': pd.Timestamp.now().isoformat(),
-            'state': args.state,
-            'genders': genders,
-            'ages': ages,
-            'provider': args.provider,
-            'baseline_teams': len(df_baseline),
-            'scenarios_run': len(scenario_results),
-            'scenario_results': scenario_results
-        }
-        
-        summary_file = output_dir / "tuning_summary.json"
-        with open(summary_file, 'w') as f:
-            json.dump(summary, f, indent=2, default=str)
-        
-        logger.info(f"Tuning complete! Results saved to {output_dir}")
-        logger.info(f"Summary saved to {summary_file}")
+        scenario_results = summary['scenario_results']
         
         # Print summary table
         print("\n" + "="*80)
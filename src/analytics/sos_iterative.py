@@ -10,6 +10,7 @@ import pandas as pd
 import numpy as np
 from typing import Dict, Any, Optional
 import logging
+from itertools import chain
 
 logger = logging.getLogger(__name__)
 
@@ -145,6 +146,110 @@ def compute_baseline_sos(games_df: pd.DataFrame, team_strengths: pd.Series) -> p
     return pd.Series(sos_values)
 
 
+def canonize_ids(ids: pd.Series) -> pd.Series:
+    """
+    Canonicalize a Series of team/opponent IDs in one vectorized pass.
+    
+    Mirrors the scalar rule used by the ranking engine: stringify, strip
+    whitespace and drop a trailing ".0" left over from float coercion.
+    ``None`` values stay null so callers can drop them.
+    
+    Args:
+        ids: Series of raw IDs (any dtype)
+        
+    Returns:
+        Series of canonical string IDs (object dtype, None for missing)
+    """
+    canon = ids.astype(str).str.strip().str.replace(r"\.0$", "", regex=True)
+    is_none = ids.isna() & (canon == "None")
+    return canon.mask(is_none, None)
+
+
+def build_alias_strength_map(team_strength: pd.Series, alias_map: Dict[str, str]) -> pd.Series:
+    """
+    Extend a canonical team strength lookup with every alias ID.
+    
+    The inverse alias index is resolved with a single ``map`` over the alias
+    table, so the cost is O(teams + aliases) rather than scanning the alias
+    map once per team.
+    
+    Args:
+        team_strength: Strength values indexed by canonical team ID
+        alias_map: Mapping of alias ID -> canonical team ID
+        
+    Returns:
+        Strength values indexed by canonical and alias IDs
+    """
+    if not alias_map:
+        return team_strength
+    
+    aliases = pd.Series(alias_map, dtype=object)
+    alias_strength = aliases.map(team_strength).dropna()
+    combined = pd.concat([team_strength, alias_strength])
+    return combined[~combined.index.duplicated(keep='last')]
+
+
+def compute_opponent_sos(team_ids: pd.Series, opponents: pd.Series, team_strength: pd.Series,
+                         alias_map: Optional[Dict[str, str]] = None, baseline: float = 0.35,
+                         repeat_cap: int = 2) -> pd.DataFrame:
+    """
+    Compute raw SOS as the mean strength of each team's resolved opponents.
+    
+    The opponent lists are exploded into a single edge table; aliases are
+    canonicalized with one ``map``, self-loops are dropped, repeat games per
+    opponent are capped with ``groupby().cumcount()`` and the per-team mean
+    is taken over unique opponents with a groupby. Unknown opponents are
+    credited ``baseline`` and teams without opponents get ``baseline``.
+    
+    Args:
+        team_ids: Canonical team IDs, one per team
+        opponents: List-like of raw opponent IDs per team (aligned with team_ids)
+        team_strength: Strength values indexed by canonical team ID
+        alias_map: Optional mapping of alias ID -> canonical team ID
+        baseline: Strength credited for unranked/unknown opponents
+        repeat_cap: Maximum repeat games counted per opponent
+        
+    Returns:
+        DataFrame aligned with team_ids with columns
+        [sos_component, opp_count, unique_opps, missing_opps]
+    """
+    alias_map = alias_map or {}
+    n_teams = len(team_ids)
+    team_pos = np.arange(n_teams)
+    
+    opp_lists = [list(o) if o is not None else [] for o in opponents]
+    opp_count = pd.Series([len(o) for o in opp_lists], index=team_pos)
+    edges = pd.DataFrame({
+        'team_pos': np.repeat(team_pos, opp_count.to_numpy()),
+        'team_id': np.repeat(team_ids.to_numpy(), opp_count.to_numpy()),
+        'opponent': pd.Series(list(chain.from_iterable(opp_lists)), dtype=object),
+    })
+    
+    # Resolve aliases and drop empty IDs and self-loops
+    canon = canonize_ids(edges['opponent'])
+    resolved = canon.map(alias_map) if alias_map else pd.Series(np.nan, index=canon.index)
+    edges['resolved'] = resolved.where(resolved.notna(), canon)
+    edges = edges[edges['resolved'].notna() & (edges['resolved'] != '') &
+                  (edges['resolved'] != edges['team_id'])]
+    
+    # Cap repeat weight per opponent, then average over unique opponents
+    edges = edges[edges.groupby(['team_pos', 'resolved']).cumcount() < repeat_cap]
+    edges = edges.drop_duplicates(['team_pos', 'resolved'])
+    
+    strength_map = build_alias_strength_map(team_strength, alias_map)
+    strengths = edges['resolved'].map(strength_map)
+    edges = edges.assign(strength=strengths.fillna(baseline).astype(float),
+                         missing=strengths.isna())
+    
+    grouped = edges.groupby('team_pos')
+    result = pd.DataFrame(index=team_pos)
+    result['sos_component'] = grouped['strength'].mean().reindex(team_pos).fillna(baseline)
+    result['opp_count'] = opp_count
+    result['unique_opps'] = grouped.size().reindex(team_pos).fillna(0).astype(int)
+    result['missing_opps'] = grouped['missing'].sum().reindex(team_pos).fillna(0).astype(int)
+    return result.reset_index(drop=True)
+
+
 def build_opponent_edges(games_df: pd.DataFrame) -> pd.DataFrame:
     """
     Build opponent edge list from games data.
@@ -8,7 +8,9 @@ used throughout the ranking pipeline.
 
 import pandas as pd
 import numpy as np
-from typing import Dict, Any, Tuple
+from typing import Dict, Any, Optional, Tuple
+import hashlib
+import json
 import logging
 
 logger = logging.getLogger(__name__)
@@ -275,6 +277,144 @@ def compute_bayesian_shrinkage(value: float, sample_size: int, prior_mean: float
     return shrunk
 
 
+def performance_adj_factor(perf_delta: float, performance_k: float, decay_rate: float,
+                           recency_index: int, threshold: float = 1.0,
+                           decay_table: Optional[np.ndarray] = None) -> float:
+    """
+    Apply the apply_performance_multiplier formula with a configurable threshold.
+    
+    Computes (1 + performance_k * sign(perf_delta)) * exp(-decay_rate * recency_index),
+    reading the decay factor from a precomputed table when one is given.
+    
+    Args:
+        perf_delta: Actual minus expected goal differential
+        performance_k: Base performance multiplier
+        decay_rate: Decay rate for recency
+        recency_index: Index of game (0 = most recent)
+        threshold: Minimum |perf_delta| before any adjustment applies
+        decay_table: Optional precomputed decay factors indexed by recency_index
+        
+    Returns:
+        Performance multiplier (1.0 below the threshold)
+    """
+    if abs(perf_delta) < threshold:
+        return 1.0
+    
+    if decay_table is not None and recency_index < len(decay_table):
+        decay_factor = decay_table[recency_index]
+    else:
+        decay_factor = np.exp(-decay_rate * recency_index)
+    
+    return (1 + performance_k * np.sign(perf_delta)) * decay_factor
+
+
+def robust_scale(series: pd.Series) -> pd.Series:
+    """
+    v5.3E-style robust scaling: winsorize at 1-99%, z-score, logistic.
+    
+    Args:
+        series: Raw metric values
+        
+    Returns:
+        Series scaled into (0, 1)
+    """
+    if series.empty:
+        return series
+    
+    p1, p99 = np.nanpercentile(series, [1, 99])
+    s = series.clip(lower=p1, upper=p99)
+    z = (s - s.mean()) / (s.std() or 1.0)
+    return 1.0 / (1.0 + np.exp(-z))
+
+
+robust_scale_logistic = robust_scale
+
+
+# Config keys the precomputed weight tables depend on
+WEIGHT_TABLE_KEYS = [
+    'MAX_GAMES_FOR_RANK', 'RECENT_K', 'RECENT_SHARE',
+    'DAMPEN_TAIL_START', 'DAMPEN_TAIL_END', 'DAMPEN_TAIL_START_WEIGHT', 'DAMPEN_TAIL_END_WEIGHT',
+    'PERFORMANCE_DECAY_RATE', 'PROVISIONAL_ALPHA'
+]
+
+_WEIGHT_TABLE_CACHE: Dict[str, Dict[str, Any]] = {}
+
+
+def weight_table_hash(config: Dict[str, Any]) -> str:
+    """
+    Hash the config values the weight tables depend on.
+    
+    Args:
+        config: Ranking configuration
+        
+    Returns:
+        Short hex digest; configs that only differ in unrelated keys share it
+    """
+    relevant = {key: config.get(key) for key in WEIGHT_TABLE_KEYS}
+    payload = json.dumps(relevant, sort_keys=True, default=str)
+    return hashlib.md5(payload.encode('utf-8')).hexdigest()[:16]
+
+
+def build_weight_tables(config: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Precompute the per-run lookup tables used by the ranking hot loops.
+    
+    Args:
+        config: Ranking configuration
+        
+    Returns:
+        Dictionary with:
+            - tapered: (max_games + 1, max_games) array, row n holds
+              tapered_weights(n, ...) in its first n columns
+            - decay: performance decay factor per game index
+            - gp_mult: game-count multiplier per games played
+            - gp_adj: stepwise provisional floor per games played
+            - config_hash: weight_table_hash(config)
+    """
+    max_games = int(config['MAX_GAMES_FOR_RANK'])
+    tail_cfg = {
+        'tail_start': config['DAMPEN_TAIL_START'],
+        'tail_end': config['DAMPEN_TAIL_END'],
+        'tail_start_weight': config['DAMPEN_TAIL_START_WEIGHT'],
+        'tail_end_weight': config['DAMPEN_TAIL_END_WEIGHT']
+    }
+    
+    tapered = np.zeros((max_games + 1, max(max_games, 1)))
+    for n in range(1, max_games + 1):
+        tapered[n, :n] = tapered_weights(n, config['RECENT_K'], config['RECENT_SHARE'], tail_cfg)
+    
+    gp = np.arange(max_games + 1)
+    gp_adj = np.where(gp < 8, 0.85, np.where(gp < 15, 0.95, 1.0))
+    
+    return {
+        'tapered': tapered,
+        'decay': np.exp(-float(config['PERFORMANCE_DECAY_RATE']) * np.arange(max_games)),
+        'gp_mult': (np.minimum(gp, 20) / 20.0) ** config['PROVISIONAL_ALPHA'],
+        'gp_adj': gp_adj,
+        'config_hash': weight_table_hash(config)
+    }
+
+
+def get_weight_tables(config: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Return the weight tables for a config, building them at most once.
+    
+    Tables are cached by weight_table_hash, so tuner sweeps that only change
+    unrelated parameters reuse the same arrays.
+    
+    Args:
+        config: Ranking configuration
+        
+    Returns:
+        Weight tables as produced by build_weight_tables
+    """
+    key = weight_table_hash(config)
+    if key not in _WEIGHT_TABLE_CACHE:
+        _WEIGHT_TABLE_CACHE[key] = build_weight_tables(config)
+        logger.debug(f"Built weight tables for config {key}")
+    return _WEIGHT_TABLE_CACHE[key]
+
+
 if __name__ == "__main__":
     # Test the statistical utilities
     print("Testing statistical utilities...")
@@ -5,52 +5,166 @@ Safe Write Operations with Atomic Writes and Checksums
 Provides atomic file writing operations that write to temporary files first,
 compute checksums, and then atomically rename to the final destination.
 Includes support for CSV and Parquet formats.
+
+Checksums are computed while the bytes are written (HashingWriter), so a
+write never reads its own output back. The digest algorithm is configurable:
+md5 (default), blake2b, any other hashlib algorithm, or xxhash if installed.
 """
 
 import hashlib
+import io
 import os
 import tempfile
+import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Union, Optional
+from typing import Any, Callable, Dict, List, Union, Optional
 import pandas as pd
 import logging
 
 from src.scraper.utils.logger import get_logger
 
+# Optional fast non-cryptographic hashing
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
+DEFAULT_CHECKSUM_ALGORITHM = 'md5'
+
+
+def new_hasher(algorithm: str = DEFAULT_CHECKSUM_ALGORITHM):
+    """
+    Create a hash object for a checksum algorithm.
+    
+    Args:
+        algorithm: 'md5', 'blake2b', 'xxhash' or any hashlib algorithm name
+        
+    Returns:
+        Object with update() and hexdigest()
+        
+    Raises:
+        ImportError: If 'xxhash' is requested but not installed
+    """
+    if algorithm == 'xxhash':
+        if not XXHASH_AVAILABLE:
+            raise ImportError("xxhash checksums requested but the xxhash package is not installed")
+        return xxhash.xxh3_64()
+    return hashlib.new(algorithm)
+
 
-def compute_file_checksum(file_path: Path, algorithm: str = 'md5') -> str:
+def compute_file_checksum(file_path: Path, algorithm: str = DEFAULT_CHECKSUM_ALGORITHM) -> str:
     """
     Compute checksum for a file.
     
     Args:
         file_path: Path to the file
-        algorithm: Hash algorithm ('md5', 'sha1', 'sha256')
+        algorithm: Hash algorithm ('md5', 'blake2b', 'xxhash', 'sha256', ...)
         
     Returns:
         Hexadecimal checksum string
     """
-    hash_obj = hashlib.new(algorithm)
+    hash_obj = new_hasher(algorithm)
     
     with open(file_path, 'rb') as f:
-        for chunk in iter(lambda: f.read(4096), b""):
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
             hash_obj.update(chunk)
     
     return hash_obj.hexdigest()
 
 
-def safe_write_csv(df: pd.DataFrame, path: Union[str, Path], 
-                   logger: Optional[logging.Logger] = None) -> Dict[str, Union[str, int, Path]]:
+class HashingWriter:
     """
-    Safely write DataFrame to CSV with atomic operation and checksum.
+    Binary file wrapper that hashes bytes as they are written.
+    
+    Lets writers compute a file checksum while streaming output instead of
+    reading the finished file back.
+    """
+    
+    mode = 'wb'
+    
+    def __init__(self, raw, algorithm: str = DEFAULT_CHECKSUM_ALGORITHM):
+        """
+        Wrap an open binary file.
+        
+        Args:
+            raw: File object opened in binary write mode
+            algorithm: Checksum algorithm (see new_hasher)
+        """
+        self._raw = raw
+        self._hash = new_hasher(algorithm)
+        self.algorithm = algorithm
+        self.bytes_written = 0
+    
+    def write(self, data) -> int:
+        """Hash and write a chunk of bytes."""
+        if isinstance(data, memoryview):
+            data = data.tobytes()
+        self._hash.update(data)
+        self.bytes_written += len(data)
+        return self._raw.write(data)
+    
+    def hexdigest(self) -> str:
+        """Return the checksum of everything written so far."""
+        return self._hash.hexdigest()
+    
+    def flush(self) -> None:
+        self._raw.flush()
+    
+    def tell(self) -> int:
+        return self.bytes_written
+    
+    def close(self) -> None:
+        self._raw.close()
+    
+    @property
+    def closed(self) -> bool:
+        return self._raw.closed
+    
+    def writable(self) -> bool:
+        return True
+    
+    def readable(self) -> bool:
+        return False
+    
+    def seekable(self) -> bool:
+        return False
+
+
+def _temp_path_for(path: Path) -> Path:
+    """Return an unused temporary path in the same directory as path."""
+    # Ensure temp file doesn't already exist with max retry counter
+    MAX_TEMP_RETRIES = 10
+    for _ in range(MAX_TEMP_RETRIES):
+        temp_path = path.with_suffix(f".tmp.{uuid.uuid4().hex[:8]}")
+        if not temp_path.exists():
+            return temp_path
+    raise RuntimeError(f"Temp file collision after {MAX_TEMP_RETRIES} attempts, attempted temp_path: {temp_path}")
+
+
+def atomic_hashed_write(path: Union[str, Path], write_fn: Callable[[HashingWriter], None],
+                        algorithm: str = DEFAULT_CHECKSUM_ALGORITHM, fsync: bool = True,
+                        logger: Optional[logging.Logger] = None) -> Dict[str, Any]:
+    """
+    Write a file atomically, hashing its bytes as they are written.
+    
+    write_fn receives a HashingWriter over a temporary file in the destination
+    directory. The temp file is fsynced once and renamed over the destination;
+    on failure it is removed and the destination is left untouched. The write
+    and its checksum are logged at debug level.
     
     Args:
-        df: pandas DataFrame to write
         path: Destination file path
-        logger: Optional logger instance
+        write_fn: Callable that writes the content to the given binary writer
+        algorithm: Checksum algorithm (see new_hasher)
+        fsync: Force the data to disk before the rename
+        logger: Optional logger instance for the write and checksum
         
     Returns:
-        Dictionary with path, checksum, and size information
+        Dictionary with path, checksum, algorithm, size_bytes, duration_seconds
+        and throughput_mb_s
         
     Raises:
         Exception: If write operation fails
@@ -60,63 +174,65 @@ def safe_write_csv(df: pd.DataFrame, path: Union[str, Path],
     
     path = Path(path)
     path.parent.mkdir(parents=True, exist_ok=True)
-    
-    # Create unique temporary file in same directory
-    temp_suffix = f".tmp.{uuid.uuid4().hex[:8]}"
-    temp_path = path.with_suffix(temp_suffix)
-    
-    # Ensure temp file doesn't already exist with max retry counter
-    MAX_TEMP_RETRIES = 10
-    retry_count = 0
-    while temp_path.exists():
-        retry_count += 1
-        if retry_count > MAX_TEMP_RETRIES:
-            raise RuntimeError(f"Temp file collision after {MAX_TEMP_RETRIES} attempts, attempted temp_path: {temp_path}")
-        temp_suffix = f".tmp.{uuid.uuid4().hex[:8]}"
-        temp_path = path.with_suffix(temp_suffix)
+    temp_path = _temp_path_for(path)
+    started = time.perf_counter()
     
     try:
-        logger.info(f"Writing CSV to temporary file: {temp_path}")
-        
-        # Write to temporary file
-        df.to_csv(temp_path, index=False)
-        
-        # Compute checksum
-        checksum = compute_file_checksum(temp_path)
-        size_bytes = temp_path.stat().st_size
+        with open(temp_path, 'wb') as raw:
+            writer = HashingWriter(raw, algorithm)
+            write_fn(writer)
+            if fsync:
+                raw.flush()
+                os.fsync(raw.fileno())
         
         # Atomically rename to final destination
         temp_path.replace(path)
         
-        logger.info(f"Successfully wrote CSV: {path} ({size_bytes:,} bytes, MD5: {checksum})")
-        
-        return {
-            "path": path,
-            "checksum": checksum,
-            "size_bytes": size_bytes,
-            "format": "csv"
-        }
-        
-    except Exception as e:
+    except Exception:
         # Clean up temporary file on error
         if temp_path.exists():
             temp_path.unlink()
-        logger.error(f"Failed to write CSV to {path}: {e}")
+        logger.debug(f"Atomic write to {path} failed, removed {temp_path.name}")
         raise
+    
+    elapsed = time.perf_counter() - started
+    result = {
+        "path": path,
+        "checksum": writer.hexdigest(),
+        "algorithm": algorithm,
+        "size_bytes": writer.bytes_written,
+        "duration_seconds": round(elapsed, 4),
+        "throughput_mb_s": round(writer.bytes_written / 1e6 / elapsed, 2) if elapsed > 0 else 0.0
+    }
+    logger.debug(f"Atomically wrote {path} ({result['size_bytes']:,} bytes, "
+                 f"{algorithm.upper()}: {result['checksum']})")
+    return result
 
 
-def safe_write_parquet(df: pd.DataFrame, path: Union[str, Path],
-                      logger: Optional[logging.Logger] = None) -> Dict[str, Union[str, int, Path]]:
+def _write_text(writer: HashingWriter, write_text: Callable[[io.TextIOBase], None]) -> None:
+    """Run a text-mode writer over a HashingWriter with the platform's newline handling."""
+    text = io.TextIOWrapper(writer, encoding='utf-8')
+    try:
+        write_text(text)
+        text.flush()
+    finally:
+        text.detach()
+
+
+def safe_write_csv(df: pd.DataFrame, path: Union[str, Path], 
+                   logger: Optional[logging.Logger] = None,
+                   algorithm: str = DEFAULT_CHECKSUM_ALGORITHM) -> Dict[str, Union[str, int, Path]]:
     """
-    Safely write DataFrame to Parquet with atomic operation and checksum.
+    Safely write DataFrame to CSV with atomic operation and checksum.
     
     Args:
         df: pandas DataFrame to write
         path: Destination file path
         logger: Optional logger instance
+        algorithm: Checksum algorithm (see new_hasher)
         
     Returns:
-        Dictionary with path, checksum, and size information
+        Dictionary with path, checksum, size and throughput information
         
     Raises:
         Exception: If write operation fails
@@ -124,55 +240,58 @@ def safe_write_parquet(df: pd.DataFrame, path: Union[str, Path],
     if logger is None:
         logger = get_logger(__name__)
     
-    path = Path(path)
-    path.parent.mkdir(parents=True, exist_ok=True)
-    
-    # Create unique temporary file in same directory
-    temp_suffix = f".tmp.{uuid.uuid4().hex[:8]}"
-    temp_path = path.with_suffix(temp_suffix)
-    
-    # Ensure temp file doesn't already exist with max retry counter
-    MAX_TEMP_RETRIES = 10
-    retry_count = 0
-    while temp_path.exists():
-        retry_count += 1
-        if retry_count > MAX_TEMP_RETRIES:
-            raise RuntimeError(f"Temp file collision after {MAX_TEMP_RETRIES} attempts, attempted temp_path: {temp_path}")
-        temp_suffix = f".tmp.{uuid.uuid4().hex[:8]}"
-        temp_path = path.with_suffix(temp_suffix)
-    
     try:
-        logger.info(f"Writing Parquet to temporary file: {temp_path}")
-        
-        # Write to temporary file
-        df.to_parquet(temp_path, index=False)
+        logger.info(f"Writing CSV atomically: {path}")
+        result = atomic_hashed_write(path, lambda writer: df.to_csv(writer, index=False),
+                                     algorithm=algorithm, logger=logger)
+        result["format"] = "csv"
+        logger.info(f"Successfully wrote CSV: {result['path']} ({result['size_bytes']:,} bytes, "
+                    f"{algorithm.upper()}: {result['checksum']}, {result['throughput_mb_s']} MB/s)")
+        return result
         
-        # Compute checksum
-        checksum = compute_file_checksum(temp_path)
-        size_bytes = temp_path.stat().st_size
-        
-        # Atomically rename to final destination
-        temp_path.replace(path)
+    except Exception as e:
+        logger.error(f"Failed to write CSV to {path}: {e}")
+        raise
+
+
+def safe_write_parquet(df: pd.DataFrame, path: Union[str, Path],
+                      logger: Optional[logging.Logger] = None,
+                      algorithm: str = DEFAULT_CHECKSUM_ALGORITHM) -> Dict[str, Union[str, int, Path]]:
+    """
+    Safely write DataFrame to Parquet with atomic operation and checksum.
+    
+    Args:
+        df: pandas DataFrame to write
+        path: Destination file path
+        logger: Optional logger instance
+        algorithm: Checksum algorithm (see new_hasher)
         
-        logger.info(f"Successfully wrote Parquet: {path} ({size_bytes:,} bytes, MD5: {checksum})")
+    Returns:
+        Dictionary with path, checksum, size and throughput information
         
-        return {
-            "path": path,
-            "checksum": checksum,
-            "size_bytes": size_bytes,
-            "format": "parquet"
-        }
+    Raises:
+        Exception: If write operation fails
+    """
+    if logger is None:
+        logger = get_logger(__name__)
+    
+    try:
+        logger.info(f"Writing Parquet atomically: {path}")
+        result = atomic_hashed_write(path, lambda writer: df.to_parquet(writer, index=False),
+                                     algorithm=algorithm, logger=logger)
+        result["format"] = "parquet"
+        logger.info(f"Successfully wrote Parquet: {result['path']} ({result['size_bytes']:,} bytes, "
+                    f"{algorithm.upper()}: {result['checksum']}, {result['throughput_mb_s']} MB/s)")
+        return result
         
     except Exception as e:
-        # Clean up temporary file on error
-        if temp_path.exists():
-            temp_path.unlink()
         logger.error(f"Failed to write Parquet to {path}: {e}")
         raise
 
 
 def safe_write_json(data: Union[dict, list], path: Union[str, Path],
-                   logger: Optional[logging.Logger] = None) -> Dict[str, Union[str, int, Path]]:
+                   logger: Optional[logging.Logger] = None,
+                   algorithm: str = DEFAULT_CHECKSUM_ALGORITHM) -> Dict[str, Union[str, int, Path]]:
     """
     Safely write JSON data with atomic operation and checksum.
     
@@ -180,9 +299,10 @@ def safe_write_json(data: Union[dict, list], path: Union[str, Path],
         data: Dictionary or list to write as JSON
         path: Destination file path
         logger: Optional logger instance
+        algorithm: Checksum algorithm (see new_hasher)
         
     Returns:
-        Dictionary with path, checksum, and size information
+        Dictionary with path, checksum, size and throughput information
         
     Raises:
         Exception: If write operation fails
@@ -192,56 +312,70 @@ def safe_write_json(data: Union[dict, list], path: Union[str, Path],
     if logger is None:
         logger = get_logger(__name__)
     
-    path = Path(path)
-    path.parent.mkdir(parents=True, exist_ok=True)
-    
-    # Create unique temporary file in same directory
-    temp_suffix = f".tmp.{uuid.uuid4().hex[:8]}"
-    temp_path = path.with_suffix(temp_suffix)
-    
-    # Ensure temp file doesn't already exist with max retry counter
-    MAX_TEMP_RETRIES = 10
-    retry_count = 0
-    while temp_path.exists():
-        retry_count += 1
-        if retry_count > MAX_TEMP_RETRIES:
-            raise RuntimeError(f"Temp file collision after {MAX_TEMP_RETRIES} attempts, attempted temp_path: {temp_path}")
-        temp_suffix = f".tmp.{uuid.uuid4().hex[:8]}"
-        temp_path = path.with_suffix(temp_suffix)
-    
     try:
-        logger.info(f"Writing JSON to temporary file: {temp_path}")
-        
-        # Write to temporary file
-        with open(temp_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
-        
-        # Compute checksum
-        checksum = compute_file_checksum(temp_path)
-        size_bytes = temp_path.stat().st_size
-        
-        # Atomically rename to final destination
-        temp_path.replace(path)
-        
-        logger.info(f"Successfully wrote JSON: {path} ({size_bytes:,} bytes, MD5: {checksum})")
-        
-        return {
-            "path": path,
-            "checksum": checksum,
-            "size_bytes": size_bytes,
-            "format": "json"
-        }
+        logger.info(f"Writing JSON atomically: {path}")
+        result = atomic_hashed_write(
+            path,
+            lambda writer: _write_text(writer, lambda f: json.dump(data, f, indent=2, ensure_ascii=False)),
+            algorithm=algorithm,
+            logger=logger
+        )
+        result["format"] = "json"
+        logger.info(f"Successfully wrote JSON: {result['path']} ({result['size_bytes']:,} bytes, "
+                    f"{algorithm.upper()}: {result['checksum']})")
+        return result
         
     except Exception as e:
-        # Clean up temporary file on error
-        if temp_path.exists():
-            temp_path.unlink()
         logger.error(f"Failed to write JSON to {path}: {e}")
         raise
 
 
+def safe_write_partitions(df: pd.DataFrame, by: Union[str, List[str]],
+                          path_for: Callable[[Any], Path], write_parquet: bool = False,
+                          max_workers: int = 8,
+                          logger: Optional[logging.Logger] = None) -> List[Dict[str, Any]]:
+    """
+    Partition a DataFrame once with groupby and write each part on a thread pool.
+    
+    Each partition is written atomically with safe_write_csv (and optionally
+    safe_write_parquet next to it). A failed partition is logged and skipped.
+    
+    Args:
+        df: pandas DataFrame to partition
+        by: Column(s) to partition on; rows with missing keys are skipped
+        path_for: Maps a partition key to its CSV path
+        write_parquet: Also write a .parquet copy of each partition
+        max_workers: Thread pool size
+        logger: Optional logger instance
+        
+    Returns:
+        List of safe_write_csv results (plus partition, rows and parquet_path),
+        in partition key order
+    """
+    if logger is None:
+        logger = get_logger(__name__)
+    
+    def _write(item):
+        key, part = item
+        path = Path(path_for(key))
+        try:
+            result = safe_write_csv(part, path, logger)
+            result.update({"partition": key, "rows": len(part)})
+            if write_parquet:
+                result["parquet_path"] = safe_write_parquet(part, path.with_suffix('.parquet'), logger)["path"]
+            return result
+        except Exception as e:
+            logger.error(f"Failed to write partition {key} to {path}: {e}")
+            return None
+    
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = list(executor.map(_write, df.groupby(by, sort=True)))
+    
+    return [result for result in results if result is not None]
+
+
 def verify_file_integrity(file_path: Path, expected_checksum: str, 
-                         algorithm: str = 'md5') -> bool:
+                         algorithm: str = DEFAULT_CHECKSUM_ALGORITHM) -> bool:
     """
     Verify file integrity by comparing checksums.
     
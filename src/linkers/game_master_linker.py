@@ -214,6 +214,45 @@ def link_games_to_master(
     logger.info(f"Linking complete: {linked}/{total} games linked ({percentage:.1f}%).")
 
 
+def relink_latest_build() -> int:
+    """
+    Re-link every games CSV in the latest build directory to the latest master index.
+    
+    Returns:
+        Number of games files linked
+        
+    Raises:
+        FileNotFoundError: If no build directories exist
+        Exception: If linking any games file fails
+    """
+    # Find latest build directory
+    build_dirs = sorted(Path("data/games").glob("build_*"))
+    if not build_dirs:
+        raise FileNotFoundError("No build directories found")
+    latest_build = build_dirs[-1]
+    print(f"Re-linking games from latest build: {latest_build.name}")
+    
+    # Get master index path
+    master_path = str(latest_master_index())
+    
+    # Link all games CSV files in latest build
+    linked = 0
+    for games_csv in latest_build.glob("games_gotsport_*.csv"):
+        print(f"Linking {games_csv.name}...")
+        try:
+            link_games_to_master(
+                games_path=str(games_csv),
+                master_path=master_path
+            )
+            linked += 1
+        except Exception as e:
+            print(f"Error linking {games_csv.name}: {e}")
+            raise
+    
+    print(f"Successfully re-linked all games from {latest_build.name}")
+    return linked
+
+
 if __name__ == "__main__":
     import sys
     import argparse
@@ -235,30 +274,13 @@ if __name__ == "__main__":
     
     # Handle relink modes
     if args.relink_latest:
-        # Find latest build directory
-        build_dirs = sorted(Path("data/games").glob("build_*"))
-        if not build_dirs:
-            print("No build directories found")
+        try:
+            relink_latest_build()
+        except FileNotFoundError as e:
+            print(e)
+            sys.exit(1)
+        except Exception:
             sys.exit(1)
-        latest_build = build_dirs[-1]
-        print(f"Re-linking games from latest build: {latest_build.name}")
-        
-        # Get master index path
-        master_path = str(latest_master_index())
-        
-        # Link all games CSV files in latest build
-        for games_csv in latest_build.glob("games_gotsport_*.csv"):
-            print(f"Linking {games_csv.name}...")
-            try:
-                link_games_to_master(
-                    games_path=str(games_csv),
-                    master_path=master_path
-                )
-            except Exception as e:
-                print(f"Error linking {games_csv.name}: {e}")
-                sys.exit(1)
-        
-        print(f"Successfully re-linked all games from {latest_build.name}")
         sys.exit(0)
     
     elif args.relink_all:
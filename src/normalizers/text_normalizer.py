@@ -5,10 +5,20 @@ Canonical Name Normalizer
 Normalizes soccer team names for consistent identity matching across different
 data sources. Removes common stopwords and special characters to enable better
 fuzzy matching and duplicate detection.
+
+Normalization is memoized per distinct name (team names repeat heavily across
+audits and rename detection), and normalize_names() handles whole Series with
+vectorized string operations over the unique values only. For scoring many
+pairs, token_id_sets() maps each name to a frozenset of integer token ids once
+so jaccard_scores() compares ids instead of re-splitting strings.
 """
 
 import re
-from typing import Optional
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
 
 
 # Common soccer team stopwords to remove for normalization
@@ -19,6 +29,17 @@ STOPWORDS = {
     "travel", "competitive", "recreation", "recreational"
 }
 
+# Distinct names memoized by the scalar normalizers
+NORMALIZE_CACHE_SIZE = 65536
+
+# Precompiled patterns
+NON_ALNUM_PATTERN = re.compile(r"[^a-z0-9\s]")
+WHITESPACE_PATTERN = re.compile(r"\s+")
+YEAR_PATTERN = re.compile(r"\b(19|20)\d{2}\b")
+# Only [a-z0-9] and whitespace remain when stopwords are removed, so word
+# boundaries are exactly token boundaries
+STOPWORD_PATTERN = re.compile(r"\b(?:" + "|".join(sorted(STOPWORDS)) + r")\b")
+
 
 def normalize_name(name: str) -> str:
     """
@@ -30,6 +51,8 @@ def normalize_name(name: str) -> str:
     3. Remove common soccer stopwords
     4. Strip and collapse multiple spaces
     
+    Results are memoized, so repeated names are only normalized once.
+    
     Args:
         name: Raw team name string
         
@@ -45,23 +68,57 @@ def normalize_name(name: str) -> str:
     if not name or not isinstance(name, str):
         return ""
     
-    # Convert to lowercase
-    normalized = name.lower().strip()
+    return _normalize_cached(name)
+
+
+@lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
+def _normalize_cached(name: str) -> str:
+    """Normalize a non-empty name string (memoized)."""
+    # Lowercase and remove special characters, keep alphanumeric and spaces
+    normalized = NON_ALNUM_PATTERN.sub("", name.lower())
     
-    # Remove special characters, keep alphanumeric and spaces
-    normalized = re.sub(r"[^a-z0-9\s]", "", normalized)
+    # Split into tokens (collapsing whitespace) and filter out stopwords
+    return " ".join(token for token in normalized.split() if token not in STOPWORDS)
+
+
+@lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
+def _name_tokens(name: str) -> FrozenSet[str]:
+    """Return the set of normalized tokens of a name (memoized)."""
+    return frozenset(normalize_name(name).split())
+
+
+def normalize_names(names: Iterable[str]) -> pd.Series:
+    """
+    Normalize many team names at once.
     
-    # Split into tokens and filter out stopwords
-    tokens = normalized.split()
-    filtered_tokens = [token for token in tokens if token not in STOPWORDS]
+    Equivalent to applying normalize_name to each element, but each distinct
+    name is normalized once with vectorized string operations.
     
-    # Join tokens and collapse multiple spaces
-    result = " ".join(filtered_tokens)
+    Args:
+        names: Series or iterable of raw team names (non-strings normalize to "")
+        
+    Returns:
+        Series of normalized names (keeps the index of an input Series)
+    """
+    series = names if isinstance(names, pd.Series) else pd.Series(list(names), dtype=object)
     
-    # Final cleanup - remove extra spaces
-    result = re.sub(r"\s+", " ", result).strip()
+    codes, uniques = pd.factorize(series, use_na_sentinel=True)
+    uniques = pd.Series(uniques, dtype=object)
+    is_text = uniques.map(lambda value: isinstance(value, str))
     
-    return result
+    normalized = pd.Series("", index=uniques.index, dtype=object)
+    if is_text.any():
+        normalized[is_text] = (
+            uniques[is_text].astype(str)
+            .str.lower()
+            .str.replace(NON_ALNUM_PATTERN, "", regex=True)
+            .str.replace(STOPWORD_PATTERN, " ", regex=True)
+            .str.replace(WHITESPACE_PATTERN, " ", regex=True)
+            .str.strip()
+        )
+    
+    values = np.append(normalized.to_numpy(dtype=object), "")  # code -1 (missing) maps to ""
+    return pd.Series(values[codes], index=series.index, dtype=object, name=series.name)
 
 
 def normalize_name_with_year(name: str) -> tuple[str, Optional[str]]:
@@ -84,11 +141,11 @@ def normalize_name_with_year(name: str) -> tuple[str, Optional[str]]:
         return "", None
     
     # Extract year (4 digits)
-    year_match = re.search(r'\b(19|20)\d{2}\b', name)
+    year_match = YEAR_PATTERN.search(name)
     extracted_year = year_match.group(0) if year_match else None
     
     # Remove year from name before normalizing
-    name_without_year = re.sub(r'\b(19|20)\d{2}\b', '', name)
+    name_without_year = YEAR_PATTERN.sub('', name)
     
     # Normalize the name without year
     normalized = normalize_name(name_without_year)
@@ -98,9 +155,10 @@ def normalize_name_with_year(name: str) -> tuple[str, Optional[str]]:
 
 def similarity_score(name1: str, name2: str) -> float:
     """
-    Calculate similarity score between two normalized team names.
+    Calculate similarity between two team names.
     
-    Uses simple token-based similarity (Jaccard similarity).
+    Uses simple token-based similarity (Jaccard similarity) on the
+    normalized names.
     
     Args:
         name1: First team name
@@ -109,20 +167,94 @@ def similarity_score(name1: str, name2: str) -> float:
     Returns:
         Similarity score between 0.0 and 1.0
     """
-    norm1 = normalize_name(name1)
-    norm2 = normalize_name(name2)
-    
-    if not norm1 or not norm2:
+    if not name1 or not name2 or not isinstance(name1, str) or not isinstance(name2, str):
         return 0.0
     
-    tokens1 = set(norm1.split())
-    tokens2 = set(norm2.split())
+    tokens1 = _name_tokens(name1)
+    tokens2 = _name_tokens(name2)
+    
+    if not tokens1 or not tokens2:
+        return 0.0
     
-    intersection = len(tokens1.intersection(tokens2))
-    union = len(tokens1.union(tokens2))
+    intersection = len(tokens1 & tokens2)
+    union = len(tokens1 | tokens2)
     
     return intersection / union if union > 0 else 0.0
 
+
+def token_id_sets(names: Iterable[str], vocabulary: Optional[Dict[str, int]] = None) -> List[FrozenSet[int]]:
+    """
+    Convert team names to sets of integer token ids.
+    
+    Names are normalized with normalize_names and each distinct token is
+    assigned an id. Pass the same vocabulary when encoding both sides of a
+    comparison so their ids agree.
+    
+    Args:
+        names: Series or iterable of raw team names
+        vocabulary: Token -> id mapping, extended in place (new one if None)
+        
+    Returns:
+        One frozenset of token ids per name (empty for names with no tokens)
+    """
+    if vocabulary is None:
+        vocabulary = {}
+    
+    normalized = normalize_names(names)
+    codes, uniques = pd.factorize(normalized)
+    
+    unique_sets = []
+    for value in uniques:
+        ids = set()
+        for token in value.split():
+            token_id = vocabulary.get(token)
+            if token_id is None:
+                token_id = vocabulary[token] = len(vocabulary)
+            ids.add(token_id)
+        unique_sets.append(frozenset(ids))
+    
+    return [unique_sets[code] for code in codes]
+
+
+def jaccard_scores(sets1: List[FrozenSet[int]], sets2: List[FrozenSet[int]]) -> np.ndarray:
+    """
+    Calculate Jaccard similarity for aligned pairs of token id sets.
+    
+    Args:
+        sets1: Token id sets (from token_id_sets)
+        sets2: Token id sets encoded with the same vocabulary
+        
+    Returns:
+        Array of similarity scores (0.0 where either set is empty)
+        
+    Raises:
+        ValueError: If the inputs have different lengths
+    """
+    if len(sets1) != len(sets2):
+        raise ValueError(f"Length mismatch: {len(sets1)} vs {len(sets2)}")
+    
+    scores = np.zeros(len(sets1), dtype=float)
+    for i, (tokens1, tokens2) in enumerate(zip(sets1, sets2)):
+        if tokens1 and tokens2:
+            intersection = len(tokens1 & tokens2)
+            scores[i] = intersection / (len(tokens1) + len(tokens2) - intersection)
+    return scores
+
+
+def similarity_scores(names1: Iterable[str], names2: Iterable[str]) -> np.ndarray:
+    """
+    Calculate similarity_score for many aligned pairs of team names.
+    
+    Args:
+        names1: First team names
+        names2: Second team names (same length)
+        
+    Returns:
+        Array of similarity scores between 0.0 and 1.0
+    """
+    vocabulary: Dict[str, int] = {}
+    return jaccard_scores(token_id_sets(names1, vocabulary), token_id_sets(names2, vocabulary))
+
 def is_likely_same_team(name1: str, name2: str, threshold: float = 0.7) -> bool:
     """
     Determine if two team names likely refer to the same team.
@@ -43,6 +43,7 @@ class UnifiedRegistry:
         self.build_registry_path = self.base_path / "build_registry.json"
         self.metadata_registry_path = self.base_path / "metadata_registry.json"
         self.history_registry_path = self.base_path / "history_registry.json"
+        self.stage_fingerprints_path = self.base_path / "stage_fingerprints.json"
         
         self.logger = logging.getLogger(__name__)
         
@@ -454,6 +455,47 @@ class UnifiedRegistry:
         
         return summary
     
+    # ============================================================================
+    # STAGE FINGERPRINT METHODS
+    # ============================================================================
+    
+    def get_stage_fingerprint(self, stage_key: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the fingerprint recorded for the last successful run of a pipeline stage.
+        
+        Args:
+            stage_key: Stage identifier (e.g., "Normalizer" or "Ranking Engine:AZ")
+            
+        Returns:
+            Dictionary with fingerprint, parts, outputs and recorded_at, or None
+        """
+        return self._load_stage_fingerprints().get(stage_key)
+    
+    def record_stage_fingerprint(self, stage_key: str, fingerprint: str,
+                                 parts: Dict[str, str], outputs: Any) -> None:
+        """
+        Record the fingerprint and outputs of a successful pipeline stage run.
+        
+        Args:
+            stage_key: Stage identifier
+            fingerprint: Combined digest of the stage inputs, config and code
+            parts: Digest of each fingerprint component (used to explain reruns)
+            outputs: JSON-serializable outputs that can be reused on a skip
+        """
+        fingerprints = self._load_stage_fingerprints()
+        fingerprints[stage_key] = {
+            "fingerprint": fingerprint,
+            "parts": parts,
+            "outputs": outputs,
+            "recorded_at": datetime.now(timezone.utc).isoformat()
+        }
+        self._save_stage_fingerprints(fingerprints)
+        self.logger.debug(f"Recorded fingerprint for stage {stage_key}")
+    
+    def list_stage_fingerprints(self) -> Dict[str, Any]:
+        """Get all recorded stage fingerprints."""
+        return self._load_stage_fingerprints()
+    
     # ============================================================================
     # UNIFIED METHODS
     # ============================================================================
@@ -575,6 +617,22 @@ class UnifiedRegistry:
         """Save history registry to JSON file."""
         self._atomic_save(self.history_registry_path, registry)
     
+    def _load_stage_fingerprints(self) -> Dict[str, Any]:
+        """Load stage fingerprints from JSON file."""
+        if not self.stage_fingerprints_path.exists():
+            return {}
+        
+        try:
+            with open(self.stage_fingerprints_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (json.JSONDecodeError, IOError) as e:
+            self.logger.warning(f"Could not load stage fingerprints: {e}")
+            return {}
+    
+    def _save_stage_fingerprints(self, fingerprints: Dict[str, Any]) -> None:
+        """Save stage fingerprints to JSON file."""
+        self._atomic_save(self.stage_fingerprints_path, fingerprints)
+    
     def _atomic_save(self, file_path: Path, data: Any) -> None:
         """Save data to file using atomic write pattern."""
         # Create unique temporary file
@@ -0,0 +1,21 @@
+#!/usr/bin/env python3
+"""
+Shared Schema Constants
+
+Patterns and allowed values used by both the master team and game history
+schemas (Pandera models and fast validation profiles).
+"""
+
+AGE_GROUP_PATTERN = r"^U(1[0-8]|[0-9])$"
+STATE_PATTERN = r"^[A-Z]{2}$"
+ISO_TIMESTAMP_PATTERN = r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(\.\d+)?Z?$"
+
+# US state codes (50 states + DC)
+US_STATE_CODES = frozenset({
+    'AL', 'AK', 'AZ', 'AR', 'CA', 'CO', 'CT', 'DE', 'FL', 'GA',
+    'HI', 'ID', 'IL', 'IN', 'IA', 'KS', 'KY', 'LA', 'ME', 'MD',
+    'MA', 'MI', 'MN', 'MS', 'MO', 'MT', 'NE', 'NV', 'NH', 'NJ',
+    'NM', 'NY', 'NC', 'ND', 'OH', 'OK', 'OR', 'PA', 'RI', 'SC',
+    'SD', 'TN', 'TX', 'UT', 'VT', 'VA', 'WA', 'WV', 'WI', 'WY',
+    'DC'
+})
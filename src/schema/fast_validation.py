@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+"""
+Tiered Schema Validation
+
+Full Pandera validation coerces a copy of the frame and runs element-wise
+checks on every row, which dominates write time for national outputs. This
+module adds cheaper tiers driven by a per-schema "fast profile" (a plain dict
+of column rules kept next to each Pandera model):
+
+- full:    Pandera schema on every row (coerced copy returned)
+- fast:    vectorized presence/nullability/regex/isin/range checks on every
+           row through pandas string methods, without copying the frame
+- sampled: fast checks on every row plus the full Pandera schema on N random
+           rows and every row touched since the last build
+- auto:    full for frames up to FULL_VALIDATION_MAX_ROWS rows, sampled above
+
+Fast checks collect every failure before raising (lazy) unless lazy=False.
+Every mode returns the same dtypes: fast and sampled apply the profile's
+per-column "dtype" to a shallow copy, replacing only columns that differ.
+"""
+
+import logging
+from typing import Any, Callable, Dict, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+VALIDATION_MODES = ("full", "fast", "sampled", "auto")
+
+# Frames up to this size are always fully validated in auto mode
+FULL_VALIDATION_MAX_ROWS = 50_000
+
+# Random rows fully validated in sampled mode (in addition to touched rows)
+DEFAULT_SAMPLE_SIZE = 5_000
+
+# Failure values kept per failed check
+MAX_FAILURE_CASES = 5
+
+
+class FastValidationError(ValueError):
+    """Raised when fast schema checks fail; failure_cases lists every failed check."""
+
+    def __init__(self, message: str, failure_cases: pd.DataFrame):
+        super().__init__(message)
+        self.failure_cases = failure_cases
+
+
+def resolve_mode(mode: str, n_rows: int) -> str:
+    """
+    Resolve a validation mode name ("auto" picks by frame size).
+
+    Args:
+        mode: One of VALIDATION_MODES
+        n_rows: Number of rows to validate
+
+    Returns:
+        "full", "fast" or "sampled"
+    """
+    if mode not in VALIDATION_MODES:
+        raise ValueError(f"Unknown validation mode '{mode}' (expected one of {VALIDATION_MODES})")
+    if mode == "auto":
+        return "full" if n_rows <= FULL_VALIDATION_MAX_ROWS else "sampled"
+    return mode
+
+
+def touched_since(df: pd.DataFrame, column: str, since: Optional[str]) -> pd.Series:
+    """
+    Mark rows whose ISO timestamp column is at or after a cutoff.
+
+    Args:
+        df: DataFrame to inspect
+        column: ISO timestamp column (e.g. scraped_at, created_at)
+        since: ISO timestamp of the last build (None marks nothing)
+
+    Returns:
+        Boolean mask aligned with df
+    """
+    if since is None or column not in df.columns:
+        return pd.Series(False, index=df.index)
+    # ISO timestamps order lexicographically
+    return df[column].astype(str) >= since
+
+
+def _as_strings(series: pd.Series) -> pd.Series:
+    """Return a string view of a column (no copy for object/string columns)."""
+    if pd.api.types.is_object_dtype(series) or pd.api.types.is_string_dtype(series):
+        return series
+    return series.astype(str)
+
+
+def _invalid_values(series: pd.Series, is_valid: Callable[[pd.Series], pd.Series]) -> pd.Series:
+    """
+    Apply an element-wise check once per distinct value.
+
+    Codes, states, dates and timestamps repeat heavily, so checking the
+    factorized uniques and mapping back is much cheaper than checking every row.
+    Nulls are never flagged here (nullability is checked separately).
+    """
+    codes, uniques = pd.factorize(series)
+    valid = np.asarray(is_valid(pd.Series(uniques)), dtype=bool)
+    invalid = np.zeros(len(series), dtype=bool)
+    present = codes >= 0
+    invalid[present] = ~valid[codes[present]]
+    return pd.Series(invalid, index=series.index)
+
+
+def _column_failures(series: pd.Series, rule: Dict[str, Any]) -> Dict[str, pd.Series]:
+    """Evaluate one column rule; returns {check name: failing-row mask}."""
+    failures = {}
+    nulls = series.isna()
+    if not rule.get("nullable", False):
+        failures["not_nullable"] = nulls
+
+    present = ~nulls
+    if "pattern" in rule:
+        failures[f"str_matches('{rule['pattern']}')"] = _invalid_values(
+            series, lambda values: _as_strings(values).str.match(rule["pattern"], na=False)
+        )
+    if "isin" in rule:
+        failures["isin"] = present & ~series.isin(rule["isin"])
+    if "date_format" in rule:
+        failures[f"date_format('{rule['date_format']}')"] = _invalid_values(
+            series, lambda values: pd.to_datetime(values, format=rule["date_format"], errors="coerce").notna()
+        )
+    if "ge" in rule or "le" in rule:
+        numbers = pd.to_numeric(series, errors="coerce")
+        failures["numeric"] = present & numbers.isna()
+        if "ge" in rule:
+            failures[f"greater_than_or_equal_to({rule['ge']})"] = numbers < rule["ge"]
+        if "le" in rule:
+            failures[f"less_than_or_equal_to({rule['le']})"] = numbers > rule["le"]
+    return failures
+
+
+def fast_validate(df: pd.DataFrame, profile: Dict[str, Any], lazy: bool = True) -> pd.DataFrame:
+    """
+    Run vectorized profile checks on every row without copying the frame.
+
+    Args:
+        df: DataFrame to validate
+        profile: {"columns": {name: rule}, "frame_checks": {name: callable}} where
+            a rule may set required, nullable, pattern, isin, date_format, ge, le
+            (and dtype, used by coerce_columns) and a frame check returns a boolean Series (True = valid)
+        lazy: Collect every failure before raising (False stops at the first)
+
+    Returns:
+        The input DataFrame (unchanged)
+
+    Raises:
+        FastValidationError: If any check fails
+    """
+    failures: List[Dict[str, Any]] = []
+
+    def _fail(column: Optional[str], check: str, mask: Optional[pd.Series] = None) -> None:
+        entry = {"column": column, "check": check, "failure_count": 0, "failure_cases": []}
+        if mask is not None:
+            entry["failure_count"] = int(mask.sum())
+            values = df.loc[mask, column] if column in df.columns else df.index[mask.to_numpy()]
+            entry["failure_cases"] = list(pd.unique(np.asarray(values, dtype=object))[:MAX_FAILURE_CASES])
+        failures.append(entry)
+        if not lazy:
+            raise _error(failures, len(df))
+
+    for column, rule in profile.get("columns", {}).items():
+        if column not in df.columns:
+            if rule.get("required", True):
+                _fail(column, "column_in_dataframe")
+            continue
+        for check, mask in _column_failures(df[column], rule).items():
+            if mask.any():
+                _fail(column, check, mask)
+
+    for check, func in profile.get("frame_checks", {}).items():
+        try:
+            valid = func(df)
+        except KeyError:
+            # Frame checks need columns already reported missing
+            continue
+        invalid = ~valid.fillna(False).astype(bool)
+        if invalid.any():
+            _fail(None, check, invalid)
+
+    if failures:
+        raise _error(failures, len(df))
+    return df
+
+
+def _needs_coercion(series: pd.Series, dtype: Any) -> bool:
+    """Check whether a column differs from the dtype the Pandera schema coerces to."""
+    if dtype is str:
+        # Object columns already holding only strings (and nulls) are left as-is
+        return not (pd.api.types.is_object_dtype(series)
+                    and pd.api.types.infer_dtype(series, skipna=True) in ("string", "empty"))
+    return series.dtype != pd.api.types.pandas_dtype(dtype)
+
+
+def coerce_columns(df: pd.DataFrame, profile: Dict[str, Any]) -> pd.DataFrame:
+    """
+    Coerce columns to the dtypes the full Pandera schema produces.
+
+    Args:
+        df: DataFrame that passed fast_validate
+        profile: Fast profile whose column rules may set "dtype" (str or a pandas dtype)
+
+    Returns:
+        Shallow copy of df with only the differing columns replaced
+    """
+    coerced = df.copy(deep=False)
+    for column, rule in profile.get("columns", {}).items():
+        dtype = rule.get("dtype")
+        if dtype is None or column not in df.columns or not _needs_coercion(df[column], dtype):
+            continue
+        series = df[column]
+        if dtype is str:
+            # Nulls stay null instead of becoming the string 'nan'
+            coerced[column] = series.astype(object).where(series.isna(), series.astype(str))
+        else:
+            coerced[column] = series.astype(dtype)
+    return coerced
+
+
+def _error(failures: List[Dict[str, Any]], n_rows: int) -> FastValidationError:
+    failure_cases = pd.DataFrame(failures)
+    summary = "; ".join(
+        f"{f['column'] or '<frame>'}: {f['check']} ({f['failure_count']} rows)" for f in failures
+    )
+    return FastValidationError(f"Fast schema validation failed on {n_rows} rows: {summary}", failure_cases)
+
+
+def sample_rows(df: pd.DataFrame, sample_size: int = DEFAULT_SAMPLE_SIZE,
+                touched: Optional[Union[pd.Series, pd.Index, List[Any]]] = None,
+                random_state: int = 42) -> pd.DataFrame:
+    """
+    Select N random rows plus every touched row.
+
+    Args:
+        df: DataFrame to sample
+        sample_size: Number of random rows
+        touched: Boolean mask aligned with df, or index labels of touched rows
+        random_state: Seed for reproducible samples
+
+    Returns:
+        Subset of df (original row order)
+    """
+    n = len(df)
+    rng = np.random.default_rng(random_state)
+    keep = np.zeros(n, dtype=bool)
+    keep[rng.choice(n, size=min(sample_size, n), replace=False)] = True
+
+    if touched is not None:
+        if isinstance(touched, pd.Series) and touched.dtype == bool:
+            keep |= touched.reindex(df.index, fill_value=False).to_numpy()
+        else:
+            keep |= df.index.isin(touched)
+
+    return df[keep]
+
+
+def validate_tiered(df: pd.DataFrame, full_validate: Callable[[pd.DataFrame], pd.DataFrame],
+                    profile: Dict[str, Any], mode: str = "auto", sample_size: int = DEFAULT_SAMPLE_SIZE,
+                    touched: Optional[Union[pd.Series, pd.Index, List[Any]]] = None, lazy: bool = True,
+                    logger: Optional[logging.Logger] = None) -> pd.DataFrame:
+    """
+    Validate a frame with the requested tier.
+
+    Args:
+        df: DataFrame to validate
+        full_validate: Callable running the full Pandera schema on a frame
+        profile: Fast profile for the schema (see fast_validate)
+        mode: One of VALIDATION_MODES
+        sample_size: Random rows fully validated in sampled mode
+        touched: Rows changed since the last build (always fully validated when sampling)
+        lazy: Collect every fast-check failure before raising
+        logger: Optional logger instance
+
+    Returns:
+        Validated DataFrame with the schema's dtypes (coerced copy in every mode)
+    """
+    logger = logger or logging.getLogger(__name__)
+    resolved = resolve_mode(mode, len(df))
+
+    if resolved == "full":
+        return full_validate(df)
+
+    fast_validate(df, profile, lazy=lazy)
+    if resolved == "fast":
+        logger.info(f"Fast schema validation passed on {len(df):,} rows")
+        return coerce_columns(df, profile)
+
+    subset = sample_rows(df, sample_size, touched)
+    full_validate(subset)
+    logger.info(f"Sampled schema validation passed: fast checks on {len(df):,} rows, "
+                f"full schema on {len(subset):,} sampled/touched rows")
+    return coerce_columns(df, profile)
@@ -14,6 +14,12 @@ import re
 import pandas as pd
 import logging
 
+from src.schema.constants import AGE_GROUP_PATTERN, ISO_TIMESTAMP_PATTERN, STATE_PATTERN, US_STATE_CODES
+from src.schema.fast_validation import DEFAULT_SAMPLE_SIZE, FastValidationError, validate_tiered
+
+# Patterns and allowed values shared by the Pandera model and the fast profile
+GAME_DATE_PATTERN = r"^\d{4}-\d{2}-\d{2}$"
+
 
 def sanitize_error_message(error_msg: str, max_length: int = 500) -> str:
     """
@@ -94,7 +100,7 @@ class GameHistorySchema(pa.DataFrameModel):
     # Game metadata
     age_group: Series[str] = pa.Field(
         description="Age group display format (U10, U11, etc.)",
-        regex=r"^U(1[0-8]|[0-9])$"
+        regex=AGE_GROUP_PATTERN
     )
     
     gender: Series[str] = pa.Field(
@@ -104,13 +110,13 @@ class GameHistorySchema(pa.DataFrameModel):
     
     state: Series[str] = pa.Field(
         description="2-letter US state code",
-        regex=r"^[A-Z]{2}$"
+        regex=STATE_PATTERN
     )
     
     # Game details
     game_date: Series[str] = pa.Field(
         description="Game date in YYYY-MM-DD format",
-        regex=r"^\d{4}-\d{2}-\d{2}$"
+        regex=GAME_DATE_PATTERN
     )
     
     home_away: Series[str] = pa.Field(
@@ -158,7 +164,7 @@ class GameHistorySchema(pa.DataFrameModel):
     
     scraped_at: Series[str] = pa.Field(
         description="ISO timestamp when data was scraped",
-        regex=r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(\.\d+)?Z?$"
+        regex=ISO_TIMESTAMP_PATTERN
     )
     
     class Config:
@@ -193,17 +199,34 @@ def valid_game_date_format_check(df: DataFrame) -> Series[bool]:
 
 def valid_us_state_codes_check(series: Series[str]) -> Series[bool]:
     """Validate that state codes are valid US states."""
-    # US state codes (50 states + DC)
-    valid_states = {
-        'AL', 'AK', 'AZ', 'AR', 'CA', 'CO', 'CT', 'DE', 'FL', 'GA',
-        'HI', 'ID', 'IL', 'IN', 'IA', 'KS', 'KY', 'LA', 'ME', 'MD',
-        'MA', 'MI', 'MN', 'MS', 'MO', 'MT', 'NE', 'NV', 'NH', 'NJ',
-        'NM', 'NY', 'NC', 'ND', 'OH', 'OK', 'OR', 'PA', 'RI', 'SC',
-        'SD', 'TN', 'TX', 'UT', 'VT', 'VA', 'WA', 'WV', 'WI', 'WY',
-        'DC'  # District of Columbia
+    return series.isin(US_STATE_CODES)
+
+
+# Vectorized equivalent of GameHistorySchema for fast/sampled validation
+GAMES_FAST_PROFILE = {
+    "columns": {
+        "provider": {"dtype": str},
+        "team_id_source": {"dtype": str},
+        "team_id_master": {"dtype": str},
+        "team_name": {"dtype": str},
+        "club_name": {"dtype": str, "required": False, "nullable": True},
+        "opponent_name": {"dtype": str},
+        "opponent_id": {"dtype": str, "required": False, "nullable": True},
+        "age_group": {"dtype": str, "pattern": AGE_GROUP_PATTERN},
+        "gender": {"dtype": str, "isin": ["M", "F"]},
+        "state": {"dtype": str, "pattern": STATE_PATTERN, "isin": US_STATE_CODES},
+        "game_date": {"dtype": str, "pattern": GAME_DATE_PATTERN, "date_format": "%Y-%m-%d"},
+        "home_away": {"dtype": str, "isin": ["H", "A"]},
+        "goals_for": {"dtype": "Int64", "required": False, "nullable": True, "ge": 0},
+        "goals_against": {"dtype": "Int64", "required": False, "nullable": True, "ge": 0},
+        "result": {"dtype": str, "isin": ["W", "L", "D", "U"]},
+        "competition": {"dtype": str, "required": False, "nullable": True},
+        "venue": {"dtype": str, "required": False, "nullable": True},
+        "city": {"dtype": str, "required": False, "nullable": True},
+        "source_url": {"dtype": str},
+        "scraped_at": {"dtype": str, "pattern": ISO_TIMESTAMP_PATTERN}
     }
-    
-    return series.isin(valid_states)
+}
 
 
 class ClubLookupSchema(pa.DataFrameModel):
@@ -228,7 +251,7 @@ class ClubLookupSchema(pa.DataFrameModel):
     
     state: Series[str] = pa.Field(
         description="2-letter US state code",
-        regex=r"^[A-Z]{2}$"
+        regex=STATE_PATTERN
     )
     
     city: Optional[Series[str]] = pa.Field(
@@ -243,12 +266,12 @@ class ClubLookupSchema(pa.DataFrameModel):
     
     first_seen_at: Series[str] = pa.Field(
         description="ISO timestamp when club was first seen",
-        regex=r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(\.\d+)?Z?$"
+        regex=ISO_TIMESTAMP_PATTERN
     )
     
     last_seen_at: Series[str] = pa.Field(
         description="ISO timestamp when club was last seen",
-        regex=r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(\.\d+)?Z?$"
+        regex=ISO_TIMESTAMP_PATTERN
     )
     
     source_url: Series[str] = pa.Field(
@@ -261,13 +284,20 @@ class ClubLookupSchema(pa.DataFrameModel):
         strict = False
 
 
-def validate_games_dataframe(df, schema: GameHistorySchema = GameHistorySchema):
+def validate_games_dataframe(df, schema: GameHistorySchema = GameHistorySchema, mode: str = "auto",
+                             sample_size: int = DEFAULT_SAMPLE_SIZE, touched=None, lazy: bool = True):
     """
     Validate a DataFrame against the GameHistorySchema.
     
     Args:
         df: pandas DataFrame to validate
         schema: Pandera schema class (default: GameHistorySchema)
+        mode: "full", "fast", "sampled" or "auto" (see src.schema.fast_validation);
+            fast checks use GAMES_FAST_PROFILE
+        sample_size: Random rows fully validated in sampled mode
+        touched: Rows changed since the last build (mask or index labels), always
+            fully validated in sampled mode
+        lazy: Collect every fast-check failure before raising
         
     Returns:
         Validated DataFrame
@@ -278,8 +308,8 @@ def validate_games_dataframe(df, schema: GameHistorySchema = GameHistorySchema):
     logger = logging.getLogger(__name__)
     
     try:
-        # Create a copy to avoid modifying the original DataFrame
-        df_clean = df.copy()
+        # Shallow copy: only the goal columns are replaced, the original is untouched
+        df_clean = df.copy(deep=False)
         
         # Handle nullable integer fields properly
         if 'goals_for' in df_clean.columns:
@@ -301,9 +331,10 @@ def validate_games_dataframe(df, schema: GameHistorySchema = GameHistorySchema):
             missing_goals_against = df_clean['goals_against'].isna().sum()
             logger.info(f"Found {missing_goals_against} rows with missing goals_against data")
         
-        validated_df = schema.validate(df_clean)
+        validated_df = validate_tiered(df_clean, schema.validate, GAMES_FAST_PROFILE, mode,
+                                       sample_size, touched, lazy, logger)
         return validated_df
-    except (pa.errors.SchemaError, pa.errors.SchemaErrors) as e:
+    except (pa.errors.SchemaError, pa.errors.SchemaErrors, FastValidationError) as e:
         # Log detailed error information
         logger.exception("Game history schema validation failed")
         logger.debug(f"DataFrame shape: {df.shape}")
@@ -321,7 +352,7 @@ def validate_games_dataframe(df, schema: GameHistorySchema = GameHistorySchema):
         sanitized_error = sanitize_error_message(error_msg)
         
         # Re-raise with sanitized message
-        raise pa.errors.SchemaError(data=None, message=sanitized_error) from e
+        raise pa.errors.SchemaError(schema=None, data=None, message=sanitized_error) from e
 
 
 def validate_club_lookup_dataframe(df, schema: ClubLookupSchema = ClubLookupSchema):
@@ -361,7 +392,7 @@ def validate_club_lookup_dataframe(df, schema: ClubLookupSchema = ClubLookupSche
         sanitized_error = sanitize_error_message(error_msg)
         
         # Re-raise with sanitized message
-        raise pa.errors.SchemaError(data=None, message=sanitized_error) from e
+        raise pa.errors.SchemaError(schema=None, data=None, message=sanitized_error) from e
 
 
 def get_games_schema_summary() -> dict:
@@ -12,6 +12,12 @@ from pandera.typing import Series, DataFrame
 from typing import Optional
 import re
 
+from src.schema.constants import AGE_GROUP_PATTERN, ISO_TIMESTAMP_PATTERN, STATE_PATTERN, US_STATE_CODES
+from src.schema.fast_validation import DEFAULT_SAMPLE_SIZE, FastValidationError, validate_tiered
+
+# Patterns and allowed values shared by the Pandera model and the fast profile
+TEAM_ID_PATTERN = r"^[a-f0-9]{12}$"
+
 
 class MasterTeamSchema(pa.DataFrameModel):
     """
@@ -40,7 +46,7 @@ class MasterTeamSchema(pa.DataFrameModel):
     # Core identity fields
     team_id: Series[str] = pa.Field(
         description="Deterministic team ID hash (12 characters)",
-        regex=r"^[a-f0-9]{12}$"
+        regex=TEAM_ID_PATTERN
     )
     
     provider_team_id: Optional[Series[str]] = pa.Field(
@@ -55,7 +61,7 @@ class MasterTeamSchema(pa.DataFrameModel):
     # Age fields (both string and numeric)
     age_group: Series[str] = pa.Field(
         description="Age group display format (U10, U11, etc.)",
-        regex=r"^U(1[0-8]|[0-9])$"
+        regex=AGE_GROUP_PATTERN
     )
     
     age_u: Series[int] = pa.Field(
@@ -72,7 +78,7 @@ class MasterTeamSchema(pa.DataFrameModel):
     
     state: Series[str] = pa.Field(
         description="2-letter US state code",
-        regex=r"^[A-Z]{2}$"
+        regex=STATE_PATTERN
     )
     
     # Provider information
@@ -92,7 +98,7 @@ class MasterTeamSchema(pa.DataFrameModel):
     created_at: Optional[Series[str]] = pa.Field(
         description="ISO timestamp when record was created",
         nullable=True,
-        regex=r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(\.\d+)?Z?$"
+        regex=ISO_TIMESTAMP_PATTERN
     )
     
     class Config:
@@ -103,45 +109,70 @@ class MasterTeamSchema(pa.DataFrameModel):
     @pa.dataframe_check
     def age_group_matches_age_u(cls, df: DataFrame) -> Series[bool]:
         """Validate that age_group format matches age_u value."""
-        # Build expected age_group string for each row
-        expected_age_group = "U" + df["age_u"].astype(str)
-        # Compare actual age_group with expected format
-        return df["age_group"] == expected_age_group
+        return age_group_matches_age_u_check(df)
     
     @pa.check("state")
     def valid_us_state_codes(cls, series: Series[str]) -> Series[bool]:
         """Validate that state codes are valid US states."""
-        # US state codes (50 states + DC)
-        valid_states = {
-            'AL', 'AK', 'AZ', 'AR', 'CA', 'CO', 'CT', 'DE', 'FL', 'GA',
-            'HI', 'ID', 'IL', 'IN', 'IA', 'KS', 'KY', 'LA', 'ME', 'MD',
-            'MA', 'MI', 'MN', 'MS', 'MO', 'MT', 'NE', 'NV', 'NH', 'NJ',
-            'NM', 'NY', 'NC', 'ND', 'OH', 'OK', 'OR', 'PA', 'RI', 'SC',
-            'SD', 'TN', 'TX', 'UT', 'VT', 'VA', 'WA', 'WV', 'WI', 'WY',
-            'DC'  # District of Columbia
-        }
-        
-        return series.isin(valid_states)
+        return series.isin(US_STATE_CODES)
+
+
+def age_group_matches_age_u_check(df: DataFrame) -> Series[bool]:
+    """Validate that age_group format matches age_u value."""
+    # Build expected age_group string for each row
+    expected_age_group = "U" + df["age_u"].astype(str)
+    # Compare actual age_group with expected format
+    return df["age_group"] == expected_age_group
+
+
+# Vectorized equivalent of MasterTeamSchema for fast/sampled validation
+MASTER_TEAM_FAST_PROFILE = {
+    "columns": {
+        "team_id": {"dtype": str, "pattern": TEAM_ID_PATTERN},
+        "provider_team_id": {"dtype": str, "required": False, "nullable": True},
+        "team_name": {"dtype": str},
+        "age_group": {"dtype": str, "pattern": AGE_GROUP_PATTERN},
+        "age_u": {"dtype": "int64", "ge": 10, "le": 18},
+        "gender": {"dtype": str, "isin": ["M", "F"]},
+        "state": {"dtype": str, "pattern": STATE_PATTERN, "isin": US_STATE_CODES},
+        "provider": {"dtype": str},
+        "club_name": {"dtype": str, "required": False, "nullable": True},
+        "source_url": {"dtype": str},
+        "created_at": {"dtype": str, "required": False, "nullable": True, "pattern": ISO_TIMESTAMP_PATTERN}
+    },
+    "frame_checks": {
+        "age_group_matches_age_u": age_group_matches_age_u_check
+    }
+}
 
 
-def validate_dataframe(df, schema: MasterTeamSchema = MasterTeamSchema):
+def validate_dataframe(df, schema: MasterTeamSchema = MasterTeamSchema, mode: str = "full",
+                       sample_size: int = DEFAULT_SAMPLE_SIZE, touched=None, lazy: bool = True):
     """
     Validate a DataFrame against the MasterTeamSchema.
     
     Args:
         df: pandas DataFrame to validate
         schema: Pandera schema class (default: MasterTeamSchema)
+        mode: "full", "fast", "sampled" or "auto" (see src.schema.fast_validation);
+            fast checks use MASTER_TEAM_FAST_PROFILE
+        sample_size: Random rows fully validated in sampled mode
+        touched: Rows changed since the last build (mask or index labels), always
+            fully validated in sampled mode
+        lazy: Collect every fast-check failure before raising
         
     Returns:
         Validated DataFrame
         
     Raises:
         pa.errors.SchemaError: If validation fails
+        FastValidationError: If fast checks fail
     """
     try:
-        validated_df = schema.validate(df)
+        validated_df = validate_tiered(df, schema.validate, MASTER_TEAM_FAST_PROFILE, mode,
+                                       sample_size, touched, lazy)
         return validated_df
-    except (pa.errors.SchemaError, pa.errors.SchemaErrors) as e:
+    except (pa.errors.SchemaError, pa.errors.SchemaErrors, FastValidationError) as e:
         # Provide more detailed error information
         print(f"Schema validation failed:")
         print(f"Error: {e}")
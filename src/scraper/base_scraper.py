@@ -13,7 +13,7 @@ the required abstract methods.
 
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Union
 import pandas as pd
 import logging
 import requests
@@ -61,7 +61,8 @@ class BaseScraper(ABC):
         
         Args:
             url: The URL to fetch
-            js_render: Whether to enable JavaScript rendering (only used with ZenRows)
+            js_render: Whether JavaScript rendering may be used (ZenRows renders only
+                when a static fetch fails)
             **kwargs: Additional parameters for requests or ZenRows
             
         Returns:
@@ -69,18 +70,26 @@ class BaseScraper(ABC):
         """
         if self.use_zenrows:
             try:
-                # Import ZenRows client
-                from src.scraper.utils.zenrows_client import fetch_with_zenrows
-                
-                self.logger.info(f"🔧 Using ZenRows for rendering: {url}")
-                return fetch_with_zenrows(url, js_render=js_render, params=kwargs)
-                
+                # Import the shared ZenRows client
+                from src.scraper.utils.zenrows_client import get_zenrows_client
             except ImportError:
                 self.logger.warning("⚠️ ZenRows client not available, falling back to standard requests")
                 return self._fetch_with_requests(url, **kwargs)
+
+            # Render only when a static fetch through ZenRows is not enough
+            mode = "auto" if js_render else False
+            self.logger.info(f"🔧 Using ZenRows (js_render={mode}): {url}")
+            try:
+                result = get_zenrows_client().fetch(url, js_render=mode, params=kwargs)
             except Exception as e:
                 self.logger.error(f"❌ ZenRows request failed: {e}, falling back to standard requests")
                 return self._fetch_with_requests(url, **kwargs)
+            if result["ok"]:
+                return result["content"]
+
+            self.logger.error(f"❌ ZenRows request failed ({result['error_type']}): {result['error']}, "
+                              f"falling back to standard requests")
+            return self._fetch_with_requests(url, **kwargs)
         else:
             return self._fetch_with_requests(url, **kwargs)
     
@@ -119,7 +128,7 @@ class BaseScraper(ABC):
             return ""
     
     @abstractmethod
-    def fetch_raw_data(self, *args, **kwargs) -> List[Dict[str, Any]]:
+    def fetch_raw_data(self, *args, **kwargs) -> Union[pd.DataFrame, List[Dict[str, Any]]]:
         """
         Fetch raw data from the provider's API or website.
         
@@ -131,7 +140,9 @@ class BaseScraper(ABC):
             **kwargs: Arbitrary keyword arguments for provider-specific parameters
             
         Returns:
-            List of dictionaries containing raw data from the provider
+            DataFrame (or list of dictionaries) containing raw data from the provider.
+            Providers that also save their own CSVs (GotSport) return a
+            (DataFrame, path) tuple and override run().
             
         Raises:
             NotImplementedError: Must be implemented by child classes
@@ -139,7 +150,7 @@ class BaseScraper(ABC):
         pass
     
     @abstractmethod
-    def parse_data(self, raw_data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def parse_data(self, raw_data: Union[pd.DataFrame, List[Dict[str, Any]]]) -> Union[pd.DataFrame, List[Dict[str, Any]]]:
         """
         Parse and normalize raw data into a standardized format.
         
@@ -147,10 +158,10 @@ class BaseScraper(ABC):
         consistent format that matches the master team index schema.
         
         Args:
-            raw_data: List of dictionaries containing raw data from fetch_raw_data
+            raw_data: DataFrame (or list of dictionaries) of raw data from fetch_raw_data
             
         Returns:
-            List of dictionaries with standardized team data fields:
+            DataFrame (or list of dictionaries) with standardized team data fields:
             - team_name: Full team name
             - age_group: Age group (e.g., "U11", "U12")
             - gender: Gender category ("Male", "Female", "Coed")
@@ -218,7 +229,7 @@ class BaseScraper(ABC):
             self.logger.info(f"📡 Fetching raw data from {self.provider_name}")
             raw_data = self.fetch_raw_data()
             
-            if not raw_data:
+            if raw_data is None or len(raw_data) == 0:
                 self.logger.warning(f"⚠️ No raw data retrieved from {self.provider_name}")
                 return
             
@@ -228,7 +239,7 @@ class BaseScraper(ABC):
             self.logger.info(f"🔧 Parsing and normalizing data from {self.provider_name}")
             parsed_data = self.parse_data(raw_data)
             
-            if not parsed_data:
+            if parsed_data is None or len(parsed_data) == 0:
                 self.logger.warning(f"⚠️ No data after parsing from {self.provider_name}")
                 return
             
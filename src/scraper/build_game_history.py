@@ -23,7 +23,7 @@ sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
 from scraper.providers import get_provider
 from scraper.utils.game_state import GameStateManager
 from scraper.utils.activity_filter import filter_inactive_teams, apply_game_filters, calculate_team_activity_metrics
-from scraper.utils.game_writers import write_games_csv, write_club_lookup_csv, write_slice_summary, get_output_paths, cleanup_failed_writes, extract_clubs_from_games
+from scraper.utils.game_writers import write_games_csv, write_club_lookup_csv, write_slice_summary, get_output_paths, cleanup_failed_writes, extract_clubs_frame
 from src.utils.metrics_snapshot import MetricsSnapshot
 from src.registry.registry import get_registry
 
@@ -271,8 +271,8 @@ def process_slice(provider_name: str, state: str, gender: str, age_group: str,
             
             checkpoint = state_manager.mark_team_complete(checkpoint, team_id, last_game_date, len(filtered_games))
             
-            # Save checkpoint after each team
-            state_manager.save_checkpoint(state, gender, age_group, checkpoint)
+            # Journal the completed team (snapshot is compacted periodically)
+            state_manager.append_team_checkpoint(state, gender, age_group, checkpoint, team_id)
             
             teams_processed += 1
             
@@ -280,6 +280,10 @@ def process_slice(provider_name: str, state: str, gender: str, age_group: str,
             logger.exception(f"Error processing team {team['team_name']}")
             continue
     
+    # Compact the slice journal into a single snapshot
+    if teams_processed:
+        state_manager.save_checkpoint(state, gender, age_group, checkpoint)
+    
     # Post-scrape identity sync: sync any new teams discovered in opponent data
     if all_games:
         logger.info(f"Syncing identity for opponent teams from {len(all_games)} games")
@@ -370,16 +374,17 @@ def process_slice(provider_name: str, state: str, gender: str, age_group: str,
                                        incremental=incremental, existing_file=existing_games_file)
             
             # Extract clubs data once
-            clubs_data = extract_clubs_from_games(games_df, provider_name) if not games_df.empty else []
+            clubs_df = extract_clubs_frame(games_df, provider_name)
             
             # Write club lookup CSV
             club_path = write_club_lookup_csv(games_df, provider_name, state, gender, age_group, build_id,
-                                            incremental=incremental, existing_file=existing_clubs_file)
+                                            incremental=incremental, existing_file=existing_clubs_file,
+                                            clubs_df=clubs_df)
             
             # Write slice summary
             summary_path = write_slice_summary(
                 games_df, provider_name, state, gender, age_group, build_id,
-                teams_processed, len(all_games), skipped_inactive, clubs_data
+                teams_processed, len(all_games), skipped_inactive, clubs_df
             )
             
             logger.info(f"Wrote outputs for {slice_key}: {len(games_df)} games, {teams_processed} teams")
@@ -487,16 +492,52 @@ def main():
     genders = [g.strip().upper() for g in args.genders.split(',')]
     ages = [a.strip().upper() for a in args.ages.split(',')]
     
+    run_game_history_build(
+        providers, states, genders, ages,
+        build_id=args.build_id,
+        resume=args.resume,
+        max_teams=args.max_teams,
+        incremental=args.incremental,
+        auto=args.auto,
+        logger=logger
+    )
+
+
+def run_game_history_build(providers: List[str], states: List[str], genders: List[str], ages: List[str],
+                           build_id: Optional[str] = None, resume: bool = False,
+                           max_teams: Optional[int] = None, incremental: bool = False,
+                           auto: bool = False, logger: Optional[logging.Logger] = None) -> Dict[str, Any]:
+    """
+    Scrape game history for every provider and slice, then update registries and link games.
+    
+    Args:
+        providers: Provider names (e.g., ['gotsport'])
+        states: State codes
+        genders: Genders ('M', 'F')
+        ages: Age groups (e.g., 'U10')
+        build_id: Custom build ID (default: auto-generated)
+        resume: Resume slices from their checkpoints
+        max_teams: Maximum number of teams to process per slice
+        incremental: Append to the latest existing build files
+        auto: Discover the latest build per slice from the registry (incremental only)
+        logger: Optional logger instance
+        
+    Returns:
+        Dictionary with build_id and per-slice results
+    """
+    if logger is None:
+        logger = logging.getLogger(__name__)
+    
     # Generate build ID
-    build_id = args.build_id or generate_build_id()
+    build_id = build_id or generate_build_id()
     
     logger.info(f"Starting game history build: {build_id}")
     logger.info(f"Providers: {providers}")
     logger.info(f"States: {states}")
     logger.info(f"Genders: {genders}")
     logger.info(f"Ages: {ages}")
-    logger.info(f"Resume: {args.resume}")
-    logger.info(f"Max teams: {args.max_teams}")
+    logger.info(f"Resume: {resume}")
+    logger.info(f"Max teams: {max_teams}")
     
     # Generate slice combinations
     slice_combinations = parse_slice_combinations(states, genders, ages)
@@ -521,9 +562,9 @@ def main():
                 # Determine existing files for incremental mode
                 existing_games_file = None
                 existing_clubs_file = None
-                if args.incremental:
+                if incremental:
                     # Use registry for auto-discovery if --auto flag is set
-                    if args.auto:
+                    if auto:
                         registry = get_registry()
                         slice_key = f"{state}_{gender}_{age_group}"
                         latest_build = registry.get_latest_build(slice_key)
@@ -561,9 +602,9 @@ def main():
                     gender,
                     age_group,
                     build_id,
-                    args.resume,
-                    args.max_teams,
-                    args.incremental,
+                    resume,
+                    max_teams,
+                    incremental,
                     existing_games_file,
                     existing_clubs_file
                 )
@@ -674,6 +715,8 @@ def main():
         logger.exception("Error during games linking to master index")
     
     logger.info("Game history build completed successfully!")
+    
+    return {'build_id': build_id, 'results': all_results}
 
 
 if __name__ == "__main__":
@@ -33,7 +33,6 @@ from src.scraper.utils.logger import get_logger
 from src.scraper.utils.file_utils import (
     get_timestamp,
     ensure_dir,
-    safe_write_csv,
     list_csvs,
 )
 from src.registry.registry import get_registry, create_build_entry
@@ -42,8 +41,7 @@ from src.scraper.utils.delta_tracker import compare_builds, save_deltas_to_csv
 from src.validators.verify_master_index import validate_master_index_with_schema, ValidationError
 from src.utils.metrics_snapshot import write_metrics_snapshot
 from src.utils.state_summary_builder import build_state_summaries
-from src.utils.multi_provider_merge import merge_provider_data
-from src.io.safe_write import safe_write_csv as atomic_write_csv
+from src.io.safe_write import safe_write_csv as atomic_write_csv, safe_write_partitions
 
 
 def ensure_data_tree() -> None:
@@ -273,7 +271,7 @@ def save_incremental_master(df_all: pd.DataFrame, logger: logging.Logger) -> Pat
 
 def save_national_master(df_all: pd.DataFrame, logger: logging.Logger) -> Path:
     """
-    Save the national master team index CSV.
+    Save the national master team index CSV and its baseline key index.
     
     Args:
         df_all: Combined DataFrame with all team data
@@ -289,6 +287,13 @@ def save_national_master(df_all: pd.DataFrame, logger: logging.Logger) -> Path:
         atomic_write_csv(df_all, master_path, logger=logger)
         logger.info(f"✅ National master index saved: {master_path}")
         
+        # Key index next to the master so incremental runs skip re-reading the CSV
+        try:
+            from src.scraper.utils.incremental_detector import write_baseline_index
+            write_baseline_index(df_all, master_path, logger)
+        except Exception as e:
+            logger.warning(f"⚠️ Could not write baseline key index: {e}")
+        
         return master_path
         
     except Exception as e:
@@ -296,49 +301,48 @@ def save_national_master(df_all: pd.DataFrame, logger: logging.Logger) -> Path:
         raise
 
 
-def save_per_state_csvs(df_all: pd.DataFrame, logger: logging.Logger) -> List[Tuple[str, Path]]:
+def save_per_state_csvs(df_all: pd.DataFrame, logger: logging.Logger,
+                        write_parquet: bool = False, max_workers: int = 8) -> List[Tuple[str, Path]]:
     """
     Group data by state and save per-state CSV files.
     
+    The frame is partitioned once with groupby and the states are written
+    concurrently, each atomically with a streamed checksum.
+    
     Args:
         df_all: Combined DataFrame with all team data
         logger: Logger instance for operation logging
+        write_parquet: Also write a Parquet copy of each state file
+        max_workers: Number of concurrent state writers
         
     Returns:
         List of tuples (state, csv_path) for saved files
     """
     try:
         timestamp = get_timestamp()
-        saved_states = []
         
         # Get unique states (excluding NaN values)
-        unique_states = df_all["state"].dropna().unique()
+        state_count = df_all["state"].nunique()
         
-        if len(unique_states) == 0:
+        if state_count == 0:
             logger.warning("⚠️ No states found in data")
-            return saved_states
+            return []
         
-        logger.info(f"🌎 Processing {len(unique_states)} states")
+        logger.info(f"🌎 Processing {state_count} states")
         
-        for state in sorted(unique_states):
-            try:
-                # Filter data for this state
-                df_state = df_all[df_all["state"] == state]
-                
-                if df_state.empty:
-                    logger.warning(f"⚠️ No data found for state: {state}")
-                    continue
-                
-                # Save per-state CSV
-                state_path = Path(f"data/master/states/{state}/combined_{state}_{timestamp}.csv")
-                safe_write_csv(df_state, state_path, logger=logger)
-                
-                saved_states.append((state, state_path))
-                logger.info(f"📦 {state}: {len(df_state)} teams saved → {state_path}")
-                
-            except Exception as e:
-                logger.error(f"❌ Failed to save state CSV for {state}: {e}")
-                continue
+        results = safe_write_partitions(
+            df_all,
+            "state",
+            lambda state: Path(f"data/master/states/{state}/combined_{state}_{timestamp}.csv"),
+            write_parquet=write_parquet,
+            max_workers=max_workers,
+            logger=logger
+        )
+        
+        saved_states = []
+        for result in results:
+            saved_states.append((result["partition"], result["path"]))
+            logger.info(f"📦 {result['partition']}: {result['rows']} teams saved → {result['path']}")
         
         logger.info(f"✅ Successfully saved {len(saved_states)} state CSV files")
         return saved_states
@@ -348,7 +352,7 @@ def save_per_state_csvs(df_all: pd.DataFrame, logger: logging.Logger) -> List[Tu
         raise
 
 
-def main(incremental_only: bool = False):
+def main(incremental_only: bool = False, write_parquet: bool = False):
     """
     Main orchestrator function for building the master team index.
     
@@ -362,6 +366,7 @@ def main(incremental_only: bool = False):
     
     Args:
         incremental_only: If True, only run incremental updates (new teams only)
+        write_parquet: Also write Parquet copies of the per-state files
     """
     start_time = time.time()
     
@@ -474,7 +479,11 @@ def main(incremental_only: bool = False):
         
         try:
             logger.info("📊 Running comprehensive validation...")
-            validation_results = validate_master_index_with_schema(df_all, logger)
+            # Incremental builds always fully validate the teams they added
+            touched = None
+            if incremental_only and 'team_id' in df_gotsport.columns:
+                touched = df_all['team_id'].isin(df_gotsport['team_id'])
+            validation_results = validate_master_index_with_schema(df_all, logger, touched=touched)
             
             if validation_results['overall_status'] == 'failed':
                 logger.error("❌ Schema validation failed - stopping build")
@@ -514,7 +523,7 @@ def main(incremental_only: bool = False):
         logger.info("=" * 60)
         
         try:
-            saved_states = save_per_state_csvs(df_all, logger)
+            saved_states = save_per_state_csvs(df_all, logger, write_parquet=write_parquet)
         except Exception as e:
             logger.error(f"❌ Stage 5 failed: {e}")
             return
@@ -546,7 +555,7 @@ def main(incremental_only: bool = False):
                     'renamed_teams': len(deltas["renamed"])
                 })
             
-            write_metrics_snapshot(metrics_data, logger)
+            write_metrics_snapshot(timestamp, metrics_data, logger)
             logger.info("✅ Metrics snapshot generated")
             
             # Generate state summaries
@@ -626,7 +635,10 @@ if __name__ == "__main__":
     # Check for incremental mode flag
     incremental_only = "--incremental" in sys.argv or "-i" in sys.argv
     
+    # Check for Parquet output flag (per-state files in addition to CSV)
+    write_parquet = "--parquet" in sys.argv
+    
     if incremental_only:
         print("Running in incremental mode - only new teams will be processed")
     
-    main(incremental_only=incremental_only)
\ No newline at end of file
+    main(incremental_only=incremental_only, write_parquet=write_parquet)
\ No newline at end of file
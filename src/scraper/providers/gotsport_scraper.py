@@ -12,11 +12,12 @@ to extract comprehensive team ranking data including names, states, and points.
 
 import requests
 from bs4 import BeautifulSoup, Tag
-from typing import List, Dict, Any, Tuple
+from typing import List, Dict, Any, Optional, Tuple, Union
+from functools import partial
 from pathlib import Path
+import json
 import logging
 import time
-import random
 import pandas as pd
 import re
 
@@ -24,8 +25,82 @@ import re
 import sys
 import os
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../..")))
+from src.schema.constants import US_STATE_CODES
 from src.scraper.base_scraper import BaseScraper
 from src.scraper.utils.file_utils import get_timestamp, ensure_dir, safe_write_csv
+from src.scraper.utils.crawl_scheduler import CrawlCheckpoint, crawl_streams
+from src.io.safe_write import safe_write_partitions
+
+# Optional fast JSON decoding and Arrow-backed table assembly
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import pyarrow as pa
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# Per-stream page journals for resuming an interrupted rankings crawl
+CRAWL_CHECKPOINT_DIR = Path("data/master/sources/crawl_state/gotsport_rankings")
+
+# Output column order for rankings tables
+RANKINGS_COLUMNS = ["team_name", "team_id", "age_group", "gender", "source", "points", "state", "rank", "url"]
+
+
+def decode_json(content: str) -> Any:
+    """
+    Decode a JSON document, using orjson when it is installed.
+    
+    Args:
+        content: JSON text
+        
+    Returns:
+        Decoded Python object
+        
+    Raises:
+        ValueError: If the content is not valid JSON
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def batches_to_frame(batches: List[Dict[str, List[Any]]]) -> pd.DataFrame:
+    """
+    Assemble columnar page batches into one rankings DataFrame.
+    
+    Batches are concatenated as Arrow record batches when pyarrow is available;
+    raw points text is converted to integers in one vectorized pass.
+    
+    Args:
+        batches: Columnar page batches from _parse_api_response
+        
+    Returns:
+        DataFrame with RANKINGS_COLUMNS
+    """
+    batches = [batch for batch in batches if batch and batch.get("team_name")]
+    if not batches:
+        return pd.DataFrame(columns=RANKINGS_COLUMNS)
+    
+    if PYARROW_AVAILABLE:
+        table = pa.Table.from_batches([pa.RecordBatch.from_pydict(batch) for batch in batches])
+        df = table.to_pandas()
+    else:
+        df = pd.DataFrame({
+            col: [value for batch in batches for value in batch[col]]
+            for col in batches[0]
+        })
+    
+    # First run of digits in the points text, matching _extract_points
+    df["points"] = (
+        df["points"].astype(str).str.extract(r'(\d+)', expand=False)
+        .fillna(0).astype(int)
+    )
+    return df[RANKINGS_COLUMNS]
 
 
 class GotSportScraper(BaseScraper):
@@ -70,14 +145,7 @@ class GotSportScraper(BaseScraper):
         self.logger.info(f"🏗️ Initialized GotSport Rankings scraper with base URL: {self.base_url}")
         
         # Valid US state codes for validation
-        self.valid_states = {
-            'AL', 'AK', 'AZ', 'AR', 'CA', 'CO', 'CT', 'DE', 'FL', 'GA',
-            'HI', 'ID', 'IL', 'IN', 'IA', 'KS', 'KY', 'LA', 'ME', 'MD',
-            'MA', 'MI', 'MN', 'MS', 'MO', 'MT', 'NE', 'NV', 'NH', 'NJ',
-            'NM', 'NY', 'NC', 'ND', 'OH', 'OK', 'OR', 'PA', 'RI', 'SC',
-            'SD', 'TN', 'TX', 'UT', 'VT', 'VA', 'WA', 'WV', 'WI', 'WY',
-            'DC'  # District of Columbia
-        }
+        self.valid_states = US_STATE_CODES
     
     def _fetch_with_retry(self, url: str, max_retries: int = 3, sleep_time: float = 1.5) -> str:
         """
@@ -89,7 +157,7 @@ class GotSportScraper(BaseScraper):
             sleep_time: Base sleep time between retries
             
         Returns:
-            HTML content as string, or empty string if all retries fail
+            Response content as string, or empty string if all retries fail
         """
         for attempt in range(max_retries):
             try:
@@ -98,11 +166,12 @@ class GotSportScraper(BaseScraper):
                 # Fetch JSON API content directly (no ZenRows needed for API)
                 json_content = self.fetch_url(url, js_render=False)
                 
-                if json_content and len(json_content) > 50:  # Basic content validation for JSON
+                # Any non-blank body is a reply; a short one can be a valid empty last page
+                if json_content and json_content.strip():
                     self.logger.info(f"✅ Successfully fetched content ({len(json_content)} chars)")
                     return json_content
                 else:
-                    self.logger.warning(f"⚠️ Empty or insufficient content on attempt {attempt + 1}")
+                    self.logger.warning(f"⚠️ Empty content on attempt {attempt + 1}")
                     
             except Exception as e:
                 self.logger.error(f"❌ Attempt {attempt + 1} failed: {e}")
@@ -115,19 +184,26 @@ class GotSportScraper(BaseScraper):
         self.logger.error(f"❌ All {max_retries} attempts failed for {url}")
         return ""
     
-    def fetch_raw_data(self, *args, **kwargs) -> Tuple[List[Dict[str, Any]], str]:
+    def fetch_raw_data(self, *args, **kwargs) -> Tuple[pd.DataFrame, Path]:
         """
         Fetch raw team ranking data from GotSport Rankings.
         
-        This method iterates through all age groups (U10-U18) and genders (Male/Female)
-        to scrape comprehensive team ranking data from the GotSport Rankings platform.
+        The 18 age/gender streams (U10-U18, Male/Female) are crawled concurrently
+        under one global request budget. When the API reports its page count, each
+        stream stops after the last page without probing an empty one. Every page
+        is journaled per stream, so an interrupted crawl resumes mid-pagination.
+        Pages are parsed straight into columnar batches and assembled into one
+        table at the end, without building a dict per team.
         
         Args:
             *args: Variable length argument list (not used in current implementation)
-            **kwargs: Arbitrary keyword arguments (not used in current implementation)
+            **kwargs: Optional crawl settings:
+                max_workers: Streams crawled at once (default: 6)
+                max_per_second: Global request budget (default: 3.0)
+                resume: Resume from an existing checkpoint (default: True)
             
         Returns:
-            Tuple of (List of dictionaries containing raw team ranking data, CSV file path)
+            Tuple of (DataFrame of raw team ranking data, CSV file path)
             
         Raises:
             Exception: For unexpected errors during data fetching
@@ -135,66 +211,54 @@ class GotSportScraper(BaseScraper):
         try:
             self.logger.info("🌐 Starting comprehensive GotSport Rankings data fetch")
             
-            all_teams = []
             ages = range(10, 19)  # U10 to U18
             genders = ["m", "f"]  # Male and Female
             
             total_combinations = len(ages) * len(genders)
             self.logger.info(f"📊 Processing {total_combinations} age/gender combinations")
             
-            for age in ages:
-                for gender in genders:
-                    try:
-                        gender_text = "Boys" if gender == "m" else "Girls"
-                        page = 1
-                        collected_teams = []
-                        
-                        self.logger.info(f"📡 Starting pagination for U{age} {gender_text}")
-                        
-                        while True:
-                            # Build API URL for this age/gender/page combination
-                            url = f"{self.base_url}?search[team_country]=USA&search[age]={age}&search[gender]={gender}&search[page]={page}"
-                            
-                            self.logger.info(f"📡 Fetching page {page} for U{age} {gender_text}")
-                            
-                            # Fetch JSON API content with retry logic
-                            json_content = self._fetch_with_retry(url)
-                            
-                            if not json_content:
-                                self.logger.warning(f"⚠️ No JSON content received for U{age} {gender_text} page {page}")
-                                break
-                            
-                            # Parse JSON API response
-                            page_teams = self._parse_api_response(json_content, age, gender, url)
-                            
-                            if not page_teams:
-                                self.logger.info(f"📄 No teams found on page {page} for U{age} {gender_text} - stopping pagination")
-                                break
-                            
-                            # Add teams from this page
-                            collected_teams.extend(page_teams)
-                            self.logger.info(f"📄 Page {page}: Found {len(page_teams)} teams for U{age} {gender_text}")
-                            
-                            # Move to next page
-                            page += 1
-                            
-                            # Add delay between requests to be respectful
-                            time.sleep(random.uniform(1.5, 2.5))
-                        
-                        # Add all collected teams for this age/gender combination
-                        if collected_teams:
-                            all_teams.extend(collected_teams)
-                            self.logger.info(f"✅ U{age} {gender_text}: {len(collected_teams)} teams total across {page-1} pages")
-                        else:
-                            self.logger.warning(f"⚠️ No teams found for U{age} {gender_text}")
-                        
-                    except Exception as e:
-                        self.logger.error(f"❌ Error processing U{age} {gender_text}: {e}")
-                        continue
+            # A zero max age discards any existing journal when resume is disabled
+            checkpoint = CrawlCheckpoint(
+                CRAWL_CHECKPOINT_DIR,
+                max_age_hours=24.0 if kwargs.get('resume', True) else 0.0,
+                logger=self.logger
+            )
+            
+            streams = {
+                f"U{age}_{gender}": partial(self._fetch_rankings_page, age, gender)
+                for age in ages
+                for gender in genders
+            }
+            
+            results = crawl_streams(
+                streams,
+                max_workers=kwargs.get('max_workers', 6),
+                max_per_second=kwargs.get('max_per_second', 3.0),
+                checkpoint=checkpoint,
+                page_delay=(0.5, 1.0),
+                logger=self.logger
+            )
+            
+            # Assemble in a fixed stream order so output is independent of thread timing
+            batches = []
+            for key in streams:
+                result = results[key]
+                if result["rows"]:
+                    batches.extend(result["batches"])
+                    self.logger.info(f"✅ {key}: {result['rows']} teams total across {result['pages']} pages")
+                else:
+                    self.logger.warning(f"⚠️ No teams found for {key}")
+            all_teams = batches_to_frame(batches)
             
-            if not all_teams:
+            if all(result["complete"] for result in results.values()):
+                checkpoint.clear()
+            else:
+                incomplete = [key for key, result in results.items() if not result["complete"]]
+                self.logger.warning(f"⚠️ {len(incomplete)} streams incomplete, checkpoint kept for resume: {incomplete}")
+            
+            if all_teams.empty:
                 self.logger.warning("⚠️ No teams found from any age/gender combination, using fallback data")
-                all_teams = self._get_fallback_data()
+                all_teams = pd.DataFrame(self._get_fallback_data())
             
             # Create DataFrame and save CSVs
             df, nationwide_path = self._create_dataframe_and_save(all_teams)
@@ -205,11 +269,79 @@ class GotSportScraper(BaseScraper):
         except Exception as e:
             self.logger.error(f"❌ Unexpected error fetching data from GotSport Rankings: {e}")
             # Return fallback data if everything fails
-            fallback_data = self._get_fallback_data()
+            fallback_data = pd.DataFrame(self._get_fallback_data())
             df, nationwide_path = self._create_dataframe_and_save(fallback_data)
             return fallback_data, nationwide_path
     
-    def _parse_api_response(self, json_content: str, age: int, gender: str, url: str) -> List[Dict[str, Any]]:
+    def _fetch_rankings_page(self, age: int, gender: str, page: int) -> Tuple[Optional[Dict[str, List[Any]]], Optional[int]]:
+        """
+        Fetch and parse one page of an age/gender rankings stream.
+        
+        Args:
+            age: Age group number (10-18)
+            gender: Gender code ("m" or "f")
+            page: 1-based page number
+            
+        Returns:
+            Tuple of (columnar batch of teams, total pages if reported). The batch
+            is empty when the page has no teams (the end of the stream) and None
+            only when the page could not be fetched or decoded.
+        """
+        gender_text = "Boys" if gender == "m" else "Girls"
+        url = f"{self.base_url}?search[team_country]=USA&search[age]={age}&search[gender]={gender}&search[page]={page}"
+        
+        self.logger.info(f"📡 Fetching page {page} for U{age} {gender_text}")
+        json_content = self._fetch_with_retry(url)
+        
+        if not json_content:
+            self.logger.warning(f"⚠️ No JSON content received for U{age} {gender_text} page {page}")
+            return None, None
+        
+        try:
+            data = decode_json(json_content)
+        except ValueError as e:
+            self.logger.error(f"❌ Error parsing JSON response: {e}")
+            return None, None
+        
+        page_teams = self._parse_api_columns(data, age, gender, url)
+        total_pages = self._extract_total_pages(data)
+        
+        if page_teams["team_name"]:
+            suffix = f"/{total_pages}" if total_pages else ""
+            self.logger.info(f"📄 Page {page}{suffix}: Found {len(page_teams['team_name'])} teams for U{age} {gender_text}")
+        else:
+            self.logger.info(f"📄 No teams found on page {page} for U{age} {gender_text} - stopping pagination")
+        
+        return page_teams, total_pages
+    
+    @staticmethod
+    def _extract_total_pages(data: Any) -> Optional[int]:
+        """
+        Read the total page count from API pagination metadata, if present.
+        
+        Args:
+            data: Decoded JSON response
+            
+        Returns:
+            Total number of pages, or None when the response carries no pagination info
+        """
+        if not isinstance(data, dict):
+            return None
+        
+        candidates = [data]
+        for key in ('pagination', 'meta', 'pages'):
+            if isinstance(data.get(key), dict):
+                candidates.append(data[key])
+        
+        for block in candidates:
+            for key in ('total_pages', 'last_page', 'page_count', 'num_pages'):
+                value = block.get(key)
+                if isinstance(value, (int, float, str)) and str(value).isdigit() and int(value) > 0:
+                    return int(value)
+        
+        return None
+    
+    def _parse_api_response(self, json_content: str, age: int, gender: str, url: str) -> Dict[str, List[Any]]:
         """
         Parse GotSport API JSON response to extract team data.
         
@@ -220,96 +352,72 @@ class GotSportScraper(BaseScraper):
             url: The URL being scraped
             
         Returns:
-            List of dictionaries containing team ranking data
+            Columnar batch (column name -> list of values) of team ranking data
         """
         try:
-            import json
-            
-            # Parse JSON response
-            data = json.loads(json_content)
-            
-            # Extract teams from the API response
-            teams = []
-            
-            # The API response structure uses 'team_ranking_data' key
-            if isinstance(data, dict):
-                # Look for the correct GotSport API key
-                team_data = data.get('team_ranking_data')
-                
-                if team_data:
-                    self.logger.info(f"📊 Found {len(team_data)} teams in API response")
-                    
-                    for i, team in enumerate(team_data):
-                        try:
-                            # Extract team information based on common API field names
-                            team_info = {
-                                "rank": i + 1,
-                                "team_name": "",
-                                "team_id": "",
-                                "points": 0,
-                                "state": "",
-                                "age_group": f"U{age}",
-                                "gender": "Male" if gender == "m" else "Female",
-                                "source": "GotSport Rankings",
-                                "url": url
-                            }
-                            
-                            # Extract team information using correct GotSport API field names
-                            team_info["team_name"] = str(team.get('team_name', '')).strip()
-                            team_info["team_id"] = str(team.get('team_id', '')).strip()
-                            team_info["points"] = self._extract_points(str(team.get('points', team.get('score', 0))))
-                            team_info["state"] = str(team.get('team_association', '')).strip()
-                            
-                            # If we found a team name, add it to our results
-                            if team_info["team_name"]:
-                                teams.append(team_info)
-                                
-                        except Exception as e:
-                            self.logger.warning(f"⚠️ Error parsing team {i}: {e}")
-                            continue
-                else:
-                    self.logger.warning(f"⚠️ No team data found in API response structure")
-                    # Log the structure for debugging
-                    self.logger.debug(f"API response keys: {list(data.keys()) if isinstance(data, dict) else 'Not a dict'}")
-            
-            elif isinstance(data, list):
-                # Direct list of teams
-                teams = []
-                for i, team in enumerate(data):
-                    try:
-                        team_info = {
-                            "rank": i + 1,
-                            "team_name": str(team.get("team_name", "")).strip(),
-                            "team_id": str(team.get("team_id", "")).strip(),
-                            "points": self._extract_points(str(team.get("points", team.get("score", 0)))),
-                            "state": str(team.get("team_association", "")).strip(),
-                            "age_group": f"U{age}",
-                            "gender": "Male" if gender == "m" else "Female",
-                            "source": "GotSport Rankings",
-                            "url": url
-                        }
-                        
-                        if team_info["team_name"]:
-                            teams.append(team_info)
-                            
-                    except Exception as e:
-                        self.logger.warning(f"⚠️ Error parsing team {i}: {e}")
-                        continue
-            
-            if teams:
-                self.logger.info(f"✅ Successfully parsed {len(teams)} teams from U{age} {'Boys' if gender=='m' else 'Girls'} API")
-            else:
-                self.logger.warning(f"⚠️ No teams parsed from U{age} {'Boys' if gender=='m' else 'Girls'} API")
-            
-            return teams
-            
-        except json.JSONDecodeError as e:
+            return self._parse_api_columns(decode_json(json_content), age, gender, url)
+        except ValueError as e:
             self.logger.error(f"❌ Error parsing JSON response: {e}")
-            return []
-        except Exception as e:
-            self.logger.error(f"❌ Error parsing API response: {e}")
-            return []
-
+            return self._parse_api_columns(None, age, gender, url)
+    
+    def _parse_api_columns(self, data: Any, age: int, gender: str, url: str) -> Dict[str, List[Any]]:
+        """
+        Extract team columns from a decoded GotSport API response.
+        
+        Values are collected column by column; points stay as raw text and are
+        converted for the whole table in batches_to_frame.
+        
+        Args:
+            data: Decoded JSON response
+            age: Age group number (10-18)
+            gender: Gender code ("m" or "f")
+            url: The URL being scraped
+            
+        Returns:
+            Columnar batch (column name -> list of values) of team ranking data
+        """
+        # The API response structure uses 'team_ranking_data' key, or is a bare list of teams
+        if isinstance(data, dict):
+            team_data = data.get('team_ranking_data') or []
+            if not team_data:
+                self.logger.warning(f"⚠️ No team data found in API response structure")
+                self.logger.debug(f"API response keys: {list(data.keys())}")
+        elif isinstance(data, list):
+            team_data = data
+        else:
+            team_data = []
+        
+        # Rank is the position within the page, counting entries that are later skipped
+        positions = [i for i, team in enumerate(team_data) if isinstance(team, dict)]
+        teams = [team_data[i] for i in positions]
+        names = [str(team.get('team_name', '')).strip() for team in teams]
+        keep = [j for j, name in enumerate(names) if name]
+        if len(keep) < len(names):
+            teams = [teams[j] for j in keep]
+            positions = [positions[j] for j in keep]
+            names = [names[j] for j in keep]
+        
+        count = len(teams)
+        columns = {
+            "team_name": names,
+            "team_id": [str(team.get('team_id', '')).strip() for team in teams],
+            "age_group": [f"U{age}"] * count,
+            "gender": ["Male" if gender == "m" else "Female"] * count,
+            "source": ["GotSport Rankings"] * count,
+            "points": [str(team.get('points', team.get('score', 0))) for team in teams],
+            "state": [str(team.get('team_association', '')).strip() for team in teams],
+            "rank": [i + 1 for i in positions],
+            "url": [url] * count
+        }
+        
+        gender_text = 'Boys' if gender == 'm' else 'Girls'
+        if count:
+            self.logger.info(f"✅ Successfully parsed {count} teams from U{age} {gender_text} API")
+        else:
+            self.logger.warning(f"⚠️ No teams parsed from U{age} {gender_text} API")
+        
+        return columns
+    
     def _parse_rankings_page(self, html_content: str, age: int, gender: str, url: str) -> List[Dict[str, Any]]:
         """
         Parse a GotSport rankings page to extract team data.
@@ -486,19 +594,19 @@ class GotSportScraper(BaseScraper):
         except Exception:
             return ""
     
-    def _create_dataframe_and_save(self, teams_data: List[Dict[str, Any]]) -> Tuple[pd.DataFrame, Path]:
+    def _create_dataframe_and_save(self, teams_data: Union[pd.DataFrame, List[Dict[str, Any]]]) -> Tuple[pd.DataFrame, Path]:
         """
         Create DataFrame and save CSVs using file utilities.
         
         Args:
-            teams_data: List of team dictionaries
+            teams_data: DataFrame or list of team dictionaries
             
         Returns:
             Tuple of (DataFrame, nationwide CSV path)
         """
         try:
             # Create DataFrame with specified column order
-            column_order = ["team_name", "team_id", "age_group", "gender", "source", "points", "state", "rank", "url"]
+            column_order = RANKINGS_COLUMNS
             df = pd.DataFrame(teams_data)
             
             # Ensure all columns exist
@@ -519,16 +627,16 @@ class GotSportScraper(BaseScraper):
             safe_write_csv(df, nationwide_path, logger=self.logger)
             self.logger.info(f"✅ Nationwide CSV saved → {nationwide_path}")
             
-            # Create per-state CSVs using groupby
-            states_saved = 0
-            for state, group_df in df.groupby("state"):
-                if not state:  # skip blanks
-                    continue
-                
-                state_path = Path(f"data/master/states/{state}/gotsport_rankings_{timestamp}_{state}.csv")
-                safe_write_csv(group_df, state_path, logger=self.logger)
-                self.logger.info(f"✅ {state}: {len(group_df)} teams saved → {state_path}")
-                states_saved += 1
+            # Create per-state CSVs: partition once, write states concurrently (blank states skipped)
+            results = safe_write_partitions(
+                df[df["state"].astype(bool)],
+                "state",
+                lambda state: Path(f"data/master/states/{state}/gotsport_rankings_{timestamp}_{state}.csv"),
+                logger=self.logger
+            )
+            for result in results:
+                self.logger.info(f"✅ {result['partition']}: {result['rows']} teams saved → {result['path']}")
+            states_saved = len(results)
             
             # Log summary
             self.logger.info(f"📦 Total teams saved: {len(df)} across {states_saved} states")
@@ -599,19 +707,19 @@ class GotSportScraper(BaseScraper):
             }
         ]
     
-    def parse_data(self, raw_data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def parse_data(self, raw_data: Union[pd.DataFrame, List[Dict[str, Any]]]) -> pd.DataFrame:
         """
         Parse and normalize raw GotSport Rankings data into standardized format.
         
-        This method transforms the raw HTML/scraped data from GotSport Rankings into a
+        This method transforms the raw data from GotSport Rankings into a
         consistent format that matches the master team index schema. It validates and
         cleans the data while preserving all ranking information.
         
         Args:
-            raw_data: List of dictionaries containing raw team ranking data from fetch_raw_data
+            raw_data: DataFrame (or list of dictionaries) of raw team ranking data from fetch_raw_data
             
         Returns:
-            List of dictionaries with standardized team data:
+            DataFrame with standardized team data:
             - team_name: Full team name
             - age_group: Normalized age group (U10, U11, U12, etc.)
             - gender: Standardized gender (Male, Female)
@@ -625,38 +733,33 @@ class GotSportScraper(BaseScraper):
         """
         try:
             self.logger.info("🔧 Starting data parsing and normalization")
-            parsed_teams = []
+            df = pd.DataFrame(raw_data).copy()
             
-            for team_data in raw_data:
-                try:
-                    # Validate required fields
-                    if not team_data.get("team_name"):
-                        self.logger.warning("⚠️ Skipping team with empty name")
-                        continue
-                    
-                    # Validate state code
-                    state = team_data.get("state", "")
-                    if state and state not in self.valid_states:
-                        self.logger.warning(f"⚠️ Invalid state code '{state}' for team '{team_data['team_name']}'")
-                        state = ""  # Set to empty string for invalid states
-                    
-                    # Create standardized team record
-                    parsed_team = {
-                        "team_name": team_data["team_name"].strip(),
-                        "age_group": team_data.get("age_group", "Unknown"),
-                        "gender": team_data.get("gender", "Unknown"),
-                        "source": team_data.get("source", "GotSport Rankings"),
-                        "points": team_data.get("points", 0),
-                        "state": state,
-                        "rank": team_data.get("rank", 0),
-                        "url": team_data.get("url", "")
-                    }
-                    
-                    parsed_teams.append(parsed_team)
-                    
-                except Exception as e:
-                    self.logger.warning(f"⚠️ Error parsing team data: {e}")
-                    continue
+            defaults = {
+                "team_name": "", "age_group": "Unknown", "gender": "Unknown",
+                "source": "GotSport Rankings", "points": 0, "state": "", "rank": 0, "url": ""
+            }
+            for col, default in defaults.items():
+                if col not in df.columns:
+                    df[col] = default
+                else:
+                    df[col] = df[col].fillna(default)
+            
+            # Validate required fields
+            df["team_name"] = df["team_name"].astype(str).str.strip()
+            empty_names = df["team_name"] == ""
+            if empty_names.any():
+                self.logger.warning(f"⚠️ Skipping {int(empty_names.sum())} teams with empty name")
+                df = df[~empty_names]
+            
+            # Validate state codes, blanking invalid ones
+            invalid_states = (df["state"] != "") & ~df["state"].isin(self.valid_states)
+            if invalid_states.any():
+                examples = df.loc[invalid_states, "state"].unique()[:5].tolist()
+                self.logger.warning(f"⚠️ Invalid state code for {int(invalid_states.sum())} teams (e.g. {examples})")
+                df.loc[invalid_states, "state"] = ""
+            
+            parsed_teams = df[list(defaults)].reset_index(drop=True)
             
             self.logger.info(f"✅ Successfully parsed {len(parsed_teams)} teams from GotSport Rankings")
             return parsed_teams
@@ -689,9 +792,9 @@ class GotSportScraper(BaseScraper):
                 self.logger.info(f"🔄 Running incremental detection mode - performing real scrape to test team_id capture")
                 # For testing: run a small real scrape to verify team_id capture
                 raw_data, nationwide_path = self.fetch_raw_data()
-                if raw_data:
+                if len(raw_data) > 0:
                     # Take only first 5 teams for testing
-                    test_data = raw_data[:5]
+                    test_data = raw_data.head(5)
                     self.logger.info(f"📂 Created test data from real scrape: {len(test_data)} rows")
                     return test_data, Path("data/master/incremental/test_teams.csv")
                 else:
@@ -743,7 +846,7 @@ class GotSportScraper(BaseScraper):
                 self.logger.info(f"📡 Fetching raw data from {self.provider_name}")
                 raw_data, nationwide_path = self.fetch_raw_data()
             
-            if not raw_data:
+            if len(raw_data) == 0:
                 self.logger.warning(f"⚠️ No raw data retrieved from {self.provider_name}")
                 # Return empty DataFrame with path
                 empty_df = pd.DataFrame(columns=["team_name", "age_group", "gender", "source", "points", "state", "rank", "url"])
@@ -755,7 +858,7 @@ class GotSportScraper(BaseScraper):
             self.logger.info(f"🔧 Parsing and normalizing data from {self.provider_name}")
             parsed_data = self.parse_data(raw_data)
             
-            if not parsed_data:
+            if parsed_data.empty:
                 self.logger.warning(f"⚠️ No data after parsing from {self.provider_name}")
                 # Return empty DataFrame with path
                 empty_df = pd.DataFrame(columns=["team_name", "age_group", "gender", "source", "points", "state", "rank", "url"])
@@ -767,15 +870,15 @@ class GotSportScraper(BaseScraper):
             # Step 3: Handle incremental mode if requested
             if incremental:
                 try:
-                    from src.scraper.utils.incremental_detector import load_baseline_master, detect_new_teams, save_incremental
+                    from src.scraper.utils.incremental_detector import load_baseline_index, detect_new_teams, save_incremental
                     
                     self.logger.info("🔄 Running in incremental mode - detecting new teams")
                     
-                    # Load baseline master
-                    baseline_df = load_baseline_master()
+                    # Load baseline key index (memory-mapped, no full master read)
+                    baseline_keys = load_baseline_index(logger=self.logger)
                     
                     # Detect new teams
-                    new_teams_df = detect_new_teams(df, baseline_df, self.logger)
+                    new_teams_df = detect_new_teams(df, baseline_keys, self.logger)
                     
                     if not new_teams_df.empty:
                         # Save incremental teams
@@ -31,6 +31,31 @@ def is_team_active(last_active_date: Optional[date], threshold_days: int = 120)
     return last_active_date >= cutoff_date
 
 
+def parse_activity_dates(values: pd.Series) -> pd.Series:
+    """
+    Parse a column of date strings / date objects into day-normalized timestamps.
+    
+    ISO dates take a fast vectorized path; remaining values are parsed with
+    mixed-format inference. Missing or unparseable values become NaT.
+    
+    Args:
+        values: Series of date strings, date/datetime objects or nulls
+        
+    Returns:
+        Series of naive, day-normalized Timestamps (NaT where unparseable)
+    """
+    text = values.astype(object).where(values.isna(), values.astype(str))
+    # Keep the wall-clock date of timestamps with UTC offsets, as date.fromisoformat would
+    text = text.str.replace(r'(\d{2}:\d{2}(?::\d{2}(?:\.\d+)?)?)(?:Z|[+-]\d{2}:?\d{2})$', r'\1', regex=True)
+    
+    parsed = pd.to_datetime(text, format='ISO8601', errors='coerce')
+    retry = parsed.isna() & text.notna()
+    if retry.any():
+        parsed[retry] = pd.to_datetime(text[retry], format='mixed', errors='coerce')
+    
+    return parsed.dt.normalize()
+
+
 def filter_recent_games(games_list: List[Dict[str, Any]], months_back: int = 12) -> List[Dict[str, Any]]:
     """
     Filter games to only include those within the specified time period.
@@ -45,39 +70,13 @@ def filter_recent_games(games_list: List[Dict[str, Any]], months_back: int = 12)
     if not games_list:
         return games_list
     
-    cutoff_date = date.today() - relativedelta(months=months_back)
-    filtered_games = []
+    cutoff_date = pd.Timestamp(date.today() - relativedelta(months=months_back))
     
-    for game in games_list:
-        try:
-            # Parse game date
-            game_date_str = game.get('game_date')
-            if not game_date_str:
-                continue
-            
-            # Handle different date formats
-            if isinstance(game_date_str, str):
-                try:
-                    game_date = datetime.strptime(game_date_str, '%Y-%m-%d').date()
-                except ValueError:
-                    try:
-                        game_date = datetime.fromisoformat(game_date_str).date()
-                    except ValueError:
-                        continue
-            elif isinstance(game_date_str, date):
-                game_date = game_date_str
-            else:
-                continue
-            
-            # Include game if within time period
-            if game_date >= cutoff_date:
-                filtered_games.append(game)
-                
-        except Exception as e:
-            logging.getLogger(__name__).warning(f"Error filtering game {game}: {e}")
-            continue
+    # Games without a date or with an unparseable date are dropped
+    game_dates = parse_activity_dates(pd.Series([game.get('game_date') for game in games_list], dtype=object))
+    keep = (game_dates >= cutoff_date).to_numpy()
     
-    return filtered_games
+    return [game for game, recent in zip(games_list, keep) if recent]
 
 
 def filter_inactive_teams(teams_df: pd.DataFrame, threshold_days: int = 120) -> pd.DataFrame:
@@ -102,40 +101,16 @@ def filter_inactive_teams(teams_df: pd.DataFrame, threshold_days: int = 120) ->
         logger.warning("No 'last_seen_active_date' column found, skipping inactivity filter")
         return teams_df
     
-    # Convert activity dates to date objects
-    active_teams = []
-    for _, team in teams_df.iterrows():
-        try:
-            last_active_str = team.get('last_seen_active_date')
-            if pd.isna(last_active_str) or last_active_str is None:
-                # No activity date, assume active
-                active_teams.append(True)
-                continue
-            
-            # Parse activity date
-            if isinstance(last_active_str, str):
-                try:
-                    last_active_date = datetime.strptime(last_active_str, '%Y-%m-%d').date()
-                except ValueError:
-                    try:
-                        last_active_date = datetime.fromisoformat(last_active_str).date()
-                    except ValueError:
-                        logger.warning(f"Invalid activity date format: {last_active_str}")
-                        active_teams.append(True)  # Assume active
-                        continue
-            elif isinstance(last_active_str, date):
-                last_active_date = last_active_str
-            else:
-                active_teams.append(True)  # Assume active
-                continue
-            
-            # Check if team is active
-            is_active = last_active_date >= cutoff_date
-            active_teams.append(is_active)
-            
-        except Exception as e:
-            logger.warning(f"Error checking team activity: {e}")
-            active_teams.append(True)  # Assume active on error
+    # Parse activity dates once; teams without a usable date are assumed active
+    raw_dates = teams_df['last_seen_active_date']
+    last_active = parse_activity_dates(raw_dates)
+    
+    invalid = last_active.isna() & raw_dates.notna()
+    if invalid.any():
+        examples = raw_dates[invalid].astype(str).unique()[:5].tolist()
+        logger.warning(f"Invalid activity date format for {int(invalid.sum())} teams (e.g. {examples})")
+    
+    active_teams = (last_active.isna() | (last_active >= pd.Timestamp(cutoff_date))).to_numpy()
     
     # Filter teams
     filtered_df = teams_df[active_teams].copy()
@@ -235,17 +210,24 @@ def calculate_team_activity_metrics(teams_df: pd.DataFrame) -> Dict[str, Any]:
     if teams_df.empty:
         return metrics
     
-    cutoff_date = date.today() - timedelta(days=120)
+    cutoff_date = pd.Timestamp(date.today() - timedelta(days=120))
     
-    for _, team in teams_df.iterrows():
-        last_active_date = get_team_last_activity_date(team.to_dict())
-        
-        if last_active_date is None:
-            metrics['teams_without_activity_date'] += 1
-        elif last_active_date >= cutoff_date:
-            metrics['active_teams'] += 1
-        else:
-            metrics['inactive_teams'] += 1
+    # First parseable date across the activity fields, in get_team_last_activity_date order
+    activity_fields = ['last_seen_active_date', 'last_active_date', 'last_game_date']
+    last_active = pd.Series(pd.NaT, index=teams_df.index, dtype='datetime64[ns]')
+    for field in activity_fields:
+        if field in teams_df.columns:
+            last_active = last_active.fillna(parse_activity_dates(teams_df[field]))
+    
+    status = pd.Series('teams_without_activity_date', index=teams_df.index)
+    status[last_active >= cutoff_date] = 'active_teams'
+    status[last_active < cutoff_date] = 'inactive_teams'
+    metrics.update({key: int(count) for key, count in status.value_counts().items()})
+    
+    days_inactive = (pd.Timestamp(date.today()) - last_active).dt.days.dropna()
+    if not days_inactive.empty:
+        metrics['days_since_activity_median'] = float(days_inactive.quantile(0.5))
+        metrics['days_since_activity_p90'] = float(days_inactive.quantile(0.9))
     
     # Calculate percentages
     if metrics['total_teams'] > 0:
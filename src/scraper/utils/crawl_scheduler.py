@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+"""
+Crawl Scheduler for Paginated Provider APIs
+
+Runs several independent paginated streams (e.g. one per age/gender) concurrently
+under a single global request budget, with an append-only checkpoint per stream so
+an interrupted crawl resumes mid-pagination instead of starting over.
+
+Each stream is driven by a ``fetch_page(page)`` callable that returns a
+``(batch, total_pages)`` tuple. A batch is either a list of records or a columnar
+dict of equal-length lists; batches are kept as-is so providers can build their
+output table without per-row dicts. When ``total_pages`` is known the stream
+stops after that page; otherwise it stops at the first empty page.
+"""
+
+import json
+import logging
+import random
+import shutil
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+Batch = Union[List[Dict[str, Any]], Dict[str, List[Any]]]
+
+
+def batch_rows(batch: Optional[Batch]) -> int:
+    """Return the number of rows in a record list or columnar batch."""
+    if not batch:
+        return 0
+    if isinstance(batch, dict):
+        return len(next(iter(batch.values())))
+    return len(batch)
+
+
+class RateBudget:
+    """
+    Thread-safe global request budget shared by all crawl streams.
+
+    Requests are spaced at least ``1 / max_per_second`` seconds apart across
+    every thread; each caller reserves the next free slot and sleeps until it.
+    """
+
+    def __init__(self, max_per_second: float = 6.0):
+        """
+        Initialize the budget.
+
+        Args:
+            max_per_second: Maximum requests per second across all streams
+        """
+        self.interval = 1.0 / max_per_second if max_per_second > 0 else 0.0
+        self._lock = threading.Lock()
+        self._next_slot = time.monotonic()
+
+    def acquire(self) -> None:
+        """Block until the caller may issue its next request."""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+
+        delay = slot - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+
+
+class CrawlCheckpoint:
+    """
+    Append-only per-stream page journal.
+
+    Layout: ``{checkpoint_dir}/{stream_key}.jsonl`` with one JSON line per fetched
+    page (``{"page": n, "total_pages": t, "batch": ...}``) and a final
+    ``{"done": true}`` line once the stream is exhausted.
+    """
+
+    def __init__(self, checkpoint_dir: Path, max_age_hours: float = 24.0,
+                 logger: Optional[logging.Logger] = None):
+        """
+        Initialize the checkpoint, discarding journals older than max_age_hours.
+
+        Args:
+            checkpoint_dir: Directory holding per-stream journals
+            max_age_hours: Journals older than this are treated as stale
+            logger: Optional logger instance
+        """
+        self.checkpoint_dir = Path(checkpoint_dir)
+        self.logger = logger or logging.getLogger(__name__)
+        self._lock = threading.Lock()
+
+        marker = self.checkpoint_dir / "started_at"
+        if marker.exists():
+            started = datetime.fromisoformat(marker.read_text().strip())
+            age_hours = (datetime.now() - started).total_seconds() / 3600
+            if age_hours > max_age_hours:
+                self.logger.info(f"Discarding stale crawl checkpoint ({age_hours:.1f}h old)")
+                self.clear()
+
+        self.checkpoint_dir.mkdir(parents=True, exist_ok=True)
+        if not marker.exists():
+            marker.write_text(datetime.now().isoformat())
+
+    def _journal(self, stream_key: str) -> Path:
+        return self.checkpoint_dir / f"{stream_key}.jsonl"
+
+    def load(self, stream_key: str) -> Dict[str, Any]:
+        """
+        Replay a stream journal.
+
+        Returns:
+            Dictionary with batches, next_page, total_pages and done
+        """
+        state = {"batches": [], "next_page": 1, "total_pages": None, "done": False}
+        journal = self._journal(stream_key)
+        if not journal.exists():
+            return state
+
+        complete_bytes = 0
+        with open(journal, 'rb') as f:
+            for line in f:
+                if not line.endswith(b"\n"):
+                    # Torn final line from a crash mid-write: ignore it
+                    break
+                complete_bytes += len(line)
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if entry.get("done"):
+                    state["done"] = True
+                    continue
+                state["batches"].append(entry["batch"])
+                state["next_page"] = max(state["next_page"], entry["page"] + 1)
+                if entry.get("total_pages"):
+                    state["total_pages"] = entry["total_pages"]
+
+        # Drop the torn tail so the next append starts on a fresh line
+        if journal.stat().st_size > complete_bytes:
+            with self._lock, open(journal, 'r+b') as f:
+                f.truncate(complete_bytes)
+
+        return state
+
+    def append_page(self, stream_key: str, page: int, batch: Batch,
+                    total_pages: Optional[int]) -> None:
+        """Append one fetched page to the stream journal."""
+        line = json.dumps({"page": page, "total_pages": total_pages, "batch": batch}, default=str)
+        with self._lock, open(self._journal(stream_key), 'a', encoding='utf-8') as f:
+            f.write(line + "\n")
+
+    def mark_done(self, stream_key: str) -> None:
+        """Record that a stream reached its last page."""
+        with self._lock, open(self._journal(stream_key), 'a', encoding='utf-8') as f:
+            f.write(json.dumps({"done": True}) + "\n")
+
+    def clear(self) -> None:
+        """Remove all stream journals."""
+        shutil.rmtree(self.checkpoint_dir, ignore_errors=True)
+
+
+def crawl_stream(stream_key: str, fetch_page: Callable[[int], Tuple[Optional[Batch], Optional[int]]],
+                 budget: RateBudget, checkpoint: Optional[CrawlCheckpoint] = None,
+                 page_delay: Tuple[float, float] = (0.0, 0.0),
+                 logger: Optional[logging.Logger] = None) -> Dict[str, Any]:
+    """
+    Crawl one paginated stream to completion.
+
+    Args:
+        stream_key: Unique stream identifier (used for checkpoints and logs)
+        fetch_page: Callable returning (batch, total_pages) for a page number;
+            batch is None when the page could not be fetched
+        budget: Shared global rate budget
+        checkpoint: Optional checkpoint for resume support
+        page_delay: (min, max) politeness delay between pages of this stream
+        logger: Optional logger instance
+
+    Returns:
+        Dictionary with stream_key, batches, rows, pages, complete flag and
+        error (None unless a page could not be fetched)
+    """
+    logger = logger or logging.getLogger(__name__)
+    state = checkpoint.load(stream_key) if checkpoint else {
+        "batches": [], "next_page": 1, "total_pages": None, "done": False
+    }
+    batches = state["batches"]
+    rows = sum(batch_rows(batch) for batch in batches)
+    page = state["next_page"]
+    total_pages = state["total_pages"]
+
+    if state["done"]:
+        logger.info(f"Stream {stream_key} already complete in checkpoint ({rows} records)")
+        return {"stream_key": stream_key, "batches": batches, "rows": rows, "pages": page - 1,
+                "complete": True, "error": None}
+    if page > 1:
+        logger.info(f"Resuming stream {stream_key} at page {page} ({rows} records restored)")
+
+    complete = False
+    error = None
+    while True:
+        if total_pages is not None and page > total_pages:
+            complete = True
+            break
+
+        budget.acquire()
+        batch, page_total = fetch_page(page)
+
+        if batch is None:
+            error = f"page {page} could not be fetched"
+            logger.warning(f"Stream {stream_key}: {error} - stopping stream")
+            break
+        if batch_rows(batch) == 0:
+            complete = True
+            break
+
+        total_pages = page_total or total_pages
+        batches.append(batch)
+        rows += batch_rows(batch)
+        if checkpoint:
+            checkpoint.append_page(stream_key, page, batch, total_pages)
+
+        page += 1
+        if page_delay[1] > 0 and (total_pages is None or page <= total_pages):
+            time.sleep(random.uniform(*page_delay))
+
+    if complete and checkpoint:
+        checkpoint.mark_done(stream_key)
+
+    return {"stream_key": stream_key, "batches": batches, "rows": rows, "pages": page - 1,
+            "complete": complete, "error": error}
+
+
+def crawl_streams(streams: Dict[str, Callable[[int], Tuple[Optional[Batch], Optional[int]]]],
+                  max_workers: int = 6, max_per_second: float = 6.0,
+                  checkpoint: Optional[CrawlCheckpoint] = None,
+                  page_delay: Tuple[float, float] = (0.0, 0.0),
+                  logger: Optional[logging.Logger] = None) -> Dict[str, Dict[str, Any]]:
+    """
+    Crawl many paginated streams concurrently under one global rate budget.
+
+    Args:
+        streams: Mapping of stream_key -> fetch_page callable
+        max_workers: Number of streams crawled at once
+        max_per_second: Global request budget across all streams
+        checkpoint: Optional checkpoint for resume support
+        page_delay: (min, max) politeness delay between pages of one stream
+        logger: Optional logger instance
+
+    Returns:
+        Mapping of stream_key -> crawl_stream result, in the order of streams.
+        A stream whose fetch raised is reported with complete=False and the
+        exception message as its error.
+    """
+    logger = logger or logging.getLogger(__name__)
+    budget = RateBudget(max_per_second)
+    results: Dict[str, Dict[str, Any]] = {}
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(crawl_stream, key, fetch, budget, checkpoint, page_delay, logger): key
+            for key, fetch in streams.items()
+        }
+        for future in as_completed(futures):
+            key = futures[future]
+            try:
+                results[key] = future.result()
+            except Exception as e:
+                logger.error(f"Stream {key} failed: {e}")
+                results[key] = {"stream_key": key, "batches": [], "rows": 0, "pages": 0,
+                                "complete": False, "error": str(e)}
+
+    # Report streams in the order given, not completion order
+    return {key: results[key] for key in streams}
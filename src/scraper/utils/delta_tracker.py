@@ -5,11 +5,12 @@ Delta Tracker - Detects changes between master index builds.
 This module provides functionality to compare two master index builds and detect:
 - Added teams (exist in new but not in old)
 - Removed teams (exist in old but not in new) 
-- Renamed teams (same metadata but different team names)
+- Renamed teams (same metadata, similar but different team names)
 
 Author: Youth Soccer Master Index System
 """
 
+import numpy as np
 import pandas as pd
 import logging
 from pathlib import Path
@@ -28,10 +29,26 @@ except ImportError:
     process = None
 
 
+# Columns identifying a team across builds, and the metadata block renames are searched within
+KEY_COLUMNS = ["team_name", "age_group", "gender", "state"]
+BLOCK_COLUMNS = ["age_group", "gender", "state"]
+RENAME_SIMILARITY_THRESHOLD = 70
+
+
+def _hash_keys(df: pd.DataFrame, columns: List[str]) -> np.ndarray:
+    """Hash a multi-column key to one uint64 per row (string-normalized, index ignored)."""
+    return pd.util.hash_pandas_object(df[columns].astype(str), index=False).to_numpy()
+
+
 def compare_builds(new_df: pd.DataFrame, old_df: pd.DataFrame, logger: Optional[logging.Logger] = None) -> Dict[str, pd.DataFrame]:
     """
     Compare two master index builds and detect changes.
     
+    Teams are identified by (team_name, age_group, gender, state); added and
+    removed teams are anti-joins on hashed keys of those columns. Renames are
+    searched only among those unmatched rows, within the same
+    (age_group, gender, state) block.
+    
     Args:
         new_df: DataFrame with the new build data
         old_df: DataFrame with the old build data
@@ -50,12 +67,9 @@ def compare_builds(new_df: pd.DataFrame, old_df: pd.DataFrame, logger: Optional[
         logger.info(f"📊 New build: {len(new_df):,} teams")
         logger.info(f"📊 Old build: {len(old_df):,} teams")
     
-    # Define comparison columns (excluding team_name for renamed detection)
-    comparison_cols = ["age_group", "gender", "state"]
-    
-    # Check if all comparison columns exist in both DataFrames
-    missing_cols_new = [col for col in comparison_cols if col not in new_df.columns]
-    missing_cols_old = [col for col in comparison_cols if col not in old_df.columns]
+    # Check if all key columns exist in both DataFrames
+    missing_cols_new = [col for col in KEY_COLUMNS if col not in new_df.columns]
+    missing_cols_old = [col for col in KEY_COLUMNS if col not in old_df.columns]
     
     if missing_cols_new:
         raise ValueError(f"Missing columns in new DataFrame: {missing_cols_new}")
@@ -63,31 +77,18 @@ def compare_builds(new_df: pd.DataFrame, old_df: pd.DataFrame, logger: Optional[
     if missing_cols_old:
         raise ValueError(f"Missing columns in old DataFrame: {missing_cols_old}")
     
-    # Create comparison keys for both DataFrames (excluding team_name)
-    new_keys = new_df[comparison_cols].apply(lambda x: '|'.join(x.astype(str)), axis=1)
-    old_keys = old_df[comparison_cols].apply(lambda x: '|'.join(x.astype(str)), axis=1)
-    
-    # Add keys as temporary columns
-    new_df_temp = new_df.copy()
-    old_df_temp = old_df.copy()
-    new_df_temp['_comparison_key'] = new_keys
-    old_df_temp['_comparison_key'] = old_keys
+    # Hashed team keys (no copies of the full frames)
+    new_keys = _hash_keys(new_df, KEY_COLUMNS)
+    old_keys = _hash_keys(old_df, KEY_COLUMNS)
     
-    # Find added teams (exist in new but not in old)
-    added_mask = ~new_keys.isin(old_keys)
-    added_df = new_df_temp[added_mask].drop('_comparison_key', axis=1).copy()
+    # Anti-joins: added exist only in new, removed exist only in old
+    added_mask = ~pd.Index(new_keys).isin(old_keys)
+    removed_mask = ~pd.Index(old_keys).isin(new_keys)
+    added_df = new_df[added_mask].reset_index(drop=True)
+    removed_df = old_df[removed_mask].reset_index(drop=True)
     
-    # Find removed teams (exist in old but not in new)
-    removed_mask = ~old_keys.isin(new_keys)
-    removed_df = old_df_temp[removed_mask].drop('_comparison_key', axis=1).copy()
-    
-    # Find potentially renamed teams (same metadata but different team names)
-    renamed_df = _detect_renamed_teams(new_df_temp, old_df_temp, logger)
-    
-    # Reset indices
-    added_df = added_df.reset_index(drop=True)
-    removed_df = removed_df.reset_index(drop=True)
-    renamed_df = renamed_df.reset_index(drop=True)
+    # Potential renames among the unmatched rows only
+    renamed_df = _detect_renamed_teams(added_df, removed_df, logger)
     
     # Log summary
     if logger:
@@ -113,68 +114,77 @@ def compare_builds(new_df: pd.DataFrame, old_df: pd.DataFrame, logger: Optional[
     }
 
 
-def _detect_renamed_teams(new_df: pd.DataFrame, old_df: pd.DataFrame, logger: Optional[logging.Logger] = None) -> pd.DataFrame:
+def _detect_renamed_teams(added_df: pd.DataFrame, removed_df: pd.DataFrame, logger: Optional[logging.Logger] = None) -> pd.DataFrame:
     """
     Detect potentially renamed teams using fuzzy matching.
     
-    This function looks for teams that have the same metadata (age_group, gender, state)
-    but different team names, suggesting they might be the same team with a name change.
+    Each added team is matched against the removed teams with the same metadata
+    (age_group, gender, state). Similarities for a block are computed in one
+    rapidfuzz cdist call; the best match above the threshold is reported.
     
     Args:
-        new_df: DataFrame with new build data (includes _comparison_key)
-        old_df: DataFrame with old build data (includes _comparison_key)
+        added_df: Teams only in the new build
+        removed_df: Teams only in the old build
         logger: Optional logger instance
         
     Returns:
         DataFrame with potentially renamed teams
     """
+    columns = ['old_team_name', 'new_team_name', 'age_group', 'gender', 'state', 'similarity_score',
+               'old_rank', 'new_rank', 'old_points', 'new_points']
+    if fuzz is None or process is None or added_df.empty or removed_df.empty:
+        return pd.DataFrame(columns=columns)
+    
     if logger:
         logger.info("🔍 Detecting potentially renamed teams...")
     
-    renamed_teams = []
-    
-    # Group by comparison key to find teams with same metadata
-    new_grouped = new_df.groupby('_comparison_key')
-    old_grouped = old_df.groupby('_comparison_key')
-    
-    # Find keys that exist in both builds
-    common_keys = set(new_df['_comparison_key'].unique()) & set(old_df['_comparison_key'].unique())
-    
-    for key in common_keys:
-        new_teams = new_grouped.get_group(key)
-        old_teams = old_grouped.get_group(key)
-        
-        # If different number of teams with same metadata, might be renamed
-        if len(new_teams) != len(old_teams):
-            # Use fuzzy matching to find potential renames
-            if fuzz is not None and process is not None:
-                for _, new_team in new_teams.iterrows():
-                    old_names = old_teams['team_name'].tolist()
-                    if old_names:
-                        # Find best match using fuzzy matching
-                        best_match = process.extractOne(new_team['team_name'], old_names)
-                        if best_match and best_match[1] > 70:  # 70% similarity threshold
-                            # Found a potential rename
-                            old_team = old_teams[old_teams['team_name'] == best_match[0]].iloc[0]
-                            renamed_teams.append({
-                                'old_team_name': old_team['team_name'],
-                                'new_team_name': new_team['team_name'],
-                                'age_group': new_team['age_group'],
-                                'gender': new_team['gender'],
-                                'state': new_team['state'],
-                                'similarity_score': best_match[1],
-                                'old_rank': old_team.get('rank', 'N/A'),
-                                'new_rank': new_team.get('rank', 'N/A'),
-                                'old_points': old_team.get('points', 'N/A'),
-                                'new_points': new_team.get('points', 'N/A')
-                            })
-    
-    if logger and renamed_teams:
-        logger.info(f"✏️ Found {len(renamed_teams)} potentially renamed teams")
-        for rename in renamed_teams[:3]:  # Show first 3 examples
-            logger.info(f"   '{rename['old_team_name']}' → '{rename['new_team_name']}' ({rename['similarity_score']:.1f}% match)")
-    
-    return pd.DataFrame(renamed_teams)
+    new_names = added_df['team_name'].astype(str).to_numpy()
+    old_names = removed_df['team_name'].astype(str).to_numpy()
+    old_blocks = pd.Series(np.arange(len(removed_df))).groupby(_hash_keys(removed_df, BLOCK_COLUMNS)).indices
+    new_blocks = pd.Series(np.arange(len(added_df))).groupby(_hash_keys(added_df, BLOCK_COLUMNS)).indices
+    
+    new_pos, old_pos, scores = [], [], []
+    for block, new_idx in new_blocks.items():
+        old_idx = old_blocks.get(block)
+        if old_idx is None:
+            continue
+        similarity = process.cdist(new_names[new_idx], old_names[old_idx], scorer=fuzz.WRatio)
+        best = similarity.argmax(axis=1)
+        best_score = similarity[np.arange(len(new_idx)), best]
+        keep = best_score > RENAME_SIMILARITY_THRESHOLD
+        new_pos.append(new_idx[keep])
+        old_pos.append(old_idx[best[keep]])
+        scores.append(best_score[keep])
+    
+    if not new_pos:
+        return pd.DataFrame(columns=columns)
+    new_pos = np.concatenate(new_pos)
+    old_pos = np.concatenate(old_pos)
+    
+    def _take(df: pd.DataFrame, column: str, positions: np.ndarray) -> np.ndarray:
+        if column not in df.columns:
+            return np.full(len(positions), 'N/A', dtype=object)
+        return df[column].to_numpy()[positions]
+    
+    renamed = pd.DataFrame({
+        'old_team_name': old_names[old_pos],
+        'new_team_name': new_names[new_pos],
+        'age_group': _take(added_df, 'age_group', new_pos),
+        'gender': _take(added_df, 'gender', new_pos),
+        'state': _take(added_df, 'state', new_pos),
+        'similarity_score': np.concatenate(scores),
+        'old_rank': _take(removed_df, 'rank', old_pos),
+        'new_rank': _take(added_df, 'rank', new_pos),
+        'old_points': _take(removed_df, 'points', old_pos),
+        'new_points': _take(added_df, 'points', new_pos)
+    })
+    
+    if logger and not renamed.empty:
+        logger.info(f"✏️ Found {len(renamed)} potentially renamed teams")
+        for rename in renamed.head(3).itertuples():  # Show first 3 examples
+            logger.info(f"   '{rename.old_team_name}' → '{rename.new_team_name}' ({rename.similarity_score:.1f}% match)")
+    
+    return renamed
 
 
 def save_deltas_to_csv(deltas: Dict[str, pd.DataFrame], timestamp: str, output_dir: str = "data/master/history") -> Dict[str, Path]:
@@ -18,6 +18,7 @@ from datetime import datetime
 from typing import List, Optional
 import csv
 from src.scraper.utils.logger import get_logger
+from src.io.safe_write import atomic_hashed_write
 
 
 def get_timestamp(fmt: str = "%Y%m%d_%H%M") -> str:
@@ -85,7 +86,8 @@ def safe_write_csv(
     
     This function provides a robust way to save DataFrames to CSV files,
     ensuring the target directory exists and providing optional logging
-    for successful operations.
+    for successful operations. The CSV is written to a temporary file and
+    atomically renamed, so readers never see a partially written file.
     
     Args:
         df: Pandas DataFrame to save
@@ -111,12 +113,13 @@ def safe_write_csv(
         # Ensure directory exists
         ensure_dir(path)
         
-        # Write CSV with UTF-8 encoding
-        df.to_csv(path, index=False, encoding="utf-8")
+        # Write CSV with UTF-8 encoding (atomic, checksummed while writing)
+        result = atomic_hashed_write(path, lambda writer: df.to_csv(writer, index=False, encoding="utf-8"),
+                                     logger=logger)
         
         # Log success if logger provided
         if logger:
-            logger.info(f"✅ Saved CSV → {path} ({len(df)} rows)")
+            logger.info(f"✅ Saved CSV → {path} ({len(df)} rows, {result['size_bytes']:,} bytes)")
         
         return path
         
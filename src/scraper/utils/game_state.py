@@ -4,6 +4,10 @@ Game State Checkpoint Management
 
 Manages checkpoint state for game history scraping to enable resumable builds.
 Tracks completed teams and per-team progress for incremental updates.
+
+Each slice checkpoint is a JSON snapshot plus an append-only journal with one
+line per completed team. Loading replays the journal on top of the snapshot;
+the journal is periodically compacted back into the snapshot.
 """
 
 import json
@@ -13,6 +17,9 @@ from pathlib import Path
 from typing import Dict, Any, Optional, List
 import pandas as pd
 
+# Journal lines appended before the checkpoint is compacted into a new snapshot
+JOURNAL_COMPACT_EVERY = 200
+
 
 class GameStateManager:
     """
@@ -30,19 +37,26 @@ class GameStateManager:
             }
         }
     }
+    
+    Journal lines ({slice}.journal.jsonl):
+    {"team_id": "team_id_1", "last_build_id": "...", "last_scraped_game_date": "2024-10-15", ...}
     """
     
-    def __init__(self, provider: str):
+    def __init__(self, provider: str, compact_every: int = JOURNAL_COMPACT_EVERY):
         """
         Initialize game state manager.
         
         Args:
             provider: Provider name (e.g., 'gotsport')
+            compact_every: Journal lines appended before compacting into a snapshot
         """
         self.provider = provider
+        self.compact_every = compact_every
         self.logger = logging.getLogger(__name__)
         self.state_dir = Path(f"data/game_history/state/{provider}")
         self.state_dir.mkdir(parents=True, exist_ok=True)
+        # Journal lines written since the last snapshot, per slice
+        self._journal_lines: Dict[Path, int] = {}
     
     def load_checkpoint(self, state: str, gender: str, age_group: str) -> Dict[str, Any]:
         """
@@ -57,16 +71,23 @@ class GameStateManager:
             Checkpoint dictionary or default empty state
         """
         checkpoint_file = self._get_checkpoint_path(state, gender, age_group)
+        journal_file = self._get_journal_path(checkpoint_file)
         
-        if not checkpoint_file.exists():
+        if not checkpoint_file.exists() and not journal_file.exists():
             self.logger.info(f"No checkpoint found for {state}_{gender}_{age_group}")
             return self._get_default_checkpoint()
         
         try:
-            with open(checkpoint_file, 'r') as f:
-                checkpoint = json.load(f)
+            if checkpoint_file.exists():
+                with open(checkpoint_file, 'r') as f:
+                    checkpoint = json.load(f)
+            else:
+                checkpoint = self._get_default_checkpoint()
             
-            self.logger.info(f"Loaded checkpoint for {state}_{gender}_{age_group}")
+            replayed = self._replay_journal(checkpoint, journal_file)
+            
+            self.logger.info(f"Loaded checkpoint for {state}_{gender}_{age_group}"
+                             + (f" ({replayed} journal entries replayed)" if replayed else ""))
             self.logger.debug(f"Checkpoint: {checkpoint}")
             
             return checkpoint
@@ -77,7 +98,9 @@ class GameStateManager:
     
     def save_checkpoint(self, state: str, gender: str, age_group: str, checkpoint: Dict[str, Any]) -> None:
         """
-        Save checkpoint data for a specific slice.
+        Save a full checkpoint snapshot for a specific slice.
+        
+        The snapshot supersedes the slice journal, which is removed afterwards.
         
         Args:
             state: State code (e.g., 'AZ')
@@ -99,12 +122,51 @@ class GameStateManager:
             # Atomic move
             temp_file.replace(checkpoint_file)
             
+            # Journal is now folded into the snapshot (replaying it again would be harmless)
+            self._get_journal_path(checkpoint_file).unlink(missing_ok=True)
+            self._journal_lines[checkpoint_file] = 0
+            
             self.logger.debug(f"Saved checkpoint for {state}_{gender}_{age_group}")
             
         except Exception:
             self.logger.exception(f"Error saving checkpoint {checkpoint_file}")
             raise
     
+    def append_team_checkpoint(self, state: str, gender: str, age_group: str,
+                               checkpoint: Dict[str, Any], team_id: str) -> None:
+        """
+        Persist one completed team by appending a line to the slice journal.
+        
+        The first call for a slice in this manager writes a full snapshot (so a
+        fresh, non-resumed checkpoint replaces any previous state), and the
+        journal is compacted into a snapshot every compact_every lines.
+        
+        Args:
+            state: State code (e.g., 'AZ')
+            gender: Gender ('M' or 'F')
+            age_group: Age group (e.g., 'U10')
+            checkpoint: Checkpoint data already updated by mark_team_complete
+            team_id: Team ID that was just completed
+        """
+        checkpoint_file = self._get_checkpoint_path(state, gender, age_group)
+        written = self._journal_lines.get(checkpoint_file)
+        
+        if written is None or written >= self.compact_every:
+            self.save_checkpoint(state, gender, age_group, checkpoint)
+            return
+        
+        entry = {'team_id': team_id, 'last_build_id': checkpoint.get('last_build_id')}
+        entry.update(checkpoint.get('per_team', {}).get(team_id, {}))
+        
+        try:
+            with open(self._get_journal_path(checkpoint_file), 'a') as f:
+                f.write(json.dumps(entry, default=str) + "\n")
+            self._journal_lines[checkpoint_file] = written + 1
+            
+        except Exception:
+            self.logger.exception(f"Error appending checkpoint journal for {state}_{gender}_{age_group}")
+            raise
+    
     def mark_team_complete(self, checkpoint: Dict[str, Any], team_id: str, last_game_date: Optional[date], games_scraped: int = 0) -> Dict[str, Any]:
         """
         Mark a team as completed in the checkpoint.
@@ -204,6 +266,52 @@ class GameStateManager:
         filename = f"{state}_{gender}_{age_group}.json"
         return self.state_dir / filename
     
+    def _get_journal_path(self, checkpoint_file: Path) -> Path:
+        """Get the append-only journal path for a slice checkpoint."""
+        return checkpoint_file.with_suffix('.journal.jsonl')
+    
+    def _replay_journal(self, checkpoint: Dict[str, Any], journal_file: Path) -> int:
+        """
+        Apply journal entries to a checkpoint loaded from its snapshot.
+        
+        Args:
+            checkpoint: Snapshot checkpoint (updated in place)
+            journal_file: Slice journal path
+            
+        Returns:
+            Number of entries replayed
+        """
+        if not journal_file.exists():
+            return 0
+        
+        completed_teams = checkpoint.setdefault('completed_teams', [])
+        per_team = checkpoint.setdefault('per_team', {})
+        completed = set(completed_teams)
+        replayed = 0
+        
+        with open(journal_file, 'r') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    # Torn final line from a crash mid-write: ignore it
+                    continue
+                
+                team_id = entry.pop('team_id', None) if isinstance(entry, dict) else None
+                if team_id is None:
+                    self.logger.warning(f"Skipping journal entry without team_id in {journal_file}")
+                    continue
+                build_id = entry.pop('last_build_id', None)
+                if build_id:
+                    checkpoint['last_build_id'] = build_id
+                if team_id not in completed:
+                    completed.add(team_id)
+                    completed_teams.append(team_id)
+                per_team[team_id] = entry
+                replayed += 1
+        
+        return replayed
+    
     def _get_default_checkpoint(self) -> Dict[str, Any]:
         """Get default empty checkpoint structure."""
         return {
@@ -221,7 +329,7 @@ class GameStateManager:
         """
         cutoff_time = datetime.now().timestamp() - (keep_days * 24 * 60 * 60)
         
-        for checkpoint_file in self.state_dir.glob("*.json"):
+        for checkpoint_file in [*self.state_dir.glob("*.json"), *self.state_dir.glob("*.journal.jsonl")]:
             if checkpoint_file.stat().st_mtime < cutoff_time:
                 self.logger.info(f"Removing old checkpoint: {checkpoint_file}")
                 checkpoint_file.unlink()
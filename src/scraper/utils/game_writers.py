@@ -4,17 +4,35 @@ Game Writers Utilities
 
 Handles writing game history data to CSV files with atomic operations.
 Creates both games CSV and club lookup CSV outputs.
+
+Club lookups are keyed by normalized (club_name, state). Each club lookup CSV
+has a Parquet twin holding the same keyed table, which incremental builds
+upsert into instead of re-parsing the previous CSV.
 """
 
 import pandas as pd
 import logging
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Union
 from datetime import datetime
 
-from src.io.safe_write import safe_write_csv
+from src.io.safe_write import safe_write_csv, safe_write_parquet
 from src.schema.game_history_schema import validate_games_dataframe, validate_club_lookup_dataframe, GAMES_COLUMNS, CLUB_COLUMNS
 
+# How each club column is combined when several rows share a club key:
+# 'first'/'last' take the first/last non-null value in row order
+CLUB_AGGREGATIONS = {
+    'provider': 'last',
+    'club_id': 'first',
+    'club_name': 'first',
+    'state': 'first',
+    'city': 'first',
+    'website': 'first',
+    'first_seen_at': 'first',
+    'last_seen_at': 'last',
+    'source_url': 'first'
+}
+
 
 def write_games_csv(games_df: pd.DataFrame, provider: str, state: str, gender: str, age_group: str, build_id: str, incremental: bool = False, existing_file: Optional[Path] = None) -> Path:
     """
@@ -105,7 +123,7 @@ def write_games_csv(games_df: pd.DataFrame, provider: str, state: str, gender: s
         raise
 
 
-def write_club_lookup_csv(games_df: pd.DataFrame, provider: str, state: str, gender: str, age_group: str, build_id: str, incremental: bool = False, existing_file: Optional[Path] = None) -> Path:
+def write_club_lookup_csv(games_df: pd.DataFrame, provider: str, state: str, gender: str, age_group: str, build_id: str, incremental: bool = False, existing_file: Optional[Path] = None, clubs_df: Optional[pd.DataFrame] = None) -> Path:
     """
     Write club lookup data to CSV file with atomic operation.
     
@@ -116,8 +134,9 @@ def write_club_lookup_csv(games_df: pd.DataFrame, provider: str, state: str, gen
         gender: Gender ('M' or 'F')
         age_group: Age group (e.g., 'U10')
         build_id: Build identifier
-        incremental: If True, append to existing file instead of overwriting
+        incremental: If True, upsert into the existing club table instead of overwriting
         existing_file: Path to existing file for incremental mode
+        clubs_df: Clubs already extracted from games_df (extracted here if None)
         
     Returns:
         Path to written CSV file
@@ -135,15 +154,13 @@ def write_club_lookup_csv(games_df: pd.DataFrame, provider: str, state: str, gen
         return None
     
     # Extract unique clubs from games
-    clubs_data = extract_clubs_from_games(games_df, provider)
+    if clubs_df is None:
+        clubs_df = extract_clubs_frame(games_df, provider)
     
-    if not clubs_data:
+    if clubs_df.empty:
         logger.warning(f"No clubs found in games for {provider}_{state}_{gender}_{age_group}")
         return None
     
-    # Create DataFrame
-    clubs_df = pd.DataFrame(clubs_data)
-    
     # Validate data against schema
     try:
         validated_df = validate_club_lookup_dataframe(clubs_df)
@@ -177,12 +194,9 @@ def write_club_lookup_csv(games_df: pd.DataFrame, provider: str, state: str, gen
     # Write CSV with atomic operation
     try:
         if incremental and existing_file and existing_file.exists():
-            # Append mode: read existing data, combine, and write
-            existing_df = pd.read_csv(existing_file)
-            combined_df = pd.concat([existing_df, validated_df], ignore_index=True)
-            # Remove duplicates based on club_id if it exists
-            if 'club_id' in combined_df.columns:
-                combined_df = combined_df.drop_duplicates(subset=['club_id'], keep='last')
+            # Upsert mode: merge new clubs into the existing keyed club table
+            existing_df = load_club_table(existing_file)
+            combined_df = upsert_clubs(existing_df, validated_df)
             
             # For incremental mode, write to a new file in the current build directory
             # to avoid file locking issues
@@ -191,12 +205,13 @@ def write_club_lookup_csv(games_df: pd.DataFrame, provider: str, state: str, gen
             incremental_filename = f"club_lookup_{provider}_{state}_{gender}_{age_group}_incremental.csv"
             incremental_output_path = incremental_output_dir / incremental_filename
             
-            safe_write_csv(combined_df, incremental_output_path)
-            logger.info(f"Appended {len(validated_df)} new clubs to {incremental_output_path} (total: {len(combined_df)})")
+            _write_club_table(combined_df, incremental_output_path)
+            logger.info(f"Upserted {len(validated_df)} clubs into {incremental_output_path} "
+                        f"({len(combined_df) - len(existing_df)} new, total: {len(combined_df)})")
             return incremental_output_path
         else:
             # Overwrite mode: write new file
-            safe_write_csv(validated_df, output_path)
+            _write_club_table(validated_df, output_path)
             logger.info(f"Wrote {len(validated_df)} clubs to {output_path}")
             return output_path
     except Exception as e:
@@ -204,64 +219,142 @@ def write_club_lookup_csv(games_df: pd.DataFrame, provider: str, state: str, gen
         raise
 
 
-def extract_clubs_from_games(games_df: pd.DataFrame, provider: str) -> List[Dict[str, Any]]:
+def club_keys(clubs_df: pd.DataFrame) -> pd.Series:
     """
-    Extract unique clubs from games data.
+    Build normalized club keys from club_name and state.
+    
+    Names are case-folded with whitespace collapsed, so "FC  Elite" and
+    "fc elite" in the same state are one club.
+    
+    Args:
+        clubs_df: DataFrame with club_name and state columns
+        
+    Returns:
+        Series of "{normalized club name}|{state}" keys
+    """
+    names = clubs_df['club_name'].astype(str).str.strip().str.replace(r'\s+', ' ', regex=True).str.casefold()
+    states = clubs_df['state'].fillna('').astype(str).str.strip().str.upper()
+    return names + '|' + states
+
+
+def _combine_clubs(clubs_df: pd.DataFrame) -> pd.DataFrame:
+    """Collapse rows sharing a club key, keeping first-appearance order."""
+    aggregations = {col: how for col, how in CLUB_AGGREGATIONS.items() if col in clubs_df.columns}
+    combined = clubs_df.groupby(club_keys(clubs_df), sort=False).agg(aggregations)
+    return combined.reset_index(drop=True)
+
+
+def extract_clubs_frame(games_df: pd.DataFrame, provider: str) -> pd.DataFrame:
+    """
+    Extract unique clubs from games data as a DataFrame.
+    
+    Games are grouped on normalized (club_name, state); each club keeps the
+    first non-empty city and source URL seen in its games.
     
     Args:
         games_df: DataFrame with game data
         provider: Provider name
         
     Returns:
-        List of club dictionaries
+        DataFrame with one row per club (CLUB_COLUMNS)
     """
     logger = logging.getLogger(__name__)
     
-    clubs = {}
+    if 'club_name' not in games_df.columns:
+        return pd.DataFrame(columns=CLUB_COLUMNS)
+    
+    # Keep games with a non-empty club name
+    games = games_df[games_df['club_name'].notna()]
+    club_names = games['club_name'].astype(str).str.strip()
+    games = games[club_names != '']
+    
+    def _column(name: str, default: Any) -> Any:
+        # Empty strings count as missing so 'first' picks the first usable value
+        return games[name].mask(games[name] == '') if name in games.columns else default
+    
+    clubs = pd.DataFrame({
+        'club_name': club_names[club_names != ''],
+        'state': _column('state', ''),
+        'city': _column('city', None),
+        'source_url': _column('source_url', None)
+    })
+    clubs['state'] = clubs['state'].fillna('')
+    clubs = _combine_clubs(clubs)
+    
     current_time = datetime.utcnow().isoformat()
+    clubs['provider'] = provider
+    clubs['club_id'] = None  # Not available from games
+    clubs['website'] = None  # Not available from games
+    clubs['first_seen_at'] = current_time
+    clubs['last_seen_at'] = current_time
+    clubs['source_url'] = clubs['source_url'].fillna('')
+    clubs['city'] = clubs['city'].astype(object).where(clubs['city'].notna(), None)
     
-    # Process each game to extract club information
-    for _, game in games_df.iterrows():
-        club_name = game.get('club_name')
-        if pd.isna(club_name) or not club_name:
-            continue
-        
-        club_name = str(club_name).strip()
-        if not club_name:
-            continue
-        
-        # Create club key (name + state for uniqueness)
-        club_key = f"{club_name}_{game.get('state', '')}"
+    logger.info(f"Extracted {len(clubs)} unique clubs from {len(games_df)} games")
+    
+    return clubs[CLUB_COLUMNS]
+
+
+def extract_clubs_from_games(games_df: pd.DataFrame, provider: str) -> List[Dict[str, Any]]:
+    """
+    Extract unique clubs from games data.
+    
+    Args:
+        games_df: DataFrame with game data
+        provider: Provider name
         
-        if club_key not in clubs:
-            clubs[club_key] = {
-                'provider': provider,
-                'club_id': None,  # Not available from games
-                'club_name': club_name,
-                'state': game.get('state', ''),
-                'city': game.get('city', ''),
-                'website': None,  # Not available from games
-                'first_seen_at': current_time,
-                'last_seen_at': current_time,
-                'source_url': game.get('source_url', '')
-            }
-        else:
-            # Update last_seen_at
-            clubs[club_key]['last_seen_at'] = current_time
-            
-            # Update city if available and different
-            game_city = game.get('city')
-            if game_city and pd.notna(game_city) and not clubs[club_key]['city']:
-                clubs[club_key]['city'] = str(game_city)
+    Returns:
+        List of club dictionaries
+    """
+    return extract_clubs_frame(games_df, provider).to_dict('records')
+
+
+def upsert_clubs(existing_df: pd.DataFrame, clubs_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Upsert clubs into an existing club table keyed by normalized (club_name, state).
     
-    clubs_list = list(clubs.values())
-    logger.info(f"Extracted {len(clubs_list)} unique clubs from {len(games_df)} games")
+    Known clubs keep their first_seen_at and any values already recorded
+    (club_id, city, website, source_url) and get last_seen_at refreshed;
+    unknown clubs are appended.
     
-    return clubs_list
+    Args:
+        existing_df: Existing club table
+        clubs_df: Newly extracted clubs
+        
+    Returns:
+        Combined club table (CLUB_COLUMNS)
+    """
+    combined = _combine_clubs(pd.concat([existing_df, clubs_df], ignore_index=True))
+    for col in CLUB_COLUMNS:
+        if col not in combined.columns:
+            combined[col] = None
+    return combined[CLUB_COLUMNS]
+
+
+def load_club_table(club_file: Path) -> pd.DataFrame:
+    """
+    Load a club table, preferring its Parquet twin over the CSV.
+    
+    Args:
+        club_file: Path to a club lookup CSV
+        
+    Returns:
+        Club table DataFrame
+    """
+    parquet_file = Path(club_file).with_suffix('.parquet')
+    if parquet_file.exists():
+        return pd.read_parquet(parquet_file)
+    return pd.read_csv(club_file, dtype=str)
+
+
+def _write_club_table(clubs_df: pd.DataFrame, output_path: Path) -> None:
+    """Write a club table as CSV plus its keyed Parquet twin."""
+    safe_write_csv(clubs_df, output_path)
+    safe_write_parquet(clubs_df.astype(object).where(clubs_df.notna(), None), output_path.with_suffix('.parquet'))
 
 
 def write_slice_summary(games_df: pd.DataFrame, provider: str, state: str, gender: str, age_group: str, build_id: str, 
-                       teams_processed: int, games_scraped: int, skipped_inactive: int, clubs_data: Optional[List[Dict[str, Any]]] = None) -> Path:
+                       teams_processed: int, games_scraped: int, skipped_inactive: int, clubs_data: Optional[Union[pd.DataFrame, List[Dict[str, Any]]]] = None) -> Path:
     """
     Write slice summary to JSON file.
     
@@ -275,6 +368,7 @@ def write_slice_summary(games_df: pd.DataFrame, provider: str, state: str, gende
         teams_processed: Number of teams processed
         games_scraped: Number of games scraped
         skipped_inactive: Number of teams skipped due to inactivity
+        clubs_data: Clubs already extracted from games_df (DataFrame or list)
         
     Returns:
         Path to written summary file
@@ -293,7 +387,7 @@ def write_slice_summary(games_df: pd.DataFrame, provider: str, state: str, gende
         'games_scraped': games_scraped,
         'games_written': len(games_df),
         'skipped_inactive': skipped_inactive,
-        'clubs_found': len(clubs_data) if clubs_data else (len(extract_clubs_from_games(games_df, provider)) if not games_df.empty else 0),
+        'clubs_found': len(clubs_data) if clubs_data is not None and len(clubs_data) else (len(extract_clubs_frame(games_df, provider)) if not games_df.empty else 0),
         'completed_at': datetime.utcnow().isoformat()
     }
     
@@ -6,10 +6,11 @@ Detects new teams by comparing scraped data against the existing master index.
 Only captures teams that are not already present in the baseline.
 """
 
+import numpy as np
 import pandas as pd
 import logging
 from pathlib import Path
-from typing import Optional, Tuple, Dict
+from typing import List, Optional, Tuple, Dict, Union
 import sys
 import os
 from datetime import datetime
@@ -24,19 +25,48 @@ except ImportError as e:
     print(f"Import error: {e}")
     sys.exit(1)
 
+# Columns that identify a team for incremental comparison
+COMPARISON_COLS = ["team_name", "age_group", "gender", "state"]
 
-def load_baseline_master(data_dir: str = "data/master", sample_mode: bool = False, 
-                        logger: Optional[logging.Logger] = None) -> pd.DataFrame:
+
+def hash_team_keys(df: pd.DataFrame, cols: List[str] = COMPARISON_COLS) -> np.ndarray:
     """
-    Load the baseline master CSV using metadata registry lookup.
+    Hash the comparison key columns of each row to a uint64.
+    
+    Values are compared as strings, so a row hashes the same as the
+    '|'-joined string key it replaces. Missing values (None or NaN) all hash
+    as 'nan', so in-memory frames match their CSV round trip.
+    
+    Args:
+        df: DataFrame containing the key columns
+        cols: Key columns to hash
+        
+    Returns:
+        Array of uint64 row hashes aligned with df
+    """
+    if df.empty:
+        return np.empty(0, dtype=np.uint64)
+    return pd.util.hash_pandas_object(df[cols].fillna('nan').astype(str), index=False).to_numpy()
+
+
+def _check_comparison_columns(df: pd.DataFrame, label: str) -> None:
+    """Raise ValueError if a DataFrame lacks a comparison column."""
+    missing_cols = [col for col in COMPARISON_COLS if col not in df.columns]
+    if missing_cols:
+        raise ValueError(f"Missing columns in {label} DataFrame: {missing_cols}")
+
+
+def find_baseline_master_path(data_dir: str = "data/master",
+                              logger: Optional[logging.Logger] = None) -> Path:
+    """
+    Locate the baseline master CSV using metadata registry lookup.
     
     Args:
         data_dir: Directory to search for master index files
-        sample_mode: If True, limit to first 5000 rows for testing
         logger: Optional logger instance for output
         
     Returns:
-        DataFrame with baseline master data
+        Path to the baseline master CSV
         
     Raises:
         FileNotFoundError: If no baseline master file found
@@ -45,57 +75,46 @@ def load_baseline_master(data_dir: str = "data/master", sample_mode: bool = Fals
         from src.registry.registry import get_registry
     except ImportError:
         # Fallback to old method if registry not available
-        return _load_baseline_master_fallback(data_dir, sample_mode, logger)
+        return _find_baseline_master_fallback(data_dir, logger)
     
     if logger is None:
         from src.scraper.utils.logger import get_logger
         logger = get_logger(__name__)
     
-    logger.info("📋 Loading baseline master from metadata registry...")
+    logger.info("📋 Locating baseline master from metadata registry...")
     
     # Load registry and get latest entry
     registry = get_registry()
     registry_data = registry.get_metadata_summary()
     if not registry_data or registry_data['total_builds'] == 0:
         logger.warning("⚠️ No entries in metadata registry, falling back to file search")
-        return _load_baseline_master_fallback(data_dir, sample_mode, logger)
+        return _find_baseline_master_fallback(data_dir, logger)
     
     latest_entry = registry.get_latest_metadata()
     if not latest_entry or 'master_file' not in latest_entry:
         logger.warning("⚠️ No master_file in latest registry entry, falling back to file search")
-        return _load_baseline_master_fallback(data_dir, sample_mode, logger)
+        return _find_baseline_master_fallback(data_dir, logger)
     
     baseline_file = Path(latest_entry['master_file'])
     if not baseline_file.exists():
         logger.warning(f"⚠️ Baseline file not found: {baseline_file}, falling back to file search")
-        return _load_baseline_master_fallback(data_dir, sample_mode, logger)
-    
-    logger.info(f"📂 Loading baseline from registry: {baseline_file}")
-    
-    # Load the DataFrame
-    df = pd.read_csv(baseline_file)
+        return _find_baseline_master_fallback(data_dir, logger)
     
-    # Apply sample mode if requested
-    if sample_mode and len(df) > 5000:
-        logger.info(f"🔬 Sample mode: limiting to first 5000 rows")
-        df = df.head(5000)
-    
-    logger.info(f"✅ Baseline loaded: {len(df):,} teams from {baseline_file}")
-    return df
+    logger.info(f"📂 Baseline from registry: {baseline_file}")
+    return baseline_file
 
 
-def _load_baseline_master_fallback(data_dir: str = "data/master", sample_mode: bool = False,
-                                  logger: Optional[logging.Logger] = None) -> pd.DataFrame:
+def _find_baseline_master_fallback(data_dir: str = "data/master",
+                                   logger: Optional[logging.Logger] = None) -> Path:
     """
-    Fallback method to load baseline master using file globbing.
+    Fallback method to locate the baseline master using file globbing.
     
     Args:
         data_dir: Directory to search for master index files
-        sample_mode: If True, limit to first 5000 rows for testing
         logger: Optional logger instance for output
         
     Returns:
-        DataFrame with baseline master data
+        Path to the newest USA-only master CSV
         
     Raises:
         FileNotFoundError: If no master index files found
@@ -104,7 +123,7 @@ def _load_baseline_master_fallback(data_dir: str = "data/master", sample_mode: b
         from src.scraper.utils.logger import get_logger
         logger = get_logger(__name__)
     
-    logger.info("📋 Loading baseline master using fallback file search...")
+    logger.info("📋 Locating baseline master using fallback file search...")
     
     data_path = Path(data_dir)
     
@@ -123,24 +142,140 @@ def _load_baseline_master_fallback(data_dir: str = "data/master", sample_mode: b
     # Sort by modification time (newest first)
     latest_file = max(master_files, key=lambda f: f.stat().st_mtime)
     
-    logger.info(f"📂 Loading baseline from file search: {latest_file}")
+    logger.info(f"📂 Baseline from file search: {latest_file}")
+    return latest_file
+
+
+def load_baseline_master(data_dir: str = "data/master", sample_mode: bool = False, 
+                        logger: Optional[logging.Logger] = None) -> pd.DataFrame:
+    """
+    Load the baseline master CSV using metadata registry lookup.
+    
+    Only needed when the full baseline rows are required (e.g. merging);
+    new-team detection can use load_baseline_index instead.
+    
+    Args:
+        data_dir: Directory to search for master index files
+        sample_mode: If True, limit to first 5000 rows for testing
+        logger: Optional logger instance for output
+        
+    Returns:
+        DataFrame with baseline master data
+        
+    Raises:
+        FileNotFoundError: If no baseline master file found
+    """
+    if logger is None:
+        from src.scraper.utils.logger import get_logger
+        logger = get_logger(__name__)
+    
+    baseline_file = find_baseline_master_path(data_dir, logger)
     
     # Load the DataFrame
-    df = pd.read_csv(latest_file)
+    df = pd.read_csv(baseline_file)
     
     # Apply sample mode if requested
     if sample_mode and len(df) > 5000:
         logger.info(f"🔬 Sample mode: limiting to first 5000 rows")
         df = df.head(5000)
     
-    logger.info(f"✅ Baseline loaded: {len(df):,} teams from {latest_file}")
+    logger.info(f"✅ Baseline loaded: {len(df):,} teams from {baseline_file}")
     return df
 
 
+def baseline_index_path(master_path: Path) -> Path:
+    """
+    Return the key index path stored next to a master CSV.
+    
+    Args:
+        master_path: Path to a master team index CSV
+        
+    Returns:
+        Path like master_team_index_USAonly_<ts>.keys.npy
+    """
+    master_path = Path(master_path)
+    return master_path.with_name(f"{master_path.stem}.keys.npy")
+
+
+def write_baseline_index(df: pd.DataFrame, master_path: Path,
+                         logger: Optional[logging.Logger] = None) -> Path:
+    """
+    Write the sorted comparison-key hashes of a master build next to its CSV.
+    
+    Args:
+        df: Master DataFrame that was written to master_path
+        master_path: Path to the master CSV
+        logger: Optional logger instance for output
+        
+    Returns:
+        Path to the written key index
+    """
+    index_path = baseline_index_path(master_path)
+    keys = np.unique(hash_team_keys(df))
+    
+    # Write to a temp file and replace, so readers never see a partial index
+    temp_path = index_path.with_name(f"{index_path.stem}.tmp.npy")
+    np.save(temp_path, keys)
+    os.replace(temp_path, index_path)
+    
+    if logger:
+        logger.info(f"🔑 Baseline key index saved: {index_path} ({len(keys):,} keys, {index_path.stat().st_size:,} bytes)")
+    return index_path
+
+
+def load_baseline_index(data_dir: str = "data/master",
+                        logger: Optional[logging.Logger] = None) -> np.ndarray:
+    """
+    Load the baseline key index memory-mapped, building it lazily if missing.
+    
+    Masters written before the index existed get one built from their four
+    comparison columns on first use; later runs only map the index file.
+    
+    Args:
+        data_dir: Directory to search for master index files
+        logger: Optional logger instance for output
+        
+    Returns:
+        Sorted uint64 array of baseline comparison-key hashes
+        
+    Raises:
+        FileNotFoundError: If no baseline master file found
+    """
+    if logger is None:
+        from src.scraper.utils.logger import get_logger
+        logger = get_logger(__name__)
+    
+    baseline_file = find_baseline_master_path(data_dir, logger)
+    index_path = baseline_index_path(baseline_file)
+    
+    if not index_path.exists() or index_path.stat().st_mtime < baseline_file.stat().st_mtime:
+        logger.info(f"🔑 Building baseline key index for {baseline_file.name}")
+        keys_df = pd.read_csv(baseline_file, usecols=COMPARISON_COLS)
+        write_baseline_index(keys_df, baseline_file, logger)
+    
+    keys = np.load(index_path, mmap_mode='r')
+    logger.info(f"✅ Baseline key index loaded: {len(keys):,} keys from {index_path}")
+    return keys
+
+
+def _in_baseline(hashes: np.ndarray, baseline_keys: np.ndarray) -> np.ndarray:
+    """Return a mask of hashes present in a sorted baseline key index."""
+    if len(baseline_keys) == 0:
+        return np.zeros(len(hashes), dtype=bool)
+    pos = np.searchsorted(baseline_keys, hashes)
+    pos[pos == len(baseline_keys)] = 0
+    return np.asarray(baseline_keys[pos]) == hashes
+
+
 def detect_new_teams_by_provider(new_df: pd.DataFrame, baseline_df: pd.DataFrame, 
                                 logger: Optional[logging.Logger] = None) -> Dict[str, Dict[str, int]]:
     """
-    Detect new teams grouped by provider.
+    Detect new, removed and renamed teams grouped by provider.
+    
+    Teams are matched on their hashed comparison key within the same provider,
+    in a single pass over both DataFrames. A team whose key changed but whose
+    team_id appears on both sides is counted as renamed rather than as an
+    addition plus a removal.
     
     Args:
         new_df: DataFrame with newly scraped data
@@ -157,40 +292,65 @@ def detect_new_teams_by_provider(new_df: pd.DataFrame, baseline_df: pd.DataFrame
     
     logger.info("🔍 Detecting new teams by provider...")
     
-    # Get unique providers in new data
-    providers = new_df['provider'].unique() if 'provider' in new_df.columns else ['unknown']
+    new_provider = new_df['provider'] if 'provider' in new_df.columns else pd.Series('unknown', index=new_df.index)
+    providers = new_provider.unique()
+    
+    # Only baseline rows of providers present in the new scrape take part
+    if 'provider' in baseline_df.columns:
+        baseline_df = baseline_df[baseline_df['provider'].isin(providers)]
+    else:
+        baseline_df = baseline_df.iloc[0:0]
+    
+    if not new_df.empty and not baseline_df.empty:
+        _check_comparison_columns(new_df, "new")
+        _check_comparison_columns(baseline_df, "baseline")
+    
+    key_cols = COMPARISON_COLS + ['provider']
+    new_hashes = hash_team_keys(new_df.assign(provider=new_provider), key_cols)
+    baseline_hashes = hash_team_keys(baseline_df, key_cols)
+    
+    added_mask = ~pd.Index(new_hashes).isin(baseline_hashes)
+    removed_mask = ~pd.Index(baseline_hashes).isin(new_hashes)
+    
+    added = new_provider[added_mask].value_counts()
+    removed = baseline_df.loc[removed_mask, 'provider'].value_counts() if not baseline_df.empty else pd.Series(dtype=int)
+    
+    # Renamed: same provider/team_id on both sides of the key diff
+    renamed = pd.Series(dtype=int)
+    if 'team_id' in new_df.columns and 'team_id' in baseline_df.columns:
+        added_ids = pd.DataFrame({'provider': new_provider[added_mask], 'team_id': new_df.loc[added_mask, 'team_id']})
+        removed_ids = baseline_df.loc[removed_mask, ['provider', 'team_id']]
+        matched = (
+            added_ids.dropna().drop_duplicates()
+            .merge(removed_ids.dropna().drop_duplicates(), on=['provider', 'team_id'])
+        )
+        matched = matched[matched['team_id'].astype(str).str.strip() != '']
+        renamed = matched['provider'].value_counts()
     
     provider_deltas = {}
-    
     for provider in providers:
-        logger.info(f"📊 Processing provider: {provider}")
-        
-        # Filter data for this provider
-        provider_new_df = new_df[new_df['provider'] == provider] if 'provider' in new_df.columns else new_df
-        provider_baseline_df = baseline_df[baseline_df['provider'] == provider] if 'provider' in baseline_df.columns else pd.DataFrame()
-        
-        # Detect new teams for this provider
-        new_teams = detect_new_teams(provider_new_df, provider_baseline_df, logger)
-        
+        n_renamed = int(renamed.get(provider, 0))
         provider_deltas[provider] = {
-            'added': len(new_teams),
-            'removed': 0,  # Not implemented yet
-            'renamed': 0   # Not implemented yet
+            'added': max(int(added.get(provider, 0)) - n_renamed, 0),
+            'removed': max(int(removed.get(provider, 0)) - n_renamed, 0),
+            'renamed': n_renamed
         }
-        
-        logger.info(f"   {provider}: {len(new_teams)} new teams")
+        logger.info(f"   {provider}: {provider_deltas[provider]['added']} new, "
+                    f"{provider_deltas[provider]['removed']} removed, {n_renamed} renamed")
     
     logger.info(f"📈 Provider delta summary: {provider_deltas}")
     return provider_deltas
 
 
-def detect_new_teams(new_df: pd.DataFrame, baseline_df: pd.DataFrame, logger: Optional[logging.Logger] = None) -> pd.DataFrame:
+def detect_new_teams(new_df: pd.DataFrame, baseline_df: Union[pd.DataFrame, np.ndarray],
+                     logger: Optional[logging.Logger] = None) -> pd.DataFrame:
     """
     Detect new teams by comparing against baseline master index.
     
     Args:
         new_df: DataFrame with newly scraped data
-        baseline_df: DataFrame with baseline master data
+        baseline_df: DataFrame with baseline master data, or a sorted key
+            index from load_baseline_index
         logger: Optional logger instance for output
         
     Returns:
@@ -201,34 +361,25 @@ def detect_new_teams(new_df: pd.DataFrame, baseline_df: pd.DataFrame, logger: Op
             logger.warning("⚠️ New DataFrame is empty")
         return new_df
     
-    if baseline_df.empty:
+    if len(baseline_df) == 0:
         if logger:
             logger.warning("⚠️ Baseline DataFrame is empty - all teams are considered new")
         return new_df
     
-    # Define comparison columns
-    comparison_cols = ["team_name", "age_group", "gender", "state"]
-    
     # Check if all comparison columns exist in both DataFrames
-    missing_cols_new = [col for col in comparison_cols if col not in new_df.columns]
-    missing_cols_baseline = [col for col in comparison_cols if col not in baseline_df.columns]
-    
-    if missing_cols_new:
-        raise ValueError(f"Missing columns in new DataFrame: {missing_cols_new}")
-    
-    if missing_cols_baseline:
-        raise ValueError(f"Missing columns in baseline DataFrame: {missing_cols_baseline}")
+    _check_comparison_columns(new_df, "new")
+    if isinstance(baseline_df, pd.DataFrame):
+        _check_comparison_columns(baseline_df, "baseline")
     
     if logger:
         logger.info(f"📂 Baseline loaded: {len(baseline_df):,} rows")
         logger.info(f"🧮 Comparing with new scrape: {len(new_df):,} rows")
     
-    # Create comparison keys for both DataFrames
-    new_keys = new_df[comparison_cols].apply(lambda x: '|'.join(x.astype(str)), axis=1)
-    baseline_keys = baseline_df[comparison_cols].apply(lambda x: '|'.join(x.astype(str)), axis=1)
-    
-    # Find new teams (not in baseline)
-    new_mask = ~new_keys.isin(baseline_keys)
+    # Anti-join on hashed comparison keys: keep rows whose key is not in baseline
+    if isinstance(baseline_df, pd.DataFrame):
+        new_mask = ~pd.Index(hash_team_keys(new_df)).isin(hash_team_keys(baseline_df))
+    else:
+        new_mask = ~_in_baseline(hash_team_keys(new_df), baseline_df)
     new_teams_df = new_df[new_mask].copy()
     
     # Reset index
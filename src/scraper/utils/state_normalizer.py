@@ -6,6 +6,7 @@ Normalizes state/region codes in the master team index and removes non-U.S. reco
 Handles regional variations and filters to USA-only teams.
 """
 
+import numpy as np
 import pandas as pd
 import logging
 from typing import List, Optional, Dict
@@ -45,10 +46,44 @@ NON_US_CODES = [
 ]
 
 
+# State classification outcomes used by normalize_states
+STATE_KEEP = "keep"
+STATE_NON_US = "non_us"
+STATE_INVALID = "invalid"
+
+
+def build_state_lookup(states) -> pd.DataFrame:
+    """
+    Build the normalization table for a set of distinct state values.
+    
+    Regional codes are mapped through STATE_MAP first, then classified as
+    non-U.S. (NON_US_CODES), invalid (empty or shorter than 2 characters) or kept.
+    
+    Args:
+        states: Distinct raw state values (no NaN)
+        
+    Returns:
+        DataFrame indexed like states with 'state' (normalized) and 'status' columns
+    """
+    non_us = set(NON_US_CODES)
+    normalized = [STATE_MAP.get(state, state) if isinstance(state, str) else state for state in states]
+    status = [
+        STATE_NON_US if state in non_us
+        else STATE_INVALID if isinstance(state, str) and len(state) < 2
+        else STATE_KEEP
+        for state in normalized
+    ]
+    return pd.DataFrame({'raw': list(states), 'state': normalized, 'status': status})
+
+
 def normalize_states(df: pd.DataFrame, logger: Optional[logging.Logger] = None) -> pd.DataFrame:
     """
     Normalize state codes and filter to USA-only teams.
     
+    The state column is factorized once and classified through a lookup table
+    built from its distinct values, so mapping and filtering take a single pass
+    over the frame.
+    
     Args:
         df: DataFrame with 'state' column
         logger: Optional logger instance for output
@@ -61,65 +96,56 @@ def normalize_states(df: pd.DataFrame, logger: Optional[logging.Logger] = None)
             logger.warning("⚠️ Empty DataFrame provided to normalize_states")
         return df
     
-    # Create a copy to avoid modifying original
-    df_clean = df.copy()
-    original_count = len(df_clean)
+    original_count = len(df)
     
     if logger:
         logger.info(f"🔧 Starting state normalization for {original_count:,} teams")
     
-    # Log original state distribution
-    if 'state' in df_clean.columns:
-        original_states = df_clean['state'].value_counts()
-        if logger:
-            logger.info(f"📊 Original states found: {len(original_states)}")
-            logger.debug(f"Top 10 states: {original_states.head(10).to_dict()}")
-    else:
+    if 'state' not in df.columns:
         if logger:
             logger.warning("⚠️ No 'state' column found in DataFrame")
-        return df_clean
+        return df.copy()
     
-    # Apply state mapping for regional variations
-    mapping_count = 0
-    for old_code, new_code in STATE_MAP.items():
-        mask = df_clean['state'] == old_code
-        count = mask.sum()
-        if count > 0:
-            df_clean.loc[mask, 'state'] = new_code
-            mapping_count += count
-            if logger:
-                logger.info(f"🔄 Mapped {count:,} teams: {old_code} → {new_code}")
-    
-    if logger and mapping_count > 0:
-        logger.info(f"✅ Total regional mappings applied: {mapping_count:,}")
-    
-    # Filter out non-U.S. teams
-    non_us_mask = df_clean['state'].isin(NON_US_CODES)
-    non_us_count = non_us_mask.sum()
-    
-    if non_us_count > 0:
-        if logger:
-            logger.info(f"🌍 Removing {non_us_count:,} non-U.S. teams")
-            removed_states = df_clean[non_us_mask]['state'].value_counts()
-            logger.debug(f"Removed states: {removed_states.to_dict()}")
-        
-        df_clean = df_clean[~non_us_mask].copy()
+    # One hash pass over the column; everything else works on the distinct values
+    codes, uniques = pd.factorize(df['state'])
+    lookup = build_state_lookup(uniques)
+    counts = np.bincount(codes[codes >= 0], minlength=len(uniques))
+    lookup['count'] = counts
     
-    # Remove teams with invalid/empty state codes
-    invalid_mask = (
-        df_clean['state'].isna() | 
-        (df_clean['state'] == '') | 
-        (df_clean['state'].str.len() < 2)
-    )
-    invalid_count = invalid_mask.sum()
+    if logger:
+        logger.info(f"📊 Original states found: {len(uniques)}")
+        top = lookup.nlargest(10, 'count')
+        logger.debug(f"Top 10 states: {dict(zip(top['raw'], top['count']))}")
     
-    if invalid_count > 0:
-        if logger:
-            logger.info(f"⚠️ Removing {invalid_count:,} teams with invalid state codes")
-        df_clean = df_clean[~invalid_mask].copy()
+    # Log regional mappings applied
+    map_order = {code: i for i, code in enumerate(STATE_MAP)}
+    mapped = lookup[lookup['raw'].isin(list(STATE_MAP)) & (lookup['count'] > 0)]
+    mapped = mapped.sort_values('raw', key=lambda col: col.map(map_order))
+    mapping_count = int(mapped['count'].sum())
+    if logger:
+        for row in mapped.itertuples():
+            logger.info(f"🔄 Mapped {row.count:,} teams: {row.raw} → {row.state}")
+        if mapping_count > 0:
+            logger.info(f"✅ Total regional mappings applied: {mapping_count:,}")
+    
+    # Per-row status; missing states (code -1) are invalid
+    status = np.append(lookup['status'].to_numpy(), STATE_INVALID)[codes]
+    
+    non_us_count = int((status == STATE_NON_US).sum())
+    if non_us_count > 0 and logger:
+        logger.info(f"🌍 Removing {non_us_count:,} non-U.S. teams")
+        removed = lookup[(lookup['status'] == STATE_NON_US) & (lookup['count'] > 0)]
+        logger.debug(f"Removed states: {removed.groupby('state')['count'].sum().sort_values(ascending=False).to_dict()}")
+    
+    invalid_count = int((status == STATE_INVALID).sum())
+    if invalid_count > 0 and logger:
+        logger.info(f"⚠️ Removing {invalid_count:,} teams with invalid state codes")
     
-    # Reset index after filtering
-    df_clean = df_clean.reset_index(drop=True)
+    # Filter once and write the normalized codes into the single copy
+    keep = np.flatnonzero(status == STATE_KEEP)
+    df_clean = df.take(keep)
+    df_clean['state'] = lookup['state'].to_numpy()[codes[keep]]
+    df_clean.index = pd.RangeIndex(len(df_clean))
     
     # Log final results
     final_count = len(df_clean)
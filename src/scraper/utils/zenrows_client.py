@@ -3,22 +3,364 @@ zenrows_client.py
 -----------------
 ZenRows API client for enhanced web scraping with JavaScript rendering support.
 
-This module provides a utility function to interact with ZenRows API, which offers
-advanced web scraping capabilities including JavaScript rendering, proxy rotation,
-and anti-bot protection bypass for dynamic websites.
+This module provides a client for the ZenRows API, which offers advanced web
+scraping capabilities including JavaScript rendering, proxy rotation, and
+anti-bot protection bypass for dynamic websites.
 
-The client handles API key management, request formatting, and error handling
-to provide a seamless integration with the scraper framework.
+ZenRowsClient reads the API key once, reuses one pooled HTTP session, caps the
+number of in-flight requests at the plan's concurrency limit and counts the
+credits spent against an optional budget (a hard stop: requests past the budget
+are not sent). JavaScript rendering, which costs several times a static
+request, can be used adaptively: the page is fetched statically first and only
+rendered (with a wait) when the static fetch fails. Every fetch returns a
+structured result dictionary instead of raising or returning an empty string.
 """
 
 import os
+import threading
+import time
 import requests
 import logging
-from typing import Dict, Any, Optional
-from dotenv import load_dotenv
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Union
+from requests.adapters import HTTPAdapter
 
-# Load environment variables from .env file
-load_dotenv()
+try:
+    from dotenv import load_dotenv
+    # Load environment variables from .env file
+    load_dotenv()
+except ImportError:
+    pass
+
+ZENROWS_API_URL = "https://api.zenrows.com/v1/"
+
+# Concurrent requests allowed by the ZenRows plan (requests above it get HTTP 429)
+PLAN_CONCURRENCY_LIMIT = int(os.getenv("ZENROWS_CONCURRENCY", "5"))
+
+DEFAULT_TIMEOUT = 30
+DEFAULT_MAX_RETRIES = 2
+RETRY_BACKOFF_SECONDS = 1.0
+
+# Milliseconds to wait for scripts when a page has to be rendered
+JS_RENDER_WAIT_MS = 5000
+
+# Credits per successful request (ZenRows charges nothing for failed requests);
+# the X-Request-Cost response header overrides these estimates when present
+CREDIT_COSTS = {
+    "static": 1,
+    "js_render": 5,
+    "premium_proxy": 10,
+    "js_render_premium_proxy": 25,
+}
+
+# HTTP statuses worth retrying (concurrency limit exceeded, transient server errors)
+RETRYABLE_STATUSES = {429, 500, 502, 503, 504}
+
+# Structured error types reported in fetch results
+ERROR_TYPES = {
+    401: "auth",
+    402: "quota_exceeded",
+    403: "forbidden",
+    404: "not_found",
+    422: "unprocessable",
+    429: "rate_limited",
+}
+
+USER_AGENT = (
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
+    '(KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+)
+
+
+def request_cost(js_render: bool, params: Optional[Dict[str, Any]] = None) -> int:
+    """
+    Estimate the credits a request will cost.
+
+    Args:
+        js_render: Whether the page is rendered
+        params: Extra ZenRows parameters (premium_proxy raises the cost)
+
+    Returns:
+        Estimated credits
+    """
+    premium = str((params or {}).get("premium_proxy", "")).lower() == "true"
+    if js_render:
+        return CREDIT_COSTS["js_render_premium_proxy" if premium else "js_render"]
+    return CREDIT_COSTS["premium_proxy" if premium else "static"]
+
+
+def parse_request_cost(header: Optional[str], estimate: float) -> float:
+    """
+    Parse the X-Request-Cost response header.
+
+    Args:
+        header: Raw header value (may be missing, fractional or malformed)
+        estimate: Credits to charge when the header is unusable
+
+    Returns:
+        Credits charged for the request
+    """
+    if header is None:
+        return estimate
+    try:
+        cost = float(header)
+    except (TypeError, ValueError):
+        return estimate
+    return cost if cost >= 0 and cost != float("inf") else estimate
+
+
+class ZenRowsClient:
+    """
+    Pooled, concurrency-limited ZenRows client with credit accounting.
+
+    Thread-safe: one client can be shared by every scraper thread. Results are
+    dictionaries with ok, url, status, content, error_type, error, credits,
+    js_render, attempts and elapsed keys.
+    """
+
+    def __init__(self, api_key: Optional[str] = None, concurrency: int = PLAN_CONCURRENCY_LIMIT,
+                 credit_budget: Optional[int] = None, timeout: float = DEFAULT_TIMEOUT,
+                 max_retries: int = DEFAULT_MAX_RETRIES, api_url: str = ZENROWS_API_URL,
+                 plan_concurrency: int = PLAN_CONCURRENCY_LIMIT,
+                 logger: Optional[logging.Logger] = None):
+        """
+        Initialize the client.
+
+        Args:
+            api_key: ZenRows API key (defaults to ZENROWS_API_KEY)
+            concurrency: Maximum in-flight requests (clamped to plan_concurrency)
+            credit_budget: Credits this client may spend (None = unlimited)
+            timeout: Per-request timeout in seconds
+            max_retries: Retries for rate-limited/transient failures
+            api_url: ZenRows endpoint (overridable for local stand-ins)
+            plan_concurrency: Concurrency limit of the ZenRows plan
+            logger: Optional logger instance
+        """
+        self.logger = logger or logging.getLogger("zenrows-client")
+        self.api_key = api_key or os.getenv("ZENROWS_API_KEY")
+        self.api_url = api_url
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.credit_budget = credit_budget
+
+        if concurrency > plan_concurrency:
+            self.logger.warning(f"⚠️ ZenRows concurrency {concurrency} exceeds plan limit "
+                                f"{plan_concurrency}, using {plan_concurrency}")
+        self.concurrency = max(1, min(concurrency, plan_concurrency))
+
+        # One pooled session shared by all threads (one connection per slot)
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.concurrency)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update({'User-Agent': USER_AGENT})
+
+        self._slots = threading.BoundedSemaphore(self.concurrency)
+        self._lock = threading.Lock()
+        self.credits_used = 0
+        self._reserved = 0
+        self.requests_sent = 0
+        self.errors: Dict[str, int] = {}
+
+    # ============================================================================
+    # CREDIT ACCOUNTING
+    # ============================================================================
+
+    @property
+    def credits_remaining(self) -> Optional[int]:
+        """Credits left in the budget (None when unlimited)."""
+        if self.credit_budget is None:
+            return None
+        with self._lock:
+            return max(0, self.credit_budget - self.credits_used - self._reserved)
+
+    def _reserve(self, cost: int) -> bool:
+        """Reserve credits for a request; False when it would exceed the budget."""
+        with self._lock:
+            if self.credit_budget is not None and \
+                    self.credits_used + self._reserved + cost > self.credit_budget:
+                return False
+            self._reserved += cost
+            return True
+
+    def _settle(self, reserved: float, charged: float) -> None:
+        """Release a reservation and record the credits actually charged."""
+        with self._lock:
+            self._reserved -= reserved
+            self.credits_used += charged
+
+    def _count_error(self, error_type: str) -> None:
+        with self._lock:
+            self.errors[error_type] = self.errors.get(error_type, 0) + 1
+
+    # ============================================================================
+    # FETCHING
+    # ============================================================================
+
+    def fetch(self, url: str, js_render: Union[bool, str] = "auto",
+              params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Fetch a page through ZenRows.
+
+        Args:
+            url: The target URL to scrape
+            js_render: True to always render, False for a static fetch only, or
+                "auto" to fetch statically first and render (with a wait) only
+                if the static fetch fails or returns an empty page
+            params: Additional ZenRows parameters
+
+        Returns:
+            Result dictionary (see class docstring)
+        """
+        if js_render == "auto":
+            result = self._request(url, False, params)
+            if result["ok"] and result["content"].strip():
+                return result
+            if result["error_type"] in ("budget_exhausted", "auth", "quota_exceeded", "config"):
+                return result
+            self.logger.info(f"🔁 Static fetch failed ({result['error_type'] or 'empty page'}), "
+                             f"rendering JavaScript: {url}")
+            rendered = self._request(url, True, params)
+            rendered["credits"] += result["credits"]
+            rendered["attempts"] += result["attempts"]
+            return rendered
+
+        return self._request(url, bool(js_render), params)
+
+    def fetch_many(self, urls: List[str], js_render: Union[bool, str] = "auto",
+                   params: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """
+        Fetch several pages concurrently (up to the client's concurrency).
+
+        Args:
+            urls: Target URLs
+            js_render: Rendering mode (see fetch)
+            params: Additional ZenRows parameters
+
+        Returns:
+            Result dictionaries in the same order as urls
+        """
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            return list(executor.map(lambda url: self.fetch(url, js_render, params), urls))
+
+    def _request(self, url: str, js_render: bool, params: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Send one API request (with retries) and classify the outcome."""
+        start = time.time()
+        result = {
+            "ok": False, "url": url, "status": None, "content": "", "error_type": None,
+            "error": None, "credits": 0, "js_render": js_render, "attempts": 0, "elapsed": 0.0
+        }
+
+        if not self.api_key:
+            self.logger.error("❌ ZENROWS_API_KEY not found in environment variables")
+            return self._fail(result, "config", "ZenRows API key not configured. "
+                                                "Please set ZENROWS_API_KEY in your .env file", start)
+
+        query_params = {"url": url, "apikey": self.api_key, "js_render": "true" if js_render else "false"}
+        if js_render:
+            query_params["wait"] = str(JS_RENDER_WAIT_MS)
+        if params:
+            query_params.update(params)
+
+        cost = request_cost(js_render, params)
+        if not self._reserve(cost):
+            self.logger.error(f"❌ ZenRows credit budget exhausted ({self.credits_used}/{self.credit_budget}), "
+                              f"not fetching {url}")
+            return self._fail(result, "budget_exhausted",
+                              f"Credit budget of {self.credit_budget} exhausted", start)
+
+        charged = 0
+        try:
+            for attempt in range(self.max_retries + 1):
+                result["attempts"] = attempt + 1
+                try:
+                    with self._slots:
+                        response = self.session.get(self.api_url, params=query_params, timeout=self.timeout)
+                    with self._lock:
+                        self.requests_sent += 1
+                except requests.exceptions.Timeout:
+                    error = ("timeout", f"ZenRows request timed out after {self.timeout}s")
+                except requests.exceptions.ConnectionError as e:
+                    error = ("connection", f"Connection error with ZenRows API: {e}")
+                except requests.exceptions.RequestException as e:
+                    error = ("request", f"Request error with ZenRows API: {e}")
+                else:
+                    result["status"] = response.status_code
+                    if response.ok:
+                        charged = parse_request_cost(response.headers.get("X-Request-Cost"), cost)
+                        result.update(ok=True, content=response.text, credits=charged,
+                                      error_type=None, error=None)
+                        self.logger.info(f"✅ Fetched via ZenRows ({response.status_code}, "
+                                         f"{len(response.text)} chars, {charged} credits): {url}")
+                        break
+                    error = (ERROR_TYPES.get(response.status_code, "http_error"),
+                             f"HTTP {response.status_code} from ZenRows API: {response.text[:200]}")
+                    if response.status_code not in RETRYABLE_STATUSES:
+                        result.update(error_type=error[0], error=error[1])
+                        break
+
+                result.update(error_type=error[0], error=error[1])
+                if attempt < self.max_retries:
+                    time.sleep(RETRY_BACKOFF_SECONDS * (2 ** attempt))
+        finally:
+            self._settle(cost, charged)
+
+        if not result["ok"]:
+            self._count_error(result["error_type"])
+            self.logger.warning(f"⚠️ ZenRows fetch failed ({result['error_type']}): {result['error']}")
+        result["elapsed"] = round(time.time() - start, 3)
+        return result
+
+    def _fail(self, result: Dict[str, Any], error_type: str, error: str, start: float) -> Dict[str, Any]:
+        self._count_error(error_type)
+        result.update(error_type=error_type, error=error, elapsed=round(time.time() - start, 3))
+        return result
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get usage statistics for this client.
+
+        Returns:
+            Dictionary with requests_sent, credits_used, credit_budget,
+            credits_remaining, concurrency and error counts by type
+        """
+        return {
+            "requests_sent": self.requests_sent,
+            "credits_used": self.credits_used,
+            "credit_budget": self.credit_budget,
+            "credits_remaining": self.credits_remaining,
+            "concurrency": self.concurrency,
+            "errors": dict(self.errors)
+        }
+
+    def close(self) -> None:
+        """Close the pooled session."""
+        self.session.close()
+
+    def __enter__(self) -> "ZenRowsClient":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+# Global client instance
+_client_instance = None
+_client_lock = threading.Lock()
+
+
+def get_zenrows_client() -> ZenRowsClient:
+    """
+    Get the shared ZenRows client.
+
+    The credit budget comes from ZENROWS_CREDIT_BUDGET when set.
+    """
+    global _client_instance
+    with _client_lock:
+        if _client_instance is None:
+            budget = os.getenv("ZENROWS_CREDIT_BUDGET")
+            _client_instance = ZenRowsClient(credit_budget=int(budget) if budget else None)
+        return _client_instance
 
 
 def fetch_with_zenrows(
@@ -29,9 +371,7 @@ def fetch_with_zenrows(
     """
     Fetch web content using ZenRows API with optional JavaScript rendering.
     
-    This function provides enhanced web scraping capabilities through ZenRows,
-    including JavaScript rendering for dynamic websites, proxy rotation,
-    and anti-bot protection bypass.
+    Thin wrapper over the shared ZenRowsClient kept for existing callers.
     
     Args:
         url: The target URL to scrape
@@ -40,73 +380,9 @@ def fetch_with_zenrows(
         
     Returns:
         The HTML content of the page as a string, or empty string if request fails
-        
-    Raises:
-        ValueError: If ZenRows API key is not configured
-        requests.RequestException: For HTTP-related errors
-        Exception: For other unexpected errors
     """
-    # Get logger for this module
-    logger = logging.getLogger("zenrows-client")
-    
-    try:
-        # Load ZenRows API key from environment
-        api_key = os.getenv("ZENROWS_API_KEY")
-        if not api_key:
-            logger.error("❌ ZENROWS_API_KEY not found in environment variables")
-            raise ValueError("ZenRows API key not configured. Please set ZENROWS_API_KEY in your .env file")
-        
-        # Prepare ZenRows API endpoint
-        zenrows_url = "https://api.zenrows.com/v1/"
-        
-        # Build query parameters
-        query_params = {
-            "url": url,
-            "apikey": api_key,
-            "js_render": "true" if js_render else "false",
-            "wait": "5000" if js_render else "0"  # Wait 5 seconds for JS to load
-        }
-        
-        # Add any additional parameters
-        if params:
-            query_params.update(params)
-        
-        logger.info(f"Fetching URL with ZenRows: {url}")
-        logger.info(f"JavaScript rendering: {'enabled' if js_render else 'disabled'}")
-        
-        # Make request to ZenRows API
-        response = requests.get(
-            zenrows_url,
-            params=query_params,
-            timeout=30,  # 30 second timeout
-            headers={
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-            }
-        )
-        
-        # Check for successful response
-        response.raise_for_status()
-        
-        logger.info(f"Successfully fetched content via ZenRows (status: {response.status_code})")
-        logger.info(f"Response size: {len(response.text)} characters")
-        
-        return response.text
-        
-    except requests.exceptions.Timeout:
-        logger.exception(f"ZenRows request timed out for URL: {url}")
-        return ""
-    except requests.exceptions.ConnectionError:
-        logger.exception(f"Connection error with ZenRows API for URL: {url}")
-        return ""
-    except requests.exceptions.HTTPError as e:
-        logger.exception(f"HTTP error from ZenRows API: {e.response.status_code}")
-        return ""
-    except requests.exceptions.RequestException as e:
-        logger.exception(f"Request error with ZenRows API")
-        return ""
-    except ValueError as e:
-        logger.exception(f"Configuration error")
-        return ""
+    result = get_zenrows_client().fetch(url, js_render=js_render, params=params)
+    return result["content"] if result["ok"] else ""
 
 
 def test_zenrows_connection() -> bool:
@@ -147,7 +423,8 @@ def get_zenrows_status() -> Dict[str, Any]:
     status = {
         "api_key_configured": bool(api_key),
         "api_key_length": len(api_key) if api_key else 0,
-        "connection_test": False
+        "connection_test": False,
+        "usage": get_zenrows_client().stats()
     }
     
     if api_key:
@@ -0,0 +1,366 @@
+#!/usr/bin/env python3
+"""
+Dashboard Data Layer
+
+In-process data access for the Mission Control dashboard (scripts/dashboard_v2.py).
+Registry statistics come straight from UnifiedRegistry instead of a
+``python -m src.registry.registry`` subprocess, the newest audit/ranking files
+are found in one directory scan, and tables are read with only the columns and
+rows a panel displays.
+
+Nothing here imports Streamlit. Cacheable reads take a file signature
+(path, mtime_ns, size) as their first argument so the dashboard can wrap them
+in ``st.cache_data`` and re-read a file only when it changes. Long-running
+commands run in a PipelineJob, a background worker that streams output lines
+while the UI keeps rendering.
+"""
+
+import fnmatch
+import json
+import logging
+import os
+import subprocess
+import threading
+import time
+from collections import deque
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# (path, mtime_ns, size) - changes whenever the file is rewritten
+FileSignature = Tuple[str, int, int]
+
+# Slices not rebuilt within this many days count as stale
+REGISTRY_STALE_DAYS = 7
+
+# Registry health checks kept in the history log
+HISTORY_LIMIT = 100
+
+# Output lines kept per background job
+JOB_OUTPUT_LINES = 2000
+
+
+def file_signature(path: Optional[Union[str, Path]]) -> Optional[FileSignature]:
+    """
+    Return a cache key identifying the current contents of a file.
+
+    Args:
+        path: File path (None is passed through)
+
+    Returns:
+        (path, mtime_ns, size), or None if the file does not exist
+    """
+    if path is None:
+        return None
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (str(path), stat.st_mtime_ns, stat.st_size)
+
+
+def registry_signature(registry) -> Tuple[Optional[FileSignature], ...]:
+    """Return the signatures of the build, metadata and history registry files."""
+    return (
+        file_signature(registry.build_registry_path),
+        file_signature(registry.metadata_registry_path),
+        file_signature(registry.history_registry_path),
+    )
+
+
+def latest_file(directory: Union[str, Path], pattern: str) -> Optional[Path]:
+    """
+    Find the most recently modified file matching a glob pattern.
+
+    Uses a single directory scan (no sort of every match).
+
+    Args:
+        directory: Directory to scan
+        pattern: Filename glob, e.g. "identity_audit_*.csv"
+
+    Returns:
+        Path of the newest match, or None
+    """
+    try:
+        entries = os.scandir(directory)
+    except OSError:
+        return None
+
+    newest, newest_mtime = None, -1
+    with entries:
+        for entry in entries:
+            if not fnmatch.fnmatch(entry.name, pattern) or not entry.is_file():
+                continue
+            mtime = entry.stat().st_mtime_ns
+            if mtime > newest_mtime:
+                newest, newest_mtime = entry.path, mtime
+    return Path(newest) if newest else None
+
+
+def read_table(signature: FileSignature, columns: Optional[Sequence[str]] = None,
+               nrows: Optional[int] = None) -> pd.DataFrame:
+    """
+    Read a CSV or Parquet file, limited to the requested columns and rows.
+
+    Args:
+        signature: file_signature() of the file (used as the cache key)
+        columns: Columns to read (missing ones are ignored; None reads all)
+        nrows: Only read the first N rows
+
+    Returns:
+        DataFrame with the requested slice of the file
+    """
+    path = Path(signature[0])
+
+    if path.suffix == ".parquet":
+        import pyarrow.parquet as pq
+
+        parquet = pq.ParquetFile(path)
+        if columns is not None:
+            columns = [col for col in columns if col in parquet.schema_arrow.names]
+        if nrows is None:
+            return parquet.read(columns=columns).to_pandas()
+        batch = next(parquet.iter_batches(batch_size=nrows, columns=columns), None)
+        if batch is None:
+            return parquet.schema_arrow.empty_table().to_pandas()
+        return batch.to_pandas()
+
+    usecols = None
+    if columns is not None:
+        header = pd.read_csv(path, nrows=0).columns
+        usecols = [col for col in columns if col in header]
+    return pd.read_csv(path, usecols=usecols, nrows=nrows)
+
+
+def read_bytes(signature: FileSignature) -> bytes:
+    """Read a file's raw bytes (for download buttons)."""
+    return Path(signature[0]).read_bytes()
+
+
+def _slice_age_days(last_updated: Optional[str], now: datetime) -> Optional[int]:
+    """Return the age in days of an ISO registry timestamp (None if unparseable)."""
+    try:
+        updated = datetime.fromisoformat(str(last_updated).replace('Z', '+00:00'))
+    except ValueError:
+        return None
+    if updated.tzinfo is None:
+        updated = updated.replace(tzinfo=timezone.utc)
+    return (now - updated).days
+
+
+def registry_stats(registry=None, stale_days: int = REGISTRY_STALE_DAYS) -> Dict[str, Any]:
+    """
+    Compute registry health statistics in-process.
+
+    Args:
+        registry: UnifiedRegistry instance (defaults to the global registry)
+        stale_days: Slices older than this many days are reported as stale
+
+    Returns:
+        Dictionary with registry_version, total_slices, total_builds,
+        health_score (percent of slices that are not stale), stale_slices
+        and timestamp
+    """
+    if registry is None:
+        from src.registry.registry import get_registry
+        registry = get_registry()
+
+    builds = registry.list_all_builds()
+    history = registry.get_history_summary()
+    metadata = registry.get_metadata_summary()
+    now = datetime.now(timezone.utc)
+
+    stale_slices = []
+    for slice_key, info in builds.items():
+        age_days = _slice_age_days(info.get('last_updated'), now)
+        if age_days is None or age_days > stale_days:
+            stale_slices.append(slice_key)
+
+    total_slices = len(builds)
+    health_score = round((total_slices - len(stale_slices)) / total_slices * 100, 1) if total_slices else 0.0
+
+    return {
+        "registry_version": history.get("latest_timestamp") or metadata.get("latest_timestamp") or "n/a",
+        "total_slices": total_slices,
+        "total_builds": max(history.get("total_builds", 0), metadata.get("total_builds", 0)),
+        "health_score": health_score,
+        "stale_slices": stale_slices,
+        "timestamp": now.isoformat()
+    }
+
+
+def slice_build_rows(registry=None) -> pd.DataFrame:
+    """
+    Tabulate the build registry for the Slice Builds panel.
+
+    Args:
+        registry: UnifiedRegistry instance (defaults to the global registry)
+
+    Returns:
+        DataFrame with Slice, State, Gender, Age Group, Build, Last Updated,
+        Age and Status columns (empty if no slices are registered)
+    """
+    if registry is None:
+        from src.registry.registry import get_registry
+        registry = get_registry()
+
+    now = datetime.now(timezone.utc)
+    rows = []
+    for slice_key, info in registry.list_all_builds().items():
+        last_updated = info.get('last_updated', 'N/A')
+        age_days = _slice_age_days(last_updated, now)
+
+        if age_days is None:
+            age_str, status = "Unknown", "❓"
+        elif age_days == 0:
+            age_str, status = "Today", "✅ Fresh"
+        elif age_days <= 7:
+            age_str, status = f"{age_days} days ago", "✅ Recent"
+        elif age_days <= 30:
+            age_str, status = f"{age_days} days ago", "⚠️ Aging"
+        else:
+            age_str, status = f"{age_days} days ago", "🔴 Stale"
+
+        parts = slice_key.split('_')
+        state, gender, age = parts[:3] if len(parts) >= 3 else (slice_key, "", "")
+
+        rows.append({
+            'Slice': slice_key,
+            'State': state,
+            'Gender': gender,
+            'Age Group': age,
+            'Build': info.get('latest_build', 'N/A'),
+            'Last Updated': last_updated[:10] if len(last_updated) > 10 else last_updated,
+            'Age': age_str,
+            'Status': status
+        })
+
+    return pd.DataFrame(rows, columns=['Slice', 'State', 'Gender', 'Age Group', 'Build',
+                                       'Last Updated', 'Age', 'Status'])
+
+
+def append_registry_history(entry: Dict[str, Any], history_path: Union[str, Path],
+                            limit: int = HISTORY_LIMIT) -> None:
+    """
+    Append a registry health check to the history log (keeping the last N).
+
+    Args:
+        entry: registry_stats() result
+        history_path: JSON history file
+        limit: Number of checks kept
+    """
+    history_path = Path(history_path)
+    history_path.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        data = json.loads(history_path.read_text()) if history_path.exists() else []
+        data.append(entry)
+        history_path.write_text(json.dumps(data[-limit:], indent=2))
+    except Exception as e:
+        logger.exception(f"Failed to save registry history: {e}")
+
+
+def load_registry_history(signature: Optional[FileSignature]) -> pd.DataFrame:
+    """
+    Load the registry health history log.
+
+    Args:
+        signature: file_signature() of the history file (None if missing)
+
+    Returns:
+        DataFrame with one row per health check
+    """
+    if signature is None:
+        return pd.DataFrame()
+    try:
+        return pd.DataFrame(json.loads(Path(signature[0]).read_text()))
+    except Exception:
+        return pd.DataFrame()
+
+
+class PipelineJob:
+    """
+    Run a command in a background worker and stream its output.
+
+    The dashboard keeps the job in session state and re-renders while it runs,
+    showing the latest output lines instead of blocking on the whole command.
+    """
+
+    def __init__(self, cmd: List[str], cwd: Optional[Union[str, Path]] = None,
+                 max_lines: int = JOB_OUTPUT_LINES):
+        """
+        Initialize the job (call start() to launch it).
+
+        Args:
+            cmd: Command and arguments
+            cwd: Working directory for the command
+            max_lines: Output lines kept in memory
+        """
+        self.cmd = list(cmd)
+        self.cwd = cwd
+        self.returncode: Optional[int] = None
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self._lines = deque(maxlen=max_lines)
+        self._lock = threading.Lock()
+        self._process: Optional[subprocess.Popen] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> "PipelineJob":
+        """Launch the command and the output reader thread."""
+        env = dict(os.environ, PYTHONUNBUFFERED="1")
+        self.started_at = time.time()
+        try:
+            self._process = subprocess.Popen(
+                self.cmd, cwd=self.cwd, env=env, text=True, bufsize=1,
+                stdout=subprocess.PIPE, stderr=subprocess.STDOUT, errors="replace"
+            )
+        except Exception as e:
+            self._lines.append(f"[ERROR] {e}")
+            self.returncode = 1
+            self.finished_at = time.time()
+            return self
+
+        self._thread = threading.Thread(target=self._pump, daemon=True)
+        self._thread.start()
+        return self
+
+    def _pump(self) -> None:
+        """Collect output lines until the process exits."""
+        for line in self._process.stdout:
+            with self._lock:
+                self._lines.append(line.rstrip("\n"))
+        self._process.wait()
+        self.returncode = self._process.returncode
+        self.finished_at = time.time()
+
+    @property
+    def running(self) -> bool:
+        """True while the command has not finished."""
+        return self.started_at is not None and self.finished_at is None
+
+    @property
+    def elapsed(self) -> float:
+        """Seconds since the job started (frozen once it finishes)."""
+        if self.started_at is None:
+            return 0.0
+        return (self.finished_at or time.time()) - self.started_at
+
+    def output(self, tail: Optional[int] = None) -> str:
+        """
+        Return the collected output.
+
+        Args:
+            tail: Only return the last N lines
+        """
+        with self._lock:
+            lines = list(self._lines)
+        return "\n".join(lines[-tail:] if tail else lines)
+
+    def cancel(self) -> None:
+        """Terminate the command if it is still running."""
+        if self._process is not None and self.running:
+            self._process.terminate()
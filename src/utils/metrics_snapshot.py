@@ -4,16 +4,21 @@ Metrics Snapshot System
 
 Captures and stores build metrics in JSON format for tracking data quality,
 build performance, and historical trends across different builds.
+
+Every snapshot is also recorded in the metrics store (src.utils.metrics_store),
+one row per build, which serves comparisons and trend queries without opening
+each JSON file.
 """
 
 import json
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 from datetime import datetime
 import logging
 
 from src.scraper.utils.logger import get_logger
 from src.io.safe_write import safe_write_json
+from src.utils.metrics_store import get_metrics_store
 
 
 def write_metrics_snapshot(build_id: str, metrics_dict: Dict[str, Any], 
@@ -60,6 +65,12 @@ def write_metrics_snapshot(build_id: str, metrics_dict: Dict[str, Any],
         # Write metrics using safe write
         write_result = safe_write_json(metrics_dict, metrics_file, logger)
         
+        # Keep the columnar store in sync (the JSON snapshot stays authoritative)
+        try:
+            get_metrics_store().record_build(metrics_dict, metrics_file)
+        except Exception as e:
+            logger.warning(f"⚠️ Failed to record metrics in store: {e}")
+        
         logger.info(f"✅ Metrics snapshot written: {metrics_file}")
         logger.info(f"📊 Metrics summary:")
         logger.info(f"   Build ID: {build_id}")
@@ -146,8 +157,9 @@ def compare_metrics_snapshots(build_id1: str, build_id2: str) -> Dict[str, Any]:
     Returns:
         Dictionary containing comparison metrics
     """
-    metrics1 = load_metrics_snapshot(build_id1)
-    metrics2 = load_metrics_snapshot(build_id2)
+    builds = {m["build_id"]: m for m in get_metrics_store().get_builds([build_id1, build_id2])}
+    metrics1 = builds.get(build_id1)
+    metrics2 = builds.get(build_id2)
     
     if not metrics1 or not metrics2:
         raise ValueError("One or both metrics snapshots not found")
@@ -171,20 +183,15 @@ def generate_metrics_summary() -> Dict[str, Any]:
     """
     Generate a summary of all metrics snapshots.
     
+    Reads every build from the metrics store in one query (newest first).
+    
     Returns:
         Dictionary containing summary statistics
     """
-    metrics_files = list_metrics_snapshots()
-    
-    if not metrics_files:
+    if not list_metrics_snapshots():
         return {"total_builds": 0, "message": "No metrics snapshots found"}
     
-    all_metrics = []
-    for file_path in metrics_files:
-        build_id = file_path.stem.replace("build_", "")
-        metrics = load_metrics_snapshot(build_id)
-        if metrics:
-            all_metrics.append(metrics)
+    all_metrics = get_metrics_store().get_builds()
     
     if not all_metrics:
         return {"total_builds": 0, "message": "No valid metrics snapshots found"}
@@ -221,6 +228,20 @@ def generate_metrics_summary() -> Dict[str, Any]:
     return summary
 
 
+def get_metrics_trend(columns: Optional[List[str]] = None, limit: Optional[int] = None):
+    """
+    Get build metrics over time for trend charts.
+    
+    Args:
+        columns: Metric columns (e.g. ["team_count", "states_covered"]); defaults to all
+        limit: Only return the most recent N builds
+        
+    Returns:
+        DataFrame with one row per build, oldest first
+    """
+    return get_metrics_store().trend(columns, limit)
+
+
 if __name__ == "__main__":
     """Test the metrics snapshot system."""
     logger = get_logger(__name__)
@@ -0,0 +1,379 @@
+#!/usr/bin/env python3
+"""
+Metrics Store - columnar, indexed read model for build metrics.
+
+Each build writes a JSON snapshot (data/metrics/build_{build_id}.json) and a
+state summary (data/master/state_summaries.json, overwritten per build).
+Trend charts and comparisons used to open every snapshot on each refresh. This
+module keeps one SQLite table row per build plus one row per (build, state)
+coverage entry, so trends, comparisons and state history are single indexed
+queries. The JSON snapshots remain the source of truth: writes go to both, and
+snapshots written or edited outside write_metrics_snapshot are picked up by
+sync_snapshots (keyed on file modification time).
+
+Usage:
+    python -m src.utils.metrics_store --sync
+    python -m src.utils.metrics_store --trend team_count states_covered
+    python -m src.utils.metrics_store --state AZ
+"""
+
+import argparse
+import json
+import logging
+import sqlite3
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Union
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_METRICS_DIR = Path("data/metrics")
+DEFAULT_METRICS_STORE_PATH = DEFAULT_METRICS_DIR / "metrics_store.sqlite"
+
+# Scalar snapshot fields stored as columns (everything else is kept in 'extra')
+BUILD_COLUMNS = [
+    'build_id', 'timestamp', 'team_count', 'new_teams', 'removed_teams', 'renamed_teams',
+    'states_covered', 'build_duration_seconds', 'data_quality_score'
+]
+
+STATE_COLUMNS = [
+    'build_id', 'build_timestamp', 'state', 'teams', 'providers', 'age_groups', 'genders',
+    'age_breakdown', 'gender_breakdown', 'provider_breakdown'
+]
+
+# State columns holding lists/dicts (stored as JSON text)
+_STATE_JSON_COLUMNS = ['providers', 'age_groups', 'genders', 'age_breakdown', 'gender_breakdown',
+                       'provider_breakdown']
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS builds (
+    build_id TEXT PRIMARY KEY,
+    timestamp TEXT,
+    team_count INTEGER,
+    new_teams INTEGER,
+    removed_teams INTEGER,
+    renamed_teams INTEGER,
+    states_covered INTEGER,
+    build_duration_seconds NUMERIC,
+    data_quality_score NUMERIC,
+    providers TEXT,
+    extra TEXT,
+    snapshot_file TEXT,
+    snapshot_mtime REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS state_coverage (
+    build_id TEXT NOT NULL,
+    build_timestamp TEXT,
+    state TEXT NOT NULL,
+    teams INTEGER,
+    providers TEXT,
+    age_groups TEXT,
+    genders TEXT,
+    age_breakdown TEXT,
+    gender_breakdown TEXT,
+    provider_breakdown TEXT,
+    PRIMARY KEY (build_id, state)
+);
+CREATE INDEX IF NOT EXISTS idx_builds_mtime ON builds (snapshot_mtime);
+CREATE INDEX IF NOT EXISTS idx_builds_snapshot ON builds (snapshot_file);
+CREATE INDEX IF NOT EXISTS idx_state_coverage_state ON state_coverage (state, build_timestamp);
+"""
+
+
+class MetricsStore:
+    """
+    SQLite-backed metrics table with one row per build and per-state coverage rows.
+    """
+
+    def __init__(self, db_path: Union[str, Path] = DEFAULT_METRICS_STORE_PATH,
+                 metrics_dir: Union[str, Path] = DEFAULT_METRICS_DIR):
+        """
+        Initialize the metrics store, creating the schema if needed.
+
+        Args:
+            db_path: Path to the SQLite store file
+            metrics_dir: Directory holding the build_*.json snapshots
+        """
+        self.db_path = Path(db_path)
+        self.metrics_dir = Path(metrics_dir)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._synced = False
+
+        with self._connect() as conn:
+            conn.executescript(_SCHEMA)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open a connection, committing on success and rolling back on error."""
+        conn = sqlite3.connect(self.db_path)
+        conn.row_factory = sqlite3.Row
+        try:
+            yield conn
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            conn.close()
+
+    # ============================================================================
+    # WRITES
+    # ============================================================================
+
+    def record_build(self, metrics: Dict[str, Any], snapshot_file: Optional[Union[str, Path]] = None) -> None:
+        """
+        Insert (or replace) the metrics row of one build.
+
+        Args:
+            metrics: Snapshot dictionary (must include build_id)
+            snapshot_file: JSON snapshot the metrics were written to
+        """
+        with self._connect() as conn:
+            self._insert_build(conn, metrics, snapshot_file)
+
+    def _insert_build(self, conn: sqlite3.Connection, metrics: Dict[str, Any],
+                      snapshot_file: Optional[Union[str, Path]]) -> None:
+        snapshot_mtime = time.time()
+        if snapshot_file is not None and Path(snapshot_file).exists():
+            snapshot_mtime = Path(snapshot_file).stat().st_mtime
+
+        extra = {k: v for k, v in metrics.items() if k not in BUILD_COLUMNS and k != 'providers'}
+        values = [metrics.get(col) for col in BUILD_COLUMNS] + [
+            json.dumps(metrics['providers'], default=str) if 'providers' in metrics else None,
+            json.dumps(extra, default=str),
+            str(snapshot_file) if snapshot_file is not None else None,
+            snapshot_mtime
+        ]
+        columns = BUILD_COLUMNS + ['providers', 'extra', 'snapshot_file', 'snapshot_mtime']
+        conn.execute(
+            f"INSERT OR REPLACE INTO builds ({', '.join(columns)}) VALUES ({', '.join('?' for _ in columns)})",
+            values
+        )
+
+    def record_state_coverage(self, build_id: str, states: Dict[str, Dict[str, Any]],
+                              build_timestamp: Optional[str] = None) -> int:
+        """
+        Replace the per-state coverage rows of one build.
+
+        Args:
+            build_id: Build identifier
+            states: state_summaries "states" mapping (state -> summary dict)
+            build_timestamp: ISO timestamp of the build
+
+        Returns:
+            Number of state rows stored
+        """
+        rows = []
+        for state, summary in states.items():
+            row = {
+                'build_id': build_id,
+                'build_timestamp': build_timestamp,
+                'state': state,
+                'teams': summary.get('teams')
+            }
+            for col in _STATE_JSON_COLUMNS:
+                row[col] = json.dumps(summary[col], default=str) if col in summary else None
+            rows.append(tuple(row[col] for col in STATE_COLUMNS))
+
+        with self._connect() as conn:
+            conn.execute("DELETE FROM state_coverage WHERE build_id = ?", (build_id,))
+            conn.executemany(
+                f"INSERT INTO state_coverage ({', '.join(STATE_COLUMNS)}) "
+                f"VALUES ({', '.join('?' for _ in STATE_COLUMNS)})",
+                rows
+            )
+        return len(rows)
+
+    def sync_snapshots(self) -> int:
+        """
+        Bring the builds table in line with the JSON snapshots on disk.
+
+        Snapshots are re-read only when new or modified since they were stored;
+        rows whose snapshot file was deleted are dropped.
+
+        Returns:
+            Number of snapshots (re)loaded
+        """
+        on_disk = {str(path): path.stat().st_mtime for path in self.metrics_dir.glob("build_*.json")}
+        loaded = 0
+
+        with self._connect() as conn:
+            stored = {
+                row['snapshot_file']: row['snapshot_mtime']
+                for row in conn.execute("SELECT snapshot_file, snapshot_mtime FROM builds "
+                                        "WHERE snapshot_file IS NOT NULL")
+            }
+            for snapshot_file, mtime in on_disk.items():
+                if stored.get(snapshot_file) == mtime:
+                    continue
+                try:
+                    with open(snapshot_file, 'r', encoding='utf-8') as f:
+                        metrics = json.load(f)
+                except Exception as e:
+                    logger.error(f"Failed to load metrics snapshot {snapshot_file}: {e}")
+                    continue
+                metrics.setdefault('build_id', Path(snapshot_file).stem.replace("build_", ""))
+                self._insert_build(conn, metrics, snapshot_file)
+                loaded += 1
+
+            removed = [path for path in stored if path not in on_disk
+                       and Path(path).parent == self.metrics_dir]
+            conn.executemany("DELETE FROM builds WHERE snapshot_file = ?", [(path,) for path in removed])
+
+        self._synced = True
+        if loaded or removed:
+            logger.info(f"Synced metrics store: {loaded} snapshots loaded, {len(removed)} removed")
+        return loaded
+
+    def _ensure_synced(self) -> None:
+        """Sync with the JSON snapshots once per store instance."""
+        if not self._synced:
+            self.sync_snapshots()
+
+    # ============================================================================
+    # QUERIES
+    # ============================================================================
+
+    def _query(self, sql: str, params: tuple = ()) -> pd.DataFrame:
+        """Run a read query and return the rows as a DataFrame."""
+        with self._connect() as conn:
+            return pd.read_sql_query(sql, conn, params=params)
+
+    @staticmethod
+    def _build_record(row: sqlite3.Row) -> Dict[str, Any]:
+        """Rebuild a snapshot dictionary from a builds row."""
+        record = json.loads(row['extra']) if row['extra'] else {}
+        for col in BUILD_COLUMNS:
+            if row[col] is not None:
+                record[col] = row[col]
+        if row['providers'] is not None:
+            record['providers'] = json.loads(row['providers'])
+        return record
+
+    def get_builds(self, build_ids: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """
+        Return snapshot dictionaries, newest snapshot first.
+
+        Args:
+            build_ids: Builds to return (defaults to every stored build)
+
+        Returns:
+            List of metrics dictionaries as written to the JSON snapshots
+        """
+        self._ensure_synced()
+        sql = "SELECT * FROM builds"
+        params: tuple = ()
+        if build_ids is not None:
+            sql += f" WHERE build_id IN ({', '.join('?' for _ in build_ids)})"
+            params = tuple(build_ids)
+        sql += " ORDER BY snapshot_mtime DESC, build_id DESC"
+
+        with self._connect() as conn:
+            return [self._build_record(row) for row in conn.execute(sql, params)]
+
+    def get_build(self, build_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Return the metrics of one build, or None if it is not stored.
+
+        Args:
+            build_id: Build identifier
+        """
+        builds = self.get_builds([build_id])
+        return builds[0] if builds else None
+
+    def trend(self, columns: Optional[List[str]] = None, limit: Optional[int] = None) -> pd.DataFrame:
+        """
+        Return build metrics over time, oldest first (one row per build).
+
+        Args:
+            columns: Metric columns to return (defaults to every scalar column)
+            limit: Only return the most recent N builds
+
+        Returns:
+            DataFrame with build_id, timestamp and the requested columns
+        """
+        self._ensure_synced()
+        columns = [col for col in (columns or BUILD_COLUMNS) if col in BUILD_COLUMNS]
+        selected = ', '.join(dict.fromkeys(['build_id', 'timestamp'] + columns))
+        sql = f"SELECT {selected}, snapshot_mtime FROM builds ORDER BY snapshot_mtime DESC"
+        params: tuple = ()
+        if limit:
+            sql += " LIMIT ?"
+            params = (limit,)
+
+        df = self._query(sql, params)
+        return df.iloc[::-1].drop(columns='snapshot_mtime').reset_index(drop=True)
+
+    def state_coverage(self, build_id: str) -> pd.DataFrame:
+        """
+        Return the per-state coverage rows of one build.
+
+        Args:
+            build_id: Build identifier
+        """
+        df = self._query("SELECT * FROM state_coverage WHERE build_id = ? ORDER BY state", (build_id,))
+        for col in _STATE_JSON_COLUMNS:
+            df[col] = df[col].map(lambda value: json.loads(value) if value is not None else None)
+        return df
+
+    def state_history(self, state: str) -> pd.DataFrame:
+        """
+        Return a state's team coverage across builds, oldest first.
+
+        Args:
+            state: Two-letter state code
+        """
+        df = self._query(
+            "SELECT build_id, build_timestamp, teams, providers FROM state_coverage "
+            "WHERE state = ? ORDER BY build_timestamp",
+            (state.upper(),)
+        )
+        df['providers'] = df['providers'].map(lambda value: json.loads(value) if value is not None else None)
+        return df
+
+
+# Global store instance
+_store_instance = None
+
+
+def get_metrics_store() -> MetricsStore:
+    """Get the global metrics store instance."""
+    global _store_instance
+    if _store_instance is None:
+        _store_instance = MetricsStore()
+    return _store_instance
+
+
+def main():
+    """CLI entry point for the metrics store."""
+    parser = argparse.ArgumentParser(description="Metrics Store - indexed build metrics")
+    parser.add_argument("--db", type=str, default=str(DEFAULT_METRICS_STORE_PATH), help="Store file path")
+    parser.add_argument("--metrics-dir", type=str, default=str(DEFAULT_METRICS_DIR),
+                        help="Directory of build_*.json snapshots")
+    parser.add_argument("--sync", action="store_true", help="Sync the store with the JSON snapshots")
+    parser.add_argument("--trend", nargs="*", metavar="COLUMN", help="Metric trend (default: all columns)")
+    parser.add_argument("--state", type=str, help="Team coverage history for a state")
+    parser.add_argument("-n", type=int, default=None, help="Only show the most recent N builds")
+
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    store = MetricsStore(args.db, args.metrics_dir)
+
+    with pd.option_context('display.width', 200, 'display.max_columns', 20):
+        if args.sync:
+            store.sync_snapshots()
+        elif args.trend is not None:
+            print(store.trend(args.trend or None, args.n))
+        elif args.state:
+            print(store.state_history(args.state))
+        else:
+            print("Use --help for available options")
+
+
+if __name__ == "__main__":
+    main()
@@ -20,6 +20,25 @@ from src.scraper.utils.logger import get_logger
 from src.utils.team_id_generator import make_team_id
 
 
+# Fields used for data completeness scoring and their weights
+FIELD_WEIGHTS = {
+    'team_name': 0.25,
+    'team_id': 0.20,
+    'provider_team_id': 0.15,
+    'age_group': 0.10,
+    'age_u': 0.10,
+    'gender': 0.10,
+    'state': 0.10,
+    'club_name': 0.05,
+    'source_url': 0.05
+}
+
+# Tie-break between equally complete records (higher wins)
+PROVIDER_PREFERENCE = {'GotSport': 3, 'Modular11': 2, 'AthleteOne': 1}
+
+TEAM_ID_FIELDS = ['team_name', 'state', 'age_group', 'gender']
+
+
 def calculate_data_completeness_score(row: pd.Series) -> float:
     """
     Calculate a data completeness score for a row.
@@ -30,23 +49,10 @@ def calculate_data_completeness_score(row: pd.Series) -> float:
     Returns:
         Float score between 0.0 and 1.0 (higher = more complete)
     """
-    # Define fields and their weights
-    field_weights = {
-        'team_name': 0.25,
-        'team_id': 0.20,
-        'provider_team_id': 0.15,
-        'age_group': 0.10,
-        'age_u': 0.10,
-        'gender': 0.10,
-        'state': 0.10,
-        'club_name': 0.05,
-        'source_url': 0.05
-    }
-    
     total_score = 0.0
     total_weight = 0.0
     
-    for field, weight in field_weights.items():
+    for field, weight in FIELD_WEIGHTS.items():
         if field in row.index:
             # Check if field has meaningful data (not null, not empty string)
             if pd.notna(row[field]) and str(row[field]).strip() != '':
@@ -56,6 +62,71 @@ def calculate_data_completeness_score(row: pd.Series) -> float:
     return total_score / total_weight if total_weight > 0 else 0.0
 
 
+def calculate_completeness_scores(df: pd.DataFrame) -> pd.Series:
+    """
+    Calculate data completeness scores for every row at once.
+    
+    Vectorized equivalent of calculate_data_completeness_score: a weighted sum
+    of per-field "has meaningful data" masks.
+    
+    Args:
+        df: DataFrame of team records
+        
+    Returns:
+        Series of scores between 0.0 and 1.0 aligned with df.index
+    """
+    total_score = pd.Series(0.0, index=df.index)
+    total_weight = 0.0
+    
+    for field, weight in FIELD_WEIGHTS.items():
+        if field in df.columns:
+            values = df[field]
+            has_value = values.notna() & (values.astype(str).str.strip() != '')
+            total_score = total_score + has_value * weight
+            total_weight += weight
+    
+    return total_score / total_weight if total_weight > 0 else total_score
+
+
+def generate_team_ids(df: pd.DataFrame, logger: Optional[logging.Logger] = None) -> List[Optional[str]]:
+    """
+    Generate team IDs for a provider DataFrame.
+    
+    Each distinct (team_name, state, age_group, gender) combination is hashed
+    once. Rows whose attributes cannot be normalized get None.
+    
+    Args:
+        df: DataFrame with team_name, state, age_group and gender columns
+        logger: Optional logger instance for output
+        
+    Returns:
+        List of team IDs (or None) aligned with df rows
+    """
+    if logger is None:
+        logger = get_logger(__name__)
+    
+    missing = [col for col in TEAM_ID_FIELDS if col not in df.columns]
+    if missing:
+        logger.warning(f"   Failed to generate team_id for {len(df):,} teams: missing columns {missing}")
+        return [None] * len(df)
+    
+    cache: Dict[Tuple, Optional[str]] = {}
+    team_ids = []
+    for key in zip(*(df[col].tolist() for col in TEAM_ID_FIELDS)):
+        if key not in cache:
+            try:
+                cache[key] = make_team_id(*key)
+            except (ValueError, AttributeError) as e:
+                logger.warning(f"   Failed to generate team_id for {key[0]}: {e}")
+                cache[key] = None
+            except Exception as e:
+                logger.error(f"   Unexpected error generating team_id for {key[0]}: {e}", exc_info=True)
+                raise
+        team_ids.append(cache[key])
+    
+    return team_ids
+
+
 def merge_provider_dataframes(provider_dfs: Dict[str, pd.DataFrame], 
                              logger: Optional[logging.Logger] = None) -> pd.DataFrame:
     """
@@ -86,27 +157,7 @@ def merge_provider_dataframes(provider_dfs: Dict[str, pd.DataFrame],
     for provider, df in provider_dfs.items():
         if 'team_id' not in df.columns:
             logger.info(f"   Generating team_id for {provider}...")
-            team_ids = []
-            for _, row in df.iterrows():
-                try:
-                    team_id = make_team_id(
-                        row['team_name'],
-                        row['state'],
-                        row['age_group'],
-                        row['gender']
-                    )
-                    team_ids.append(team_id)
-                except (KeyError, ValueError, AttributeError) as e:
-                    logger.warning(f"   Failed to generate team_id for {row.get('team_name', '<unknown team>')}: {e}")
-                    team_ids.append(None)
-                except Exception as e:
-                    logger.error(
-                        f"   Unexpected error generating team_id for {row.get('team_name', '<unknown team>')}: {e}",
-                        exc_info=True,
-                    )
-                    raise
-            
-            provider_dfs[provider] = df.assign(team_id=team_ids)
+            provider_dfs[provider] = df.assign(team_id=generate_team_ids(df, logger))
     
     # Step 2: Concatenate all DataFrames
     logger.info("📋 Concatenating provider DataFrames...")
@@ -127,64 +178,53 @@ def resolve_merge_conflicts(df: pd.DataFrame, logger: Optional[logging.Logger] =
     """
     Resolve conflicts when merging data from multiple providers.
     
+    Keeps one row per team_id: the most complete record, ties broken by
+    provider preference and then by original order. Rows without a team_id
+    are dropped. Output is ordered by team_id.
+    
     Args:
         df: DataFrame with potential conflicts
         logger: Optional logger instance for output
         
     Returns:
-        DataFrame with conflicts resolved
+        DataFrame with conflicts resolved and a providers list column
     """
     if logger is None:
         logger = get_logger(__name__)
     
-    # Group by team_id to identify conflicts
-    grouped = df.groupby('team_id')
-    
-    resolved_rows = []
-    conflict_count = 0
-    
-    for team_id, group in grouped:
-        if len(group) == 1:
-            # No conflict, keep the row
-            resolved_rows.append(group.iloc[0])
-        else:
-            # Conflict detected - resolve using data completeness
-            conflict_count += 1
-            logger.debug(f"   Conflict for team_id {team_id}: {len(group)} records")
-            
-            # Calculate completeness scores
-            group_with_scores = group.copy()
-            group_with_scores['completeness_score'] = group.apply(calculate_data_completeness_score, axis=1)
-            
-            # Sort by completeness score (descending) and provider preference
-            provider_preference = {'GotSport': 3, 'Modular11': 2, 'AthleteOne': 1}
-            group_with_scores['provider_priority'] = group_with_scores['provider'].map(provider_preference).fillna(0)
-            
-            # Sort by completeness score first, then provider priority
-            group_sorted = group_with_scores.sort_values(
-                ['completeness_score', 'provider_priority'], 
-                ascending=[False, False]
-            )
-            
-            # Take the best row
-            best_row = group_sorted.iloc[0].drop(['completeness_score', 'provider_priority'])
-            
-            # Create providers list for tracking
-            providers = sorted(group['provider'].unique().tolist())
-            best_row['providers'] = providers
-            
-            resolved_rows.append(best_row)
+    keyed = df[df['team_id'].notna()]
     
-    if conflict_count > 0:
-        logger.info(f"🔧 Resolved {conflict_count:,} conflicts using data completeness scoring")
+    # Rank every record: team_id, then completeness (desc), then provider priority (desc).
+    # Multi-key sort_values is stable, so ties keep their original order.
+    ranking = pd.DataFrame({
+        'team_id': keyed['team_id'].to_numpy(),
+        'completeness_score': calculate_completeness_scores(keyed).to_numpy(),
+        'provider_priority': keyed['provider'].map(PROVIDER_PREFERENCE).fillna(0).to_numpy()
+    }).sort_values(['team_id', 'completeness_score', 'provider_priority'], ascending=[True, False, False])
+    
+    best = ranking.index[~ranking['team_id'].duplicated()]
+    resolved_df = keyed.iloc[best].copy()
     
-    # Convert back to DataFrame
-    resolved_df = pd.DataFrame(resolved_rows)
+    # Track every provider that reported a team (sorted, unique)
+    group_sizes = keyed['team_id'].value_counts()
+    conflicted = group_sizes.index[group_sizes > 1]
+    conflict_count = len(conflicted)
     
-    # Ensure providers column exists for all rows
-    if 'providers' not in resolved_df.columns:
-        resolved_df['providers'] = resolved_df['provider'].apply(lambda x: [x])
+    providers = resolved_df['provider'].map(lambda provider: [provider])
+    if conflict_count > 0:
+        in_conflict = keyed[keyed['team_id'].isin(conflicted)]
+        provider_lists = (
+            in_conflict[['team_id', 'provider']]
+            .drop_duplicates()
+            .sort_values('provider')
+            .groupby('team_id')['provider']
+            .agg(list)
+        )
+        conflict_providers = resolved_df['team_id'].map(provider_lists)
+        providers = conflict_providers.where(conflict_providers.notna(), providers)
+        logger.info(f"🔧 Resolved {conflict_count:,} conflicts using data completeness scoring")
     
+    resolved_df['providers'] = providers
     return resolved_df
 
 
@@ -273,7 +313,7 @@ def get_merge_summary(merged_df: pd.DataFrame, logger: Optional[logging.Logger]
     
     # Data completeness
     if not merged_df.empty:
-        completeness_scores = merged_df.apply(calculate_data_completeness_score, axis=1)
+        completeness_scores = calculate_completeness_scores(merged_df)
         summary["avg_completeness_score"] = completeness_scores.mean()
         summary["min_completeness_score"] = completeness_scores.min()
         summary["max_completeness_score"] = completeness_scores.max()
@@ -0,0 +1,477 @@
+#!/usr/bin/env python3
+"""
+In-Process Pipeline DAG Runner
+
+Runs pipeline stages as Python callables in dependency order inside a single
+interpreter. Stages declare named inputs and outputs; outputs are kept in an
+in-memory artifact store and handed to downstream stages directly, so
+DataFrames do not need a CSV/Parquet round trip between stages.
+
+A stage may be sharded (e.g. one shard per state). Shards of a parallel stage
+run on a process pool; the first failing shard or stage stops the pipeline.
+Every stage and shard is timed and a timing report can be written as JSON.
+
+Stages can be memoized make-style: a stage that declares a fingerprint (input
+file checksums, in-memory input digests, config) is fingerprinted together
+with the source of its code. When the fingerprint matches the one recorded in
+the unified registry for the previous successful run, the stage is skipped and
+its recorded outputs are reused.
+"""
+
+import hashlib
+import inspect
+import json
+import logging
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+from graphlib import TopologicalSorter
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+import pandas as pd
+
+from src.io.safe_write import compute_file_checksum, safe_write_json
+
+_NOT_REUSED = object()
+
+
+def stable_digest(value: Any) -> str:
+    """Return a SHA-256 digest of a JSON-serializable value (key order independent)."""
+    payload = json.dumps(value, sort_keys=True, default=str, ensure_ascii=False)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def file_digests(paths: Iterable[Union[str, Path]]) -> Dict[str, Optional[str]]:
+    """Return {path: checksum} for input files (None for files that do not exist)."""
+    return {
+        str(path): compute_file_checksum(Path(path)) if Path(path).exists() else None
+        for path in sorted(set(map(str, paths)))
+    }
+
+
+def frame_digest(df: pd.DataFrame) -> str:
+    """Return a content digest of an in-memory DataFrame (columns, dtypes and values)."""
+    hasher = hashlib.sha256()
+    hasher.update(json.dumps([[str(col), str(dtype)] for col, dtype in df.dtypes.items()]).encode('utf-8'))
+    hasher.update(pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes())
+    return hasher.hexdigest()
+
+
+def source_digest(*objects: Any) -> Dict[str, str]:
+    """Return {source file: checksum} for the modules defining the given functions/modules."""
+    digests = {}
+    for obj in objects:
+        module = obj if inspect.ismodule(obj) else inspect.getmodule(obj)
+        source = inspect.getsourcefile(module) if module else None
+        if source:
+            digests[module.__name__] = compute_file_checksum(Path(source))
+    return digests
+
+
+class StageFailure(Exception):
+    """Raised when a pipeline stage (or one of its shards) fails."""
+
+    def __init__(self, stage: str, shard: Optional[str], error: BaseException, details: str):
+        self.stage = stage
+        self.shard = shard
+        self.error = error
+        self.details = details
+        label = f"{stage} ({shard})" if shard is not None else stage
+        super().__init__(f"Stage {label} failed: {error}")
+
+
+class Stage:
+    """
+    A pipeline stage: a callable with declared inputs and outputs.
+
+    The callable is invoked as ``func(**params, **inputs)`` where ``inputs`` maps
+    each declared input name to the artifact produced upstream. Its return value
+    is stored under the single declared output, or must be a dict keyed by the
+    declared outputs when there are several.
+
+    A sharded stage is invoked once per shard as ``func(shard, **params, **inputs)``
+    and its output is a dict of shard -> result. ``split`` can narrow the inputs
+    handed to each shard (e.g. one state's rows of a DataFrame).
+    """
+
+    def __init__(self, name: str, func: Callable[..., Any],
+                 inputs: Sequence[str] = (), outputs: Sequence[str] = (),
+                 params: Optional[Dict[str, Any]] = None,
+                 after: Sequence[str] = (),
+                 shards: Optional[Sequence[str]] = None,
+                 parallel: bool = True,
+                 split: Optional[Callable[[str, Dict[str, Any]], Dict[str, Any]]] = None,
+                 finalize: Optional[Callable[[str, Any], Any]] = None,
+                 fingerprint: Optional[Callable[[Optional[str], Dict[str, Any]], Optional[Dict[str, Any]]]] = None,
+                 code: Sequence[Any] = (),
+                 record: Optional[Callable[[Any], Any]] = None,
+                 reuse: Optional[Callable[[Any], Any]] = None):
+        """
+        Initialize a stage.
+
+        Args:
+            name: Unique stage name (used in logs and reports)
+            func: Callable implementing the stage
+            inputs: Artifact names consumed from upstream stages
+            outputs: Artifact names produced by this stage
+            params: Extra keyword arguments passed to func
+            after: Stage names that must finish first without an artifact dependency
+                (e.g. stages that only communicate through files on disk)
+            shards: Optional shard keys; func runs once per shard
+            parallel: Run shards on the process pool (func must be picklable)
+            split: Optional (shard, inputs) -> inputs narrowing each shard's inputs
+            finalize: Optional (shard, result) -> result run in this process after each
+                shard (serially, e.g. to write shared stores)
+            fingerprint: Optional (shard, inputs) -> parts dict (e.g. {"inputs": ...,
+                "config": ...}) identifying the work; enables skipping. Return None
+                to always run.
+            code: Extra functions/modules whose source is part of the fingerprint
+                (the module defining func is always included)
+            record: Converts a result into the JSON-serializable outputs recorded
+                in the registry (default: the result itself)
+            reuse: Converts recorded outputs back into the stage result when the
+                stage is skipped; raise if they are no longer available
+        """
+        self.name = name
+        self.func = func
+        self.inputs = list(inputs)
+        self.outputs = list(outputs)
+        self.params = params or {}
+        self.after = list(after)
+        self.shards = list(shards) if shards is not None else None
+        self.parallel = parallel
+        self.split = split
+        self.finalize = finalize
+        self.fingerprint = fingerprint
+        self.code = list(code)
+        self.record = record
+        self.reuse = reuse
+
+    def describe(self) -> str:
+        """Return a one-line description for plans and dry runs."""
+        parts = [f"{self.name} -> {getattr(self.func, '__module__', '?')}.{getattr(self.func, '__qualname__', self.func)}"]
+        if self.shards is not None:
+            mode = "parallel" if self.parallel else "serial"
+            parts.append(f"shards={self.shards} ({mode})")
+        if self.inputs:
+            parts.append(f"inputs={self.inputs}")
+        if self.outputs:
+            parts.append(f"outputs={self.outputs}")
+        if self.fingerprint:
+            parts.append("(memoized)")
+        return " ".join(parts)
+
+
+class PipelineDAG:
+    """
+    Dependency-ordered, fail-fast executor for pipeline stages.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, logger: Optional[logging.Logger] = None,
+                 registry: Optional[Any] = None, force: bool = False):
+        """
+        Initialize the runner.
+
+        Args:
+            max_workers: Process pool size for parallel shards (default: CPU count)
+            logger: Optional logger instance
+            registry: UnifiedRegistry storing stage fingerprints (None disables skipping)
+            force: Run every stage even when its fingerprint is unchanged
+        """
+        self.max_workers = max_workers
+        self.logger = logger or logging.getLogger(__name__)
+        self.registry = registry
+        self.force = force
+        self.stages: Dict[str, Stage] = {}
+        self.artifacts: Dict[str, Any] = {}
+        self.timings: List[Dict[str, Any]] = []
+        self.decisions: List[Dict[str, Any]] = []
+
+    def add(self, stage: Stage) -> Stage:
+        """Register a stage."""
+        if stage.name in self.stages:
+            raise ValueError(f"Duplicate stage name: {stage.name}")
+        self.stages[stage.name] = stage
+        return stage
+
+    def order(self) -> List[Stage]:
+        """
+        Return stages in dependency order (registration order among independent stages).
+
+        Raises:
+            ValueError: If an input has no producer or dependencies are cyclic
+        """
+        producers = {output: stage.name for stage in self.stages.values() for output in stage.outputs}
+        graph: Dict[str, List[str]] = {}
+        for stage in self.stages.values():
+            deps = list(stage.after)
+            for name in stage.inputs:
+                if name not in producers:
+                    raise ValueError(f"Stage {stage.name} needs input '{name}' that no stage produces")
+                deps.append(producers[name])
+            unknown = [dep for dep in deps if dep not in self.stages]
+            if unknown:
+                raise ValueError(f"Stage {stage.name} depends on unknown stages: {unknown}")
+            graph[stage.name] = deps
+
+        sorter = TopologicalSorter(graph)
+        sorter.prepare()
+        position = {name: i for i, name in enumerate(self.stages)}
+        ordered = []
+        while sorter.is_active():
+            ready = sorted(sorter.get_ready(), key=position.get)
+            for name in ready:
+                ordered.append(self.stages[name])
+                sorter.done(name)
+        return ordered
+
+    def run(self, dry_run: bool = False) -> Dict[str, Any]:
+        """
+        Execute every stage in dependency order.
+
+        Args:
+            dry_run: Log the execution plan without running anything
+
+        Returns:
+            Artifact store (output name -> value)
+
+        Raises:
+            StageFailure: On the first failing stage or shard
+        """
+        for stage in self.order():
+            if dry_run:
+                self.logger.info(f"[DRY RUN] Would run {stage.describe()}")
+                continue
+
+            self.logger.info(f"[START] {stage.name}")
+            started = time.perf_counter()
+            inputs = {name: self.artifacts[name] for name in stage.inputs}
+
+            try:
+                if stage.shards is None:
+                    result, skipped = self._run_unit(stage, None, inputs)
+                else:
+                    result, skipped = self._run_shards(stage, inputs)
+            except StageFailure:
+                self._record(stage.name, None, "failed", started)
+                raise
+
+            self._record(stage.name, None, "skipped" if skipped else "success", started)
+            self._store(stage, result)
+            if skipped:
+                self.logger.info(f"[SKIPPED] {stage.name} (unchanged, reusing previous outputs)")
+            else:
+                self.logger.info(f"[SUCCESS] {stage.name} ({time.perf_counter() - started:.1f}s)")
+
+        return self.artifacts
+
+    def _stage_key(self, stage: Stage, shard: Optional[str]) -> str:
+        return stage.name if shard is None else f"{stage.name}:{shard}"
+
+    def _shard_inputs(self, stage: Stage, shard: str, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        return stage.split(shard, inputs) if stage.split else inputs
+
+    def _fingerprint(self, stage: Stage, shard: Optional[str], inputs: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Compute {fingerprint, parts} for a stage/shard, or None if it is not memoized."""
+        if stage.fingerprint is None or self.registry is None:
+            return None
+        parts = stage.fingerprint(shard, inputs)
+        if parts is None:
+            return None
+        parts = dict(parts)
+        parts.setdefault("code", source_digest(stage.func, *stage.code))
+        part_digests = {name: stable_digest(value) for name, value in parts.items()}
+        return {"fingerprint": stable_digest(part_digests), "parts": part_digests}
+
+    def _try_reuse(self, stage: Stage, shard: Optional[str], fingerprint: Optional[Dict[str, Any]]) -> Any:
+        """
+        Decide whether a stage/shard can be skipped.
+
+        Returns:
+            The reused result, or _NOT_REUSED if the work has to run
+        """
+        if fingerprint is None:
+            return _NOT_REUSED
+
+        key = self._stage_key(stage, shard)
+        previous = self.registry.get_stage_fingerprint(key)
+        reused = _NOT_REUSED
+
+        if self.force:
+            reason = "forced (--force)"
+        elif previous is None:
+            reason = "no previous run recorded"
+        elif previous.get("fingerprint") != fingerprint["fingerprint"]:
+            old_parts = previous.get("parts", {})
+            changed = sorted(name for name, digest in fingerprint["parts"].items() if old_parts.get(name) != digest)
+            reason = f"changed: {', '.join(changed) or 'fingerprint'}"
+        else:
+            try:
+                outputs = previous.get("outputs")
+                reused = stage.reuse(outputs) if stage.reuse else outputs
+                reason = f"unchanged since {previous.get('recorded_at', 'last run')}"
+            except Exception as e:
+                reason = f"previous outputs unavailable ({e})"
+
+        action = "ran" if reused is _NOT_REUSED else "skipped"
+        self.decisions.append({"stage": stage.name, "shard": shard, "action": action, "reason": reason})
+        self.logger.info(f"  {key}: {'run' if action == 'ran' else 'skip'} - {reason}")
+        return reused
+
+    def _remember(self, stage: Stage, shard: Optional[str], fingerprint: Optional[Dict[str, Any]], result: Any) -> None:
+        """Record the fingerprint and outputs of a successful stage/shard run."""
+        if fingerprint is None:
+            return
+        outputs = stage.record(result) if stage.record else result
+        self.registry.record_stage_fingerprint(
+            self._stage_key(stage, shard), fingerprint["fingerprint"], fingerprint["parts"], outputs
+        )
+
+    def _run_unit(self, stage: Stage, shard: Optional[str], inputs: Dict[str, Any]) -> Tuple[Any, bool]:
+        """Run (or skip) a whole stage or one serial shard. Returns (result, skipped)."""
+        started = time.perf_counter()
+        unit_inputs = inputs if shard is None else self._shard_inputs(stage, shard, inputs)
+        fingerprint = self._fingerprint(stage, shard, unit_inputs)
+        reused = self._try_reuse(stage, shard, fingerprint)
+        if reused is not _NOT_REUSED:
+            if shard is not None:
+                self._record(stage.name, shard, "skipped", started)
+            return reused, True
+
+        try:
+            if shard is None:
+                result = stage.func(**stage.params, **unit_inputs)
+            else:
+                result = stage.func(shard, **stage.params, **unit_inputs)
+                if stage.finalize:
+                    result = stage.finalize(shard, result)
+        except Exception as e:
+            if shard is not None:
+                self._record(stage.name, shard, "failed", started)
+            raise StageFailure(stage.name, shard, e, traceback.format_exc()) from e
+
+        self._remember(stage, shard, fingerprint, result)
+        if shard is not None:
+            self._record(stage.name, shard, "success", started)
+        return result, False
+
+    def _run_shards(self, stage: Stage, inputs: Dict[str, Any]) -> Tuple[Dict[str, Any], bool]:
+        """Run (or skip) every shard of a stage. Returns (results by shard, all skipped)."""
+        if not (stage.parallel and len(stage.shards) > 1):
+            outcomes = {shard: self._run_unit(stage, shard, inputs) for shard in stage.shards}
+            return ({shard: result for shard, (result, _) in outcomes.items()},
+                    all(skipped for _, skipped in outcomes.values()))
+
+        results: Dict[str, Any] = {}
+        pending: List[Tuple[str, Dict[str, Any], Optional[Dict[str, Any]]]] = []
+        for shard in stage.shards:
+            shard_inputs = self._shard_inputs(stage, shard, inputs)
+            fingerprint = self._fingerprint(stage, shard, shard_inputs)
+            reused = self._try_reuse(stage, shard, fingerprint)
+            if reused is _NOT_REUSED:
+                pending.append((shard, shard_inputs, fingerprint))
+            else:
+                results[shard] = reused
+                self._record(stage.name, shard, "skipped", time.perf_counter())
+
+        if pending:
+            results.update(self._run_parallel(stage, pending))
+
+        # Keep shard order stable regardless of completion order
+        return {shard: results[shard] for shard in stage.shards}, not pending
+
+    def _run_parallel(self, stage: Stage,
+                      pending: List[Tuple[str, Dict[str, Any], Optional[Dict[str, Any]]]]) -> Dict[str, Any]:
+        results: Dict[str, Any] = {}
+        submitted: Dict[Any, Tuple[str, Optional[Dict[str, Any]]]] = {}
+        starts: Dict[str, float] = {}
+        workers = min(len(pending), self.max_workers) if self.max_workers else None
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for shard, shard_inputs, fingerprint in pending:
+                starts[shard] = time.perf_counter()
+                future = executor.submit(stage.func, shard, **stage.params, **shard_inputs)
+                submitted[future] = (shard, fingerprint)
+
+            for future in as_completed(submitted):
+                shard, fingerprint = submitted[future]
+                try:
+                    result = future.result()
+                    # Finalize in this process, one shard at a time
+                    if stage.finalize:
+                        result = stage.finalize(shard, result)
+                except Exception as e:
+                    self._record(stage.name, shard, "failed", starts[shard])
+                    # Fail fast: drop shards that have not started yet
+                    executor.shutdown(wait=True, cancel_futures=True)
+                    details = "".join(traceback.format_exception(type(e), e, e.__traceback__))
+                    raise StageFailure(stage.name, shard, e, details) from e
+                results[shard] = result
+                self._remember(stage, shard, fingerprint, result)
+                self._record(stage.name, shard, "success", starts[shard])
+
+        return results
+
+    def _store(self, stage: Stage, result: Any) -> None:
+        if not stage.outputs:
+            return
+        if len(stage.outputs) == 1:
+            self.artifacts[stage.outputs[0]] = result
+            return
+        if stage.shards is not None:
+            raise ValueError(f"Sharded stage {stage.name} must declare a single output")
+        missing = [name for name in stage.outputs if name not in (result or {})]
+        if missing:
+            raise ValueError(f"Stage {stage.name} did not return outputs: {missing}")
+        for name in stage.outputs:
+            self.artifacts[name] = result[name]
+
+    def _record(self, stage: str, shard: Optional[str], status: str, started: float) -> None:
+        self.timings.append({
+            "stage": stage,
+            "shard": shard,
+            "status": status,
+            "duration_seconds": round(time.perf_counter() - started, 3)
+        })
+
+    def write_timing_report(self, log_dir: Path = Path("data/logs")) -> Optional[Path]:
+        """
+        Log per-stage timings and the skip report, and save both as JSON.
+
+        Args:
+            log_dir: Directory for pipeline_timing_<timestamp>.json
+
+        Returns:
+            Path of the report, or None if nothing ran
+        """
+        if not self.timings:
+            return None
+
+        self.logger.info("Stage timings:")
+        for entry in self.timings:
+            if entry["shard"] is not None:
+                continue
+            self.logger.info(f"  {entry['stage']:<40} {entry['duration_seconds']:>9.1f}s  {entry['status']}")
+            for shard in self.timings:
+                if shard["stage"] == entry["stage"] and shard["shard"] is not None:
+                    label = f"  [{shard['shard']}]"
+                    self.logger.info(f"  {label:<40} {shard['duration_seconds']:>9.1f}s  {shard['status']}")
+
+        skipped = [d for d in self.decisions if d["action"] == "skipped"]
+        if self.decisions:
+            self.logger.info(f"Skip report: {len(skipped)}/{len(self.decisions)} memoized steps skipped")
+            for decision in self.decisions:
+                key = decision["stage"] if decision["shard"] is None else f"{decision['stage']} [{decision['shard']}]"
+                self.logger.info(f"  {key:<40} {decision['action']:<8} {decision['reason']}")
+
+        report = {
+            "generated_at": datetime.now().isoformat(),
+            "total_seconds": round(sum(t["duration_seconds"] for t in self.timings if t["shard"] is None), 3),
+            "stages": self.timings,
+            "decisions": self.decisions
+        }
+        path = Path(log_dir) / f"pipeline_timing_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+        safe_write_json(report, path, logger=self.logger)
+        return path
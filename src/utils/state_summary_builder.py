@@ -4,6 +4,9 @@ State-Level Coverage Tracker
 
 Tracks team coverage, provider information, and build metadata for each US state.
 Generates comprehensive state summaries for monitoring data completeness and trends.
+
+The summaries file is overwritten by each build; per-build state rows are kept in
+the metrics store (src.utils.metrics_store) for history and comparisons.
 """
 
 import pandas as pd
@@ -15,6 +18,7 @@ import logging
 
 from src.scraper.utils.logger import get_logger
 from src.io.safe_write import safe_write_json
+from src.utils.metrics_store import get_metrics_store
 
 
 def build_state_summaries(df: pd.DataFrame, build_id: str, 
@@ -129,6 +133,12 @@ def build_state_summaries(df: pd.DataFrame, build_id: str,
     safe_write_json(summary, summaries_file, logger)
     
     logger.info(f"✅ State summaries saved: {summaries_file}")
+    
+    # Keep per-build coverage rows for history and comparisons
+    try:
+        get_metrics_store().record_state_coverage(build_id, summary["states"], summary["build_timestamp"])
+    except Exception as e:
+        logger.warning(f"⚠️ Failed to record state coverage in metrics store: {e}")
     logger.info(f"📊 Summary statistics:")
     logger.info(f"   Total states: {summary['statistics']['total_states']}")
     logger.info(f"   Total teams: {summary['total_teams']:,}")
@@ -190,40 +200,50 @@ def get_state_coverage(state_code: str) -> Optional[Dict[str, Any]]:
 
 
 def compare_state_coverage(build_id1: str, build_id2: str) -> Dict[str, Any]:
-    # TODO(FIXME): Historical comparison is not implemented. This function is a
-    # stub until we persist versioned state summaries per build (e.g.,
-    # `data/master/state_summaries_YYYYMMDD_HHMM.json`) or add a registry to
-    # retrieve prior snapshots by `build_id`. Next steps:
-    # 1) Persist per-build state summary snapshots and index them by build_id.
-    # 2) Load snapshots for `build_id1` and `build_id2`, then compute deltas.
-    # 3) Consider raising NotImplementedError until persistence is available.
-    # Optionally track via issue: GH-STATE-SUMMARIES-HISTORY (or PR link).
     """
-    Compare state coverage between two builds. STUB: This is intentionally a
-    placeholder until historical state summaries are persisted and retrievable
-    by `build_id`.
-
+    Compare state coverage between two builds.
+    
+    Reads both builds' per-state rows from the metrics store.
+    
     Args:
         build_id1: First build ID
         build_id2: Second build ID
         
     Returns:
-        Dictionary containing comparison results (placeholder structure for now).
-
-    Note:
-        This function currently returns a placeholder. Once per-build state
-        summary snapshots are stored, implement loading snapshots for both
-        build IDs and computing differences (e.g., team counts, providers,
-        coverage deltas). Consider raising NotImplementedError until the
-        persistence layer lands.
+        Dictionary containing comparison results: states added/removed, total
+        team change and per-state team and provider changes
+        
+    Raises:
+        ValueError: If either build has no stored state coverage
     """
-    # This would require storing historical state summaries
-    # For now, return a placeholder structure
+    store = get_metrics_store()
+    coverage1 = store.state_coverage(build_id1).set_index('state')
+    coverage2 = store.state_coverage(build_id2).set_index('state')
+    
+    if coverage1.empty or coverage2.empty:
+        raise ValueError("State coverage not found for one or both builds")
+    
+    states = {}
+    for state in sorted(set(coverage1.index) | set(coverage2.index)):
+        teams1 = int(coverage1.at[state, 'teams']) if state in coverage1.index else 0
+        teams2 = int(coverage2.at[state, 'teams']) if state in coverage2.index else 0
+        providers1 = set(coverage1.at[state, 'providers'] or []) if state in coverage1.index else set()
+        providers2 = set(coverage2.at[state, 'providers'] or []) if state in coverage2.index else set()
+        states[state] = {
+            "teams1": teams1,
+            "teams2": teams2,
+            "team_change": teams2 - teams1,
+            "providers_added": sorted(providers2 - providers1),
+            "providers_removed": sorted(providers1 - providers2)
+        }
+    
     return {
         "build1": build_id1,
         "build2": build_id2,
-        "message": "Historical state comparison not yet implemented",
-        "note": "State summaries are currently overwritten with each build"
+        "states_added": sorted(set(coverage2.index) - set(coverage1.index)),
+        "states_removed": sorted(set(coverage1.index) - set(coverage2.index)),
+        "team_count_change": int(coverage2['teams'].sum() - coverage1['teams'].sum()),
+        "states": states
     }
 
 
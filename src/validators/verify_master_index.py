@@ -14,17 +14,25 @@ Features:
 - Data quality validation (missing states, duplicates)
 - Comprehensive logging with emoji-enhanced output
 - CLI interface for quick verification
+- Streaming verification of master CSVs in fixed-size chunks (bounded memory)
+
+All statistics are accumulated by MasterIndexStats, which sees the data one
+chunk at a time. The in-memory functions feed it a single chunk and the
+streaming verifier feeds it every chunk of the file, so both produce the
+same report.
 """
 
+import numpy as np
 import pandas as pd
 import logging
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Iterator, List, Union
 import sys
 from pathlib import Path
 
 # Add project root to Python path for imports
 sys.path.append(str(Path(__file__).resolve().parents[2]))
 
+from src.schema.constants import US_STATE_CODES
 from src.scraper.utils.file_utils import list_csvs
 
 
@@ -33,71 +41,153 @@ class ValidationError(Exception):
     pass
 
 
-def summarize_master(df: pd.DataFrame, logger: Optional[logging.Logger] = None) -> Dict[str, Any]:
-    """
-    Summarize and validate a master index DataFrame.
+# Rows read per chunk by the streaming verifier
+DEFAULT_CHUNK_SIZE = 100_000
 
-    This function provides comprehensive analysis of the master team index,
-    including data quality metrics, distribution statistics, and validation
-    checks to ensure the integrity of the scraped and merged data.
+# Text columns read as strings so every chunk hashes and counts the same way
+STRING_COLUMNS = [
+    'team_id', 'provider_team_id', 'team_name', 'age_group', 'gender', 'state',
+    'provider', 'club_name', 'source', 'source_url', 'created_at'
+]
 
-    Parameters
-    ----------
-    df : pd.DataFrame
-        The master index DataFrame to analyze.
-    logger : Optional[logging.Logger]
-        Optional logger for structured output. If provided, will log detailed
-        summary information with emoji-enhanced formatting.
+DISTRIBUTION_COLUMNS = ["state", "age_group", "gender", "provider"]
+DUPLICATE_KEY_COLUMNS = ["team_name", "age_group", "gender"]
+NUMERIC_COLUMNS = ["points", "rank"]
+REQUIRED_COLUMNS = ["team_name", "age_group", "gender", "state", "source"]
 
-    Returns
-    -------
-    Dict[str, Any]
-        Summary dictionary containing:
-        - total_rows: Total number of teams
-        - unique_states_count: Number of unique states
-        - unique_states: Sorted list of state codes
-        - age_distribution: Count of teams per age group
-        - gender_distribution: Count of teams per gender
-        - missing_state_rows: Number of rows with missing state data
-        - duplicate_rows_on_team_age_gender: Number of duplicate team entries
-        - data_quality_score: Overall data quality score (0-100)
-        - provider_distribution: Count of teams per data provider
-        - top_states: Top 5 states by team count
-        - age_gender_matrix: Cross-tabulation of age groups and genders
 
-    Examples
-    --------
-    >>> import pandas as pd
-    >>> df = pd.read_csv("data/master/master_team_index_20251013_1355.csv")
-    >>> summary = summarize_master(df)
-    >>> print(f"Total teams: {summary['total_rows']}")
+def _hash_keys(df: pd.DataFrame, columns: List[str]) -> np.ndarray:
+    """Hash a multi-column key to one uint64 per row (string-normalized, index ignored)."""
+    return pd.util.hash_pandas_object(df[columns].astype(str), index=False).to_numpy()
+
+
+def _key_multiplicities(hashes: List[np.ndarray]) -> np.ndarray:
+    """Return how many rows share each distinct hashed key."""
+    if not hashes:
+        return np.array([], dtype=np.int64)
+    _, counts = np.unique(np.concatenate(hashes), return_counts=True)
+    return counts
+
+
+class MasterIndexStats:
     """
-    try:
-        # Basic metrics
-        total_rows = len(df)
-        
-        # State analysis
-        unique_states = sorted(df["state"].dropna().unique().tolist()) if "state" in df.columns else []
-        missing_state_rows = int(df["state"].isna().sum()) if "state" in df.columns else 0
-        
-        # Distribution analysis
-        age_distribution = df["age_group"].value_counts().to_dict() if "age_group" in df.columns else {}
-        gender_distribution = df["gender"].value_counts().to_dict() if "gender" in df.columns else {}
-        provider_distribution = df["provider"].value_counts().to_dict() if "provider" in df.columns else {}
-        
-        # Data quality checks
-        duplicate_rows_on_team_age_gender = int(df.duplicated(subset=["team_name", "age_group", "gender"], keep=False).sum()) if all(col in df.columns for col in ["team_name", "age_group", "gender"]) else 0
-        
-        # Top states analysis
-        if "state" in df.columns and not df["state"].isna().all():
-            state_counts = df["state"].value_counts()
-            top_states = state_counts.head(5).to_dict()
-        else:
-            top_states = {}
-        
-        # Age-gender cross-tabulation
-        if "age_group" in df.columns and "gender" in df.columns:
-            age_gender_matrix = pd.crosstab(df["age_group"], df["gender"]).to_dict()
+    One-pass accumulator for master index summary statistics.
+    
+    Each chunk is reduced to value counts, null counts, running numeric moments
+    and 8-byte hashes of its duplicate keys, so memory grows with the number of
+    distinct values and rows hashed rather than with the width of the file.
+    """
+    
+    def __init__(self):
+        """Initialize empty accumulators."""
+        self.total_rows = 0
+        self.columns: List[str] = []
+        self.null_counts: Dict[str, int] = {}
+        self.value_counts: Dict[str, Dict[Any, int]] = {col: {} for col in DISTRIBUTION_COLUMNS}
+        self.age_gender_counts: Dict[tuple, int] = {}
+        self.numeric: Dict[str, Dict[str, float]] = {}
+        self._duplicate_key_hashes: List[np.ndarray] = []
+        self._team_id_hashes: List[np.ndarray] = []
+    
+    def update(self, chunk: pd.DataFrame) -> None:
+        """
+        Fold one chunk of the master index into the running statistics.
+        
+        Args:
+            chunk: Slice of the master index (any row count)
+        """
+        for col in chunk.columns:
+            if col not in self.null_counts:
+                self.columns.append(col)
+                self.null_counts[col] = 0
+        for col, nulls in chunk.isna().sum().items():
+            self.null_counts[col] += int(nulls)
+        self.total_rows += len(chunk)
+        
+        # Distributions (first-seen order kept so ties rank as in value_counts)
+        for col in DISTRIBUTION_COLUMNS:
+            if col in chunk.columns:
+                counts = self.value_counts[col]
+                for value, count in chunk[col].value_counts(sort=False).items():
+                    counts[value] = counts.get(value, 0) + int(count)
+        
+        if "age_group" in chunk.columns and "gender" in chunk.columns:
+            pairs = chunk.groupby(["age_group", "gender"], sort=False).size()
+            for pair, count in pairs.items():
+                self.age_gender_counts[pair] = self.age_gender_counts.get(pair, 0) + int(count)
+        
+        # Duplicates are resolved across chunks from the hashed keys
+        if all(col in chunk.columns for col in DUPLICATE_KEY_COLUMNS):
+            self._duplicate_key_hashes.append(_hash_keys(chunk, DUPLICATE_KEY_COLUMNS))
+        if "team_id" in chunk.columns:
+            self._team_id_hashes.append(_hash_keys(chunk, ["team_id"]))
+        
+        for col in NUMERIC_COLUMNS:
+            if col in chunk.columns:
+                values = pd.to_numeric(chunk[col], errors="coerce").dropna().to_numpy(dtype=float)
+                if len(values) == 0:
+                    continue
+                moments = self.numeric.setdefault(col, {"count": 0, "sum": 0.0, "sum_sq": 0.0,
+                                                        "min": np.inf, "max": -np.inf})
+                moments["count"] += len(values)
+                moments["sum"] += float(values.sum())
+                moments["sum_sq"] += float(np.square(values).sum())
+                moments["min"] = min(moments["min"], float(values.min()))
+                moments["max"] = max(moments["max"], float(values.max()))
+    
+    def distribution(self, col: str) -> pd.Series:
+        """Return accumulated value counts for a column, largest first."""
+        counts = self.value_counts.get(col, {})
+        ordered = sorted(counts.items(), key=lambda item: -item[1])
+        return pd.Series(dict(ordered), dtype="int64")
+    
+    def duplicate_rows(self, keep: Union[str, bool] = False) -> int:
+        """
+        Count duplicate team/age/gender rows across every chunk seen.
+        
+        Args:
+            keep: False counts every row of a duplicated key (DataFrame.duplicated
+                keep=False); "first" counts all but the first occurrence
+        
+        Returns:
+            Number of duplicate rows
+        """
+        multiplicities = _key_multiplicities(self._duplicate_key_hashes)
+        repeated = multiplicities[multiplicities > 1]
+        if keep is False:
+            return int(repeated.sum())
+        return int((repeated - 1).sum())
+    
+    def team_id_duplicates(self) -> int:
+        """Count rows whose team_id appears more than once."""
+        multiplicities = _key_multiplicities(self._team_id_hashes)
+        return int(multiplicities[multiplicities > 1].sum())
+    
+    def summary(self) -> Dict[str, Any]:
+        """Build the summarize_master report."""
+        total_rows = self.total_rows
+        has_state = "state" in self.null_counts
+        state_counts = self.distribution("state")
+        unique_states = sorted(state_counts.index.tolist())
+        missing_state_rows = self.null_counts["state"] if has_state else 0
+        
+        age_distribution = self.distribution("age_group").to_dict() if "age_group" in self.null_counts else {}
+        gender_distribution = self.distribution("gender").to_dict() if "gender" in self.null_counts else {}
+        provider_distribution = self.distribution("provider").to_dict() if "provider" in self.null_counts else {}
+        
+        duplicate_rows_on_team_age_gender = self.duplicate_rows(keep=False) if all(
+            col in self.null_counts for col in DUPLICATE_KEY_COLUMNS) else 0
+        
+        top_states = state_counts.head(5).to_dict() if has_state and len(state_counts) > 0 else {}
+        
+        # Age-gender cross-tabulation (same layout as pd.crosstab(...).to_dict())
+        if "age_group" in self.null_counts and "gender" in self.null_counts:
+            pairs = pd.Series(self.age_gender_counts, dtype="int64")
+            if len(pairs) > 0:
+                matrix = pairs.unstack(fill_value=0).sort_index().sort_index(axis=1)
+                age_gender_matrix = matrix.to_dict()
+            else:
+                age_gender_matrix = {}
         else:
             age_gender_matrix = {}
         
@@ -128,8 +218,7 @@ def summarize_master(df: pd.DataFrame, logger: Optional[logging.Logger] = None)
         # Calculate overall quality score
         data_quality_score = min(sum(quality_factors), 100)
         
-        # Create comprehensive summary dictionary
-        summary = {
+        return {
             "total_rows": total_rows,
             "unique_states_count": len(unique_states),
             "unique_states": unique_states,
@@ -144,29 +233,185 @@ def summarize_master(df: pd.DataFrame, logger: Optional[logging.Logger] = None)
             "state_completeness_percent": round((total_rows - missing_state_rows) / total_rows * 100, 1) if total_rows > 0 else 0,
             "duplicate_percent": round(duplicate_rows_on_team_age_gender / total_rows * 100, 1) if total_rows > 0 else 0
         }
+    
+    def quality(self) -> Dict[str, bool]:
+        """Build the validate_data_quality report."""
+        total_rows = self.total_rows
+        validation_results = {}
+        
+        # Check 1: Non-empty DataFrame
+        validation_results["has_data"] = total_rows > 0
+        
+        # Check 2: Required columns present
+        validation_results["has_required_columns"] = all(col in self.null_counts for col in REQUIRED_COLUMNS)
+        
+        # Check 3: No completely empty columns
+        validation_results["no_empty_columns"] = not any(
+            nulls == total_rows for nulls in self.null_counts.values())
+        
+        # Check 4: Reasonable state completeness (at least 80%)
+        if "state" in self.null_counts and total_rows > 0:
+            state_completeness = (total_rows - self.null_counts["state"]) / total_rows
+            validation_results["good_state_completeness"] = state_completeness >= 0.8
+        else:
+            validation_results["good_state_completeness"] = False
+        
+        # Check 5: Low duplicate rate (less than 5%)
+        if all(col in self.null_counts for col in DUPLICATE_KEY_COLUMNS) and total_rows > 0:
+            duplicate_rate = self.duplicate_rows(keep="first") / total_rows
+            validation_results["low_duplicate_rate"] = duplicate_rate < 0.05
+        else:
+            validation_results["low_duplicate_rate"] = False
+        
+        # Check 6: Multiple states represented
+        if "state" in self.null_counts:
+            validation_results["multiple_states"] = len(self.value_counts["state"]) >= 3
+        else:
+            validation_results["multiple_states"] = False
+        
+        # Overall validation score
+        validation_results["overall_valid"] = all(validation_results.values())
+        return validation_results
+    
+    def trends(self) -> Dict[str, Any]:
+        """Build the analyze_trends report."""
+        trends = {}
+        
+        # Age group trends
+        if "age_group" in self.null_counts:
+            age_counts = self.distribution("age_group")
+            trends["most_common_age_group"] = age_counts.index[0] if len(age_counts) > 0 else None
+            trends["age_group_balance"] = age_counts.std() / age_counts.mean() if len(age_counts) > 0 else 0
+        
+        # Gender trends
+        if "gender" in self.null_counts:
+            gender_counts = self.distribution("gender")
+            trends["gender_balance"] = gender_counts.std() / gender_counts.mean() if len(gender_counts) > 0 else 0
+        
+        # State trends
+        if "state" in self.null_counts:
+            state_counts = self.distribution("state")
+            trends["state_concentration"] = state_counts.iloc[0] / self.total_rows if len(state_counts) > 0 else 0
+            trends["geographic_diversity"] = len(state_counts) / 50  # Normalized by total US states
+        
+        # Provider trends
+        if "provider" in self.null_counts:
+            provider_counts = self.distribution("provider")
+            trends["provider_diversity"] = len(provider_counts)
+            trends["dominant_provider"] = provider_counts.index[0] if len(provider_counts) > 0 else None
+        
+        return trends
+    
+    def null_rates(self) -> Dict[str, float]:
+        """Return the fraction of null values per column."""
+        if self.total_rows == 0:
+            return {col: 0.0 for col in self.columns}
+        return {col: round(self.null_counts[col] / self.total_rows, 4) for col in self.columns}
+    
+    def numeric_distributions(self) -> Dict[str, Dict[str, float]]:
+        """Return count/mean/std/min/max for the points and rank columns."""
+        distributions = {}
+        for col, moments in self.numeric.items():
+            count = moments["count"]
+            mean = moments["sum"] / count
+            variance = (moments["sum_sq"] - count * mean ** 2) / (count - 1) if count > 1 else 0.0
+            distributions[col] = {
+                "count": count,
+                "mean": mean,
+                "std": float(np.sqrt(max(variance, 0.0))),
+                "min": moments["min"],
+                "max": moments["max"]
+            }
+        return distributions
+
+
+def _log_summary(summary: Dict[str, Any], logger: logging.Logger) -> None:
+    """Log a summarize_master report with emoji-enhanced output."""
+    logger.info("📊 MASTER INDEX SUMMARY")
+    logger.info("=" * 50)
+    logger.info(f"📈 Total teams: {summary['total_rows']}")
+    logger.info(f"🌎 States covered: {summary['unique_states_count']} → {summary['unique_states']}")
+    logger.info(f"📊 Age distribution: {summary['age_distribution']}")
+    logger.info(f"⚽ Gender distribution: {summary['gender_distribution']}")
+    logger.info(f"🏢 Provider distribution: {summary['provider_distribution']}")
+    logger.info(f"⚠️ Missing state rows: {summary['missing_state_rows']}")
+    logger.info(f"🔄 Duplicate team-age-gender rows: {summary['duplicate_rows_on_team_age_gender']}")
+    logger.info(f"⭐ Data quality score: {summary['data_quality_score']}/100")
+    logger.info(f"📈 State completeness: {summary['state_completeness_percent']}%")
+    logger.info(f"🔄 Duplicate rate: {summary['duplicate_percent']}%")
+    
+    if summary['top_states']:
+        logger.info(f"🏆 Top 5 states by team count: {summary['top_states']}")
+    
+    if summary['age_gender_matrix']:
+        logger.info("📊 Age-Gender Matrix:")
+        for age_group, genders in summary['age_gender_matrix'].items():
+            logger.info(f"   {age_group}: {genders}")
+
+
+def _log_validation(validation_results: Dict[str, bool], logger: logging.Logger) -> None:
+    """Log a validate_data_quality report."""
+    logger.info("🔍 DATA QUALITY VALIDATION")
+    logger.info("=" * 50)
+    for check, result in validation_results.items():
+        status = "✅" if result else "❌"
+        logger.info(f"{status} {check}: {result}")
+
+
+def _log_trends(trends: Dict[str, Any], logger: logging.Logger) -> None:
+    """Log an analyze_trends report."""
+    logger.info("📈 TREND ANALYSIS")
+    logger.info("=" * 50)
+    for trend, value in trends.items():
+        logger.info(f"📊 {trend}: {value}")
+
+
+def summarize_master(df: pd.DataFrame, logger: Optional[logging.Logger] = None) -> Dict[str, Any]:
+    """
+    Summarize and validate a master index DataFrame.
+
+    This function provides comprehensive analysis of the master team index,
+    including data quality metrics, distribution statistics, and validation
+    checks to ensure the integrity of the scraped and merged data.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        The master index DataFrame to analyze.
+    logger : Optional[logging.Logger]
+        Optional logger for structured output. If provided, will log detailed
+        summary information with emoji-enhanced formatting.
+
+    Returns
+    -------
+    Dict[str, Any]
+        Summary dictionary containing:
+        - total_rows: Total number of teams
+        - unique_states_count: Number of unique states
+        - unique_states: Sorted list of state codes
+        - age_distribution: Count of teams per age group
+        - gender_distribution: Count of teams per gender
+        - missing_state_rows: Number of rows with missing state data
+        - duplicate_rows_on_team_age_gender: Number of duplicate team entries
+        - data_quality_score: Overall data quality score (0-100)
+        - provider_distribution: Count of teams per data provider
+        - top_states: Top 5 states by team count
+        - age_gender_matrix: Cross-tabulation of age groups and genders
+
+    Examples
+    --------
+    >>> import pandas as pd
+    >>> df = pd.read_csv("data/master/master_team_index_20251013_1355.csv")
+    >>> summary = summarize_master(df)
+    >>> print(f"Total teams: {summary['total_rows']}")
+    """
+    try:
+        stats = MasterIndexStats()
+        stats.update(df)
+        summary = stats.summary()
         
-        # Optional logging with emoji-enhanced output
         if logger:
-            logger.info("📊 MASTER INDEX SUMMARY")
-            logger.info("=" * 50)
-            logger.info(f"📈 Total teams: {total_rows}")
-            logger.info(f"🌎 States covered: {len(unique_states)} → {unique_states}")
-            logger.info(f"📊 Age distribution: {age_distribution}")
-            logger.info(f"⚽ Gender distribution: {gender_distribution}")
-            logger.info(f"🏢 Provider distribution: {provider_distribution}")
-            logger.info(f"⚠️ Missing state rows: {missing_state_rows}")
-            logger.info(f"🔄 Duplicate team-age-gender rows: {duplicate_rows_on_team_age_gender}")
-            logger.info(f"⭐ Data quality score: {data_quality_score}/100")
-            logger.info(f"📈 State completeness: {summary['state_completeness_percent']}%")
-            logger.info(f"🔄 Duplicate rate: {summary['duplicate_percent']}%")
-            
-            if top_states:
-                logger.info(f"🏆 Top 5 states by team count: {top_states}")
-            
-            if age_gender_matrix:
-                logger.info("📊 Age-Gender Matrix:")
-                for age_group, genders in age_gender_matrix.items():
-                    logger.info(f"   {age_group}: {genders}")
+            _log_summary(summary, logger)
         
         return summary
         
@@ -191,48 +436,12 @@ def validate_data_quality(df: pd.DataFrame, logger: Optional[logging.Logger] = N
         Dictionary of validation results with boolean flags
     """
     try:
-        validation_results = {}
-        
-        # Check 1: Non-empty DataFrame
-        validation_results["has_data"] = len(df) > 0
-        
-        # Check 2: Required columns present
-        required_columns = ["team_name", "age_group", "gender", "state", "source"]
-        validation_results["has_required_columns"] = all(col in df.columns for col in required_columns)
-        
-        # Check 3: No completely empty columns
-        validation_results["no_empty_columns"] = not df.isnull().all().any()
-        
-        # Check 4: Reasonable state completeness (at least 80%)
-        if "state" in df.columns and len(df) > 0:
-            state_completeness = (len(df) - df["state"].isna().sum()) / len(df)
-            validation_results["good_state_completeness"] = state_completeness >= 0.8
-        else:
-            validation_results["good_state_completeness"] = False
-        
-        # Check 5: Low duplicate rate (less than 5%)
-        if all(col in df.columns for col in ["team_name", "age_group", "gender"]) and len(df) > 0:
-            duplicate_rate = df.duplicated(subset=["team_name", "age_group", "gender"]).sum() / len(df)
-            validation_results["low_duplicate_rate"] = duplicate_rate < 0.05
-        else:
-            validation_results["low_duplicate_rate"] = False
-        
-        # Check 6: Multiple states represented
-        if "state" in df.columns:
-            unique_states = df["state"].dropna().nunique()
-            validation_results["multiple_states"] = unique_states >= 3
-        else:
-            validation_results["multiple_states"] = False
-        
-        # Overall validation score
-        validation_results["overall_valid"] = all(validation_results.values())
+        stats = MasterIndexStats()
+        stats.update(df)
+        validation_results = stats.quality()
         
         if logger:
-            logger.info("🔍 DATA QUALITY VALIDATION")
-            logger.info("=" * 50)
-            for check, result in validation_results.items():
-                status = "✅" if result else "❌"
-                logger.info(f"{status} {check}: {result}")
+            _log_validation(validation_results, logger)
         
         return validation_results
         
@@ -257,36 +466,12 @@ def analyze_trends(df: pd.DataFrame, logger: Optional[logging.Logger] = None) ->
         Dictionary containing trend analysis results
     """
     try:
-        trends = {}
-        
-        # Age group trends
-        if "age_group" in df.columns:
-            age_counts = df["age_group"].value_counts()
-            trends["most_common_age_group"] = age_counts.index[0] if len(age_counts) > 0 else None
-            trends["age_group_balance"] = age_counts.std() / age_counts.mean() if len(age_counts) > 0 else 0
-        
-        # Gender trends
-        if "gender" in df.columns:
-            gender_counts = df["gender"].value_counts()
-            trends["gender_balance"] = gender_counts.std() / gender_counts.mean() if len(gender_counts) > 0 else 0
-        
-        # State trends
-        if "state" in df.columns:
-            state_counts = df["state"].value_counts()
-            trends["state_concentration"] = state_counts.iloc[0] / len(df) if len(state_counts) > 0 else 0
-            trends["geographic_diversity"] = len(state_counts) / 50  # Normalized by total US states
-        
-        # Provider trends
-        if "provider" in df.columns:
-            provider_counts = df["provider"].value_counts()
-            trends["provider_diversity"] = len(provider_counts)
-            trends["dominant_provider"] = provider_counts.index[0] if len(provider_counts) > 0 else None
+        stats = MasterIndexStats()
+        stats.update(df)
+        trends = stats.trends()
         
         if logger:
-            logger.info("📈 TREND ANALYSIS")
-            logger.info("=" * 50)
-            for trend, value in trends.items():
-                logger.info(f"📊 {trend}: {value}")
+            _log_trends(trends, logger)
         
         return trends
         
@@ -299,13 +484,123 @@ def analyze_trends(df: pd.DataFrame, logger: Optional[logging.Logger] = None) ->
         raise
 
 
-def validate_master_index_with_schema(df: pd.DataFrame, logger: Optional[logging.Logger] = None) -> Dict[str, Any]:
+def iter_master_chunks(path: Union[str, Path], chunksize: int = DEFAULT_CHUNK_SIZE) -> Iterator[pd.DataFrame]:
+    """
+    Read a master index CSV in fixed-size chunks.
+    
+    Args:
+        path: Master index CSV file
+        chunksize: Rows per chunk
+        
+    Yields:
+        DataFrame chunks (text columns read as strings)
+    """
+    header = pd.read_csv(path, nrows=0).columns
+    dtype = {col: str for col in STRING_COLUMNS if col in header}
+    with pd.read_csv(path, chunksize=chunksize, dtype=dtype) as reader:
+        for chunk in reader:
+            yield chunk
+
+
+def verify_master_file(path: Union[str, Path], chunksize: int = DEFAULT_CHUNK_SIZE,
+                       schema_checks: bool = True, logger: Optional[logging.Logger] = None) -> Dict[str, Any]:
+    """
+    Verify a master index CSV in one streaming pass with bounded memory.
+    
+    Every chunk is folded into a MasterIndexStats accumulator and, optionally,
+    checked against the master team fast schema profile. The summary, validation
+    and trends reports are identical to summarize_master, validate_data_quality
+    and analyze_trends on the fully loaded file.
+    
+    Args:
+        path: Master index CSV file
+        chunksize: Rows per chunk
+        schema_checks: Run the fast schema checks on each chunk
+        logger: Optional logger instance
+        
+    Returns:
+        Dictionary with summary, validation, trends, profile (null rates and
+        points/rank distributions) and schema (per-check failures) reports
+    """
+    stats = MasterIndexStats()
+    schema_failures: Dict[tuple, Dict[str, Any]] = {}
+    chunks = 0
+    
+    profile = None
+    if schema_checks:
+        from src.schema.fast_validation import FastValidationError, fast_validate, MAX_FAILURE_CASES
+        from src.schema.master_team_schema import MASTER_TEAM_FAST_PROFILE
+        profile = MASTER_TEAM_FAST_PROFILE
+    
+    for chunk in iter_master_chunks(path, chunksize):
+        chunks += 1
+        stats.update(chunk)
+        if profile is None:
+            continue
+        try:
+            fast_validate(chunk, profile)
+        except FastValidationError as e:
+            for failure in e.failure_cases.to_dict("records"):
+                key = (failure["column"], failure["check"])
+                merged = schema_failures.setdefault(key, {
+                    "column": failure["column"], "check": failure["check"],
+                    "failure_count": 0, "failure_cases": []
+                })
+                merged["failure_count"] += failure["failure_count"]
+                for case in failure["failure_cases"]:
+                    if len(merged["failure_cases"]) < MAX_FAILURE_CASES and case not in merged["failure_cases"]:
+                        merged["failure_cases"].append(case)
+    
+    if profile is None:
+        schema = {"status": "skipped", "failures": []}
+    else:
+        schema = {
+            "status": "failed" if schema_failures else "passed",
+            "failures": list(schema_failures.values())
+        }
+    schema["team_id_duplicates"] = stats.team_id_duplicates()
+    
+    report = {
+        "summary": stats.summary(),
+        "validation": stats.quality(),
+        "trends": stats.trends(),
+        "profile": {
+            "chunks": chunks,
+            "null_rates": stats.null_rates(),
+            "numeric_distributions": stats.numeric_distributions()
+        },
+        "schema": schema
+    }
+    
+    if logger:
+        logger.info(f"📦 Streamed {stats.total_rows:,} rows in {chunks} chunks of up to {chunksize:,}")
+        _log_summary(report["summary"], logger)
+        _log_validation(report["validation"], logger)
+        _log_trends(report["trends"], logger)
+        if report["profile"]["numeric_distributions"]:
+            logger.info(f"📊 Numeric distributions: {report['profile']['numeric_distributions']}")
+        if schema["status"] == "failed":
+            for failure in schema["failures"]:
+                logger.warning(f"⚠️ Schema check {failure['column'] or '<frame>'}: {failure['check']} "
+                               f"({failure['failure_count']} rows, e.g. {failure['failure_cases']})")
+        if schema["team_id_duplicates"]:
+            logger.warning(f"⚠️ Found {schema['team_id_duplicates']} rows with duplicate team_ids")
+    
+    return report
+
+
+def validate_master_index_with_schema(df: pd.DataFrame, logger: Optional[logging.Logger] = None,
+                                      mode: str = "auto", touched=None) -> Dict[str, Any]:
     """
     Enhanced master index validation using Pandera schema validation.
     
     Args:
         df: DataFrame containing master team index data
         logger: Optional logger instance for output
+        mode: Schema validation tier - "full", "fast", "sampled" or "auto"
+            (full up to 50k rows, sampled above; see src.schema.fast_validation)
+        touched: Rows added/changed since the last build (mask or index labels),
+            always fully validated in sampled mode
         
     Returns:
         Dictionary containing comprehensive validation results
@@ -337,9 +632,9 @@ def validate_master_index_with_schema(df: pd.DataFrame, logger: Optional[logging
         logger.info("✅ Required columns validation passed")
         
         # Step 2: Pandera schema validation
-        logger.info("📊 Step 2: Running Pandera schema validation...")
+        logger.info(f"📊 Step 2: Running Pandera schema validation (mode: {mode})...")
         try:
-            validate_dataframe(df)
+            validate_dataframe(df, mode=mode, touched=touched)
             schema_status = "passed"
             schema_message = "All schema validations passed"
             logger.info("✅ Schema validation passed")
@@ -372,16 +667,7 @@ def validate_master_index_with_schema(df: pd.DataFrame, logger: Optional[logging
         
         # Step 5: State code validation
         logger.info("🗺️ Step 5: Validating state codes...")
-        valid_states = {
-            'AL', 'AK', 'AZ', 'AR', 'CA', 'CO', 'CT', 'DE', 'FL', 'GA',
-            'HI', 'ID', 'IL', 'IN', 'IA', 'KS', 'KY', 'LA', 'ME', 'MD',
-            'MA', 'MI', 'MN', 'MS', 'MO', 'MT', 'NE', 'NV', 'NH', 'NJ',
-            'NM', 'NY', 'NC', 'ND', 'OH', 'OK', 'OR', 'PA', 'RI', 'SC',
-            'SD', 'TN', 'TX', 'UT', 'VT', 'VA', 'WA', 'WV', 'WI', 'WY',
-            'DC'
-        }
-        
-        invalid_states = df[~df['state'].isin(valid_states)]
+        invalid_states = df[~df['state'].isin(US_STATE_CODES)]
         invalid_state_count = len(invalid_states)
         
         if invalid_state_count > 0:
@@ -414,7 +700,7 @@ def validate_master_index_with_schema(df: pd.DataFrame, logger: Optional[logging
         invalid_age_group_count = len(invalid_age_groups)
         
         # Check consistency between age_group and age_u
-        inconsistent_ages = df[df['age_group'] != df['age_u'].apply(lambda x: f"U{x}")]
+        inconsistent_ages = df[df['age_group'] != "U" + df['age_u'].astype(str)]
         inconsistent_count = len(inconsistent_ages)
         
         if invalid_age_count > 0:
@@ -507,18 +793,11 @@ if __name__ == "__main__":
         latest_file = master_files[0]  # Already sorted by modification time (newest first)
         print(f"Analyzing latest master index: {latest_file}")
         
-        # Load and analyze the DataFrame
-        df = pd.read_csv(latest_file)
-        
-        # Run comprehensive analysis
-        print("\nRunning comprehensive analysis...")
-        summary = summarize_master(df)
-        
-        print("\nRunning data quality validation...")
-        validation = validate_data_quality(df)
-        
-        print("\nRunning trend analysis...")
-        trends = analyze_trends(df)
+        # Stream the file through one pass of summary, validation and trend analysis
+        print("\nRunning streaming analysis...")
+        report = verify_master_file(latest_file)
+        summary = report['summary']
+        validation = report['validation']
         
         # Print summary results
         print("\n" + "=" * 50)
@@ -528,6 +807,7 @@ if __name__ == "__main__":
         print(f"States covered: {summary['unique_states_count']}")
         print(f"Data quality score: {summary['data_quality_score']}/100")
         print(f"Overall validation: {'PASS' if validation['overall_valid'] else 'FAIL'}")
+        print(f"Schema checks: {report['schema']['status'].upper()}")
         
         if summary['total_rows'] > 0:
             print(f"Top states: {list(summary['top_states'].keys())[:3]}")
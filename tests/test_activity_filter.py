@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Test suite for vectorized activity date parsing, filtering and metrics
+"""
+
+import pandas as pd
+import pytest
+import sys
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+# Add project root to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from src.scraper.utils.activity_filter import (
+    calculate_team_activity_metrics,
+    filter_inactive_teams,
+    filter_recent_games,
+    parse_activity_dates
+)
+
+
+def days_ago(days):
+    """ISO date string for a day relative to today"""
+    return (date.today() - timedelta(days=days)).isoformat()
+
+
+class TestParseActivityDates:
+    """Test cases for parse_activity_dates"""
+
+    def test_offset_naive_and_object_dates(self):
+        """Test that offset timestamps keep their wall-clock date like date.fromisoformat"""
+        values = pd.Series([
+            '2025-10-14',
+            '2025-10-14T23:30:00-07:00',
+            '2025-10-14T23:30:00Z',
+            '2025-10-14T23:30:00.123+0530',
+            '2025-10-14 08:00',
+            '10/14/2025',
+            date(2025, 10, 14),
+            datetime(2025, 10, 14, 22, 15),
+        ], dtype=object)
+
+        parsed = parse_activity_dates(values)
+
+        assert (parsed == pd.Timestamp('2025-10-14')).all()
+        assert parsed.dt.tz is None
+
+    def test_missing_and_unparseable_become_nat(self):
+        """Test that nulls and unparseable values become NaT without raising"""
+        values = pd.Series(['not a date', '2025-13-45', None, float('nan'), '2025-10-14'], dtype=object)
+
+        parsed = parse_activity_dates(values)
+
+        assert parsed.isna().tolist() == [True, True, True, True, False]
+        assert parsed.index.equals(values.index)
+
+
+class TestActivityMask:
+    """Test cases for the mask-based team and game filters"""
+
+    def test_filter_inactive_teams(self, caplog):
+        """Test that stale teams are dropped while missing/unparseable dates are kept"""
+        teams = pd.DataFrame({
+            'team_id': ['recent', 'offset', 'stale', 'missing', 'garbage'],
+            'last_seen_active_date': [days_ago(10), f"{days_ago(119)}T23:30:00-07:00", days_ago(200),
+                                      None, 'sometime'],
+        }, index=[10, 20, 30, 40, 50])
+
+        with caplog.at_level('WARNING'):
+            active = filter_inactive_teams(teams, threshold_days=120)
+
+        assert active['team_id'].tolist() == ['recent', 'offset', 'missing', 'garbage']
+        assert active.index.tolist() == [10, 20, 40, 50]
+        assert "Invalid activity date format for 1 teams" in caplog.text
+
+    def test_filter_recent_games(self):
+        """Test that games without a usable date or older than the window are dropped"""
+        games = [
+            {'game_id': 1, 'game_date': days_ago(30)},
+            {'game_id': 2, 'game_date': days_ago(500)},
+            {'game_id': 3, 'game_date': None},
+            {'game_id': 4, 'game_date': 'TBD'},
+            {'game_id': 5, 'game_date': f"{days_ago(60)}T10:00:00Z"},
+            {'game_id': 6},
+        ]
+
+        assert [g['game_id'] for g in filter_recent_games(games, months_back=12)] == [1, 5]
+        assert filter_recent_games([]) == []
+
+
+class TestActivityMetrics:
+    """Test cases for calculate_team_activity_metrics"""
+
+    def test_counts_and_percentiles(self):
+        """Test status counts, field fallback and median/p90 days since activity"""
+        teams = pd.DataFrame({
+            'last_seen_active_date': [days_ago(10), days_ago(30), None, days_ago(400), None],
+            'last_game_date': [None, days_ago(5), days_ago(200), None, 'unknown'],
+        })
+
+        metrics = calculate_team_activity_metrics(teams)
+
+        assert metrics['total_teams'] == 5
+        assert metrics['active_teams'] == 2
+        assert metrics['inactive_teams'] == 2  # 200 days via last_game_date fallback, 400 days
+        assert metrics['teams_without_activity_date'] == 1
+        assert metrics['active_percentage'] == pytest.approx(40.0)
+        assert metrics['inactive_percentage'] == pytest.approx(40.0)
+        # Days since activity: [10, 30, 200, 400]
+        assert metrics['days_since_activity_median'] == pytest.approx(115.0)
+        assert metrics['days_since_activity_p90'] == pytest.approx(340.0)
+
+    def test_no_dates_and_empty_frames(self):
+        """Test that percentiles are omitted when no team has a usable date"""
+        undated = calculate_team_activity_metrics(pd.DataFrame({'last_seen_active_date': [None, 'n/a']}))
+        assert undated['teams_without_activity_date'] == 2
+        assert 'days_since_activity_median' not in undated
+
+        empty = calculate_team_activity_metrics(pd.DataFrame())
+        assert empty == {'total_teams': 0, 'active_teams': 0, 'inactive_teams': 0,
+                         'teams_without_activity_date': 0}
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+Test suite for the concurrent crawl scheduler
+"""
+
+import pytest
+import sys
+import threading
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Add project root to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from src.scraper.utils.crawl_scheduler import CrawlCheckpoint, RateBudget, crawl_stream, crawl_streams
+
+
+class FakeFetcher:
+    """Paginated fake API: returns `pages` pages of records, optionally failing one page"""
+
+    def __init__(self, name, pages, delay=0.0, fail_page=None, raise_page=None, tracker=None):
+        self.name = name
+        self.pages = pages
+        self.delay = delay
+        self.fail_page = fail_page
+        self.raise_page = raise_page
+        self.tracker = tracker
+        self.requested = []
+
+    def __call__(self, page):
+        self.requested.append(page)
+        if self.tracker:
+            self.tracker.enter()
+        try:
+            time.sleep(self.delay)
+        finally:
+            if self.tracker:
+                self.tracker.exit()
+        if page == self.raise_page:
+            raise ConnectionError(f"{self.name} page {page} reset")
+        if page == self.fail_page:
+            return None, None
+        return [{"stream": self.name, "page": page, "row": i} for i in range(2)], self.pages
+
+
+class ConcurrencyTracker:
+    """Records the maximum number of fetches in flight"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.current = 0
+        self.peak = 0
+
+    def enter(self):
+        with self.lock:
+            self.current += 1
+            self.peak = max(self.peak, self.current)
+
+    def exit(self):
+        with self.lock:
+            self.current -= 1
+
+
+class TestCrawlScheduler:
+    """Test cases for RateBudget, crawl_stream and crawl_streams"""
+
+    def test_rate_budget_spaces_calls(self):
+        """Test that acquisitions across threads are spaced by the budget interval"""
+        budget = RateBudget(max_per_second=20)
+        stamps = []
+        lock = threading.Lock()
+
+        def worker():
+            for _ in range(3):
+                budget.acquire()
+                with lock:
+                    stamps.append(time.monotonic())
+
+        threads = [threading.Thread(target=worker) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # Nine calls at 20/s need at least eight 50ms intervals
+        assert len(stamps) == 9
+        assert max(stamps) - min(stamps) >= 8 * 0.05 - 0.01
+
+    def test_streams_run_concurrently_and_keep_order(self):
+        """Test concurrent streams under one budget, with results in stream order"""
+        tracker = ConcurrencyTracker()
+        streams = {
+            "U10_m": FakeFetcher("U10_m", pages=2, delay=0.15, tracker=tracker),
+            "U10_f": FakeFetcher("U10_f", pages=2, delay=0.05, tracker=tracker),
+            "U11_m": FakeFetcher("U11_m", pages=2, delay=0.01, tracker=tracker),
+        }
+
+        started = time.monotonic()
+        results = crawl_streams(streams, max_workers=3, max_per_second=100)
+        elapsed = time.monotonic() - started
+
+        assert list(results) == ["U10_m", "U10_f", "U11_m"]
+        assert tracker.peak > 1
+        assert elapsed < 2 * (0.15 + 0.05 + 0.01)
+        for key, result in results.items():
+            assert result["complete"] and result["error"] is None
+            assert result["rows"] == 4 and result["pages"] == 2
+            assert [batch[0]["page"] for batch in result["batches"]] == [1, 2]
+            assert {row["stream"] for batch in result["batches"] for row in batch} == {key}
+
+    def test_page_failure_is_reported(self):
+        """Test that failed pages and raising fetchers show up as incomplete streams with errors"""
+        failing = FakeFetcher("U12_f", pages=5, fail_page=3)
+        result = crawl_stream("U12_f", failing, RateBudget(1000))
+
+        assert result["complete"] is False
+        assert result["error"] == "page 3 could not be fetched"
+        assert result["rows"] == 4 and failing.requested == [1, 2, 3]
+
+        results = crawl_streams({
+            "ok": FakeFetcher("ok", pages=1),
+            "broken": FakeFetcher("broken", pages=3, raise_page=2),
+        }, max_per_second=1000)
+
+        assert results["ok"]["complete"] is True
+        assert results["broken"]["complete"] is False
+        assert "page 2 reset" in results["broken"]["error"]
+
+
+class TestCrawlCheckpoint:
+    """Test cases for the JSONL resume journal"""
+
+    def test_resume_skips_journaled_pages(self, tmp_path):
+        """Test that an interrupted stream resumes after its last journaled page"""
+        checkpoint = CrawlCheckpoint(tmp_path / "crawl")
+        first = FakeFetcher("U13_m", pages=4, fail_page=3)
+        interrupted = crawl_stream("U13_m", first, RateBudget(1000), checkpoint)
+        assert interrupted["complete"] is False and first.requested == [1, 2, 3]
+
+        second = FakeFetcher("U13_m", pages=4)
+        resumed = crawl_stream("U13_m", second, RateBudget(1000), CrawlCheckpoint(tmp_path / "crawl"))
+
+        assert second.requested == [3, 4]
+        assert resumed["complete"] is True
+        assert [batch[0]["page"] for batch in resumed["batches"]] == [1, 2, 3, 4]
+        assert resumed["rows"] == 8
+
+        third = FakeFetcher("U13_m", pages=4)
+        done = crawl_stream("U13_m", third, RateBudget(1000), CrawlCheckpoint(tmp_path / "crawl"))
+        assert third.requested == [] and done["complete"] and done["rows"] == 8
+
+    def test_stale_journal_is_discarded(self, tmp_path):
+        """Test that a journal started more than 24h ago is thrown away"""
+        checkpoint = CrawlCheckpoint(tmp_path / "crawl")
+        checkpoint.append_page("U14_f", 1, [{"row": 0}], 3)
+        (tmp_path / "crawl" / "started_at").write_text((datetime.now() - timedelta(hours=25)).isoformat())
+
+        fresh = CrawlCheckpoint(tmp_path / "crawl")
+
+        assert fresh.load("U14_f") == {"batches": [], "next_page": 1, "total_pages": None, "done": False}
+        started = datetime.fromisoformat((tmp_path / "crawl" / "started_at").read_text())
+        assert datetime.now() - started < timedelta(minutes=1)
+
+        recent = CrawlCheckpoint(tmp_path / "crawl", max_age_hours=24.0)
+        recent.append_page("U14_f", 1, [{"row": 0}], 3)
+        assert CrawlCheckpoint(tmp_path / "crawl").load("U14_f")["next_page"] == 2
+
+    def test_truncated_last_line_is_tolerated(self, tmp_path):
+        """Test that a torn final journal line is ignored on replay"""
+        checkpoint = CrawlCheckpoint(tmp_path / "crawl")
+        checkpoint.append_page("U15_m", 1, {"team": ["a", "b"]}, 3)
+        checkpoint.append_page("U15_m", 2, {"team": ["c"]}, 3)
+        with open(tmp_path / "crawl" / "U15_m.jsonl", 'a', encoding='utf-8') as f:
+            f.write('{"page": 3, "total_pages": 3, "batch": {"team": ["d"')
+
+        state = checkpoint.load("U15_m")
+
+        assert state["batches"] == [{"team": ["a", "b"]}, {"team": ["c"]}]
+        assert state["next_page"] == 3
+        assert state["total_pages"] == 3
+        assert state["done"] is False
+
+        # Resuming re-fetches page 3 onto a clean line
+        resumed = crawl_stream("U15_m", FakeFetcher("U15_m", pages=3), RateBudget(1000), checkpoint)
+        assert resumed["complete"] is True
+        assert checkpoint.load("U15_m")["next_page"] == 4
+        assert checkpoint.load("U15_m")["done"] is True
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Test suite for the dashboard data layer
+"""
+
+import json
+import os
+import pandas as pd
+import pytest
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+# Add project root to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from src.registry.registry import UnifiedRegistry
+from src.utils import dashboard_data as data
+
+
+class TestDashboardData:
+    """Test cases for dashboard_data"""
+
+    def test_latest_file_and_signatures(self, tmp_path):
+        """Test newest-file lookup and that signatures change on rewrite"""
+        old = tmp_path / "identity_audit_1.csv"
+        new = tmp_path / "identity_audit_2.csv"
+        old.write_text("a\n1\n")
+        new.write_text("a\n2\n")
+        os.utime(old, (time.time() - 60, time.time() - 60))
+        (tmp_path / "other.csv").write_text("a\n3\n")
+
+        assert data.latest_file(tmp_path, "identity_audit_*.csv") == new
+        assert data.latest_file(tmp_path / "missing", "*.csv") is None
+
+        signature = data.file_signature(new)
+        new.write_text("a\n2\n3\n")
+        assert data.file_signature(new) != signature
+        assert data.file_signature(tmp_path / "missing.csv") is None
+
+    def test_read_table_limits_columns_and_rows(self, tmp_path):
+        """Test that only requested columns/rows are read from CSV and Parquet"""
+        df = pd.DataFrame({'team': list('abcdef'), 'rank': range(6), 'score': range(6)})
+        csv_path = tmp_path / "audit.csv"
+        parquet_path = tmp_path / "audit.parquet"
+        df.to_csv(csv_path, index=False)
+        df.to_parquet(parquet_path, index=False)
+
+        for path in (csv_path, parquet_path):
+            result = data.read_table(data.file_signature(path), columns=('team', 'rank', 'missing'), nrows=3)
+            assert result.columns.tolist() == ['team', 'rank']
+            assert result['team'].tolist() == ['a', 'b', 'c']
+
+        assert len(data.read_table(data.file_signature(parquet_path))) == 6
+
+    def test_registry_stats(self, tmp_path):
+        """Test in-process registry health statistics"""
+        registry = UnifiedRegistry(str(tmp_path / "registry"))
+        now = datetime.now(timezone.utc)
+        registry.build_registry_path.write_text(json.dumps({
+            "AZ_M_U10": {"latest_build": "build_1", "last_updated": now.isoformat()},
+            "CA_F_U11": {"latest_build": "build_0", "last_updated": (now - timedelta(days=45)).isoformat()},
+        }))
+
+        stats = data.registry_stats(registry)
+
+        assert stats["total_slices"] == 2
+        assert stats["stale_slices"] == ["CA_F_U11"]
+        assert stats["health_score"] == 50.0
+        assert data.slice_build_rows(registry)['Status'].tolist() == ["✅ Fresh", "🔴 Stale"]
+
+    def test_pipeline_job_streams_output(self):
+        """Test that a background job collects output and exit code"""
+        job = data.PipelineJob([sys.executable, "-c", "print('one'); print('two')"]).start()
+        deadline = time.time() + 30
+        while job.running and time.time() < deadline:
+            time.sleep(0.05)
+
+        assert not job.running
+        assert job.returncode == 0
+        assert job.output() == "one\ntwo"
+        assert job.output(tail=1) == "two"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Test suite for build-to-build delta tracking
+"""
+
+import pandas as pd
+import pytest
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from src.scraper.utils.delta_tracker import compare_builds
+
+RENAMED_COLUMNS = ['old_team_name', 'new_team_name', 'age_group', 'gender', 'state', 'similarity_score',
+                   'old_rank', 'new_rank', 'old_points', 'new_points']
+
+
+def build(rows):
+    """Master index frame from (team_name, age_group, gender, state, rank, points) tuples"""
+    return pd.DataFrame(rows, columns=['team_name', 'age_group', 'gender', 'state', 'rank', 'points'])
+
+
+class TestCompareBuilds:
+    """Test cases for compare_builds"""
+
+    def test_added_removed_and_renamed(self):
+        """Test a small old/new pair with one rename, one new team and one dropped team"""
+        old_df = build([
+            ('Phoenix Rising FC 2014B', 'U11', 'M', 'AZ', 1, 900.0),
+            ('RSL Arizona 2014 Boys', 'U11', 'M', 'AZ', 2, 850.0),
+            ('Tucson Soccer Academy', 'U11', 'M', 'AZ', 3, 700.0),
+        ])
+        new_df = build([
+            ('Phoenix Rising FC 2014B', 'U11', 'M', 'AZ', 1, 910.0),
+            ('RSL Arizona 2014 Boys Elite', 'U11', 'M', 'AZ', 2, 860.0),
+            ('Grand Canyon Cobras', 'U11', 'M', 'AZ', 4, 500.0),
+        ])
+
+        deltas = compare_builds(new_df, old_df)
+
+        assert sorted(deltas['added']['team_name']) == ['Grand Canyon Cobras', 'RSL Arizona 2014 Boys Elite']
+        assert sorted(deltas['removed']['team_name']) == ['RSL Arizona 2014 Boys', 'Tucson Soccer Academy']
+
+        renamed = deltas['renamed']
+        assert renamed.columns.tolist() == RENAMED_COLUMNS
+        assert len(renamed) == 1
+        rename = renamed.iloc[0]
+        assert (rename['old_team_name'], rename['new_team_name']) == ('RSL Arizona 2014 Boys',
+                                                                      'RSL Arizona 2014 Boys Elite')
+        assert (rename['old_rank'], rename['new_rank']) == (2, 2)
+        assert (rename['old_points'], rename['new_points']) == (850.0, 860.0)
+        # Unchanged teams are never reported as renames
+        assert 'Phoenix Rising FC 2014B' not in set(renamed['new_team_name'])
+
+    def test_renames_stay_within_block(self):
+        """Test that renames are only matched within the same age group, gender and state"""
+        old_df = build([
+            ('Real Colorado 2013G', 'U12', 'F', 'CO', 1, 800.0),
+            ('Real Colorado 2013B', 'U12', 'M', 'CO', 1, 800.0),
+        ])
+        new_df = build([
+            ('Real Colorado 2013 Girls', 'U12', 'F', 'CO', 1, 810.0),
+            ('Real Colorado 2013 Boys', 'U12', 'M', 'NM', 1, 810.0),
+        ])
+
+        renamed = compare_builds(new_df, old_df)['renamed']
+
+        assert renamed[['old_team_name', 'new_team_name', 'gender', 'state']].values.tolist() == [
+            ['Real Colorado 2013G', 'Real Colorado 2013 Girls', 'F', 'CO']
+        ]
+
+    def test_empty_inputs_return_documented_columns(self):
+        """Test that empty builds produce empty frames with the expected columns"""
+        empty = build([])
+        new_df = build([('Tucson Soccer Academy', 'U11', 'M', 'AZ', 3, 700.0)])
+
+        deltas = compare_builds(new_df, empty)
+        assert deltas['added']['team_name'].tolist() == ['Tucson Soccer Academy']
+        assert deltas['removed'].empty
+        assert deltas['renamed'].columns.tolist() == RENAMED_COLUMNS and deltas['renamed'].empty
+
+        deltas = compare_builds(empty, empty)
+        assert all(df.empty for df in deltas.values())
+        assert deltas['added'].columns.tolist() == empty.columns.tolist()
+        assert deltas['renamed'].columns.tolist() == RENAMED_COLUMNS
+
+        with pytest.raises(ValueError):
+            compare_builds(new_df.drop(columns=['state']), empty)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
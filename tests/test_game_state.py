@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Test suite for game history checkpoint journaling
+"""
+
+import json
+import pytest
+import sys
+from datetime import date
+from pathlib import Path
+
+# Add project root to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from src.scraper.utils.game_state import GameStateManager
+
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    """Run in a temporary directory (checkpoints live under data/game_history/state)"""
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+def complete_teams(manager, team_ids, checkpoint=None):
+    """Mark teams complete and journal each one, like the game scraper does"""
+    checkpoint = checkpoint or manager.update_build_id(manager.load_checkpoint('AZ', 'M', 'U10'), 'build_1')
+    for i, team_id in enumerate(team_ids):
+        checkpoint = manager.mark_team_complete(checkpoint, team_id, date(2025, 10, 1 + i), games_scraped=i)
+        manager.append_team_checkpoint('AZ', 'M', 'U10', checkpoint, team_id)
+    return checkpoint
+
+
+def journal_lines(manager):
+    path = manager._get_journal_path(manager._get_checkpoint_path('AZ', 'M', 'U10'))
+    return path.read_text().splitlines() if path.exists() else []
+
+
+class TestGameStateJournal:
+    """Test cases for append_team_checkpoint and journal replay"""
+
+    def test_replay_restores_completed_teams(self, workdir):
+        """Test that a fresh manager replays journaled teams on top of the snapshot"""
+        manager = GameStateManager('gotsport')
+        checkpoint = complete_teams(manager, ['t1', 't2', 't3', 't4'])
+
+        # First append writes the snapshot, the rest go to the journal
+        assert len(journal_lines(manager)) == 3
+
+        restored = GameStateManager('gotsport').load_checkpoint('AZ', 'M', 'U10')
+
+        assert restored['completed_teams'] == ['t1', 't2', 't3', 't4']
+        assert restored['per_team'] == checkpoint['per_team']
+        assert restored['per_team']['t3']['last_scraped_game_date'] == '2025-10-03'
+        assert restored['last_build_id'] == 'build_1'
+
+    def test_compaction_preserves_state(self, workdir):
+        """Test that compacting the journal into a snapshot keeps every team"""
+        manager = GameStateManager('gotsport', compact_every=3)
+        team_ids = [f"t{i}" for i in range(10)]
+        checkpoint = complete_teams(manager, team_ids)
+
+        assert len(journal_lines(manager)) < 3
+        snapshot = json.loads(manager._get_checkpoint_path('AZ', 'M', 'U10').read_text())
+        assert len(snapshot['completed_teams']) > 1
+
+        restored = GameStateManager('gotsport').load_checkpoint('AZ', 'M', 'U10')
+        assert restored['completed_teams'] == team_ids
+        assert restored['per_team'] == checkpoint['per_team']
+
+    def test_torn_final_line_is_ignored(self, workdir):
+        """Test that a line cut off by a crash is skipped and resuming continues cleanly"""
+        manager = GameStateManager('gotsport')
+        complete_teams(manager, ['t1', 't2', 't3'])
+        journal = manager._get_journal_path(manager._get_checkpoint_path('AZ', 'M', 'U10'))
+        with open(journal, 'a') as f:
+            f.write('{"team_id": "t4", "last_build_id": "build_1", "games_scr')
+
+        resumed_manager = GameStateManager('gotsport')
+        restored = resumed_manager.load_checkpoint('AZ', 'M', 'U10')
+        assert restored['completed_teams'] == ['t1', 't2', 't3']
+
+        complete_teams(resumed_manager, ['t4', 't5'], restored)
+        final = GameStateManager('gotsport').load_checkpoint('AZ', 'M', 'U10')
+        assert final['completed_teams'] == ['t1', 't2', 't3', 't4', 't5']
+
+    def test_entry_without_team_id_is_skipped(self, workdir, caplog):
+        """Test that a journal line without team_id is skipped instead of discarding the checkpoint"""
+        manager = GameStateManager('gotsport')
+        complete_teams(manager, ['t1', 't2'])
+        journal = manager._get_journal_path(manager._get_checkpoint_path('AZ', 'M', 'U10'))
+        with open(journal, 'a') as f:
+            f.write('{"last_build_id": "build_1", "games_scraped": 3}\n')
+            f.write('{"team_id": "t3", "games_scraped": 4}\n')
+
+        restored = GameStateManager('gotsport').load_checkpoint('AZ', 'M', 'U10')
+
+        assert restored['completed_teams'] == ['t1', 't2', 't3']
+        assert 'without team_id' in caplog.text
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Test suite for club extraction and the keyed club table
+"""
+
+import pandas as pd
+import pytest
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from src.scraper.utils.game_writers import CLUB_COLUMNS, extract_clubs_frame, load_club_table, upsert_clubs
+
+
+@pytest.fixture
+def games_df():
+    """Games whose club names differ only in case and spacing"""
+    return pd.DataFrame({
+        'club_name': ['FC  Elite', 'fc elite', ' FC Elite ', 'Phoenix Rising', None, ''],
+        'state': ['AZ', 'AZ', 'NV', 'AZ', 'AZ', 'AZ'],
+        'city': ['', 'Phoenix', 'Las Vegas', 'Scottsdale', 'Mesa', 'Tempe'],
+        'source_url': ['https://a', 'https://b', 'https://c', '', 'https://e', 'https://f']
+    })
+
+
+class TestClubTable:
+    """Test cases for extract_clubs_frame, upsert_clubs and load_club_table"""
+
+    def test_case_and_spacing_variants_are_one_club(self, games_df):
+        """Test that "FC  Elite" and "fc elite" in one state are a single club"""
+        clubs = extract_clubs_frame(games_df, 'gotsport')
+
+        assert clubs.columns.tolist() == CLUB_COLUMNS
+        assert clubs[['club_name', 'state']].values.tolist() == [
+            ['FC  Elite', 'AZ'], ['FC Elite', 'NV'], ['Phoenix Rising', 'AZ']
+        ]
+        elite_az = clubs.iloc[0]
+        assert elite_az['city'] == 'Phoenix'  # first non-empty value
+        assert elite_az['source_url'] == 'https://a'
+        assert set(clubs['provider']) == {'gotsport'}
+
+    def test_upsert_keeps_existing_identity_and_refreshes_last_seen(self, games_df):
+        """Test that known clubs keep first_seen_at/club_id while last_seen_at is refreshed"""
+        existing = pd.DataFrame([{
+            'provider': 'gotsport', 'club_id': 'club-17', 'club_name': 'FC Elite', 'state': 'AZ',
+            'city': 'Phoenix', 'website': 'https://fcelite.example', 'first_seen_at': '2025-01-01T00:00:00',
+            'last_seen_at': '2025-01-01T00:00:00', 'source_url': 'https://old'
+        }])
+        clubs = extract_clubs_frame(games_df, 'gotsport')
+
+        upserted = upsert_clubs(existing, clubs)
+
+        assert upserted.columns.tolist() == CLUB_COLUMNS
+        assert len(upserted) == 3
+        elite = upserted.iloc[0]
+        assert elite['club_name'] == 'FC Elite'
+        assert elite['club_id'] == 'club-17'
+        assert elite['website'] == 'https://fcelite.example'
+        assert elite['first_seen_at'] == '2025-01-01T00:00:00'
+        assert elite['last_seen_at'] == clubs.iloc[0]['last_seen_at'] != '2025-01-01T00:00:00'
+        assert upserted['club_name'].tolist()[1:] == ['FC Elite', 'Phoenix Rising']
+
+    def test_load_prefers_parquet_twin(self, tmp_path):
+        """Test that the Parquet twin is read when present, the CSV otherwise"""
+        club_file = tmp_path / "clubs_gotsport_AZ_M_U10.csv"
+        pd.DataFrame({'club_name': ['From CSV'], 'state': ['AZ']}).to_csv(club_file, index=False)
+
+        assert load_club_table(club_file)['club_name'].tolist() == ['From CSV']
+
+        pd.DataFrame({'club_name': ['From Parquet'], 'state': ['AZ']}).to_parquet(club_file.with_suffix('.parquet'))
+        assert load_club_table(club_file)['club_name'].tolist() == ['From Parquet']
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
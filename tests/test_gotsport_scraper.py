@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Test suite for GotSport rankings page fetching and columnar parsing
+"""
+
+import json
+import logging
+import pandas as pd
+import pytest
+import re
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from src.scraper.providers.gotsport_scraper import RANKINGS_COLUMNS, GotSportScraper, batches_to_frame
+from src.scraper.utils.crawl_scheduler import CrawlCheckpoint, crawl_streams
+
+logger = logging.getLogger("test_gotsport_scraper")
+
+
+def api_page(teams, **extra):
+    """JSON body of one rankings API page"""
+    return json.dumps({"team_ranking_data": teams, **extra})
+
+
+# Sample rankings API pages: a dict page and a bare-list page with awkward entries
+SAMPLE_PAGES = [
+    (12, "m", {"team_ranking_data": [
+        {"team_name": "  Phoenix Rising 2013B ", "team_id": 101, "points": "1,234 pts", "team_association": "AZ"},
+        {"team_name": "", "team_id": 102, "points": 900, "team_association": "AZ"},
+        "not a team",
+        {"team_name": "RSL Arizona 2013B", "team_id": "103", "score": 880, "team_association": " ZZ "},
+        {"team_name": "Tucson SA 2013B", "points": None},
+    ], "total_pages": 2}),
+    (13, "f", [
+        {"team_name": "Legends FC 2012G", "team_id": "201", "points": "77", "team_association": "CA"},
+        {"team_name": "Solar SC 2012G", "team_id": "202", "points": "n/a", "team_association": "TX"},
+    ]),
+    (14, "m", {"team_ranking_data": []}),
+]
+
+def legacy_parse_api_response(data, age, gender, url):
+    """The previous dict-per-team API parser, kept as the reference"""
+    team_data = data.get('team_ranking_data') if isinstance(data, dict) else data
+    teams = []
+    for i, team in enumerate(team_data or []):
+        try:
+            numbers = re.findall(r'\d+', str(team.get('points', team.get('score', 0))))
+            team_info = {
+                "rank": i + 1,
+                "team_name": str(team.get('team_name', '')).strip(),
+                "team_id": str(team.get('team_id', '')).strip(),
+                "points": int(numbers[0]) if numbers else 0,
+                "state": str(team.get('team_association', '')).strip(),
+                "age_group": f"U{age}",
+                "gender": "Male" if gender == "m" else "Female",
+                "source": "GotSport Rankings",
+                "url": url
+            }
+        except Exception:
+            continue
+        if team_info["team_name"]:
+            teams.append(team_info)
+    return teams
+
+
+def legacy_parse_data(raw_data, valid_states):
+    """The previous dict-per-team parse_data, kept as the reference"""
+    parsed = []
+    for team in raw_data:
+        if not team.get("team_name"):
+            continue
+        state = team.get("state", "")
+        if state and state not in valid_states:
+            state = ""
+        parsed.append({
+            "team_name": team["team_name"].strip(),
+            "age_group": team.get("age_group", "Unknown"),
+            "gender": team.get("gender", "Unknown"),
+            "source": team.get("source", "GotSport Rankings"),
+            "points": team.get("points", 0),
+            "state": state,
+            "rank": team.get("rank", 0),
+            "url": team.get("url", "")
+        })
+    return parsed
+
+
+@pytest.fixture
+def scraper(monkeypatch):
+    """Scraper whose HTTP layer serves canned pages keyed by page number"""
+    scraper = GotSportScraper(logger, use_zenrows=False)
+    scraper.pages = {}
+    scraper.requested = []
+
+    def fake_fetch(url, js_render=True, **kwargs):
+        page = int(url.rsplit("search[page]=", 1)[1])
+        scraper.requested.append(page)
+        return scraper.pages.get(page, "")
+
+    monkeypatch.setattr(scraper, "fetch_url", fake_fetch)
+    monkeypatch.setattr("src.scraper.providers.gotsport_scraper.time.sleep", lambda seconds: None)
+    return scraper
+
+
+class TestFetchRankingsPage:
+    """Test cases for GotSportScraper._fetch_rankings_page"""
+
+    def test_short_empty_page_is_an_empty_batch(self, scraper):
+        """Test that a valid empty last page is decoded once, not retried as a failure"""
+        scraper.pages[3] = '{"teams":[]}'
+
+        batch, total_pages = scraper._fetch_rankings_page(12, "m", 3)
+
+        assert batch is not None and batch["team_name"] == []
+        assert total_pages is None
+        assert scraper.requested == [3]
+
+    def test_fetch_and_decode_errors_return_none(self, scraper):
+        """Test that only blank or undecodable replies are reported as failed pages"""
+        scraper.pages[1] = "   "
+        scraper.pages[2] = "<html>busy</html>"
+
+        assert scraper._fetch_rankings_page(12, "m", 1) == (None, None)
+        assert scraper.requested == [1, 1, 1]  # retried with backoff
+        assert scraper._fetch_rankings_page(12, "m", 2) == (None, None)
+
+    def test_stream_without_page_count_completes_and_clears_checkpoint(self, scraper, tmp_path):
+        """Test that an empty page ends the stream as complete so the journal can be cleared"""
+        scraper.pages[1] = api_page([{"team_name": "Phoenix Rising 2013B", "team_association": "AZ"}])
+        scraper.pages[2] = api_page([])
+        checkpoint = CrawlCheckpoint(tmp_path / "crawl_state", logger=logger)
+
+        results = crawl_streams({"U12_m": lambda page: scraper._fetch_rankings_page(12, "m", page)},
+                                max_workers=1, max_per_second=1000, checkpoint=checkpoint, logger=logger)
+
+        assert results["U12_m"]["complete"] is True
+        assert results["U12_m"]["error"] is None
+        assert results["U12_m"]["rows"] == 1
+        assert scraper.requested == [1, 2]
+
+
+
+class TestColumnarParsing:
+    """Test cases for _parse_api_columns, batches_to_frame and parse_data against the legacy parser"""
+
+    @pytest.fixture
+    def parsed(self, scraper):
+        """Columnar batches and legacy team dicts for SAMPLE_PAGES"""
+        batches, legacy = [], []
+        for age, gender, data in SAMPLE_PAGES:
+            url = f"https://api.example.com/rankings?age={age}&gender={gender}"
+            batches.append(scraper._parse_api_columns(data, age, gender, url))
+            legacy.extend(legacy_parse_api_response(data, age, gender, url))
+        return batches, legacy
+
+    def test_parse_api_columns(self, parsed):
+        """Test that each batch holds the legacy parser's values column by column"""
+        batches, legacy = parsed
+
+        assert batches[0]["team_name"] == ["Phoenix Rising 2013B", "RSL Arizona 2013B", "Tucson SA 2013B"]
+        assert batches[0]["rank"] == [1, 4, 5]
+        assert batches[0]["team_id"] == ["101", "103", ""]
+        assert batches[0]["points"] == ["1,234 pts", "880", "None"]  # raw text until batches_to_frame
+        assert batches[1]["gender"] == ["Female", "Female"]
+        assert all(column == [] for column in batches[2].values())
+        assert sum(len(batch["team_name"]) for batch in batches) == len(legacy)
+
+    def test_batches_to_frame_matches_legacy_rows(self, parsed):
+        """Test that the assembled table equals a DataFrame of the legacy team dicts"""
+        batches, legacy = parsed
+
+        frame = batches_to_frame(batches)
+        expected = pd.DataFrame(legacy)[RANKINGS_COLUMNS]
+
+        pd.testing.assert_frame_equal(frame, expected)
+        assert frame["points"].tolist() == [1, 880, 0, 77, 0]
+        assert list(batches_to_frame([batches[2]]).columns) == RANKINGS_COLUMNS
+
+    def test_parse_data_frame_path_matches_legacy(self, scraper, parsed):
+        """Test that parse_data on the DataFrame gives the legacy parse_data rows"""
+        batches, legacy = parsed
+
+        result = scraper.parse_data(batches_to_frame(batches))
+        expected = pd.DataFrame(legacy_parse_data(legacy, scraper.valid_states))
+
+        pd.testing.assert_frame_equal(result, expected[list(result.columns)])
+        assert result["state"].tolist() == ["AZ", "", "", "CA", "TX"]
+        pd.testing.assert_frame_equal(scraper.parse_data(legacy), result)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
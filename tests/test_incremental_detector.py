@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Test suite for hashed incremental detection and the baseline key index
+"""
+
+import logging
+import numpy as np
+import os
+import pandas as pd
+import pytest
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from src.scraper.utils import incremental_detector
+from src.scraper.utils.incremental_detector import (
+    _in_baseline,
+    baseline_index_path,
+    detect_new_teams,
+    detect_new_teams_by_provider,
+    hash_team_keys,
+    load_baseline_index,
+    write_baseline_index
+)
+
+logger = logging.getLogger("test_incremental_detector")
+
+
+def master_frame(rows):
+    """Master rows from (team_id, team_name, age_group, gender, state, provider) tuples"""
+    return pd.DataFrame(rows, columns=['team_id', 'team_name', 'age_group', 'gender', 'state', 'provider'])
+
+
+@pytest.fixture
+def baseline_df():
+    return master_frame([
+        ('g1', 'Phoenix Rising 2014B', 'U11', 'M', 'AZ', 'gotsport'),
+        ('g2', 'RSL Arizona 2014B', 'U11', 'M', 'AZ', 'gotsport'),
+        ('g3', 'Tucson SA 2013G', 'U12', 'F', None, 'gotsport'),
+    ])
+
+
+class TestBaselineKeyIndex:
+    """Test cases for the .keys.npy baseline index"""
+
+    def test_index_round_trip_and_membership(self, baseline_df, tmp_path, monkeypatch):
+        """Test write/load of the memory-mapped index and searchsorted membership"""
+        master_path = tmp_path / "master_team_index_USAonly_20251014_1200.csv"
+        baseline_df.to_csv(master_path, index=False)
+        monkeypatch.setattr(incremental_detector, "find_baseline_master_path", lambda data_dir, log: master_path)
+
+        index_path = write_baseline_index(baseline_df, master_path, logger)
+        os.utime(index_path, (master_path.stat().st_mtime + 1,) * 2)
+        keys = load_baseline_index(str(tmp_path), logger)
+
+        assert index_path == baseline_index_path(master_path)
+        assert index_path.name == "master_team_index_USAonly_20251014_1200.keys.npy"
+        assert isinstance(keys, np.memmap)
+        assert len(keys) == 3 and np.all(np.diff(keys.astype(np.uint64)) > 0)
+        assert _in_baseline(hash_team_keys(baseline_df), keys).all()
+
+        new_df = pd.concat([baseline_df, master_frame([('g4', 'Grand Canyon 2014B', 'U11', 'M', 'AZ', 'gotsport')])])
+        assert _in_baseline(hash_team_keys(new_df), keys).tolist() == [True, True, True, False]
+        assert detect_new_teams(new_df, keys)['team_name'].tolist() == ['Grand Canyon 2014B']
+        assert not _in_baseline(hash_team_keys(new_df), np.empty(0, dtype=np.uint64)).any()
+
+    def test_missing_index_is_built_from_the_csv(self, baseline_df, tmp_path, monkeypatch):
+        """Test that masters without an index get one built from their CSV on first load"""
+        master_path = tmp_path / "master_team_index_USAonly_20251014_1200.csv"
+        baseline_df.to_csv(master_path, index=False)
+        monkeypatch.setattr(incremental_detector, "find_baseline_master_path", lambda data_dir, log: master_path)
+        assert not baseline_index_path(master_path).exists()
+
+        keys = load_baseline_index(str(tmp_path), logger)
+
+        assert baseline_index_path(master_path).exists()
+        # Missing states from the CSV round trip hash like in-memory None
+        assert _in_baseline(hash_team_keys(baseline_df), keys).all()
+        np.testing.assert_array_equal(keys, np.unique(hash_team_keys(baseline_df)))
+
+
+class TestHashedAntiJoin:
+    """Test cases for hash_team_keys and the hashed provider anti-join"""
+
+    def test_hash_team_keys(self, baseline_df):
+        """Test that equal keys hash equally and missing values match their CSV form"""
+        hashes = hash_team_keys(baseline_df)
+        assert hashes.dtype == np.uint64 and len(hashes) == 3
+        assert len(set(hashes.tolist())) == 3
+
+        round_trip = baseline_df.copy()
+        round_trip.loc[2, 'state'] = np.nan
+        np.testing.assert_array_equal(hash_team_keys(round_trip), hashes)
+        assert hash_team_keys(baseline_df.iloc[0:0]).dtype == np.uint64
+
+    def test_provider_counts_new_removed_and_renamed(self):
+        """Test added/removed/renamed counts on a small old/new master pair"""
+        old = master_frame([
+            ('g1', 'Phoenix Rising 2014B', 'U11', 'M', 'AZ', 'gotsport'),
+            ('g2', 'RSL Arizona 2014B', 'U11', 'M', 'AZ', 'gotsport'),
+            ('g3', 'Tucson SA 2013G', 'U12', 'F', 'AZ', 'gotsport'),
+            ('g4', 'Grand Canyon 2014B', 'U11', 'M', 'AZ', 'gotsport'),
+            ('m1', 'Legends FC 2012B', 'U13', 'M', 'CA', 'modular11'),
+            ('a1', 'Solar SC 2012G', 'U13', 'F', 'TX', 'athleteone'),
+        ])
+        new = master_frame([
+            ('g1', 'Phoenix Rising 2014B', 'U11', 'M', 'AZ', 'gotsport'),
+            ('g2', 'RSL Arizona 2014B', 'U11', 'M', 'AZ', 'gotsport'),
+            ('g3', 'FC Tucson 2013G', 'U12', 'F', 'AZ', 'gotsport'),  # renamed
+            ('g5', 'SC Del Sol 2014B', 'U11', 'M', 'AZ', 'gotsport'),
+            ('g6', 'Arizona Arsenal 2014B', 'U11', 'M', 'AZ', 'gotsport'),
+            ('m1', 'Legends FC 2012B', 'U13', 'M', 'CA', 'modular11'),
+            ('m2', 'Grand Canyon 2014B', 'U11', 'M', 'AZ', 'modular11'),  # same key, other provider
+        ])
+
+        deltas = detect_new_teams_by_provider(new, old, logger)
+
+        assert deltas == {
+            'gotsport': {'added': 2, 'removed': 1, 'renamed': 1},
+            'modular11': {'added': 1, 'removed': 0, 'renamed': 0}
+        }
+        # The provider-agnostic anti-join matches on the comparison key alone
+        assert detect_new_teams(new, old)['team_id'].tolist() == ['g3', 'g5', 'g6']
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
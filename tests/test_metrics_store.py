@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Test suite for the columnar metrics store
+"""
+
+import json
+import pytest
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from src.utils import metrics_store
+from src.utils.metrics_store import MetricsStore
+from src.utils.state_summary_builder import compare_state_coverage
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    """Metrics store over a temporary snapshot directory, installed as the global store"""
+    metrics_dir = tmp_path / "metrics"
+    metrics_dir.mkdir()
+    store = MetricsStore(metrics_dir / "metrics_store.sqlite", metrics_dir)
+    monkeypatch.setattr(metrics_store, "_store_instance", store)
+    return store
+
+
+def write_snapshot(store, build_id, **metrics):
+    """Write a JSON snapshot the way write_metrics_snapshot lays it out"""
+    path = store.metrics_dir / f"build_{build_id}.json"
+    path.write_text(json.dumps(dict(metrics, build_id=build_id)))
+    return path
+
+
+class TestMetricsStore:
+    """Test cases for MetricsStore"""
+
+    def test_sync_round_trips_snapshots(self, store):
+        """Test that synced rows rebuild the JSON snapshot dictionaries"""
+        write_snapshot(store, "20251014_1200", team_count=100, providers=["gotsport"],
+                       build_duration_seconds=12, age_distribution={"U10": 4})
+
+        assert store.sync_snapshots() == 1
+        assert store.sync_snapshots() == 0  # unchanged files are not re-read
+        assert store.get_build("20251014_1200") == {
+            "build_id": "20251014_1200", "team_count": 100, "providers": ["gotsport"],
+            "build_duration_seconds": 12, "age_distribution": {"U10": 4}
+        }
+
+    def test_sync_follows_file_changes(self, store):
+        """Test that modified and deleted snapshots are reflected in the store"""
+        path = write_snapshot(store, "a", team_count=1)
+        write_snapshot(store, "b", team_count=2)
+        store.sync_snapshots()
+
+        write_snapshot(store, "a", team_count=10)
+        store.record_build({"build_id": "c", "team_count": 3})
+        path.unlink()
+        store.sync_snapshots()
+
+        trend = store.trend(["team_count"])
+        assert trend.columns.tolist() == ["build_id", "timestamp", "team_count"]
+        assert trend["build_id"].tolist() == ["b", "c"]
+        assert trend["team_count"].tolist() == [2, 3]
+
+    def test_compare_state_coverage(self, store):
+        """Test per-state comparison between two stored builds"""
+        store.record_state_coverage("b1", {
+            "CA": {"teams": 5, "providers": ["gotsport"]},
+            "TX": {"teams": 3, "providers": ["gotsport"]}
+        }, "2025-10-13T12:00:00")
+        store.record_state_coverage("b2", {
+            "CA": {"teams": 7, "providers": ["gotsport", "ayso"]},
+            "NY": {"teams": 2, "providers": ["gotsport"]}
+        }, "2025-10-14T12:00:00")
+
+        comparison = compare_state_coverage("b1", "b2")
+
+        assert comparison["states_added"] == ["NY"]
+        assert comparison["states_removed"] == ["TX"]
+        assert comparison["team_count_change"] == 1
+        assert comparison["states"]["CA"]["team_change"] == 2
+        assert comparison["states"]["CA"]["providers_added"] == ["ayso"]
+        assert store.state_history("ca")["teams"].tolist() == [5, 7]
+
+        with pytest.raises(ValueError):
+            compare_state_coverage("b1", "missing")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
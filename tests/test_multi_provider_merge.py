@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Test suite for multi-provider conflict resolution
+"""
+
+import logging
+import pandas as pd
+import pytest
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from src.utils.multi_provider_merge import (
+    FIELD_WEIGHTS,
+    calculate_completeness_scores,
+    calculate_data_completeness_score,
+    resolve_merge_conflicts
+)
+
+logger = logging.getLogger("test_multi_provider_merge")
+
+
+def team_row(row, team_id, provider, **overrides):
+    """Fully populated team record with selected fields overridden"""
+    record = {
+        'row': row,
+        'team_name': f"Team {team_id}",
+        'team_id': team_id,
+        'provider_team_id': f"{provider}-{team_id}",
+        'age_group': 'U12',
+        'age_u': 12,
+        'gender': 'M',
+        'state': 'AZ',
+        'club_name': 'Club',
+        'source_url': f"https://{provider.lower()}.example.com/{team_id}",
+        'provider': provider,
+    }
+    record.update(overrides)
+    return record
+
+
+@pytest.fixture
+def conflicting_rows():
+    return pd.DataFrame([
+        # t1: the less preferred provider is more complete and wins
+        team_row('t1-gotsport', 't1', 'GotSport', club_name=None, source_url=''),
+        team_row('t1-modular11', 't1', 'Modular11'),
+        # t2: equally complete, provider preference breaks the tie
+        team_row('t2-athleteone', 't2', 'AthleteOne'),
+        team_row('t2-gotsport', 't2', 'GotSport'),
+        # t3: a missing state (0.10) costs more than a missing club (0.05)
+        team_row('t3-modular11', 't3', 'Modular11', state='  '),
+        team_row('t3-athleteone', 't3', 'AthleteOne', club_name=None),
+        # t4: full tie within one provider keeps the first row
+        team_row('t4-first', 't4', 'Modular11'),
+        team_row('t4-second', 't4', 'Modular11'),
+        # t0: single record from an unknown provider; rows without team_id are dropped
+        team_row('t0-other', 't0', 'Other'),
+        team_row('no-id', None, 'GotSport'),
+    ])
+
+
+class TestCompletenessScores:
+    """Test cases for calculate_completeness_scores"""
+
+    def test_matches_row_wise_score(self, conflicting_rows):
+        """Test that the vectorized scores equal the per-row scoring"""
+        scores = calculate_completeness_scores(conflicting_rows)
+        expected = conflicting_rows.apply(calculate_data_completeness_score, axis=1)
+
+        pd.testing.assert_series_equal(scores, expected, check_names=False)
+        total = sum(FIELD_WEIGHTS.values())
+        missing_club_and_url = (total - FIELD_WEIGHTS['club_name'] - FIELD_WEIGHTS['source_url']) / total
+        assert scores.tolist()[:6] == pytest.approx([
+            missing_club_and_url, 1.0, 1.0, 1.0,
+            (total - FIELD_WEIGHTS['state']) / total,
+            (total - FIELD_WEIGHTS['club_name']) / total,
+        ])
+
+    def test_weights_normalize_over_present_columns(self):
+        """Test that only the fields present in the frame count towards the weight"""
+        df = pd.DataFrame({'team_name': ['A', None], 'state': ['', 'AZ']}, index=[5, 7])
+        total = FIELD_WEIGHTS['team_name'] + FIELD_WEIGHTS['state']
+
+        scores = calculate_completeness_scores(df)
+
+        assert scores.index.tolist() == [5, 7]
+        assert scores.tolist() == pytest.approx([FIELD_WEIGHTS['team_name'] / total,
+                                                 FIELD_WEIGHTS['state'] / total])
+
+
+class TestResolveMergeConflicts:
+    """Test cases for resolve_merge_conflicts"""
+
+    def test_winner_follows_weights_then_preference(self, conflicting_rows):
+        """Test that completeness wins first, then PROVIDER_PREFERENCE, then original order"""
+        resolved = resolve_merge_conflicts(conflicting_rows, logger)
+
+        assert resolved['team_id'].tolist() == ['t0', 't1', 't2', 't3', 't4']
+        assert resolved['row'].tolist() == ['t0-other', 't1-modular11', 't2-gotsport',
+                                            't3-athleteone', 't4-first']
+
+    def test_providers_column_lists_every_reporter(self, conflicting_rows):
+        """Test that each team lists the sorted, unique providers that reported it"""
+        resolved = resolve_merge_conflicts(conflicting_rows, logger).set_index('team_id')
+
+        assert resolved['providers'].to_dict() == {
+            't0': ['Other'],
+            't1': ['GotSport', 'Modular11'],
+            't2': ['AthleteOne', 'GotSport'],
+            't3': ['AthleteOne', 'Modular11'],
+            't4': ['Modular11'],
+        }
+
+    def test_without_conflicts(self, conflicting_rows):
+        """Test that unique teams pass through with a single-provider list"""
+        unique = conflicting_rows[conflicting_rows['row'].isin(['t1-gotsport', 't2-athleteone'])]
+
+        resolved = resolve_merge_conflicts(unique, logger)
+
+        assert resolved['row'].tolist() == ['t1-gotsport', 't2-athleteone']
+        assert resolved['providers'].tolist() == [['GotSport'], ['AthleteOne']]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
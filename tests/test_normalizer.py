@@ -3,6 +3,7 @@
 Test suite for text normalizer
 """
 
+import pandas as pd
 import pytest
 import sys
 from pathlib import Path
@@ -14,7 +15,11 @@ from src.normalizers.text_normalizer import (
     normalize_name,
     normalize_name_with_year,
     similarity_score,
-    is_likely_same_team
+    is_likely_same_team,
+    normalize_names,
+    token_id_sets,
+    jaccard_scores,
+    similarity_scores
 )
 
 
@@ -225,6 +230,40 @@ class TestTextNormalizer:
         # Very short names
         score3 = similarity_score("FC", "SC")
         assert score3 < 0.5
+    
+    def test_normalize_names_matches_scalar(self):
+        """Test that batch normalization equals normalize_name per element"""
+        names = pd.Series(["Phoenix Rising 2010 Boys", "RSL-AZ (North)", None, "",
+                           "Phoenix Rising 2010 Boys", 42, "  Real\tMadrid\nCF  ", "FC United"],
+                          index=list("abcdefgh"), name="team_name")
+        
+        result = normalize_names(names)
+        
+        assert result.tolist() == [normalize_name(name) for name in names]
+        assert result.index.tolist() == list("abcdefgh")
+        assert result.name == "team_name"
+        assert normalize_names(["Real Madrid CF"]).tolist() == ["real madrid cf"]
+    
+    def test_token_id_sets_share_vocabulary(self):
+        """Test that token ids agree across calls sharing a vocabulary"""
+        vocabulary = {}
+        left = token_id_sets(["Real Madrid", "FC"], vocabulary)
+        right = token_id_sets(["Madrid Real Club", "Madrid"], vocabulary)
+        
+        assert left[0] == right[0] == {vocabulary["real"], vocabulary["madrid"]}
+        assert left[1] == frozenset()
+        assert jaccard_scores(left, right).tolist() == [1.0, 0.0]
+        with pytest.raises(ValueError):
+            jaccard_scores(left, right[:1])
+    
+    def test_similarity_scores_matches_scalar(self):
+        """Test that batch similarity equals similarity_score per pair"""
+        names1 = ["Real Madrid CF", "Phoenix Rising", "", "Chelsea FC", None]
+        names2 = ["Madrid Real", "Rising Phoenix North", "Chelsea", "Chelsea Football Club", "Chelsea"]
+        
+        expected = [similarity_score(a, b) for a, b in zip(names1, names2)]
+        
+        assert similarity_scores(names1, names2).tolist() == expected
 
 
 if __name__ == "__main__":
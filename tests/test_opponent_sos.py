@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Test suite for the vectorized opponent SOS helpers
+"""
+
+import pandas as pd
+import pytest
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from src.analytics.sos_iterative import build_alias_strength_map, canonize_ids, compute_opponent_sos
+
+BASELINE = 0.35
+
+
+@pytest.fixture
+def team_strength():
+    return pd.Series({'101': 0.8, '102': 0.6, '103': 0.4, '104': 0.2})
+
+
+@pytest.fixture
+def alias_map():
+    """901 is an alias of 102; 902 is an alias of 101; 903 points at an unranked team"""
+    return {'901': '102', '902': '101', '903': 'zzz'}
+
+
+@pytest.fixture
+def schedule():
+    """Canonical team IDs and their raw opponent lists"""
+    team_ids = pd.Series(['101', '102', '103', '104'], dtype=object)
+    opponents = pd.Series([
+        # 102 four times (raw, float-coerced, alias), 902 is 101 itself, 999 unknown, None dropped
+        ['102', '102.0', '102', '901', '103', '902', '999', None, ' 104 '],
+        [],
+        [101.0, '901'],
+        None,
+    ], dtype=object)
+    return team_ids, opponents
+
+
+class TestCanonizeIds:
+    """Test cases for canonize_ids"""
+
+    def test_canonize_ids(self):
+        """Test ID canonicalization strips whitespace and float suffixes"""
+        ids = pd.Series([' 123 ', 456.0, None, 'abc'], dtype=object)
+        result = canonize_ids(ids)
+
+        assert result.tolist()[:2] == ['123', '456']
+        assert result.iloc[2] is None
+        assert result.iloc[3] == 'abc'
+
+
+class TestAliasStrengthMap:
+    """Test cases for build_alias_strength_map"""
+
+    def test_aliases_inherit_canonical_strength(self, team_strength, alias_map):
+        """Test that every alias of a ranked team gets its strength and others are dropped"""
+        strength_map = build_alias_strength_map(team_strength, alias_map)
+
+        assert strength_map.to_dict() == {'101': 0.8, '102': 0.6, '103': 0.4, '104': 0.2,
+                                          '901': 0.6, '902': 0.8}
+
+    def test_empty_alias_map_returns_input(self, team_strength):
+        """Test that no aliases leaves the lookup unchanged"""
+        assert build_alias_strength_map(team_strength, {}) is team_strength
+
+
+class TestComputeOpponentSOS:
+    """Test cases for compute_opponent_sos"""
+
+    def test_hand_computed_components(self, schedule, team_strength, alias_map):
+        """Test sos_component and opponent counts against hand-computed values"""
+        team_ids, opponents = schedule
+
+        result = compute_opponent_sos(team_ids, opponents, team_strength, alias_map=alias_map,
+                                      baseline=BASELINE)
+
+        # 101: unique resolved opponents 102, 103, 999 (unknown), 104; 902 -> 101 is a self-loop
+        # 103: 101.0 -> 101 and 901 -> 102
+        assert result['sos_component'].tolist() == pytest.approx([
+            (0.6 + 0.4 + BASELINE + 0.2) / 4,
+            BASELINE,
+            (0.8 + 0.6) / 2,
+            BASELINE,
+        ])
+        assert result['opp_count'].tolist() == [9, 0, 2, 0]
+        assert result['unique_opps'].tolist() == [4, 0, 2, 0]
+        assert result['missing_opps'].tolist() == [1, 0, 0, 0]
+
+    def test_without_aliases_alias_ids_are_unknown(self, schedule, team_strength):
+        """Test that unresolved alias IDs count as distinct missing opponents"""
+        team_ids, opponents = schedule
+
+        result = compute_opponent_sos(team_ids, opponents, team_strength, baseline=BASELINE)
+
+        # 101: 102, 901, 103, 902, 999, 104 with 901/902/999 unknown
+        assert result.loc[0, 'unique_opps'] == 6 and result.loc[0, 'missing_opps'] == 3
+        assert result.loc[0, 'sos_component'] == pytest.approx((0.6 + 0.4 + 0.2 + 3 * BASELINE) / 6)
+        assert result.loc[2, 'sos_component'] == pytest.approx((0.8 + BASELINE) / 2)
+
+    def test_repeat_cap(self, schedule, team_strength, alias_map):
+        """Test that repeats never weigh more than once and a zero cap drops every opponent"""
+        team_ids, opponents = schedule
+        default = compute_opponent_sos(team_ids, opponents, team_strength, alias_map=alias_map)
+
+        for cap in (1, 5):
+            capped = compute_opponent_sos(team_ids, opponents, team_strength, alias_map=alias_map,
+                                          repeat_cap=cap)
+            pd.testing.assert_frame_equal(capped, default)
+
+        none_counted = compute_opponent_sos(team_ids, opponents, team_strength, alias_map=alias_map,
+                                            baseline=BASELINE, repeat_cap=0)
+        assert none_counted['sos_component'].tolist() == [BASELINE] * 4
+        assert none_counted['unique_opps'].tolist() == [0] * 4
+        assert none_counted['opp_count'].tolist() == [9, 0, 2, 0]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
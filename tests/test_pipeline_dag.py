@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+"""
+Test suite for the in-process pipeline DAG runner
+"""
+
+import os
+import pandas as pd
+import pytest
+import sys
+import yaml
+from pathlib import Path
+
+# Add project root and scripts to path
+sys.path.append(str(Path(__file__).parent.parent))
+sys.path.append(str(Path(__file__).parent.parent / "scripts"))
+
+from src.registry.registry import UnifiedRegistry
+from src.utils.pipeline_dag import PipelineDAG, Stage, StageFailure, file_digests
+import pipeline_runner
+from pipeline_runner import build_pipeline, state_games
+
+
+def produce(value):
+    return value
+
+
+def count_rows(state, games):
+    """Shard function (module level so the process pool can pickle it)"""
+    return {'state': state, 'rows': len(games), 'pid': os.getpid()}
+
+
+def fail_on_ca(state, games):
+    if state == 'CA':
+        raise RuntimeError("bad shard")
+    return len(games)
+
+
+def games_frame():
+    return pd.DataFrame({'state': ['AZ', 'CA', 'AZ', 'NV'], 'game_id': [1, 2, 3, 4]})
+
+
+class TestPipelineDAG:
+    """Test cases for PipelineDAG ordering and execution"""
+
+    def test_order_validates_dependencies(self):
+        """Test missing producers and cycles, and registration order for independent stages"""
+        dag = PipelineDAG()
+        dag.add(Stage('Consumer', produce, inputs=['missing']))
+        with pytest.raises(ValueError, match="no stage produces"):
+            dag.order()
+
+        dag = PipelineDAG()
+        dag.add(Stage('A', produce, inputs=['b'], outputs=['a']))
+        dag.add(Stage('B', produce, inputs=['a'], outputs=['b']))
+        with pytest.raises(ValueError):
+            dag.order()
+
+        dag = PipelineDAG()
+        dag.add(Stage('Third', produce, inputs=['first'], params={'value': 3}))
+        dag.add(Stage('Second', produce, params={'value': 2}))
+        dag.add(Stage('First', produce, outputs=['first'], params={'value': 1}))
+        dag.add(Stage('Fourth', produce, params={'value': 4}))
+        assert [stage.name for stage in dag.order()] == ['Second', 'First', 'Fourth', 'Third']
+
+        with pytest.raises(ValueError, match="Duplicate"):
+            dag.add(Stage('First', produce))
+
+    def test_failing_stage_stops_pipeline(self):
+        """Test that a failing stage raises StageFailure and downstream stages do not run"""
+        ran = []
+        dag = PipelineDAG()
+        dag.add(Stage('Broken', lambda: 1 / 0, outputs=['x']))
+        dag.add(Stage('Downstream', lambda x: ran.append(x), inputs=['x']))
+
+        with pytest.raises(StageFailure) as excinfo:
+            dag.run()
+
+        assert excinfo.value.stage == 'Broken' and excinfo.value.shard is None
+        assert isinstance(excinfo.value.error, ZeroDivisionError)
+        assert ran == []
+        assert [(t['stage'], t['status']) for t in dag.timings] == [('Broken', 'failed')]
+
+    @pytest.mark.parametrize("parallel", [False, True])
+    def test_failing_shard_stops_pipeline(self, parallel):
+        """Test that a failing shard raises StageFailure naming the shard"""
+        ran = []
+        dag = PipelineDAG(max_workers=2)
+        dag.add(Stage('Games', produce, outputs=['normalized_games'], params={'value': games_frame()}))
+        dag.add(Stage('Ranking', fail_on_ca, inputs=['normalized_games'], outputs=['ranks'],
+                      shards=['AZ', 'CA'], parallel=parallel, split=state_games))
+        dag.add(Stage('Report', lambda ranks: ran.append(ranks), inputs=['ranks']))
+
+        with pytest.raises(StageFailure) as excinfo:
+            dag.run()
+
+        assert excinfo.value.stage == 'Ranking' and excinfo.value.shard == 'CA'
+        assert ran == []
+        assert 'ranks' not in dag.artifacts
+
+    @pytest.mark.parametrize("parallel", [False, True])
+    def test_split_and_finalize_run_once_per_shard_in_parent(self, parallel):
+        """Test that split/finalize run in this process once per shard, with shard order kept"""
+        calls = []
+
+        def split(shard, inputs):
+            calls.append(('split', shard, os.getpid()))
+            return state_games(shard, inputs)
+
+        def finalize(shard, result):
+            calls.append(('finalize', shard, os.getpid()))
+            return result['rows']
+
+        dag = PipelineDAG(max_workers=3)
+        dag.add(Stage('Games', produce, outputs=['normalized_games'], params={'value': games_frame()}))
+        dag.add(Stage('Ranking', count_rows, inputs=['normalized_games'], outputs=['ranks'],
+                      shards=['NV', 'AZ', 'CA'], parallel=parallel, split=split, finalize=finalize))
+
+        artifacts = dag.run()
+
+        assert artifacts['ranks'] == {'NV': 1, 'AZ': 2, 'CA': 1}
+        assert list(artifacts['ranks']) == ['NV', 'AZ', 'CA']
+        assert sorted((kind, shard) for kind, shard, _ in calls) == sorted(
+            [(kind, shard) for kind in ('split', 'finalize') for shard in ('NV', 'AZ', 'CA')]
+        )
+        assert {pid for _, _, pid in calls} == {os.getpid()}
+
+    def test_state_games_hands_each_shard_its_own_rows(self):
+        """Test that each ranking shard only receives its state's games"""
+        inputs = {'normalized_games': games_frame()}
+
+        az = state_games('AZ', inputs)['games']
+        assert az['game_id'].tolist() == [1, 3]
+        assert set(az['state']) == {'AZ'}
+        assert state_games('TX', inputs)['games'].empty
+
+
+class TestWeeklyPipeline:
+    """Test cases for build_pipeline and per-state ranking outputs"""
+
+    @pytest.fixture
+    def pipeline_for(self, tmp_path, monkeypatch):
+        """Build the weekly pipeline with a given ranking config and a temporary registry"""
+        from src.registry import registry
+
+        def build(**config):
+            config_path = tmp_path / "ranking_config.yaml"
+            config_path.write_text(yaml.safe_dump(config))
+            monkeypatch.setattr(pipeline_runner, "RANKING_CONFIG", str(config_path))
+            monkeypatch.setattr(registry, "get_registry", lambda: UnifiedRegistry(str(tmp_path / "registry")))
+            return build_pipeline(['AZ', 'NV'], ['M'], ['U11'], refresh=False, with_tuner=False)
+        return build
+
+    def test_state_games_handed_over_only_outside_national_mode(self, pipeline_for):
+        """Test that national mode and raw input rank from disk instead of per-state frames"""
+        per_state = pipeline_for(PRIMARY_INPUT='normalized').stages['Ranking Engine']
+        national = pipeline_for(PRIMARY_INPUT='normalized', NATIONAL_MODE=True).stages['Ranking Engine']
+        raw = pipeline_for(PRIMARY_INPUT='raw').stages['Ranking Engine']
+
+        assert per_state.split is state_games and per_state.inputs == ['normalized_games']
+        for stage in (national, raw):
+            assert stage.split is None and stage.inputs == [] and stage.fingerprint is None
+
+    def test_per_state_summaries_do_not_overwrite(self, tmp_path):
+        """Test that back-to-back state saves in the same minute keep separate summaries"""
+        from src.analytics.ranking_engine import save_ranking_outputs
+
+        config = {'RANKING_STORE': False, 'RANK_HISTORY': False}
+        result_df = pd.DataFrame({'team_id_master': ['t1'], 'status': ['Active']})
+        for state in ('AZ', 'NV'):
+            save_ranking_outputs(result_df, state, ['M'], ['U11'], config, str(tmp_path), 'gotsport')
+
+        summaries = sorted(p.name for p in tmp_path.glob("summary_*.json"))
+        assert len(summaries) == 2
+        assert summaries[0].startswith("summary_AZ_M_U11_") and summaries[1].startswith("summary_NV_M_U11_")
+
+
+class TestStageMemoization:
+    """Test cases for fingerprint-based stage skipping"""
+
+    @pytest.fixture
+    def workspace(self, tmp_path):
+        """Temporary registry plus an input file and an output file"""
+        source = tmp_path / "games.csv"
+        source.write_text("game_id\n1\n")
+        return {
+            'registry': UnifiedRegistry(str(tmp_path / "registry")),
+            'source': source,
+            'output': tmp_path / "normalized.csv",
+            'config': {'refresh': False},
+            'runs': []
+        }
+
+    def run_pipeline(self, workspace, force=False):
+        """Run a one-stage memoized pipeline; returns the DAG"""
+        def normalize():
+            workspace['runs'].append(1)
+            workspace['output'].write_text(workspace['source'].read_text())
+            return str(workspace['output'])
+
+        def reuse(path):
+            if not Path(path).exists():
+                raise FileNotFoundError(f"missing {path}")
+            return path
+
+        dag = PipelineDAG(registry=workspace['registry'], force=force)
+        dag.add(Stage('Normalizer', normalize, outputs=['normalized_path'],
+                      fingerprint=lambda shard, inputs: {'inputs': file_digests([workspace['source']]),
+                                                         'config': dict(workspace['config'])},
+                      reuse=reuse))
+        dag.run()
+        return dag
+
+    def test_unchanged_fingerprint_skips_and_reuses_outputs(self, workspace):
+        """Test that a second run with identical inputs is skipped"""
+        first = self.run_pipeline(workspace)
+        second = self.run_pipeline(workspace)
+
+        assert len(workspace['runs']) == 1
+        assert first.decisions[0]['action'] == 'ran'
+        assert second.decisions[0]['action'] == 'skipped'
+        assert second.artifacts['normalized_path'] == str(workspace['output'])
+        assert second.timings[0]['status'] == 'skipped'
+        recorded = workspace['registry'].get_stage_fingerprint('Normalizer')
+        assert recorded['outputs'] == str(workspace['output'])
+        assert set(recorded['parts']) == {'inputs', 'config', 'code'}
+
+    def test_changed_input_or_config_reruns(self, workspace):
+        """Test that changes rerun the stage and name the changed part"""
+        self.run_pipeline(workspace)
+
+        workspace['source'].write_text("game_id\n1\n2\n")
+        changed_input = self.run_pipeline(workspace)
+        workspace['config']['refresh'] = True
+        changed_config = self.run_pipeline(workspace)
+
+        assert len(workspace['runs']) == 3
+        assert changed_input.decisions[0] == {'stage': 'Normalizer', 'shard': None, 'action': 'ran',
+                                              'reason': 'changed: inputs'}
+        assert changed_config.decisions[0]['reason'] == 'changed: config'
+
+    def test_force_reruns(self, workspace):
+        """Test that force=True runs an unchanged stage"""
+        self.run_pipeline(workspace)
+        forced = self.run_pipeline(workspace, force=True)
+
+        assert len(workspace['runs']) == 2
+        assert forced.decisions[0]['action'] == 'ran'
+        assert forced.decisions[0]['reason'] == 'forced (--force)'
+
+    def test_missing_outputs_fall_back_to_running(self, workspace):
+        """Test that a reuse callback that raises (deleted outputs) runs the stage"""
+        self.run_pipeline(workspace)
+        workspace['output'].unlink()
+
+        rerun = self.run_pipeline(workspace)
+
+        assert len(workspace['runs']) == 2
+        assert rerun.decisions[0]['action'] == 'ran'
+        assert rerun.decisions[0]['reason'].startswith('previous outputs unavailable')
+        assert workspace['output'].exists()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
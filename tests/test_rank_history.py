@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Test suite for the partitioned rank history store
+"""
+
+import pandas as pd
+import pytest
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from src.analytics.rank_history import RankHistoryStore
+
+
+def ranking(rows):
+    """Ranking rows from (team_id_master, team, rank_national, powerscore_adj) tuples"""
+    df = pd.DataFrame(rows, columns=['team_id_master', 'team', 'rank_national', 'powerscore_adj'])
+    return df.assign(club='Club', state='AZ', gender='M', age_group='U11',
+                     sao_norm=0.5, sad_norm=0.5, sos_norm=0.5, gp_used=12, status='Active')
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    """History store with three builds: a mover, an unchanged team, a drop-out and a newcomer"""
+    monkeypatch.chdir(tmp_path)
+    store = RankHistoryStore(tmp_path / "history")
+    store.append_build(ranking([
+        ('a', 'Alpha', 1, 0.90), ('b', 'Bravo', 2, 0.80), ('c', 'Charlie', 3, 0.70), ('e', 'Echo', 4, 0.60)
+    ]), 'ALL', '20251001_1200')
+    store.append_build(ranking([
+        ('e', 'Echo', 1, 0.95), ('b', 'Bravo', 2, 0.80), ('a', 'Alpha', 3, 0.75), ('d', 'Delta', 4, 0.50)
+    ]), 'ALL', '20251008_1200')
+    store.append_build(ranking([
+        ('e', 'Echo', 1, 0.96), ('b', 'Bravo', 2, 0.80), ('a', 'Alpha', 3, 0.75), ('d', 'Delta', 4, 0.55)
+    ]), 'ALL', '20251015_1200')
+    return store
+
+
+class TestRankHistoryStore:
+    """Test cases for RankHistoryStore"""
+
+    def test_change_only_appends_and_tombstones(self, store):
+        """Test that later builds store only changed, new and removed teams"""
+        division_dir = store.root / "division=ALL_M_U11"
+        second = pd.read_parquet(division_dir / "build=20251008_1200.parquet")
+
+        assert store.list_divisions() == ['ALL_M_U11']
+        assert store.list_builds('ALL_M_U11') == ['20251001_1200', '20251008_1200', '20251015_1200']
+        assert sorted(second['team_id_master']) == ['a', 'c', 'd', 'e']  # b is unchanged
+        assert second.set_index('team_id_master')['removed'].to_dict() == {
+            'e': False, 'a': False, 'd': False, 'c': True
+        }
+
+    def test_snapshot_reconstructs_each_build(self, store):
+        """Test that snapshots replay change rows and honour tombstones"""
+        first = store.snapshot('ALL_M_U11', '20251001_1200')
+        second = store.snapshot('ALL_M_U11', '20251008_1200')
+        latest = store.snapshot('ALL_M_U11')
+
+        assert first['rank_national'].to_dict() == {'a': 1, 'b': 2, 'c': 3, 'e': 4}
+        assert second['rank_national'].to_dict() == {'a': 3, 'b': 2, 'd': 4, 'e': 1}
+        assert 'c' not in latest.index
+        assert latest.loc['d', 'powerscore_adj'] == pytest.approx(0.55)
+        assert latest.loc['b', 'team'] == 'Bravo'
+        assert store.snapshot('ALL_F_U11').empty
+
+    def test_compare_builds_and_biggest_movers(self, store):
+        """Test rank/PowerScore deltas for teams present in both builds"""
+        diff = store.compare_builds('ALL_M_U11', '20251008_1200')
+
+        assert sorted(diff.index) == ['a', 'b', 'e']
+        assert diff['rank_delta'].to_dict() == {'e': 3, 'b': 0, 'a': -2}
+        assert diff.loc['a', 'powerscore_delta'] == pytest.approx(-0.15)
+
+        movers = store.biggest_movers('ALL_M_U11', n=2, build_ts='20251008_1200')
+        assert movers.index.tolist() == ['e', 'a']
+        assert store.compare_builds('ALL_M_U11', '20251001_1200').empty
+
+    def test_team_trajectory(self, store):
+        """Test trajectories fill unchanged builds forward and stop after a drop-out"""
+        bravo = store.team_trajectory('b')
+        assert bravo['build_ts'].tolist() == ['20251001_1200', '20251008_1200', '20251015_1200']
+        assert bravo['rank_national'].tolist() == [2, 2, 2]
+        assert set(bravo['division']) == {'ALL_M_U11'}
+
+        charlie = store.team_trajectory('c')
+        assert charlie['build_ts'].tolist() == ['20251001_1200']
+
+        delta = store.team_trajectory('d', 'ALL_M_U11')
+        assert delta['powerscore_adj'].tolist() == pytest.approx([0.50, 0.55])
+        assert store.team_trajectory('missing').empty
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Test suite for the SQLite ranking store
+"""
+
+import pandas as pd
+import pytest
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from src.analytics.ranking_engine import assign_state_ranks
+from src.analytics.ranking_store import RankingStore, prepare_rankings_frame
+
+
+def ranking_frame(powerscore_shift=0.0):
+    """Small M_U11 ranking result spanning two states"""
+    return pd.DataFrame({
+        'team_id_master': ['t1', 't2', 't3', 't4'],
+        'team': ['Alpha', 'Bravo', 'Charlie', 'Delta'],
+        'club': ['State 48', 'State 48 North', 'Phoenix Rising', 'RSL'],
+        'state': ['AZ', 'CA', 'AZ', 'AZ'],
+        'gender': 'M',
+        'age_group': 'U11',
+        'rank_national': [1, 2, 3, 4],
+        'powerscore_adj': [0.9 + powerscore_shift, 0.8, 0.7, 0.6],
+        'gp_used': [20, 18, 15, 9],
+        'status': 'Active',
+        'is_active': [True, True, False, True],
+        'last_game_date': ['2025-10-01', None, '2025-09-15', None]
+    })
+
+
+@pytest.fixture
+def store(tmp_path):
+    """Ranking store with two ingested builds"""
+    store = RankingStore(tmp_path / "ranking_store.sqlite")
+    ranking_frame().to_csv(tmp_path / "rankings_ALL_M_U11_20251001_1200.csv", index=False)
+    later = ranking_frame(0.05)
+    later.loc[[0, 2], 'rank_national'] = [3, 1]
+    later.to_csv(tmp_path / "rankings_ALL_M_U11_20251008_1200.csv", index=False)
+    for csv_path in sorted(tmp_path.glob("rankings_*.csv")):
+        store.ingest_csv(csv_path)
+    return store
+
+
+class TestRankingStore:
+    """Test cases for RankingStore"""
+
+    def test_ingest_csv_is_idempotent(self, store, tmp_path):
+        """Test that re-ingesting a build replaces its rows instead of duplicating them"""
+        csv_path = tmp_path / "rankings_ALL_M_U11_20251001_1200.csv"
+
+        assert store.ingest_csv(csv_path) == 4
+        assert store.ingest_csv(csv_path) == 4
+
+        builds = store.list_builds()
+        assert builds['build_id'].tolist() == ['ALL_M_U11_20251008_1200', 'ALL_M_U11_20251001_1200']
+        assert builds['row_count'].tolist() == [4, 4]
+        assert len(store.lookup_team('t1', 'ALL_M_U11_20251001_1200')) == 1
+        assert store.ingest_csv(tmp_path / "not_a_rankings_file.csv") == 0
+
+    def test_lookup_team_defaults_to_latest_build(self, store):
+        """Test team lookup against the latest and a specific build"""
+        latest = store.lookup_team('t1').iloc[0]
+        assert latest['build_id'] == 'ALL_M_U11_20251008_1200'
+        assert latest['powerscore_adj'] == pytest.approx(0.95)
+        assert latest['division'] == 'M_U11'
+
+        first = store.lookup_team('t1', 'ALL_M_U11_20251001_1200').iloc[0]
+        assert first['rank_national'] == 1
+        assert store.lookup_team('missing').empty
+
+    def test_missing_last_game_date_is_null(self, store):
+        """Test that missing dates come back as NULL rather than 'nan'"""
+        assert store.lookup_team('t2')['last_game_date'].iloc[0] is None
+        assert store.lookup_team('t1')['last_game_date'].iloc[0] == '2025-10-01'
+        assert store.top_n('AZ', 'M_U11')['last_game_date'].isna().tolist() == [False, False, True]
+
+    def test_search_club_uses_latest_build(self, store):
+        """Test case-insensitive club prefix search"""
+        result = store.search_club('state 48')
+
+        assert result['team_id_master'].tolist() == ['t2', 't1']
+        assert set(result['build_id']) == {'ALL_M_U11_20251008_1200'}
+        assert store.search_club('state 48', division='F_U11').empty
+
+    def test_top_n_orders_by_state_rank(self, store):
+        """Test top-N within a state using per-state ranks"""
+        top = store.top_n('AZ', 'M_U11', n=2)
+
+        assert top['team_id_master'].tolist() == ['t3', 't1']
+        assert top['rank_state'].tolist() == [1, 2]
+        assert store.top_n('AZ', 'M_U11', build_id='ALL_M_U11_20251001_1200')['team_id_master'].tolist() == \
+            ['t1', 't3', 't4']
+        assert store.top_n('NY', 'M_U11').empty
+
+    def test_rank_history(self, store):
+        """Test a team's ranks across builds, oldest first"""
+        history = store.rank_history('t3')
+
+        assert history['build_id'].tolist() == ['ALL_M_U11_20251001_1200', 'ALL_M_U11_20251008_1200']
+        assert history['rank_national'].tolist() == [3, 1]
+        assert history['rank_state'].tolist() == [2, 1]
+
+
+class TestPrepareRankingsFrame:
+    """Test cases for prepare_rankings_frame"""
+
+    def test_state_ranks_match_state_views_on_ties(self):
+        """Test that a powerscore tie is broken like the state views, not by national rank"""
+        df = ranking_frame().assign(
+            powerscore_adj=[0.9, 0.8, 0.7, 0.7],
+            sao_norm=[0.5, 0.5, 0.4, 0.6],
+            sad_norm=0.5,
+            sos_norm=0.5
+        )
+
+        out = prepare_rankings_frame(df, 'ALL_M_U11_20251001_1200', '2025-10-01T12:00:00').set_index('team_id_master')
+        views = assign_state_ranks(df).set_index('team_id_master')
+
+        assert out.loc['t3', 'rank_national'] < out.loc['t4', 'rank_national']
+        assert out.loc[['t1', 't3', 't4'], 'rank_state'].tolist() == [1, 3, 2]
+        assert (out['rank_state'] == views.loc[out.index, 'rank_state']).all()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
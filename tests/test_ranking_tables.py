@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Test suite for ranking engine lookup tables
+"""
+
+import numpy as np
+import pytest
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from src.analytics.utils_stats import (
+    apply_performance_multiplier,
+    tapered_weights,
+    performance_adj_factor,
+    build_weight_tables,
+    get_weight_tables,
+    weight_table_hash
+)
+
+
+@pytest.fixture
+def ranking_config():
+    """Minimal ranking configuration for table building"""
+    return {
+        'MAX_GAMES_FOR_RANK': 30,
+        'RECENT_K': 10,
+        'RECENT_SHARE': 0.70,
+        'DAMPEN_TAIL_START': 26,
+        'DAMPEN_TAIL_END': 30,
+        'DAMPEN_TAIL_START_WEIGHT': 0.8,
+        'DAMPEN_TAIL_END_WEIGHT': 0.4,
+        'PERFORMANCE_DECAY_RATE': 0.08,
+        'PROVISIONAL_ALPHA': 1.5,
+        'SHRINK_TAU': 8
+    }
+
+
+class TestWeightTables:
+    """Test cases for precomputed weight tables"""
+
+    def test_tapered_rows_match_function(self, ranking_config):
+        """Test that each table row equals tapered_weights for that game count"""
+        tables = build_weight_tables(ranking_config)
+        tail_cfg = {
+            'tail_start': 26, 'tail_end': 30,
+            'tail_start_weight': 0.8, 'tail_end_weight': 0.4
+        }
+
+        for n in range(1, 31):
+            expected = tapered_weights(n, 10, 0.70, tail_cfg)
+            np.testing.assert_allclose(tables['tapered'][n, :n], expected)
+
+    def test_decay_table_matches_scalar_path(self, ranking_config):
+        """Test that performance_adj_factor gives the same result with a decay table"""
+        tables = build_weight_tables(ranking_config)
+
+        for idx in (0, 5, 29):
+            scalar = performance_adj_factor(2.5, 0.15, 0.08, idx)
+            tabled = performance_adj_factor(2.5, 0.15, 0.08, idx, decay_table=tables['decay'])
+            assert scalar == pytest.approx(tabled)
+
+        assert performance_adj_factor(0.5, 0.15, 0.08, 0, decay_table=tables['decay']) == 1.0
+
+    def test_adj_factor_uses_performance_multiplier_formula(self, ranking_config):
+        """Test that performance_adj_factor matches apply_performance_multiplier"""
+        tables = build_weight_tables(ranking_config)
+
+        for perf in (-3.0, -1.0, -0.5, 0.0, 0.99, 1.0, 2.5):
+            for idx in (0, 5, 29, 40):
+                expected = apply_performance_multiplier(perf, 0.15, 0.08, idx)
+                assert performance_adj_factor(perf, 0.15, 0.08, idx) == pytest.approx(expected)
+                assert performance_adj_factor(perf, 0.15, 0.08, idx,
+                                              decay_table=tables['decay']) == pytest.approx(expected)
+
+    def test_gp_multipliers(self, ranking_config):
+        """Test game-count multiplier and provisional floor tables"""
+        tables = build_weight_tables(ranking_config)
+
+        assert tables['gp_mult'][20] == pytest.approx(1.0)
+        assert tables['gp_mult'][10] == pytest.approx(0.5 ** 1.5)
+        assert tables['gp_adj'][7] == 0.85
+        assert tables['gp_adj'][14] == 0.95
+        assert tables['gp_adj'][15] == 1.0
+
+    def test_cache_ignores_unrelated_keys(self, ranking_config):
+        """Test that configs differing only in unrelated keys share tables"""
+        other = dict(ranking_config, SHRINK_TAU=20)
+        changed = dict(ranking_config, RECENT_K=5)
+
+        assert weight_table_hash(ranking_config) == weight_table_hash(other)
+        assert get_weight_tables(ranking_config) is get_weight_tables(other)
+        assert weight_table_hash(ranking_config) != weight_table_hash(changed)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
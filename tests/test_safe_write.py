@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Test suite for atomic, checksummed file writes
+"""
+
+import json
+import logging
+import pandas as pd
+import pytest
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from src.io.safe_write import (
+    atomic_hashed_write,
+    compute_file_checksum,
+    safe_write_csv,
+    safe_write_json,
+    safe_write_parquet,
+    safe_write_partitions
+)
+from src.scraper.utils import file_utils
+
+logger = logging.getLogger("test_safe_write")
+
+
+@pytest.fixture
+def teams_df():
+    """Small team DataFrame with non-ASCII text and missing values"""
+    return pd.DataFrame({
+        'team_name': ['FC Elite AZ', 'Club Atlético', 'United FC', 'Rush'],
+        'state': ['AZ', 'CA', 'AZ', None],
+        'points': [10.5, 7.0, None, 3.25]
+    })
+
+
+class TestSafeWrite:
+    """Test cases for atomic_hashed_write and the safe_write_* writers"""
+
+    def test_outputs_match_plain_writes(self, teams_df, tmp_path):
+        """Test that CSV, Parquet and JSON bytes equal a plain write and checksums match"""
+        data = {'teams': teams_df['team_name'].tolist(), 'count': 4}
+
+        teams_df.to_csv(tmp_path / "plain.csv", index=False)
+        teams_df.to_parquet(tmp_path / "plain.parquet", index=False)
+        with open(tmp_path / "plain.json", 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+
+        results = [
+            safe_write_csv(teams_df, tmp_path / "safe.csv", logger),
+            safe_write_parquet(teams_df, tmp_path / "safe.parquet", logger),
+            safe_write_json(data, tmp_path / "safe.json", logger),
+        ]
+
+        for result in results:
+            path = Path(result['path'])
+            plain = tmp_path / f"plain{path.suffix}"
+            assert path.read_bytes() == plain.read_bytes()
+            assert result['checksum'] == compute_file_checksum(path)
+            assert result['size_bytes'] == path.stat().st_size
+            assert result['algorithm'] == 'md5'
+            assert result['format'] == path.suffix[1:]
+
+        blake = safe_write_csv(teams_df, tmp_path / "blake.csv", logger, algorithm='blake2b')
+        assert blake['checksum'] == compute_file_checksum(tmp_path / "blake.csv", 'blake2b')
+
+    def test_failed_write_leaves_no_partial_or_temp_file(self, tmp_path):
+        """Test that an exception mid-write keeps the destination untouched and cleans up"""
+        def broken(writer):
+            writer.write(b"team_name\nHalf written")
+            raise RuntimeError("disk went away")
+
+        new_path = tmp_path / "new.csv"
+        with pytest.raises(RuntimeError):
+            atomic_hashed_write(new_path, broken, logger=logger)
+        assert not new_path.exists()
+
+        existing = tmp_path / "existing.csv"
+        existing.write_bytes(b"team_name\nOriginal\n")
+        with pytest.raises(RuntimeError):
+            atomic_hashed_write(existing, broken, logger=logger)
+        assert existing.read_bytes() == b"team_name\nOriginal\n"
+
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["existing.csv"]
+
+    def test_atomic_write_logs_path_and_checksum(self, tmp_path, caplog):
+        """Test that the write and its checksum go to the given logger"""
+        path = tmp_path / "teams.csv"
+
+        with caplog.at_level(logging.DEBUG, logger="test_safe_write"):
+            result = atomic_hashed_write(path, lambda writer: writer.write(b"team_name\nRush\n"), logger=logger)
+
+        assert result['checksum'] == compute_file_checksum(path)
+        assert result['size_bytes'] == 15
+        assert any(str(path) in record.message and result['checksum'] in record.message
+                   for record in caplog.records)
+
+    def test_partitions_write_one_file_per_key_and_report_failures(self, teams_df, tmp_path, caplog):
+        """Test per-key partition files and that a failing partition is reported"""
+        # A file where CA's directory should be makes that partition fail
+        (tmp_path / "CA").write_text("not a directory")
+
+        with caplog.at_level(logging.ERROR, logger="test_safe_write"):
+            results = safe_write_partitions(
+                teams_df, "state", lambda state: tmp_path / state / f"teams_{state}.csv",
+                write_parquet=True, logger=logger
+            )
+
+        assert [result['partition'] for result in results] == ['AZ']
+        assert results[0]['rows'] == 2
+        written = pd.read_csv(tmp_path / "AZ" / "teams_AZ.csv")
+        assert written['team_name'].tolist() == ['FC Elite AZ', 'United FC']
+        assert results[0]['checksum'] == compute_file_checksum(tmp_path / "AZ" / "teams_AZ.csv")
+        assert Path(results[0]['parquet_path']).exists()
+        assert any("Failed to write partition CA" in record.message for record in caplog.records)
+
+
+class TestFileUtilsSafeWriteCsv:
+    """Test cases for file_utils.safe_write_csv routed through atomic_hashed_write"""
+
+    def test_contract_is_unchanged(self, teams_df, tmp_path):
+        """Test the returned path, file bytes and the checksum metadata callers log"""
+        path = tmp_path / "nested" / "master_team_index.csv"
+        teams_df.to_csv(tmp_path / "plain.csv", index=False, encoding="utf-8")
+
+        returned = file_utils.safe_write_csv(teams_df, path, logger)
+
+        assert returned == path
+        assert path.read_bytes() == (tmp_path / "plain.csv").read_bytes()
+        assert sorted(p.name for p in path.parent.iterdir()) == ["master_team_index.csv"]
+
+        # The src.io variant returns the metadata (e.g. migrate_to_new_schema logs checksum/size)
+        result = safe_write_csv(teams_df, tmp_path / "io.csv", logger)
+        assert {'path', 'checksum', 'algorithm', 'size_bytes', 'format'} <= set(result)
+        assert result['checksum'] == compute_file_checksum(path)
+        assert result['size_bytes'] == path.stat().st_size
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
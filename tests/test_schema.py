@@ -12,7 +12,8 @@ import os
 # Add project root to path
 sys.path.append(str(Path(__file__).parent.parent))
 
-from src.schema.master_team_schema import MasterTeamSchema, validate_dataframe, get_schema_summary
+from src.schema.master_team_schema import MASTER_TEAM_FAST_PROFILE, MasterTeamSchema, validate_dataframe, get_schema_summary
+from src.schema.fast_validation import FastValidationError, resolve_mode, sample_rows, validate_tiered
 
 
 class TestMasterTeamSchema:
@@ -222,5 +223,105 @@ class TestMasterTeamSchema:
             assert row['age_group'] == expected_age_group
 
 
+
+@pytest.fixture
+def master_df():
+    """Valid master index rows"""
+    return pd.DataFrame({
+        'team_id': ['6c1e02b09d77', 'a1b2c3d4e5f6', '0123456789ab'],
+        'provider_team_id': ['522.0', None, '124.0'],
+        'team_name': ['FC Elite AZ', 'Premier Soccer Club', 'Rush'],
+        'age_group': ['U10', 'U12', 'U12'],
+        'age_u': [10, 12, 12],
+        'gender': ['M', 'F', 'F'],
+        'state': ['AZ', 'CA', 'CA'],
+        'provider': ['GotSport', 'GotSport', 'GotSport'],
+        'club_name': ['Elite FC', None, 'Rush SC'],
+        'source_url': ['https://api.example.com/team/522'] * 3,
+        'created_at': ['2025-10-14T12:00:00Z', None, '2025-10-14T12:00:00']
+    })
+
+
+class TestFastValidation:
+    """Test cases for the fast and sampled validation tiers"""
+    
+    def test_fast_mode_passes_valid_data(self, master_df):
+        """Test that fast mode accepts valid data and leaves already-typed columns alone"""
+        result = validate_dataframe(master_df, mode="fast")
+        
+        pd.testing.assert_frame_equal(result, master_df)
+        assert result is not master_df
+    
+    def test_every_mode_returns_schema_dtypes(self, master_df):
+        """Test that fast and sampled modes return the dtypes the full Pandera schema coerces to"""
+        raw = master_df.assign(age_u=master_df['age_u'].astype(str),
+                               provider_team_id=[522.0, None, 124.0])
+        
+        expected = {column: 'int64' if column == 'age_u' else 'object' for column in master_df.columns}
+        results = [
+            validate_dataframe(raw, mode="fast"),
+            validate_tiered(raw, lambda df: df, MASTER_TEAM_FAST_PROFILE, mode="sampled", sample_size=1)
+        ]
+        for result in results:
+            assert result.dtypes.astype(str).to_dict() == expected
+            assert result['age_u'].tolist() == [10, 12, 12]
+            assert result['provider_team_id'].tolist()[::2] == ['522.0', '124.0']
+            assert result['provider_team_id'].isna().tolist() == [False, True, False]
+        assert raw['age_u'].dtype == object
+    
+    def test_fast_mode_collects_all_failures(self, master_df):
+        """Test that lazy fast validation reports every failed check at once"""
+        master_df.loc[0, 'team_id'] = 'invalid_id'
+        master_df.loc[1, 'state'] = 'ZZ'
+        master_df.loc[2, 'age_u'] = 11
+        
+        with pytest.raises(FastValidationError) as exc_info:
+            validate_dataframe(master_df, mode="fast")
+        
+        failures = exc_info.value.failure_cases
+        assert set(failures['column'].dropna()) == {'team_id', 'state'}
+        assert 'age_group_matches_age_u' in set(failures['check'])
+    
+    def test_fast_mode_eager_stops_at_first_failure(self, master_df):
+        """Test that lazy=False raises on the first failed check"""
+        master_df.loc[0, 'team_id'] = 'invalid_id'
+        master_df.loc[1, 'gender'] = 'X'
+        
+        with pytest.raises(FastValidationError) as exc_info:
+            validate_dataframe(master_df, mode="fast", lazy=False)
+        
+        assert len(exc_info.value.failure_cases) == 1
+    
+    def test_missing_required_column(self, master_df):
+        """Test that missing required columns fail and optional ones do not"""
+        validate_dataframe(master_df.drop(columns=['club_name', 'created_at']), mode="fast")
+        
+        with pytest.raises(FastValidationError, match="team_name"):
+            validate_dataframe(master_df.drop(columns=['team_name']), mode="fast")
+    
+    def test_sampled_mode_includes_touched_rows(self, master_df):
+        """Test that sampled mode fully validates random plus touched rows"""
+        big = pd.concat([master_df] * 100, ignore_index=True)
+        touched = pd.Series(False, index=big.index)
+        touched.iloc[-5:] = True
+        
+        subset = sample_rows(big, sample_size=10, touched=touched)
+        assert len(subset) >= 10
+        assert set(big.index[-5:]) <= set(subset.index)
+        
+        seen = []
+        result = validate_tiered(big, lambda df: seen.append(len(df)) or df, {}, mode="sampled",
+                                 sample_size=10, touched=touched)
+        pd.testing.assert_frame_equal(result, big)
+        assert seen == [len(subset)]
+    
+    def test_auto_mode_by_size(self):
+        """Test that auto mode fully validates small frames only"""
+        assert resolve_mode("auto", 1_000) == "full"
+        assert resolve_mode("auto", 1_000_000) == "sampled"
+        with pytest.raises(ValueError):
+            resolve_mode("quick", 10)
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Test suite for state normalization and the state lookup table
+"""
+
+import logging
+import pandas as pd
+import pytest
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from src.scraper.utils.state_normalizer import (
+    STATE_INVALID,
+    STATE_KEEP,
+    STATE_NON_US,
+    build_state_lookup,
+    normalize_states
+)
+
+
+def lookup_for(states):
+    """Map of raw value -> (normalized state, status)"""
+    lookup = build_state_lookup(states)
+    return dict(zip(lookup['raw'], zip(lookup['state'], lookup['status'])))
+
+
+class TestBuildStateLookup:
+    """Test cases for build_state_lookup"""
+
+    def test_abbreviations_and_regional_codes(self):
+        """Test U.S. codes, regional codes via STATE_MAP and CAN as California North"""
+        lookup = lookup_for(['AZ', 'CAS', 'TXN', 'CAN', 'NYW'])
+
+        assert [state for state, _ in lookup.values()] == ['AZ', 'CA', 'TX', 'CA', 'NY']
+        assert {status for _, status in lookup.values()} == {STATE_KEEP}
+
+    def test_non_us_codes(self):
+        """Test that NON_US_CODES entries are classified as non-U.S."""
+        lookup = lookup_for(['MEX', 'GBR', 'QC', 'Surrey', 'OTH'])
+
+        assert {status for _, status in lookup.values()} == {STATE_NON_US}
+
+    def test_full_names_and_mixed_case_pass_through(self):
+        """Test that matching is exact: full names and mixed-case codes are kept unchanged"""
+        lookup = lookup_for(['California', 'az', 'cas', 'mex', 'surrey'])
+
+        assert lookup == {
+            'California': ('California', STATE_KEEP),
+            'az': ('az', STATE_KEEP),
+            'cas': ('cas', STATE_KEEP),
+            'mex': ('mex', STATE_KEEP),
+            'surrey': ('surrey', STATE_KEEP),
+        }
+
+    def test_unknown_and_invalid_values(self):
+        """Test that unknown values are kept and empty or one-character values are invalid"""
+        lookup = lookup_for(['Atlantis', 'ZZ', '', 'X'])
+
+        assert lookup['Atlantis'] == ('Atlantis', STATE_KEEP)
+        assert lookup['ZZ'] == ('ZZ', STATE_KEEP)
+        assert [lookup[raw][1] for raw in ('', 'X')] == [STATE_INVALID] * 2
+
+    def test_lookup_is_aligned_with_input(self):
+        """Test that the table has one row per input value in input order"""
+        states = pd.Index(['TXS', 'MEX', 'CA'])
+
+        lookup = build_state_lookup(states)
+
+        assert lookup['raw'].tolist() == ['TXS', 'MEX', 'CA']
+        assert lookup['state'].tolist() == ['TX', 'MEX', 'CA']
+        assert lookup['status'].tolist() == [STATE_KEEP, STATE_NON_US, STATE_KEEP]
+
+
+class TestNormalizeStates:
+    """Test cases for normalize_states"""
+
+    def test_rows_are_normalized_and_filtered(self, caplog):
+        """Test output rows and the logged audit counts"""
+        df = pd.DataFrame({
+            'team_name': ['A', 'B', 'C', 'D', 'E', 'F', 'G', 'H'],
+            'state': ['AZ', 'MEX', 'CAS', None, 'X', 'TXN', 'CAS', 'Arizona'],
+        })
+
+        with caplog.at_level(logging.INFO, logger="test_state_normalizer"):
+            cleaned = normalize_states(df, logging.getLogger("test_state_normalizer"))
+
+        assert cleaned['team_name'].tolist() == ['A', 'C', 'F', 'G', 'H']
+        assert cleaned['state'].tolist() == ['AZ', 'CA', 'TX', 'CA', 'Arizona']
+        assert cleaned.index.tolist() == [0, 1, 2, 3, 4]
+
+        messages = [record.getMessage() for record in caplog.records]
+        assert "🔄 Mapped 2 teams: CAS → CA" in messages
+        assert "🔄 Mapped 1 teams: TXN → TX" in messages
+        assert "✅ Total regional mappings applied: 3" in messages
+        assert "🌍 Removing 1 non-U.S. teams" in messages
+        assert "⚠️ Removing 2 teams with invalid state codes" in messages
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
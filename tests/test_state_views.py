@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Test suite for national-mode state ranks, views and summary
+"""
+
+import pandas as pd
+import pytest
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from src.analytics.ranking_engine import assign_state_ranks, build_state_summary, export_state_views
+
+
+@pytest.fixture
+def national_result():
+    """Small national ranking result across three states plus one unknown state"""
+    rows = [
+        # team_id_master, team, state, powerscore_adj, sao_norm, sad_norm, sos_norm, rank_national, status
+        ('t1', 'AZ Low', 'AZ', 0.40, 0.5, 0.5, 0.5, 6, 'Provisional'),
+        ('t2', 'CA Top', 'CA', 0.90, 0.5, 0.5, 0.5, 1, 'Active'),
+        ('t3', 'AZ Tie Weaker Offense', 'AZ', 0.70, 0.4, 0.9, 0.9, 4, 'Active'),
+        ('t4', 'AZ Tie Stronger Offense', 'AZ', 0.70, 0.6, 0.1, 0.1, 3, 'Active'),
+        ('t5', 'CA Full Tie First', 'CA', 0.50, 0.5, 0.5, 0.5, 5, 'Active'),
+        ('t6', 'NV Only', 'NV', 0.80, 0.5, 0.5, 0.5, 2, 'Active'),
+        ('t7', 'CA Full Tie Second', 'CA', 0.50, 0.5, 0.5, 0.5, 7, 'Provisional'),
+        ('t8', 'No State', None, 0.95, 0.5, 0.5, 0.5, 0, 'Active'),
+    ]
+    return pd.DataFrame(rows, columns=['team_id_master', 'team', 'state', 'powerscore_adj', 'sao_norm',
+                                       'sad_norm', 'sos_norm', 'rank_national', 'status'])
+
+
+class TestAssignStateRanks:
+    """Test cases for assign_state_ranks"""
+
+    def test_ranks_restart_per_state(self, national_result):
+        """Test per-state ranks across multiple states, sorted by (state, rank)"""
+        views = assign_state_ranks(national_result)
+
+        assert views['state'].tolist() == ['AZ', 'AZ', 'AZ', 'CA', 'CA', 'CA', 'NV']
+        assert views['rank_state'].tolist() == [1, 2, 3, 1, 2, 3, 1]
+        assert (views['rank'] == views['rank_state']).all()
+        assert views.groupby('state')['rank_state'].apply(lambda r: r.is_unique).all()
+
+    def test_ties_use_secondary_keys_then_input_order(self, national_result):
+        """Test that PowerScore ties fall back to sao_norm, and full ties keep input order"""
+        views = assign_state_ranks(national_result).set_index('team_id_master')
+
+        assert views.loc['t4', 'rank_state'] == 1 and views.loc['t3', 'rank_state'] == 2
+        assert views.loc['t5', 'rank_state'] == 2 and views.loc['t7', 'rank_state'] == 3
+
+    def test_rows_without_state_are_dropped(self, national_result):
+        """Test that teams without a state get no state rank"""
+        views = assign_state_ranks(national_result)
+
+        assert 't8' not in set(views['team_id_master'])
+        assert len(views) == len(national_result) - 1
+
+
+class TestStateViewExport:
+    """Test cases for export_state_views and build_state_summary"""
+
+    @pytest.mark.parametrize("write_parquet", [True, False])
+    def test_one_file_per_state(self, national_result, tmp_path, write_parquet):
+        """Test that each state gets its own CSV (and Parquet copy) with only its teams"""
+        views = assign_state_ranks(national_result)
+
+        written = export_state_views(views, tmp_path, "M_U11_20251014_1200",
+                                     write_parquet=write_parquet, max_workers=2)
+
+        assert [p.name for p in written] == [f"rankings_{st}_M_U11_20251014_1200.csv" for st in ('AZ', 'CA', 'NV')]
+        expected = {p.name for p in written}
+        if write_parquet:
+            expected |= {p.with_suffix('.parquet').name for p in written}
+        assert {p.name for p in tmp_path.iterdir()} == expected
+
+        az = pd.read_csv(written[0])
+        assert az['team_id_master'].tolist() == ['t4', 't3', 't1']
+        assert az['rank'].tolist() == [1, 2, 3]
+        if write_parquet:
+            pd.testing.assert_frame_equal(pd.read_parquet(written[0].with_suffix('.parquet')), az)
+
+    def test_summary_has_one_row_per_state(self, national_result):
+        """Test team counts, PowerScore stats and top team per state"""
+        summary = build_state_summary(assign_state_ranks(national_result)).set_index('state')
+
+        assert summary.index.tolist() == ['AZ', 'CA', 'NV']
+        assert summary['total_teams'].tolist() == [3, 3, 1]
+        assert summary['active_teams'].tolist() == [2, 2, 1]
+        assert summary['provisional_teams'].tolist() == [1, 1, 0]
+        assert summary.loc['AZ', 'max_powerscore'] == pytest.approx(0.70)
+        assert summary.loc['AZ', 'mean_powerscore'] == pytest.approx(0.60)
+        assert summary.loc['CA', 'median_powerscore'] == pytest.approx(0.50)
+        assert summary.loc['AZ', 'best_rank_national'] == 3
+        assert summary['top_team_id'].tolist() == ['t4', 't2', 't6']
+        assert summary.loc['CA', 'top_team'] == 'CA Top'
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Test suite for streaming master index verification
+"""
+
+import pandas as pd
+import pytest
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from src.validators.verify_master_index import (
+    summarize_master,
+    validate_data_quality,
+    analyze_trends,
+    verify_master_file
+)
+
+
+@pytest.fixture
+def master_csv(tmp_path):
+    """Small master index with duplicates across chunks, missing states and one bad row"""
+    rows = []
+    for i in range(40):
+        rows.append({
+            'team_id': f"{i:012x}",
+            'provider_team_id': str(1000 + i),
+            'team_name': f"Team {i % 30}",
+            'age_group': ['U10', 'U11', 'U12'][i % 3],
+            'age_u': [10, 11, 12][i % 3],
+            'gender': 'M' if i % 2 else 'F',
+            'state': [None, 'CA', 'TX', 'NY', 'AZ'][i % 5],
+            'provider': 'gotsport' if i % 4 else 'ayso',
+            'club_name': None,
+            'source': 'gotsport',
+            'source_url': 'https://example.com',
+            'points': float(i * 10),
+            'rank': i + 1
+        })
+    rows[-1]['gender'] = 'X'
+    path = tmp_path / "master_team_index_test.csv"
+    pd.DataFrame(rows).to_csv(path, index=False)
+    return path
+
+
+class TestStreamingVerification:
+    """Test cases for verify_master_file"""
+
+    def test_reports_match_in_memory_functions(self, master_csv):
+        """Test that chunked reports equal the full-DataFrame reports"""
+        df = pd.read_csv(master_csv)
+        report = verify_master_file(master_csv, chunksize=7)
+
+        assert report['summary'] == summarize_master(df)
+        assert report['validation'] == validate_data_quality(df)
+        assert report['trends'] == analyze_trends(df)
+        assert report['summary']['duplicate_rows_on_team_age_gender'] == int(
+            df.duplicated(subset=['team_name', 'age_group', 'gender'], keep=False).sum()
+        )
+        assert report['profile']['chunks'] == 6
+
+    def test_profile_statistics(self, master_csv):
+        """Test null rates and points/rank distributions"""
+        df = pd.read_csv(master_csv)
+        profile = verify_master_file(master_csv, chunksize=9)['profile']
+
+        assert profile['null_rates']['state'] == pytest.approx(df['state'].isna().mean())
+        assert profile['null_rates']['club_name'] == 1.0
+        points = profile['numeric_distributions']['points']
+        assert points['count'] == 40
+        assert points['mean'] == pytest.approx(df['points'].mean())
+        assert points['std'] == pytest.approx(df['points'].std())
+        assert points['max'] == 390.0
+
+    def test_schema_failures_collected_across_chunks(self, master_csv):
+        """Test that per-chunk schema failures are merged into one report"""
+        schema = verify_master_file(master_csv, chunksize=10)['schema']
+        failures = {(f['column'], f['check']): f for f in schema['failures']}
+
+        assert schema['status'] == 'failed'
+        assert failures[('state', 'not_nullable')]['failure_count'] == 8
+        assert failures[('gender', 'isin')]['failure_cases'] == ['X']
+        assert schema['team_id_duplicates'] == 0
+
+        skipped = verify_master_file(master_csv, chunksize=10, schema_checks=False)['schema']
+        assert skipped['status'] == 'skipped'
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
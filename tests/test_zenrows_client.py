@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Test suite for the ZenRows client against a local stand-in API
+"""
+
+import pytest
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import urlparse, parse_qs
+
+# Add project root to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from src.scraper.utils.zenrows_client import ZenRowsClient
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """Emulates the ZenRows API: static fetches of /dynamic pages come back empty"""
+
+    def do_GET(self):
+        query = {k: v[0] for k, v in parse_qs(urlparse(self.path).query).items()}
+        server = self.server
+        with server.lock:
+            server.calls.append(query)
+            server.in_flight += 1
+            server.max_in_flight = max(server.max_in_flight, server.in_flight)
+        try:
+            time.sleep(server.delay)
+            rendered = query.get("js_render") == "true"
+            if query.get("apikey") != "test-key":
+                self._send(401, "invalid api key", 0)
+            elif "/dynamic" in query["url"] and not rendered:
+                self._send(200, "", 1)
+            else:
+                cost = server.cost_header if server.cost_header is not None else (5 if rendered else 1)
+                self._send(200, f"<html>{query['url']}</html>", cost)
+        finally:
+            with server.lock:
+                server.in_flight -= 1
+
+    def _send(self, status, body, cost):
+        self.send_response(status)
+        self.send_header("X-Request-Cost", str(cost))
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body.encode())
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def stand_in():
+    """Local ZenRows stand-in running in a background thread"""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StandInHandler)
+    server.lock = threading.Lock()
+    server.calls, server.in_flight, server.max_in_flight, server.delay = [], 0, 0, 0.0
+    server.cost_header = None
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    server.api_url = f"http://127.0.0.1:{server.server_address[1]}/v1/"
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def make_client(stand_in, **kwargs):
+    kwargs.setdefault("api_key", "test-key")
+    return ZenRowsClient(api_url=stand_in.api_url, **kwargs)
+
+
+class TestZenRowsClient:
+    """Test cases for ZenRowsClient"""
+
+    def test_auto_renders_only_when_static_fetch_fails(self, stand_in):
+        """Test that auto mode renders (with a wait) only after an empty static fetch"""
+        with make_client(stand_in) as client:
+            static = client.fetch("https://site/static")
+            dynamic = client.fetch("https://site/dynamic")
+
+        assert static["ok"] and not static["js_render"] and static["credits"] == 1
+        assert dynamic["ok"] and dynamic["js_render"]
+        assert dynamic["content"] == "<html>https://site/dynamic</html>"
+        assert dynamic["credits"] == 6 and dynamic["attempts"] == 2
+        assert [c["js_render"] for c in stand_in.calls] == ["false", "false", "true"]
+        assert "wait" not in stand_in.calls[0] and stand_in.calls[2]["wait"] == "5000"
+
+    def test_budget_is_a_hard_stop(self, stand_in):
+        """Test that requests past the credit budget are never sent"""
+        client = make_client(stand_in, credit_budget=6)
+
+        assert client.fetch("https://site/a", js_render=True)["ok"]
+        assert client.fetch("https://site/b", js_render=False)["ok"]
+        blocked = client.fetch("https://site/c", js_render=False)
+
+        assert blocked["ok"] is False and blocked["error_type"] == "budget_exhausted"
+        assert len(stand_in.calls) == 2
+        assert client.stats()["credits_used"] == 6
+        assert client.credits_remaining == 0
+
+    def test_structured_errors(self, stand_in, monkeypatch):
+        """Test that failures are reported as typed results instead of exceptions"""
+        bad_key = make_client(stand_in, api_key="wrong").fetch("https://site/a")
+        assert bad_key["status"] == 401 and bad_key["error_type"] == "auth"
+        assert bad_key["content"] == "" and bad_key["attempts"] == 1
+
+        monkeypatch.delenv("ZENROWS_API_KEY", raising=False)
+        assert ZenRowsClient(api_url=stand_in.api_url).fetch("https://site/a")["error_type"] == "config"
+
+        unreachable = ZenRowsClient(api_key="test-key", api_url="http://127.0.0.1:9/v1/", max_retries=0)
+        result = unreachable.fetch("https://site/a", js_render=False)
+        assert result["error_type"] == "connection"
+        assert unreachable.stats()["errors"] == {"connection": 1}
+        assert unreachable.stats()["credits_used"] == 0
+
+    def test_fractional_or_malformed_cost_header(self, stand_in):
+        """Test that unusual X-Request-Cost headers never fail a successful fetch"""
+        client = make_client(stand_in)
+
+        stand_in.cost_header = "0.001"
+        fractional = client.fetch("https://site/a", js_render=False)
+        assert fractional["ok"] and fractional["credits"] == pytest.approx(0.001)
+
+        stand_in.cost_header = "not-a-number"
+        malformed = client.fetch("https://site/b", js_render=True)
+        assert malformed["ok"] and malformed["credits"] == 5  # falls back to the estimate
+
+        assert client.stats()["credits_used"] == pytest.approx(5.001)
+
+    def test_fetch_many_respects_concurrency(self, stand_in):
+        """Test ordered concurrent fetches capped at the plan limit"""
+        stand_in.delay = 0.05
+        client = make_client(stand_in, concurrency=10, plan_concurrency=3)
+        urls = [f"https://site/page{i}" for i in range(9)]
+
+        results = client.fetch_many(urls, js_render=False)
+
+        assert client.concurrency == 3
+        assert [r["url"] for r in results] == urls
+        assert all(r["ok"] for r in results)
+        assert 1 < stand_in.max_in_flight <= 3
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])